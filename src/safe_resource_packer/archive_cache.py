@@ -0,0 +1,357 @@
+"""
+Archive Output Cache
+
+Content-addressed cache for built BSA/BA2 archives. The cache key is a digest of
+the sorted Data-relative file list, each file's content digest, the game type,
+archive flags and the archive backend version, so identical inputs never have
+to go through BSArch twice. Entries are evicted least-recently-used once the
+cache grows past its size limit.
+
+File digests are remembered by (relative path, size, mtime) so files staged
+into a fresh temp directory on every run are not re-hashed, and are written
+back once per run; digests unused for DIGEST_RETENTION_DAYS are dropped.
+"""
+
+import os
+import json
+import time
+import atexit
+import shutil
+import hashlib
+import tempfile
+import threading
+from typing import Dict, Any, List, Optional, Tuple, Callable
+from .dynamic_progress import log
+from .utils import file_hash, format_bytes
+from .staging import reflink_file
+
+
+CACHE_FORMAT_VERSION = 1
+DIGEST_FORMAT_VERSION = 2
+DEFAULT_CACHE_MAX_GB = 10.0
+DIGEST_RETENTION_DAYS = 30
+
+def clone_file(src: str, dst: str) -> None:
+    """
+    Clone src to dst, using a copy-on-write reflink where the filesystem supports it.
+
+    Args:
+        src: Source file
+        dst: Destination file
+    """
+    if not reflink_file(src, dst):
+        shutil.copy2(src, dst)
+
+
+class ArchiveCache:
+    """Content-addressed store of built archives with LRU eviction."""
+
+    def __init__(self, cache_dir: Optional[str] = None, max_size_gb: float = DEFAULT_CACHE_MAX_GB):
+        """
+        Initialize archive cache.
+
+        Args:
+            cache_dir: Directory to store cached archives (defaults to temp directory)
+            max_size_gb: Maximum total size of cached archives in GB
+        """
+        if cache_dir is None:
+            cache_dir = os.path.join(tempfile.gettempdir(), "srp_archive_cache")
+
+        self.cache_dir = cache_dir
+        self.objects_dir = os.path.join(cache_dir, "objects")
+        self.index_file = os.path.join(cache_dir, "index.json")
+        self.digest_file = os.path.join(cache_dir, "digests.json")
+        self.max_size_bytes = int(max_size_gb * 1024 ** 3)
+        self._lock = threading.Lock()
+
+        os.makedirs(self.objects_dir, exist_ok=True)
+        self._index = self._load_json(self.index_file, {'version': CACHE_FORMAT_VERSION, 'entries': {}, 'hits': 0, 'misses': 0})
+        if self._index.get('version') != CACHE_FORMAT_VERSION:
+            self._index = {'version': CACHE_FORMAT_VERSION, 'entries': {}, 'hits': 0, 'misses': 0}
+        digests = self._load_json(self.digest_file, {})
+        # 'identity|size|mtime_ns' -> [digest, last_used]
+        self._digests = digests.get('digests', {}) if digests.get('version') == DIGEST_FORMAT_VERSION else {}
+        self._digests_dirty = False
+
+    def _load_json(self, path: str, default: Dict[str, Any]) -> Dict[str, Any]:
+        """Load a JSON file, returning default if missing or unreadable."""
+        try:
+            if os.path.exists(path):
+                with open(path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+        except Exception as e:
+            log(f"⚠️ Failed to load archive cache file {path}: {e}", log_type='WARNING')
+        return default
+
+    def _save_json(self, path: str, data: Dict[str, Any]) -> None:
+        """Atomically write a JSON file."""
+        try:
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            log(f"⚠️ Failed to save archive cache file {path}: {e}", log_type='WARNING')
+
+    def file_digest(self, path: str, rel_path: Optional[str] = None) -> Optional[str]:
+        """
+        Get a file's content digest, reusing the stored digest while size and mtime are unchanged.
+
+        Args:
+            path: File path
+            rel_path: Path relative to the archive root; keys the digest instead of
+                      the absolute path, so staged copies match across runs
+
+        Returns:
+            SHA1 digest or None if the file cannot be read
+        """
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+
+        identity = rel_path.replace('\\', '/').lower() if rel_path else os.path.normcase(os.path.abspath(path))
+        key = f"{identity}|{stat.st_size}|{stat.st_mtime_ns}"
+        now = int(time.time())
+        with self._lock:
+            known = self._digests.get(key)
+            if known:
+                known[1] = now
+                self._digests_dirty = True
+                return known[0]
+
+        digest = file_hash(path)
+        if digest:
+            with self._lock:
+                self._digests[key] = [digest, now]
+                self._digests_dirty = True
+        return digest
+
+    def save_digests(self) -> None:
+        """Persist remembered file digests, dropping ones unused for DIGEST_RETENTION_DAYS (once per run)."""
+        with self._lock:
+            if not self._digests_dirty:
+                return
+            self._drop_stale_digests()
+            self._save_json(self.digest_file, {'version': DIGEST_FORMAT_VERSION, 'digests': self._digests})
+            self._digests_dirty = False
+
+    def _drop_stale_digests(self) -> None:
+        """Forget digests unused for DIGEST_RETENTION_DAYS (caller holds the lock)."""
+        cutoff = time.time() - DIGEST_RETENTION_DAYS * 86400
+        self._digests = {key: value for key, value in self._digests.items() if value[1] >= cutoff}
+
+    def set_max_size(self, max_size_gb: float) -> None:
+        """
+        Change the size limit and evict down to it right away.
+
+        Args:
+            max_size_gb: Maximum total size of cached archives in GB
+        """
+        with self._lock:
+            self.max_size_bytes = int(max_size_gb * 1024 ** 3)
+            if self._evict(self.max_size_bytes)[0]:
+                self._save_json(self.index_file, self._index)
+
+    def make_key(self, entries: List[Tuple[str, str]], params: Dict[str, Any]) -> Optional[str]:
+        """
+        Build the cache key for an archive.
+
+        Args:
+            entries: List of (data_relative_path, file_path) tuples
+            params: Build parameters (game type, flags, backend version, ...)
+
+        Returns:
+            Hex key, or None if a file could not be digested
+        """
+        hash_obj = hashlib.sha256()
+        hash_obj.update(json.dumps(params, sort_keys=True).encode('utf-8'))
+        for rel_path, file_path in sorted(entries, key=lambda item: item[0].lower()):
+            digest = self.file_digest(file_path, rel_path)
+            if not digest:
+                return None
+            hash_obj.update(rel_path.replace('\\', '/').lower().encode('utf-8'))
+            hash_obj.update(b'\0')
+            hash_obj.update(digest.encode('ascii'))
+            hash_obj.update(b'\n')
+        return hash_obj.hexdigest()
+
+    def restore(self, key: str, target_for_index: Callable[[int], str]) -> Optional[List[str]]:
+        """
+        Restore cached archives for key.
+
+        Args:
+            key: Cache key
+            target_for_index: Maps archive index (0 = main archive, 1.. = chunks) to output path
+
+        Returns:
+            List of restored archive paths, or None on a miss
+        """
+        with self._lock:
+            entry = self._index['entries'].get(key)
+            if not entry:
+                self._index['misses'] = self._index.get('misses', 0) + 1
+                return None
+
+        entry_dir = os.path.join(self.objects_dir, key)
+        restored = []
+        try:
+            for index, name in enumerate(entry['archives']):
+                target = target_for_index(index)
+                clone_file(os.path.join(entry_dir, name), target)
+                restored.append(target)
+        except Exception as e:
+            log(f"⚠️ Archive cache entry unusable, discarding: {e}", log_type='WARNING')
+            for path in restored:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            with self._lock:
+                self._remove_entry(key)
+                self._index['misses'] = self._index.get('misses', 0) + 1
+                self._save_json(self.index_file, self._index)
+            return None
+
+        with self._lock:
+            entry['last_used'] = time.time()
+            entry['hits'] = entry.get('hits', 0) + 1
+            self._index['hits'] = self._index.get('hits', 0) + 1
+            self._save_json(self.index_file, self._index)
+
+        log(f"♻️ Archive cache hit: {len(restored)} archive(s) restored ({format_bytes(entry['size'])})", log_type='INFO')
+        return restored
+
+    def store(self, key: str, archives: List[str]) -> None:
+        """
+        Store built archives under key.
+
+        Args:
+            key: Cache key
+            archives: Archive paths in index order
+        """
+        total_size = sum(os.path.getsize(path) for path in archives)
+        if total_size > self.max_size_bytes:
+            log(f"📦 Archive set ({format_bytes(total_size)}) exceeds cache limit, not cached", log_type='DEBUG')
+            return
+
+        entry_dir = os.path.join(self.objects_dir, key)
+        tmp_dir = f"{entry_dir}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(tmp_dir, exist_ok=True)
+            names = []
+            for index, path in enumerate(archives):
+                name = f"{index}{os.path.splitext(path)[1].lower()}"
+                clone_file(path, os.path.join(tmp_dir, name))
+                names.append(name)
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            os.replace(tmp_dir, entry_dir)
+        except Exception as e:
+            log(f"⚠️ Failed to store archives in cache: {e}", log_type='WARNING')
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            return
+
+        now = time.time()
+        with self._lock:
+            self._index['entries'][key] = {
+                'archives': names,
+                'size': total_size,
+                'created': now,
+                'last_used': now,
+                'hits': 0
+            }
+            self._evict(self.max_size_bytes)
+            self._save_json(self.index_file, self._index)
+
+        log(f"💾 Cached {len(archives)} archive(s) ({format_bytes(total_size)})", log_type='DEBUG')
+
+    def _remove_entry(self, key: str) -> None:
+        """Remove an entry and its files (caller holds the lock)."""
+        self._index['entries'].pop(key, None)
+        shutil.rmtree(os.path.join(self.objects_dir, key), ignore_errors=True)
+
+    def _evict(self, max_size_bytes: int) -> Tuple[int, int]:
+        """
+        Evict least-recently-used entries until the cache fits (caller holds the lock).
+
+        Returns:
+            Tuple of (entries_removed, bytes_freed)
+        """
+        entries = self._index['entries']
+        total = sum(entry['size'] for entry in entries.values())
+        removed = 0
+        freed = 0
+        for key in sorted(entries, key=lambda k: entries[k].get('last_used', 0)):
+            if total <= max_size_bytes:
+                break
+            size = entries[key]['size']
+            self._remove_entry(key)
+            total -= size
+            freed += size
+            removed += 1
+        if removed:
+            log(f"🧹 Archive cache evicted {removed} entr{'y' if removed == 1 else 'ies'} ({format_bytes(freed)})", log_type='DEBUG')
+        return removed, freed
+
+    def prune(self, max_size_gb: Optional[float] = None) -> Tuple[int, int]:
+        """
+        Evict entries until the cache fits a size limit, and drop stale file digests.
+
+        Args:
+            max_size_gb: Size limit in GB (defaults to the configured limit, 0 clears the cache)
+
+        Returns:
+            Tuple of (entries_removed, bytes_freed)
+        """
+        limit = self.max_size_bytes if max_size_gb is None else int(max_size_gb * 1024 ** 3)
+        with self._lock:
+            result = self._evict(limit)
+            self._drop_stale_digests()
+
+            # Remove object directories no longer referenced by the index (interrupted stores)
+            for name in os.listdir(self.objects_dir):
+                if name not in self._index['entries']:
+                    shutil.rmtree(os.path.join(self.objects_dir, name), ignore_errors=True)
+
+            self._save_json(self.index_file, self._index)
+            self._save_json(self.digest_file, {'version': DIGEST_FORMAT_VERSION, 'digests': self._digests})
+            self._digests_dirty = False
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with entry count, sizes and hit/miss counters
+        """
+        with self._lock:
+            entries = self._index['entries']
+            return {
+                'cache_dir': self.cache_dir,
+                'entries': len(entries),
+                'total_size': sum(entry['size'] for entry in entries.values()),
+                'max_size': self.max_size_bytes,
+                'hits': self._index.get('hits', 0),
+                'misses': self._index.get('misses', 0),
+                'tracked_digests': len(self._digests)
+            }
+
+
+# Global cache instance
+_archive_cache = None
+
+
+def get_archive_cache() -> ArchiveCache:
+    """Get global archive cache instance."""
+    global _archive_cache
+    if _archive_cache is None:
+        _archive_cache = ArchiveCache()
+    return _archive_cache
+
+
+@atexit.register
+def _save_archive_cache_digests() -> None:
+    """Write digests learned by runs that never called save_digests()."""
+    if _archive_cache is not None:
+        _archive_cache.save_digests()
@@ -0,0 +1,283 @@
+"""
+Archive Job Executor
+
+Runs independent archive builds (texture/main archives, BSA chunks) concurrently.
+Output names are fixed when a job is created, results are returned in submission
+order, and a failing job cancels the remaining ones and removes the archives
+they wrote. Files already at an output path are kept unless a job replaced them,
+and archives reused from an earlier build (mark_reused) are never removed.
+
+Executors nest (batch mods, then texture/main archives, then chunks), so the
+BSArch processes themselves are limited by one process-wide set of slots. Its
+size comes from SRP_MAX_PARALLEL_ARCHIVES, --max-parallel-archives or the
+max_parallel_archives argument of ArchiveCreator/PackageBuilder/BatchModRepacker
+(set_max_parallel_archives); the outermost executor of a build forgets the
+reused archives it protected once it finishes.
+"""
+
+import os
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Iterator, List, Optional, Tuple
+from .dynamic_progress import log
+
+
+# BSArch is already multi-threaded (-mt), so a couple of overlapping builds is
+# enough to fill the cores it leaves idle during its I/O phases.
+DEFAULT_MAX_PARALLEL_ARCHIVES = 2
+MAX_PARALLEL_ARCHIVES_ENV_VAR = "SRP_MAX_PARALLEL_ARCHIVES"
+
+
+def _limit_from_env() -> int:
+    """Process-wide archive limit from $SRP_MAX_PARALLEL_ARCHIVES, else the default."""
+    try:
+        return max(1, int(os.environ.get(MAX_PARALLEL_ARCHIVES_ENV_VAR, '')))
+    except ValueError:
+        return DEFAULT_MAX_PARALLEL_ARCHIVES
+
+
+# Running BSArch processes across all executors of this process
+_build_slots = {'limit': _limit_from_env(), 'active': 0}
+_build_slots_changed = threading.Condition()
+
+# Archives reused from an earlier build: path -> (size, mtime_ns) when reused
+MAX_TRACKED_REUSED = 1024
+_reused_archives = {}
+_reused_lock = threading.Lock()
+
+
+def mark_reused(path: str) -> None:
+    """
+    Protect an archive reused from an earlier build from failure cleanup.
+
+    Nested executors report reused chunks as created archives of the enclosing
+    job, so the protection is process-wide. It lapses once the file changes.
+
+    Args:
+        path: Reused archive
+    """
+    with _reused_lock:
+        if len(_reused_archives) >= MAX_TRACKED_REUSED:
+            # Entries left behind by failed nested builds: keep only files that are unchanged
+            for stale in [p for p, identity in _reused_archives.items() if _file_identity(p) != identity]:
+                del _reused_archives[stale]
+        _reused_archives[os.path.abspath(path)] = _file_identity(path)
+
+
+def _forget_reused(paths: List[str]) -> None:
+    """Drop the protection of archives once the build that reused them is over."""
+    with _reused_lock:
+        for path in paths:
+            _reused_archives.pop(os.path.abspath(path), None)
+
+
+def set_max_parallel_archives(limit: int) -> None:
+    """
+    Set how many BSArch processes may run at once in this process.
+
+    Args:
+        limit: Maximum concurrent archive builds (at least 1)
+    """
+    with _build_slots_changed:
+        _build_slots['limit'] = max(1, int(limit))
+        _build_slots_changed.notify_all()
+
+
+def get_max_parallel_archives() -> int:
+    """Get the process-wide archive build limit."""
+    return _build_slots['limit']
+
+
+def _is_reused(path: str) -> bool:
+    """Whether path still holds an archive passed to mark_reused."""
+    with _reused_lock:
+        identity = _reused_archives.get(os.path.abspath(path))
+    return identity is not None and identity == _file_identity(path)
+
+
+@contextmanager
+def archive_build_slot(cancel_event: Optional[threading.Event] = None) -> Iterator[bool]:
+    """
+    Hold one of the process-wide archive build slots while BSArch runs.
+
+    Args:
+        cancel_event: Event that stops waiting for a slot when set
+
+    Yields:
+        True with a slot held, False if cancelled while waiting
+    """
+    with _build_slots_changed:
+        while _build_slots['active'] >= _build_slots['limit']:
+            if cancel_event is not None and cancel_event.is_set():
+                acquired = False
+                break
+            _build_slots_changed.wait(0.25)
+        else:
+            acquired = True
+            _build_slots['active'] += 1
+    if not acquired:
+        yield False
+        return
+    try:
+        yield True
+    finally:
+        with _build_slots_changed:
+            _build_slots['active'] -= 1
+            _build_slots_changed.notify()
+
+
+class _ChildCancelEvent(threading.Event):
+    """Cancel event of a nested executor that also reports its parent's cancellation."""
+
+    def __init__(self, parent: threading.Event):
+        super().__init__()
+        self.parent = parent
+
+    def is_set(self) -> bool:
+        return super().is_set() or self.parent.is_set()
+
+
+class ArchiveJob:
+    """A single archive build with a deterministic output path."""
+
+    def __init__(self,
+                 name: str,
+                 output_path: str,
+                 build: Callable[[threading.Event], Tuple[bool, str, List[str]]]):
+        """
+        Initialize archive job.
+
+        Args:
+            name: Human readable job name (used in log messages)
+            output_path: Primary archive path this job writes
+            build: Callable receiving the shared cancel event and returning
+                   (success, message, created_archives)
+        """
+        self.name = name
+        self.output_path = output_path
+        self.build = build
+        self.success = False
+        self.message = ""
+        self.created_archives: List[str] = []
+        self.cancelled = False
+        self.started = False
+        self.output_identity = None  # (size, mtime_ns) of a file already at output_path when started
+
+
+class ArchiveJobExecutor:
+    """Executes archive jobs concurrently with cancel-on-failure semantics."""
+
+    def __init__(self, max_parallel: Optional[int] = None, cancel_event: Optional[threading.Event] = None):
+        """
+        Initialize executor.
+
+        Args:
+            max_parallel: Maximum number of archives built at once
+                          (defaults to the process-wide limit)
+            cancel_event: Cancel event of an enclosing job; setting it cancels these jobs too
+        """
+        self.max_parallel = max(1, max_parallel or get_max_parallel_archives())
+        self.nested = cancel_event is not None
+        self.cancel_event = _ChildCancelEvent(cancel_event) if self.nested else threading.Event()
+
+    def run(self, jobs: List[ArchiveJob]) -> Tuple[bool, str, List[str]]:
+        """
+        Run jobs and collect their archives.
+
+        Args:
+            jobs: Jobs to execute
+
+        Returns:
+            Tuple of (success: bool, message: str, created_archives: List[str]),
+            archives ordered by job submission order
+        """
+        if not jobs:
+            return True, "No archive jobs to run", []
+
+        try:
+            return self._run(jobs)
+        finally:
+            if not self.nested:
+                # Nested executors report reused chunks up to here; nothing above needs the protection
+                _forget_reused([path for job in jobs for path in job.created_archives + [job.output_path]])
+
+    def _run(self, jobs: List[ArchiveJob]) -> Tuple[bool, str, List[str]]:
+        """Run jobs (see run())."""
+        if len(jobs) == 1 or self.max_parallel == 1:
+            for job in jobs:
+                self._run_job(job)
+                if not job.success and not job.cancelled:
+                    self.cancel_event.set()
+        else:
+            workers = min(self.max_parallel, len(jobs))
+            log(f"⚙️ Building {len(jobs)} archives with up to {workers} in parallel", log_type='DEBUG')
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="archive_job") as executor:
+                futures = {executor.submit(self._run_job, job): job for job in jobs}
+                for future in as_completed(futures):
+                    job = futures[future]
+                    if future.cancelled():
+                        job.cancelled = True
+                    elif not job.success and not job.cancelled and not self.cancel_event.is_set():
+                        log(f"🛑 {job.name} failed - cancelling remaining archive jobs", log_type='WARNING')
+                        self.cancel_event.set()
+                        for other in futures:
+                            other.cancel()
+
+        failed = [job for job in jobs if not job.success and not job.cancelled]
+        if failed or self.cancel_event.is_set():
+            self._cleanup(jobs)
+            first = failed[0] if failed else next(job for job in jobs if not job.success)
+            log(f"❌ Archive build failed ({first.name}), removed outputs of {len(jobs)} job(s)", log_type='ERROR')
+            return False, f"{first.name}: {first.message}", []
+
+        created_archives = []
+        for job in jobs:
+            created_archives.extend(job.created_archives)
+        return True, f"Built {len(jobs)} archive job(s)", created_archives
+
+    def _run_job(self, job: ArchiveJob) -> None:
+        """Run one job, recording its outcome on the job object."""
+        if self.cancel_event.is_set():
+            job.cancelled = True
+            job.message = "Cancelled"
+            return
+
+        job.started = True
+        job.output_identity = _file_identity(job.output_path)
+        try:
+            job.success, job.message, archives = job.build(self.cancel_event)
+            job.created_archives = list(archives or [])
+        except Exception as e:
+            job.success = False
+            job.message = f"Archive job raised: {e}"
+
+        if not job.success and self.cancel_event.is_set():
+            # Failure caused by a cancellation triggered by another job
+            job.cancelled = True
+
+    def _cleanup(self, jobs: List[ArchiveJob]) -> None:
+        """Remove archives written by any job of a failed run."""
+        for job in jobs:
+            if not job.started:
+                continue
+            paths = set(job.created_archives)
+            # A failed job may have written its output without reporting it
+            if job.output_path and _file_identity(job.output_path) != job.output_identity:
+                paths.add(job.output_path)
+            for path in paths:
+                if path and os.path.exists(path) and not _is_reused(path):
+                    try:
+                        os.remove(path)
+                        log(f"🧹 Removed partial archive: {os.path.basename(path)}", log_type='DEBUG')
+                    except OSError as e:
+                        log(f"⚠️ Failed to remove partial archive {path}: {e}", log_type='WARNING')
+
+
+def _file_identity(path: str) -> Optional[Tuple[int, int]]:
+    """(size, mtime_ns) of a file, None if it does not exist."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
@@ -0,0 +1,214 @@
+"""
+Background Deletion of Temp Trees
+
+Deleting a multi-GB temp tree file by file can take minutes. discard()
+renames the tree to a tombstone next to it, which is a single O(1) rename,
+and deletes the tombstone on a background thread with parallel unlinks. At
+interpreter exit any unfinished tombstones are handed to a detached process,
+so the CLI returns immediately, unless waiting was requested (CI machines
+that need the disk back).
+"""
+
+import os
+import sys
+import uuid
+import atexit
+import shutil
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+from .dynamic_progress import log
+
+
+TOMBSTONE_PREFIX = "srp_trash_"
+WAIT_ENV_VAR = "SRP_WAIT_CLEANUP"
+DEFAULT_UNLINK_WORKERS = 8
+
+# Script run by the detached deletion process
+_DETACHED_DELETE = "import shutil, sys\nfor path in sys.argv[1:]:\n    shutil.rmtree(path, ignore_errors=True)\n"
+
+
+def remove_tree_parallel(path: str, workers: int = DEFAULT_UNLINK_WORKERS) -> int:
+    """
+    Delete a directory tree, unlinking files in parallel.
+
+    Args:
+        path: Directory to delete
+        workers: Number of unlink threads
+
+    Returns:
+        Number of files removed
+    """
+    files = []
+    dirs = []
+    for root, dirnames, filenames in os.walk(path):
+        dirs.append(root)
+        files.extend(os.path.join(root, name) for name in filenames)
+        # Links to directories are removed as links, never followed
+        files.extend(os.path.join(root, name) for name in dirnames if os.path.islink(os.path.join(root, name)))
+
+    def unlink(file_path):
+        try:
+            os.unlink(file_path)
+            return 1
+        except OSError:
+            return 0
+
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            removed = sum(pool.map(unlink, files, chunksize=256))
+    except RuntimeError:
+        # Interpreter shutting down: no new worker threads
+        removed = sum(map(unlink, files))
+
+    for directory in reversed(dirs):
+        try:
+            os.rmdir(directory)
+        except OSError:
+            pass
+    if os.path.exists(path):
+        shutil.rmtree(path, ignore_errors=True)
+    return removed
+
+
+class BackgroundDeleter:
+    """Deletes discarded trees off the caller's thread."""
+
+    def __init__(self, workers: int = DEFAULT_UNLINK_WORKERS, wait_at_exit: Optional[bool] = None):
+        """
+        Initialize background deleter.
+
+        Args:
+            workers: Parallel unlinks per tree
+            wait_at_exit: Block interpreter exit until deletions finish
+                          (defaults to $SRP_WAIT_CLEANUP)
+        """
+        if wait_at_exit is None:
+            wait_at_exit = os.environ.get(WAIT_ENV_VAR, '').lower() in ('1', 'true', 'yes')
+        self.workers = workers
+        self.wait_at_exit = wait_at_exit
+        self._pending = {}  # tombstone -> thread
+        self._lock = threading.Lock()
+
+    def discard(self, path: str) -> Optional[str]:
+        """
+        Make a tree disappear now and delete it in the background.
+
+        Args:
+            path: Directory to delete
+
+        Returns:
+            Tombstone path being deleted, or None if path didn't exist
+        """
+        if not os.path.lexists(path):
+            return None
+        if not os.path.isdir(path) or os.path.islink(path):
+            os.remove(path)
+            return None
+
+        path = os.path.abspath(path)
+        tombstone = os.path.join(os.path.dirname(path), f"{TOMBSTONE_PREFIX}{uuid.uuid4().hex[:12]}")
+        try:
+            os.rename(path, tombstone)
+        except OSError as e:
+            # Open handles (Windows) can block the rename; delete in place instead
+            log(f"⚠️ Could not move {path} aside ({e}), deleting it in the background in place", log_type='DEBUG')
+            tombstone = path
+
+        thread = threading.Thread(target=self._delete, args=(tombstone,), name="srp-delete", daemon=True)
+        with self._lock:
+            self._pending[tombstone] = thread
+        try:
+            thread.start()
+        except RuntimeError:
+            # Interpreter shutting down: shutdown() finishes or hands off the tombstone
+            with self._lock:
+                self._pending[tombstone] = None
+        return tombstone
+
+    def _delete(self, tombstone: str) -> None:
+        """Delete one tombstone."""
+        try:
+            removed = remove_tree_parallel(tombstone, self.workers)
+            log(f"🧹 Background cleanup removed {removed} files", log_type='DEBUG')
+        except Exception as e:
+            log(f"⚠️ Background cleanup of {tombstone} failed: {e}", log_type='WARNING')
+        finally:
+            with self._lock:
+                self._pending.pop(tombstone, None)
+
+    def pending(self) -> List[str]:
+        """Tombstones still being deleted."""
+        with self._lock:
+            return list(self._pending)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for background deletions to finish.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if nothing is pending anymore
+        """
+        with self._lock:
+            pending = list(self._pending.items())
+        for tombstone, thread in pending:
+            if thread is None:
+                self._delete(tombstone)
+            else:
+                thread.join(timeout)
+        return not self.pending()
+
+    def shutdown(self) -> None:
+        """Finish or hand off pending deletions before the interpreter exits."""
+        if self.wait_at_exit:
+            if self.pending():
+                log(f"🧹 Waiting for {len(self.pending())} background cleanup(s) to finish...", log_type='INFO')
+            self.wait()
+            return
+
+        pending = self.pending()
+        if pending:
+            _spawn_detached_delete(pending)
+
+
+def _spawn_detached_delete(paths: List[str]) -> None:
+    """Delete paths in a process that outlives this one."""
+    kwargs = {'stdin': subprocess.DEVNULL, 'stdout': subprocess.DEVNULL, 'stderr': subprocess.DEVNULL, 'close_fds': True}
+    if os.name == 'nt':
+        kwargs['creationflags'] = subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+    else:
+        kwargs['start_new_session'] = True
+    try:
+        subprocess.Popen([sys.executable, '-c', _DETACHED_DELETE, *paths], **kwargs)
+    except OSError:
+        pass  # Tombstones are swept by the next run
+
+
+# Global deleter instance
+_background_deleter = None
+_deleter_lock = threading.Lock()
+
+
+def get_background_deleter() -> BackgroundDeleter:
+    """Get global background deleter instance."""
+    global _background_deleter
+    with _deleter_lock:
+        if _background_deleter is None:
+            _background_deleter = BackgroundDeleter()
+        return _background_deleter
+
+
+def set_wait_at_exit(wait: bool) -> None:
+    """Choose whether interpreter exit waits for background deletions."""
+    get_background_deleter().wait_at_exit = wait
+
+
+@atexit.register
+def _shutdown_background_deleter() -> None:
+    """Finish or hand off background deletions at interpreter exit."""
+    if _background_deleter is not None:
+        _background_deleter.shutdown()
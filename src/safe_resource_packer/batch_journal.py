@@ -0,0 +1,243 @@
+"""
+Batch Repack Journal
+
+Write-ahead journal of per-mod batch state (pending, in progress, done,
+failed) kept next to the repacked packages. Every transition is appended and
+fsynced before the work it describes, so after a crash, Ctrl+C or OOM kill a
+resumed run knows which packages are finished and which temp directories and
+half-written packages belong to the interrupted run. Runs record their pid
+and host, so leftovers of a run that is still alive are never collected.
+"""
+
+import os
+import json
+import glob
+import time
+import uuid
+import socket
+import threading
+from typing import Any, Dict, Optional, Tuple
+from .dynamic_progress import log
+from .scratch import get_scratch_manager, RUN_PREFIX, _pid_alive
+from .background_delete import get_background_deleter
+
+
+JOURNAL_FORMAT_VERSION = 1
+JOURNAL_FILE_NAME = ".srp_batch_journal.jsonl"
+TEMP_PREFIX = "batch_repack_"
+
+MOD_PENDING = 'pending'
+MOD_IN_PROGRESS = 'in_progress'
+MOD_DONE = 'done'
+MOD_FAILED = 'failed'
+
+
+class BatchJournal:
+    """Append-only journal of one output directory's batch runs."""
+
+    def __init__(self, output_path: str):
+        """
+        Initialize journal and replay the previous run.
+
+        Args:
+            output_path: Directory the packages are written to
+        """
+        self.output_path = output_path
+        self.journal_file = os.path.join(output_path, JOURNAL_FILE_NAME)
+        self.run_id = None
+        self.mods = {}
+        self._lock = threading.Lock()
+        self._file = None
+        self.previous_runs, self.previous_mods = self._replay()
+
+    def _replay(self) -> Tuple[list, Dict[str, Dict[str, Any]]]:
+        """
+        Read the journal left by earlier runs.
+
+        Returns:
+            Tuple of (run records, {mod_key: merged state entry})
+        """
+        runs = []
+        mods = {}
+        try:
+            with open(self.journal_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue  # Torn write at the moment of the crash
+                    if record.get('type') == 'run':
+                        if record.get('version') != JOURNAL_FORMAT_VERSION:
+                            return [], {}
+                        runs.append(record)
+                    elif record.get('type') == 'mod':
+                        mods.setdefault(record['mod'], {}).update(record)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            log(f"⚠️ Failed to read batch journal: {e}", log_type='WARNING')
+        return runs, mods
+
+    @staticmethod
+    def mod_key(mod_path: str) -> str:
+        """Journal key of a mod folder."""
+        return os.path.normcase(os.path.abspath(mod_path))
+
+    def start(self, collection_path: str, resume: bool = False) -> int:
+        """
+        Begin a new run: clean up after interrupted runs and rewrite the journal.
+
+        Args:
+            collection_path: Collection being repacked
+            resume: Carry finished mods of the previous run over to this one
+
+        Returns:
+            Number of leftovers of interrupted runs removed
+        """
+        removed = self.collect_garbage()
+
+        self.run_id = uuid.uuid4().hex[:12]
+        self.mods = {key: entry for key, entry in self.previous_mods.items()
+                     if resume and entry.get('state') == MOD_DONE}
+
+        # Compact: the new journal starts with this run and the carried-over results
+        os.makedirs(self.output_path, exist_ok=True)
+        tmp_path = f"{self.journal_file}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps({'type': 'run', 'version': JOURNAL_FORMAT_VERSION, 'run_id': self.run_id,
+                                'collection': collection_path, 'started': time.time(), 'pid': os.getpid(),
+                                'host': socket.gethostname()}) + "\n")
+            for entry in self.mods.values():
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.journal_file)
+        self._file = open(self.journal_file, 'a', encoding='utf-8')
+
+        if resume and self.mods:
+            log(f"📒 Resuming batch: {len(self.mods)} mod(s) finished in the interrupted run", log_type='INFO')
+        return removed
+
+    def mark(self, mod_path: str, state: str, **fields) -> None:
+        """
+        Record a mod state transition (durable when this returns).
+
+        Args:
+            mod_path: Mod folder
+            state: One of MOD_PENDING, MOD_IN_PROGRESS, MOD_DONE, MOD_FAILED
+            **fields: Extra details (step, temp_dir, output, error, ...)
+        """
+        key = self.mod_key(mod_path)
+        record = {'type': 'mod', 'mod': key, 'state': state, 'time': time.time()}
+        record.update(fields)
+        with self._lock:
+            self.mods.setdefault(key, {}).update(record)
+            if self._file is None:
+                return
+            try:
+                self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+                self._file.flush()
+                os.fsync(self._file.fileno())
+            except Exception as e:
+                log(f"⚠️ Failed to write batch journal: {e}", log_type='WARNING')
+
+    def mark_done(self, mod_path: str, output: str) -> None:
+        """Record a finished mod together with the identity of its package."""
+        try:
+            stat = os.stat(output)
+        except OSError:
+            self.mark(mod_path, MOD_FAILED, error=f"Package missing: {output}")
+            return
+        self.mark(mod_path, MOD_DONE, output=output, size=stat.st_size, mtime_ns=stat.st_mtime_ns, temp_dir=None)
+
+    def finished_output(self, mod_path: str) -> Optional[str]:
+        """
+        Get the package of a mod finished in the resumed run, after verifying it.
+
+        Args:
+            mod_path: Mod folder
+
+        Returns:
+            Package path, or None if the mod has to be processed
+        """
+        with self._lock:
+            entry = self.mods.get(self.mod_key(mod_path))
+        if not entry or entry.get('state') != MOD_DONE or not entry.get('output'):
+            return None
+        try:
+            stat = os.stat(entry['output'])
+        except OSError:
+            return None
+        if stat.st_size != entry.get('size') or stat.st_mtime_ns != entry.get('mtime_ns'):
+            return None
+        return entry['output']
+
+    def temp_prefix(self, name: str) -> str:
+        """Prefix for a mod's temp directory, tagged with the run so orphans can be found."""
+        return f"{TEMP_PREFIX}{name}_{self.run_id}_"
+
+    def collect_garbage(self) -> int:
+        """
+        Remove temp directories and half-written packages of interrupted runs.
+
+        Runs whose process is still alive (another batch writing to the same
+        output directory) are left alone.
+
+        Returns:
+            Number of leftovers removed
+        """
+        live = [run for run in self.previous_runs if self._run_alive(run)]
+        for run in live:
+            log(f"⚠️ Batch run {run['run_id']} (pid {run.get('pid')}) is still writing to {self.output_path}; "
+                f"leaving its files alone", log_type='WARNING')
+
+        orphans = set()
+        for scratch_root in get_scratch_manager().roots:
+            for run in self.previous_runs:
+                if run in live:
+                    continue
+                pattern = f"{TEMP_PREFIX}*_{run['run_id']}_*"
+                orphans.update(glob.glob(os.path.join(scratch_root, pattern)))
+                orphans.update(glob.glob(os.path.join(scratch_root, f"{RUN_PREFIX}*", pattern)))
+
+        # Mod entries belong to the run that last rewrote the journal
+        for entry in ([] if live else self.previous_mods.values()):
+            if entry.get('state') in (MOD_DONE, MOD_FAILED):
+                continue
+            if entry.get('temp_dir'):
+                orphans.add(entry['temp_dir'])
+            # Packages are written in place; one interrupted mid-compression is truncated
+            if entry.get('step') == 'compress_package' and entry.get('output'):
+                orphans.add(entry['output'])
+
+        removed = 0
+        deleter = get_background_deleter()
+        for path in orphans:
+            if not os.path.exists(path):
+                continue
+            try:
+                deleter.discard(path)
+                removed += 1
+            except OSError:
+                continue
+
+        if removed:
+            log(f"🧹 Removed {removed} leftover(s) of an interrupted batch run", log_type='INFO')
+        return removed
+
+    @staticmethod
+    def _run_alive(run: Dict[str, Any]) -> bool:
+        """Whether a journaled run's process still exists (assumed for runs of other hosts)."""
+        pid = run.get('pid')
+        if pid is None or pid == os.getpid():
+            return False  # This process only starts a run after its previous one ended
+        if run.get('host', socket.gethostname()) != socket.gethostname():
+            return True
+        return _pid_alive(pid)
+
+    def close(self) -> None:
+        """Close the journal file."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
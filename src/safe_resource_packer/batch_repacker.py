@@ -28,13 +28,25 @@ ModCollection/
 import os
 import json
 import shutil
-import tempfile
+import threading
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional, Any
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Tuple, Optional, Any, Iterator
 from .dynamic_progress import log
-from .utils import safe_walk, sanitize_filename, check_disk_space, format_bytes
+from .utils import safe_walk, safe_walk_with_sizes, sanitize_filename, check_disk_space, format_bytes
 from .core import SafeResourcePacker
 from .packaging import PackageBuilder
+from .packaging.compression_profiles import DEFAULT_PROFILE
+from .packaging.compression_service import get_7z_thread_budget
+from .pipeline_scheduler import StagePipeline, PipelineStage
+from .job_cost_model import get_cost_model, DEFAULT_JOB_ORDER
+from .discovery_cache import DiscoveryCache
+from .build_records import BuildRecords, input_fingerprint, tool_versions
+from .batch_journal import BatchJournal, MOD_PENDING, MOD_IN_PROGRESS, MOD_FAILED
+from .archive_cache import get_archive_cache
+from .staging import StagingTree
+from .scratch import get_scratch_manager, QUOTA_WAIT_SECONDS
+from .progress_events import get_progress_events
 from .constants import is_unpackable_folder, get_packable_folders, get_unpackable_folders_from_list
 from .comprehensive_logging import (
     ComprehensiveLogger, log_batch_repack_start, log_batch_repack_end,
@@ -55,6 +67,7 @@ class ModInfo:
         self.game_type = game_type.lower()  # skyrim, fallout4, etc.
         self.asset_files = []
         self.asset_size = 0
+        self.texture_size = 0  # Bytes of texture (DDS) assets, used for cost estimates
         self.asset_categories = set()  # Categories of assets found
         self.available_plugins = []  # List of (path, type) tuples for multiple plugins
         self.available_folders = []  # List of asset folders found
@@ -66,6 +79,31 @@ class ModInfo:
             return f"ModInfo({self.mod_name}, {len(self.available_plugins)} plugins, {len(self.available_folders)} folders)"
 
 
+class ModRepackJob:
+    """State of one mod carried between the batch pipeline stages."""
+
+    def __init__(self, mod_info: ModInfo, output_path: str):
+        self.mod_info = mod_info
+        self.output_path = output_path
+        self.temp_dir = None
+        self.pack_dir = None
+        self.created_archives = []
+        self.esp_files = []
+        self.first_esp_names = {}  # Original plugin path -> name of the ESP it replaces
+        self.timing_id = None
+        self.fingerprint = None  # Input fingerprint for the build record
+        self.up_to_date = False  # Package already built from identical inputs
+
+    def cleanup(self):
+        """Remove the job's temporary directory."""
+        if self.temp_dir:
+            get_scratch_manager().release(self.temp_dir)
+        self.temp_dir = None
+
+    def __repr__(self):
+        return self.mod_info.mod_name
+
+
 class BatchModRepacker:
     """Handles batch repacking of mod collections."""
 
@@ -83,6 +121,17 @@ class BatchModRepacker:
         self.discovered_mods = []
         self.processed_mods = []
         self.failed_mods = []
+        self.last_pipeline = None
+        self.completion_times = {}  # Mod name -> (predicted, actual) completion seconds
+        self._known_game_dirs = None
+        self._discovery_cache = None
+        self._discovery_cache_lock = threading.Lock()
+        self.up_to_date_mods = []
+        self._build_records = {}
+        self._build_records_lock = threading.Lock()
+        self._tool_versions = None
+        self.journal = None
+        self.resumed_mods = []
 
         # Load configuration with flexible defaults
         self.config = self._load_config(config or {})
@@ -121,7 +170,39 @@ class BatchModRepacker:
             },
 
             # Compression settings
-            'compression_level': 3
+            'compression_level': 3,
+            'compression_profile': DEFAULT_PROFILE,
+
+            # BSArch processes running at once across all mods and chunks (None: process-wide default)
+            'max_parallel_archives': None,
+
+            # Pipeline stage limits: mods are staged, archived and compressed concurrently
+            'pipeline': {
+                'stage_workers': 1,      # Disk-bound asset copying
+                'archive_workers': 1,    # CPU-bound BSArch (LZ4/zlib) and ESP creation
+                'compress_workers': 1,   # CPU-bound 7z (LZMA)
+                'queue_size': 1          # Mods waiting between stages
+            },
+
+            # Processing order: 'lpt' (largest estimated cost first, shortest total time),
+            # 'small_first' (quick feedback) or 'discovery'
+            'job_order': DEFAULT_JOB_ORDER,
+
+            # Reuse discovery results for unchanged mod folders; the full digest also
+            # catches files edited in place (at the cost of a stat per file)
+            'discovery_cache': {
+                'enabled': True,
+                'full_digest': False
+            },
+
+            # Incremental rebuilds: skip mods whose inputs and output package are unchanged
+            'incremental': True,
+            'force': False,       # Rebuild every mod
+            'force_mods': [],     # Rebuild these mods (folder or plugin names)
+
+            # Crash safety: write-ahead journal in the output directory
+            'journal': True,
+            'resume': False       # Skip mods finished by an interrupted run
         }
 
         # Merge user config with defaults
@@ -348,40 +429,94 @@ class BatchModRepacker:
         Returns:
             List of ModInfo objects for discovered mods
         """
+        candidates = self._list_mod_folders(collection_path)
+        order = {path: index for index, path in enumerate(candidates)}
+
+        # Analysis runs in parallel; keep the folder listing order in the result
+        discovered = sorted(self.iter_discover_mods(collection_path, candidates),
+                            key=lambda mod_info: order.get(mod_info.mod_path, len(order)))
+
+        self.discovered_mods = discovered
+        log(f"🎯 Discovery complete: {len(discovered)} mods found", log_type='SUCCESS')
+        return discovered
+
+    def _list_mod_folders(self, collection_path: str) -> List[str]:
+        """
+        List candidate mod folders (first level subdirectories) of a collection.
+
+        Args:
+            collection_path: Path to folder containing mod subfolders
+
+        Returns:
+            List of folder paths
+        """
         log(f"🔍 Discovering mods in: {collection_path}", log_type='INFO')
-        discovered = []
 
         if not os.path.exists(collection_path) or not os.path.isdir(collection_path):
             log(f"❌ Collection path does not exist or is not a directory: {collection_path}", log_type='ERROR')
-            return discovered
+            return []
 
         try:
-            # Look for mod folders (first level subdirectories)
-            for item in os.listdir(collection_path):
-                item_path = os.path.join(collection_path, item)
+            return [os.path.join(collection_path, item) for item in os.listdir(collection_path)
+                    if os.path.isdir(os.path.join(collection_path, item))]
+        except Exception as e:
+            log(f"❌ Error discovering mods: {e}", log_type='ERROR')
+            return []
+
+    def iter_discover_mods(self, collection_path: str, candidates: Optional[List[str]] = None) -> Iterator[ModInfo]:
+        """
+        Analyze mod folders in parallel, yielding each mod as soon as it is ready.
+
+        Args:
+            collection_path: Path to folder containing mod subfolders
+            candidates: Mod folders to analyze (defaults to every subfolder)
 
-                if not os.path.isdir(item_path):
+        Yields:
+            ModInfo objects in completion order
+        """
+        if candidates is None:
+            candidates = self._list_mod_folders(collection_path)
+        if not candidates:
+            return
+
+        cache = self._get_discovery_cache()
+        hits_before = cache.hits if cache else 0
+        misses_before = cache.misses if cache else 0
+
+        executor = ThreadPoolExecutor(max_workers=max(1, min(self.threads, len(candidates))),
+                                      thread_name_prefix="mod_discovery")
+        futures = {executor.submit(self._analyze_mod_folder, path): path for path in candidates}
+        try:
+            for future in as_completed(futures):
+                try:
+                    mod_info = future.result()
+                except Exception as e:
+                    log(f"❌ Error discovering mods: {e}", log_type='ERROR')
                     continue
 
-                # Look for ESP/ESL/ESM files in this folder
-                mod_info = self._analyze_mod_folder(item_path)
                 if mod_info:
-                    discovered.append(mod_info)
-                    log(f"✅ Found mod: {mod_info.mod_name} ({mod_info.esp_type})", log_type='SUCCESS')
+                    # _build_mod_info already logged the find
+                    yield mod_info
                 else:
-                    log(f"⚠️  Skipped folder (no plugin found): {item}", log_type='WARNING')
-
-        except Exception as e:
-            log(f"❌ Error discovering mods: {e}", log_type='ERROR')
-
-        self.discovered_mods = discovered
-        log(f"🎯 Discovery complete: {len(discovered)} mods found", log_type='SUCCESS')
-        return discovered
+                    log(f"⚠️  Skipped folder (no plugin found): {os.path.basename(futures[future])}", log_type='WARNING')
+        finally:
+            # Consumer stopped early: drop folders that haven't been analyzed yet
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+            if cache:
+                cache.save()
+                hits, misses = cache.hits - hits_before, cache.misses - misses_before
+                if hits:
+                    log(f"⚡ Discovery cache: {hits} unchanged folder(s) reused, {misses} re-walked", log_type='INFO')
 
     def _analyze_mod_folder(self, mod_path: str) -> Optional[ModInfo]:
         """
         Analyze a single mod folder to extract information.
 
+        Unchanged folders are reloaded from the discovery cache instead of being walked.
+
         Args:
             mod_path: Path to mod folder
 
@@ -389,78 +524,146 @@ class BatchModRepacker:
             ModInfo object if valid mod found, None otherwise
         """
         try:
-            # Find ESP/ESL/ESM files
-            plugin_files = []
-            asset_files = []
-            asset_folders = set()
-            total_asset_size = 0
-
-            for root, dirs, files in safe_walk(mod_path, followlinks=False):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    file_lower = file.lower()
-
-                    # Check for plugin files
-                    for ext in self.config['plugin_extensions']:
-                        if file_lower.endswith(ext.lower()):
-                            plugin_type = ext[1:].upper()  # Remove dot and uppercase
-                            plugin_files.append((file_path, plugin_type))
-                            break
-                    else:
-                        # Check for asset files (anything that's not a plugin)
-                        if self._is_game_asset(file_lower):
-                            asset_files.append(file_path)
-                            try:
-                                total_asset_size += os.path.getsize(file_path)
-                            except OSError:
-                                pass
-
-                # Track only top-level game asset directories (not nested subfolders)
-                # Only check directories that are direct children of the mod root
-                if root == mod_path:
-                    for dir_name in dirs:
-                        # Check if this looks like a game asset directory by scanning its contents
-                        dir_path = os.path.join(root, dir_name)
-                        if self._is_game_asset_directory(dir_path):
-                            asset_folders.add(dir_path)
-
-            # Must have at least one plugin file
-            if len(plugin_files) == 0:
-                log(f"⚠️  No plugin file found in: {os.path.basename(mod_path)}", debug_only=True, log_type='WARNING')
-                return None
-
-            # Must have some assets to be worth repacking
-            if len(asset_files) == 0:
-                log(f"⚠️  No assets found in: {os.path.basename(mod_path)}", debug_only=True, log_type='WARNING')
-                return None
-
-            # Create ModInfo with all discovered information
-            mod_info = ModInfo(mod_path, game_type=self.game_type)
-            mod_info.available_plugins = plugin_files
-            mod_info.available_folders = list(asset_folders)
-            mod_info.asset_files = asset_files
-            mod_info.asset_size = total_asset_size
-
-            # If only one plugin, auto-select it
-            if len(plugin_files) == 1:
-                plugin_path, plugin_type = plugin_files[0]
-                mod_info.esp_file = plugin_path
-                mod_info.esp_name = os.path.splitext(os.path.basename(plugin_path))[0]
-                mod_info.esp_type = plugin_type
-                log(f"✅ Found mod: {mod_info.mod_name} ({plugin_type})", log_type='SUCCESS')
-            else:
-                log(f"🔍 Found mod with multiple plugins: {mod_info.mod_name} ({len(plugin_files)} plugins)", log_type='INFO')
-
-            # Simple categorization - just note that we have assets
-            if asset_files:
-                mod_info.asset_categories.add('assets')  # Simple: we have assets to pack
-
-            return mod_info
+            cache = self._get_discovery_cache()
+            fingerprint = None
+            context = f"{self.game_type}|{','.join(self.config['plugin_extensions'])}"
+            if cache:
+                fingerprint = cache.fingerprint(mod_path)
+                entry = cache.get(mod_path, fingerprint, context)
+                if entry is not None:
+                    return self._build_mod_info(mod_path, entry['mod'])
+
+            data = self._scan_mod_folder(mod_path)
+            if cache:
+                cache.put(mod_path, fingerprint, context, data)
+            return self._build_mod_info(mod_path, data)
 
         except Exception as e:
             log(f"❌ Error analyzing mod folder {mod_path}: {e}", debug_only=True, log_type='ERROR')
             return None
 
+    def _get_discovery_cache(self) -> Optional[DiscoveryCache]:
+        """Get this repacker's discovery cache (None if disabled)."""
+        cache_config = self.config.get('discovery_cache', {})
+        if not cache_config.get('enabled', True):
+            return None
+        with self._discovery_cache_lock:
+            if self._discovery_cache is None:
+                self._discovery_cache = DiscoveryCache(full_digest=cache_config.get('full_digest', False))
+            return self._discovery_cache
+
+    def _scan_mod_folder(self, mod_path: str) -> Optional[Dict[str, Any]]:
+        """
+        Walk a mod folder and collect its plugins, assets and asset folders.
+
+        Args:
+            mod_path: Path to mod folder
+
+        Returns:
+            Dictionary of mod-relative discovery data, None if the folder is not a repackable mod
+        """
+        # Find ESP/ESL/ESM files
+        plugin_files = []
+        asset_files = []
+        asset_folders = []
+        total_asset_size = 0
+        total_texture_size = 0
+
+        # One scandir pass provides sizes and which top-level folders hold assets directly
+        top_level_dirs = []
+        dirs_with_assets = set()
+
+        for root, dirs, files in safe_walk_with_sizes(mod_path):
+            rel_root = os.path.relpath(root, mod_path)
+            if rel_root == '.':
+                rel_root = ''
+                top_level_dirs = dirs
+            parent_is_root = bool(rel_root) and os.path.dirname(rel_root) == ''
+
+            for file, file_size in files:
+                rel_path = os.path.join(rel_root, file) if rel_root else file
+                file_lower = file.lower()
+
+                # Check for plugin files
+                for ext in self.config['plugin_extensions']:
+                    if file_lower.endswith(ext.lower()):
+                        plugin_type = ext[1:].upper()  # Remove dot and uppercase
+                        plugin_files.append((rel_path, plugin_type))
+                        break
+                else:
+                    # Check for asset files (anything that's not a plugin)
+                    if self._is_game_asset(file_lower):
+                        asset_files.append(rel_path)
+                        total_asset_size += file_size
+                        if file_lower.endswith('.dds'):
+                            total_texture_size += file_size
+                        if parent_is_root:
+                            dirs_with_assets.add(rel_root)
+
+        # Track only top-level game asset directories (not nested subfolders)
+        for dir_name in top_level_dirs:
+            dir_path = os.path.join(mod_path, dir_name)
+            if self._is_game_asset_directory(dir_path, has_asset_files=dir_name in dirs_with_assets):
+                asset_folders.append(dir_name)
+
+        # Must have at least one plugin file
+        if len(plugin_files) == 0:
+            log(f"⚠️  No plugin file found in: {os.path.basename(mod_path)}", debug_only=True, log_type='WARNING')
+            return None
+
+        # Must have some assets to be worth repacking
+        if len(asset_files) == 0:
+            log(f"⚠️  No assets found in: {os.path.basename(mod_path)}", debug_only=True, log_type='WARNING')
+            return None
+
+        return {
+            'plugins': plugin_files,
+            'assets': asset_files,
+            'folders': asset_folders,
+            'asset_size': total_asset_size,
+            'texture_size': total_texture_size
+        }
+
+    def _build_mod_info(self, mod_path: str, data: Optional[Dict[str, Any]]) -> Optional[ModInfo]:
+        """
+        Create a ModInfo from discovery data.
+
+        Args:
+            mod_path: Path to mod folder
+            data: Result of _scan_mod_folder (fresh or cached)
+
+        Returns:
+            ModInfo object, None if the folder is not a repackable mod
+        """
+        if data is None:
+            return None
+
+        plugin_files = [(os.path.join(mod_path, rel_path), plugin_type) for rel_path, plugin_type in data['plugins']]
+
+        # Create ModInfo with all discovered information
+        mod_info = ModInfo(mod_path, game_type=self.game_type)
+        mod_info.available_plugins = plugin_files
+        mod_info.available_folders = [os.path.join(mod_path, folder) for folder in data['folders']]
+        mod_info.asset_files = [os.path.join(mod_path, rel_path) for rel_path in data['assets']]
+        mod_info.asset_size = data['asset_size']
+        mod_info.texture_size = data['texture_size']
+
+        # If only one plugin, auto-select it
+        if len(plugin_files) == 1:
+            plugin_path, plugin_type = plugin_files[0]
+            mod_info.esp_file = plugin_path
+            mod_info.esp_name = os.path.splitext(os.path.basename(plugin_path))[0]
+            mod_info.esp_type = plugin_type
+            log(f"✅ Found mod: {mod_info.mod_name} ({plugin_type})", log_type='SUCCESS')
+        else:
+            log(f"🔍 Found mod with multiple plugins: {mod_info.mod_name} ({len(plugin_files)} plugins)", log_type='INFO')
+
+        # Simple categorization - just note that we have assets
+        if mod_info.asset_files:
+            mod_info.asset_categories.add('assets')  # Simple: we have assets to pack
+
+        return mod_info
+
     def _is_game_asset(self, filename: str) -> bool:
         """
         Check if a file should be packed as an asset.
@@ -489,22 +692,25 @@ class BatchModRepacker:
         # Everything else is an asset to pack
         return True
 
-    def _is_game_asset_directory(self, dir_path: str) -> bool:
+    def _is_game_asset_directory(self, dir_path: str, has_asset_files: Optional[bool] = None) -> bool:
         """
         Check if a directory contains game assets or is a known game asset directory.
         
         Args:
             dir_path: Path to directory to check
+            has_asset_files: Whether the directory directly holds asset files, if already
+                             known from a walk (None lists the directory)
             
         Returns:
             True if directory should be considered for packing/loose classification
         """
         dir_name = os.path.basename(dir_path).lower()
         
-        # Get comprehensive list of known game directories from game scanner
-        from .game_scanner import get_game_scanner
-        game_scanner = get_game_scanner()
-        known_game_dirs = game_scanner.fallback_directories
+        # Get comprehensive list of known game directories from game scanner (once per repacker)
+        if self._known_game_dirs is None:
+            from .game_scanner import get_game_scanner
+            self._known_game_dirs = get_game_scanner().fallback_directories
+        known_game_dirs = self._known_game_dirs
         
         # Check if directory name matches known game directories (case-insensitive)
         if dir_name in known_game_dirs:
@@ -514,6 +720,9 @@ class BatchModRepacker:
         if is_unpackable_folder(os.path.basename(dir_path), self.game_type):
             return True
             
+        if has_asset_files is not None:
+            return has_asset_files
+
         # Check if directory contains game asset files (shallow scan for performance)
         try:
             for item in os.listdir(dir_path):
@@ -573,13 +782,16 @@ class BatchModRepacker:
         log(f"   Source: {collection_path}", log_type='INFO')
         log(f"   Output: {output_path}", log_type='INFO')
 
-        # Use already discovered mods if available, otherwise discover them
-        if self.discovered_mods:
+        # Use already discovered mods if available, otherwise stream them from discovery
+        # into the pipeline so processing starts as soon as the first mod is analyzed
+        streaming = not self.discovered_mods
+        if not streaming:
             mods = self.discovered_mods
+            expected_total = len(mods)
             log(f"📋 Using {len(mods)} pre-discovered mods with user selections", log_type='INFO')
         else:
-            mods = self.discover_mods(collection_path)
-            if not mods:
+            candidates = self._list_mod_folders(collection_path)
+            if not candidates:
                 return {
                     'success': False,
                     'message': 'No valid mods found in collection',
@@ -587,21 +799,31 @@ class BatchModRepacker:
                     'failed': 0,
                     'total': 0
                 }
+            mods = []  # Filled as discovery yields mods
+            expected_total = len(candidates)
+            log(f"📡 Discovering {len(candidates)} folders while processing", log_type='INFO')
 
         # Check output directory
         os.makedirs(output_path, exist_ok=True)
 
-        # Check available disk space
-        total_size = sum(mod.asset_size for mod in mods)
-        has_space, available, required = check_disk_space(output_path, total_size * 3)  # 3x for temp files
-        if not has_space:
-            return {
-                'success': False,
-                'message': f'Insufficient disk space: need {format_bytes(required)}, have {format_bytes(available)}',
-                'processed': 0,
-                'failed': 0,
-                'total': len(mods)
-            }
+        # Journal per-mod state so an interrupted batch can be resumed and cleaned up
+        self.journal = None
+        if self.config.get('journal', True):
+            self.journal = BatchJournal(output_path)
+            self.journal.start(collection_path, resume=self.config.get('resume', False))
+
+        # Check available disk space (streamed mods are checked one by one as they arrive)
+        if not streaming:
+            total_size = sum(mod.asset_size for mod in mods)
+            has_space, available, required = check_disk_space(output_path, total_size * 3)  # 3x for temp files
+            if not has_space:
+                return {
+                    'success': False,
+                    'message': f'Insufficient disk space: need {format_bytes(required)}, have {format_bytes(available)}',
+                    'processed': 0,
+                    'failed': 0,
+                    'total': len(mods)
+                }
 
         # Initialize Dynamic Progress if requested
         dynamic_progress_active = False
@@ -609,53 +831,172 @@ class BatchModRepacker:
             try:
                 from .dynamic_progress import start_batch_progress, update_dynamic_progress, finish_dynamic_progress, is_dynamic_progress_enabled
                 if is_dynamic_progress_enabled():
-                    start_batch_progress(len(mods))
+                    start_batch_progress(expected_total)
                     dynamic_progress_active = True
             except ImportError:
                 pass
 
-        # Process each mod
-        self.processed_mods = []
-        self.failed_mods = []
+        # Machine-readable progress: one result per mod, counted against the expected total
+        events = get_progress_events()
+        events.stage_start('batch', expected_total, collection_path=collection_path)
+        reported = {'mods': 0}
+        reported_lock = threading.Lock()
 
-        for i, mod_info in enumerate(mods):
-            # Update progress with the active progress system
+        progress_results = {'success': 'success', 'failed': 'error'}  # Up to date and resumed count as skips
+
+        def report_mod(mod_info, status, **fields):
             if dynamic_progress_active:
-                try:
-                    from .dynamic_progress import update_dynamic_progress
-                    update_dynamic_progress(mod_info.mod_name, "success", "", increment=True)
-                except ImportError:
-                    pass
-            elif progress_callback:
-                progress_callback(i+1, len(mods), f"Processing {mod_info.mod_name}")
+                update_dynamic_progress(mod_info.mod_name, progress_results.get(status, 'skip'), "", increment=True)
+            events.mod_result(mod_info.mod_name, status, mod_path=mod_info.mod_path, **fields)
+            with reported_lock:
+                reported['mods'] += 1
+                done = reported['mods']
+            events.progress('batch', done, expected_total)
+
+        # Pipeline stage limits
+        pipeline_config = self.config.get('pipeline', {})
+        queue_size = pipeline_config.get('queue_size', 1)
+        compress_workers = pipeline_config.get('compress_workers', 1)
+        stage_workers = [
+            ('stage', pipeline_config.get('stage_workers', 1)),
+            ('archive', pipeline_config.get('archive_workers', 1)),
+            ('compress', compress_workers)
+        ]
+
+        # Order mods by estimated cost so the largest ones don't run alone at the end
+        cost_model = get_cost_model()
+        job_order = self.config.get('job_order', DEFAULT_JOB_ORDER)
+        if streaming:
+            mod_source = cost_model.stream_order(self.iter_discover_mods(collection_path, candidates), job_order)
+        else:
+            mods = cost_model.order(mods, job_order)
+            mod_source = mods
+            predicted_completion = cost_model.simulate(mods, stage_workers)
+            if mods:
+                log(f"🧮 Job order '{job_order}': predicted batch time {max(predicted_completion.values()):.0f}s", log_type='INFO')
 
-            try:
-                log(f"📦 Processing mod {i+1}/{len(mods)}: {mod_info.mod_name}", log_type='INFO')
+        # Process mods through the stage pipeline
+        self.processed_mods = []
+        self.failed_mods = []
+        self.up_to_date_mods = []
+        self.resumed_mods = []
+        self._tool_versions = None  # Re-identify BSArch/7z for every run
+
+        def mod_jobs():
+            for i, mod_info in enumerate(mod_source):
+                if streaming:
+                    mods.append(mod_info)
+
+                # Packages finished by the interrupted run are kept as long as they're intact
+                finished_output = self.journal.finished_output(mod_info.mod_path) if self.journal else None
+                if finished_output:
+                    self.resumed_mods.append((mod_info, finished_output))
+                    log(f"📒 Already finished before interruption: {mod_info.mod_name}", log_type='INFO')
+                    report_mod(mod_info, 'resumed', output=finished_output)
+                    continue
 
-                # Handle multiple plugins - only auto-select if user hasn't already chosen
-                if not mod_info.esp_file and mod_info.available_plugins:
-                    self.select_plugin_for_mod(mod_info, 0)  # Select first plugin
-                    log(f"🔧 Auto-selected plugin: {mod_info.esp_name}", log_type='INFO')
-                elif mod_info.esp_file:
-                    log(f"🔧 Using user-selected plugin: {mod_info.esp_name}", log_type='INFO')
+                if streaming:
+                    has_space, available, required = check_disk_space(output_path, mod_info.asset_size * 3)
+                    if not has_space:
+                        message = f'Insufficient disk space: need {format_bytes(required)}, have {format_bytes(available)}'
+                        self.failed_mods.append((mod_info, message))
+                        log(f"❌ Failed to process: {mod_info.mod_name} - {message}", log_type='ERROR')
+                        report_mod(mod_info, 'failed', error=message)
+                        continue
 
-                # Handle folder selection - auto-select all folders for now
-                if mod_info.available_folders:
-                    self.select_folders_for_mod(mod_info, None)  # Select all folders
-                    log(f"📁 Auto-selected {len(mod_info.available_folders)} asset folders", log_type='INFO')
+                # Dynamic progress advances when the mod finishes (see report_mod)
+                if progress_callback and not dynamic_progress_active:
+                    progress_callback(i+1, expected_total, f"Processing {mod_info.mod_name}")
 
-                success, result_path = self._batch_repack_process_single_mod(mod_info, output_path)
+                try:
+                    log(f"📦 Processing mod {i+1}/{expected_total}: {mod_info.mod_name}", log_type='INFO')
+
+                    # Handle multiple plugins - only auto-select if user hasn't already chosen
+                    if not mod_info.esp_file and mod_info.available_plugins:
+                        self.select_plugin_for_mod(mod_info, 0)  # Select first plugin
+                        log(f"🔧 Auto-selected plugin: {mod_info.esp_name}", log_type='INFO')
+                    elif mod_info.esp_file:
+                        log(f"🔧 Using user-selected plugin: {mod_info.esp_name}", log_type='INFO')
+
+                    # Handle folder selection - auto-select all folders for now
+                    if mod_info.available_folders:
+                        self.select_folders_for_mod(mod_info, None)  # Select all folders
+                        log(f"📁 Auto-selected {len(mod_info.available_folders)} asset folders", log_type='INFO')
+                except Exception as e:
+                    self.failed_mods.append((mod_info, str(e)))
+                    log(f"❌ Exception processing {mod_info.mod_name}: {e}", log_type='ERROR')
+                    report_mod(mod_info, 'failed', error=str(e))
+                    continue
 
-                if success:
-                    self.processed_mods.append((mod_info, result_path))
-                    log(f"✅ Successfully processed: {mod_info.mod_name}", log_type='SUCCESS')
-                else:
-                    self.failed_mods.append((mod_info, result_path))  # result_path contains error message
-                    log(f"❌ Failed to process: {mod_info.mod_name} - {result_path}", log_type='ERROR')
+                if self.journal:
+                    self.journal.mark(mod_info.mod_path, MOD_PENDING, name=mod_info.mod_name)
+                yield self._batch_repack_start_job(mod_info, output_path)
+
+        def mod_finished(job, success, result_path):
+            if success and job.up_to_date:
+                self.up_to_date_mods.append((job.mod_info, result_path))
+                log(f"⏭️ Up to date: {job.mod_info.mod_name}", log_type='INFO')
+                report_mod(job.mod_info, 'up_to_date', output=result_path)
+            elif success:
+                self.processed_mods.append((job.mod_info, result_path))
+                log(f"✅ Successfully processed: {job.mod_info.mod_name}", log_type='SUCCESS')
+                report_mod(job.mod_info, 'success', output=result_path)
+            else:
+                self.failed_mods.append((job.mod_info, result_path))  # result_path contains error message
+                log(f"❌ Failed to process: {job.mod_info.mod_name} - {result_path}", log_type='ERROR')
+                report_mod(job.mod_info, 'failed', error=result_path)
+
+        steps = {
+            'stage': self._batch_repack_stage_assets,
+            'archive': self._batch_repack_archive_assets,
+            'compress': self._batch_repack_compress_package
+        }
+        pipeline = StagePipeline([
+            PipelineStage(name, lambda job, step=steps[name]: self._batch_repack_run_step(job, step),
+                          workers=workers, queue_size=queue_size)
+            for name, workers in stage_workers
+        ], item_name=lambda job: job.mod_info.mod_name, on_finished=mod_finished)
 
-            except Exception as e:
-                self.failed_mods.append((mod_info, str(e)))
-                log(f"❌ Exception processing {mod_info.mod_name}: {e}", log_type='ERROR')
+        # Overlapping 7z runs split the machine's threads between them
+        try:
+            with get_7z_thread_budget().expect_concurrent(compress_workers):
+                pipeline.run(mod_jobs())
+        except Exception as e:
+            events.stage_end('batch', False, error=str(e))
+            raise
+        finally:
+            if self.journal:
+                self.journal.close()
+
+        self.last_pipeline = pipeline
+        for stage_name, stats in pipeline.utilization().items():
+            log(f"📊 Stage '{stage_name}': {stats['items']} mod(s), busy {stats['busy']:.1f}s, "
+                f"utilization {stats['utilization']:.0%}", log_type='INFO')
+        log(f"🧭 Pipeline trace:\n{pipeline.format_trace()}", log_type='DEBUG')
+
+        # Remember content digests so unchanged mods are fingerprinted from stat data next time
+        get_archive_cache().save_digests()
+
+        if streaming:
+            self.discovered_mods = mods
+            predicted_completion = cost_model.simulate(mods, stage_workers)
+
+        # Compare predictions with the trace and calibrate the cost model from successful mods
+        self.completion_times = {}
+        mods_by_name = {mod.mod_name: mod for mod in mods}
+        stage_seconds = {}
+        actual_completion = {}
+        for event in pipeline.trace:
+            stage_seconds.setdefault(event.item_name, {})[event.stage] = event.duration
+            actual_completion[event.item_name] = max(actual_completion.get(event.item_name, 0.0),
+                                                     event.end - pipeline.started_at)
+        for mod_info, _ in self.processed_mods:
+            cost_model.calibrate(mod_info, stage_seconds.get(mod_info.mod_name, {}))
+        if self.processed_mods:
+            cost_model.save()
+        for name in actual_completion:
+            if name in mods_by_name:
+                self.completion_times[name] = (predicted_completion.get(name, 0.0), actual_completion[name])
 
         # Finish Dynamic Progress if active
         if dynamic_progress_active:
@@ -691,24 +1032,42 @@ class BatchModRepacker:
             'failed_count': failed_count
         })
 
+        events.stage_end('batch', success, processed=processed_count, failed=failed_count,
+                         up_to_date=len(self.up_to_date_mods), resumed=len(self.resumed_mods), total=len(mods))
+
         log(f"🎉 Batch processing complete!", log_type='SUCCESS')
         log(f"   ✅ Successfully processed: {processed_count} mods", log_type='SUCCESS')
+        if self.up_to_date_mods:
+            log(f"   ⏭️ Up to date: {len(self.up_to_date_mods)} mods", log_type='INFO')
+        if self.resumed_mods:
+            log(f"   📒 Finished before interruption: {len(self.resumed_mods)} mods", log_type='INFO')
         log(f"   ❌ Failed: {failed_count} mods", log_type='ERROR' if failed_count > 0 else 'INFO')
 
         return {
             'success': True,
-            'message': f'Processed {processed_count}/{len(mods)} mods successfully',
+            'message': f'Processed {processed_count}/{len(mods)} mods successfully'
+                       + (f', {len(self.up_to_date_mods)} up to date' if self.up_to_date_mods else '')
+                       + (f', {len(self.resumed_mods)} resumed' if self.resumed_mods else ''),
             'processed': processed_count,
             'failed': failed_count,
             'total': len(mods),
             'processed_mods': self.processed_mods,
-            'failed_mods': self.failed_mods
+            'failed_mods': self.failed_mods,
+            'up_to_date': len(self.up_to_date_mods),
+            'up_to_date_mods': self.up_to_date_mods,
+            'resumed': len(self.resumed_mods),
+            'resumed_mods': self.resumed_mods,
+            'pipeline_utilization': pipeline.utilization(),
+            'completion_times': self.completion_times
         }
 
     def _batch_repack_process_single_mod(self, mod_info: ModInfo, output_path: str) -> Tuple[bool, str]:
         """
         Process a single mod during batch repacking.
 
+        Runs the stage, archive and compress steps back to back; the batch
+        pipeline runs the same steps with per-stage worker limits instead.
+
         Args:
             mod_info: ModInfo object with mod details
             output_path: Base output directory
@@ -716,7 +1075,16 @@ class BatchModRepacker:
         Returns:
             Tuple of (success, result_path_or_error_message)
         """
-        # Log single mod processing start
+        job = self._batch_repack_start_job(mod_info, output_path)
+        result = (False, "No stages run")
+        for step in (self._batch_repack_stage_assets, self._batch_repack_archive_assets, self._batch_repack_compress_package):
+            result = self._batch_repack_run_step(job, step)
+            if not result[0]:
+                break
+        return result
+
+    def _batch_repack_start_job(self, mod_info: ModInfo, output_path: str) -> ModRepackJob:
+        """Create the job carried through the processing steps of one mod."""
         self.logger.log_operation_start('Process Single Mod', {
             'mod_name': mod_info.mod_name,
             'esp_name': mod_info.esp_name,
@@ -725,333 +1093,476 @@ class BatchModRepacker:
             'asset_size': mod_info.asset_size
         })
 
-        timing_id = self.logger.start_timing('process_single_mod')
+        job = ModRepackJob(mod_info, output_path)
+        job.timing_id = self.logger.start_timing('process_single_mod')
+        return job
 
+    def _batch_repack_run_step(self, job: ModRepackJob, step) -> Tuple[bool, str]:
+        """
+        Run one processing step of a mod, finishing the job when it fails or completes.
+
+        Args:
+            job: Mod job
+            step: Step method taking the job and returning (success, message)
+
+        Returns:
+            Tuple of (success, message)
+        """
+        mod_info = job.mod_info
+        step_name = step.__name__.replace('_batch_repack_', '')
+        if self.journal and not job.up_to_date:
+            # Written ahead of the step: a crash leaves a record of what to clean up
+            self.journal.mark(mod_info.mod_path, MOD_IN_PROGRESS, step=step_name, temp_dir=job.temp_dir,
+                              output=self._batch_repack_package_path(mod_info, job.output_path))
         try:
-            # Create temporary directories for processing
-            with tempfile.TemporaryDirectory(prefix=f"batch_repack_{mod_info.esp_name}_") as temp_dir:
-                # Step 1: Classify files (all assets are "new" since we're repacking existing mods)
-                pack_dir = os.path.join(temp_dir, "pack")
-                os.makedirs(pack_dir, exist_ok=True)
-
-                # Apply folder selection if available
-                asset_files_to_process = mod_info.asset_files
-                if hasattr(mod_info, 'selected_folders') and mod_info.selected_folders:
-                    # Filter asset files to only include those from selected folders
-                    asset_files_to_process = []
-                    for asset_file in mod_info.asset_files:
-                        asset_dir = os.path.dirname(asset_file)
-                        if any(asset_dir.startswith(folder) for folder in mod_info.selected_folders):
-                            asset_files_to_process.append(asset_file)
-                    log(f"📁 Using {len(asset_files_to_process)} files from selected folders", debug_only=True, log_type='INFO')
-
-                # Copy selected asset files to pack directory
-                log(f"📋 Classifying {len(asset_files_to_process)} asset files...", debug_only=True, log_type='INFO')
-
-                for asset_file in asset_files_to_process:
-                    # Calculate relative path from mod root
-                    rel_path = os.path.relpath(asset_file, mod_info.mod_path)
-                    dest_path = os.path.join(pack_dir, rel_path)
-
-                    # Create destination directory
-                    os.makedirs(os.path.dirname(dest_path), exist_ok=True)
-
-                    # Copy file
-                    shutil.copy2(asset_file, dest_path)
-
-                # Step 2: Create BSA/BA2 archive from assets only
-                from .packaging.archive_creator import ArchiveCreator
-                archive_creator = ArchiveCreator(game_type=self.game_type)
-
-                # Recursively find all asset files
-                asset_files = []
-                for root, dirs, files in os.walk(pack_dir):
-                    for file in files:
-                        asset_files.append(os.path.join(root, file))
-
-                if not asset_files:
-                    return False, "No asset files found to pack"
-
-                # Create BSA/BA2 archive(s) with plugin name following game-specific rules
-                log(f"📦 Creating {self.game_type.upper()} archive(s): {mod_info.esp_name}", debug_only=True, log_type='INFO')
-
-                archive_success, archive_message, created_archives = archive_creator.create_game_specific_archives(
-                    asset_files, mod_info.esp_name, temp_dir
-                )
-
-                if not archive_success:
-                    return False, f"Archive creation failed: {archive_message}"
-
-                # Validate that the returned archives actually exist
-                if not created_archives:
-                    return False, "No archives were created"
-
-                # Verify all returned archives actually exist on disk
-                valid_archives = []
-                for archive_path in created_archives:
-                    if os.path.exists(archive_path):
-                        valid_archives.append(archive_path)
-                        log(f"🔍 Verified archive exists: {os.path.basename(archive_path)}", log_type='DEBUG')
-                    else:
-                        log(f"⚠️ Archive not found on disk: {archive_path}", log_type='WARNING')
-
-                # If no valid archives from returned list, try fallback discovery methods
-                if not valid_archives:
-                    log(f"⚠️ No valid archives from returned list, trying fallback discovery...", log_type='WARNING')
-
-                    # Fallback 1: Look for BSA/BA2 files in temp_dir (where ArchiveCreator creates them)
-                    archive_ext = ".ba2" if self.game_type == "fallout4" else ".bsa"
-
-                    for file in os.listdir(temp_dir):
-                        if file.startswith(mod_info.esp_name) and file.endswith(archive_ext):
-                            file_path = os.path.join(temp_dir, file)
-                            if os.path.exists(file_path):
-                                valid_archives.append(file_path)
-                                log(f"🔍 Found archive via fallback: {file}", log_type='DEBUG')
-
-                    # Fallback 2: Check if ArchiveCreator created them at the exact bsa_path
-                    if not valid_archives:
-                        bsa_path = os.path.join(temp_dir, f"{mod_info.esp_name}")
-                        expected_archive_path = bsa_path + archive_ext
-                        if os.path.exists(expected_archive_path):
-                            valid_archives.append(expected_archive_path)
-                            log(f"🔍 Found archive at expected path: {expected_archive_path}", log_type='DEBUG')
-                        else:
-                            # Fallback 3: Check if archive was created without extension (BSArch sometimes does this)
-                            expected_archive_path_no_ext = bsa_path
-                            if os.path.exists(expected_archive_path_no_ext):
-                                valid_archives.append(expected_archive_path_no_ext)
-                                log(f"🔍 Found archive without extension: {expected_archive_path_no_ext}", log_type='DEBUG')
-                            else:
-                                log(f"⚠️ No archives found in temp_dir: {temp_dir}", log_type='WARNING')
-                                log(f"🔍 Contents of temp_dir: {os.listdir(temp_dir)}", log_type='DEBUG')
-                                log(f"🔍 Expected archive path (with ext): {expected_archive_path}", log_type='DEBUG')
-                                log(f"🔍 Expected archive path (no ext): {expected_archive_path_no_ext}", log_type='DEBUG')
-                                return False, f"No archive files found for {mod_info.esp_name} in {temp_dir}"
-
-                created_archives = valid_archives
-
-                # Log created archives
-                if len(created_archives) == 1:
-                    log(f"✅ Created single archive: {os.path.basename(created_archives[0])} ({os.path.getsize(created_archives[0])} bytes)", debug_only=True, log_type='INFO')
-                else:
-                    log(f"✅ Created {len(created_archives)} chunked archives:", debug_only=True, log_type='INFO')
-                    total_size = 0
-                    for archive_path in created_archives:
-                        size = os.path.getsize(archive_path)
-                        total_size += size
-                        log(f"  • {os.path.basename(archive_path)} ({size} bytes)", debug_only=True, log_type='INFO')
-                    log(f"📊 Total chunked size: {total_size} bytes", debug_only=True, log_type='INFO')
-
-                # Step 3: Create template ESP files ONLY for additional chunks (if chunking occurred)
-                # The main plugin should remain original, but additional chunks need template ESPs
-                esp_files = []
-                
-                if len(created_archives) > 1:
-                    # Multiple archives = chunking occurred
-                    # Let ESPManager create all template ESPs, then replace the first one with original
-                    log(f"📄 Chunking detected: {len(created_archives)} archives created", log_type='INFO')
-                    
-                    from .packaging.esp_manager import ESPManager
-                    esp_manager = ESPManager()
-                    
-                    # Create template ESPs for all archives (including first one)
-                    esp_creation_success, esp_file_path = esp_manager.create_esp(
-                        mod_name=mod_info.esp_name,
-                        output_path=temp_dir,
-                        game_type=self.game_type,
-                        bsa_files=created_archives
-                    )
-                    
-                    if not esp_creation_success:
-                        log(f"ESP creation failed: {esp_file_path}", log_type='ERROR')
-                        return False, f"ESP creation failed: {esp_file_path}"
-                    
-                    # Find all ESP files that were created
-                    for archive_path in created_archives:
-                        archive_basename = os.path.basename(archive_path)
-                        esp_basename = os.path.splitext(archive_basename)[0] + ".esp"
-                        esp_path = os.path.join(temp_dir, esp_basename)
-                        if os.path.exists(esp_path):
-                            esp_files.append(esp_path)
-                    
-                    # Now replace the FIRST template ESP with the original plugin
-                    if esp_files:
-                        first_esp_path = esp_files[0]  # This corresponds to the first archive
-                        first_esp_name = os.path.basename(first_esp_path)
-                        
-                        # Find the original plugin file
-                        original_plugin_path = None
-                        for plugin_path, plugin_type in mod_info.available_plugins:
-                            if os.path.basename(plugin_path).lower() == f"{mod_info.esp_name}.esp".lower():
-                                original_plugin_path = plugin_path
-                                break
-                        
-                        if original_plugin_path and os.path.exists(original_plugin_path):
-                            # Replace template ESP with original plugin
-                            shutil.copy2(original_plugin_path, first_esp_path)
-                            log(f"📄 Replaced template ESP with original plugin: {first_esp_name}", log_type='INFO')
-                        else:
-                            log(f"⚠️ Original plugin not found, keeping template ESP: {first_esp_name}", log_type='WARNING')
-                    
-                    log(f"📄 Final ESP files: {len(esp_files)} (first is original, rest are templates)", log_type='INFO')
-                    
+            success, message = step(job)
+        except Exception as e:
+            self.logger.log_error(e, 'Process Single Mod', {
+                'mod_name': mod_info.mod_name,
+                'esp_name': mod_info.esp_name
+            })
+            success, message = False, str(e)
+
+        if not success:
+            self.logger.log_operation_end('Process Single Mod', False, message)
+            self.logger.end_timing(job.timing_id, False, {'error': message})
+            job.cleanup()
+            if self.journal:
+                self.journal.mark(mod_info.mod_path, MOD_FAILED, error=message, temp_dir=None)
+        elif step == self._batch_repack_compress_package:
+            self.logger.log_operation_end('Process Single Mod', True, {
+                'final_package_path': message,
+                'package_size': os.path.getsize(message) if os.path.exists(message) else 0
+            })
+            self.logger.end_timing(job.timing_id, True, {
+                'final_package_path': message
+            })
+            job.cleanup()
+            if self.journal:
+                self.journal.mark_done(mod_info.mod_path, message)
+
+        return success, message
+
+    def _batch_repack_stage_assets(self, job: ModRepackJob) -> Tuple[bool, str]:
+        """
+        Stage step (disk-bound): copy the selected asset files into the job's pack directory.
+
+        Args:
+            job: Mod job
+
+        Returns:
+            Tuple of (success, message)
+        """
+        mod_info = job.mod_info
+
+        # Skip mods whose package was built from identical inputs and hasn't been touched
+        records = self._get_build_records(job.output_path)
+        if records:
+            job.fingerprint = self._batch_repack_fingerprint(mod_info)
+            package_path = self._batch_repack_package_path(mod_info, job.output_path)
+            if not self._batch_repack_is_forced(mod_info) and records.is_up_to_date(package_path, job.fingerprint):
+                job.up_to_date = True
+                return True, package_path
+
+        # Step 1: Classify files (all assets are "new" since we're repacking existing mods)
+        # Scratch on the mod's filesystem when a root exists there (the default roots add one at the
+        # volume's mount point if writable), so assets are linked instead of copied; archives are built there.
+        # Waits while other mods in the pipeline hold the quota instead of failing this one.
+        prefix = self.journal.temp_prefix(mod_info.esp_name) if self.journal else f"batch_repack_{mod_info.esp_name}_"
+        job.temp_dir = get_scratch_manager().mkdtemp(prefix=prefix, near=mod_info.mod_path, size_hint=mod_info.asset_size,
+                                                     wait=QUOTA_WAIT_SECONDS)
+        job.pack_dir = os.path.join(job.temp_dir, "pack")
+        os.makedirs(job.pack_dir, exist_ok=True)
+
+        # Apply folder selection if available
+        asset_files_to_process = mod_info.asset_files
+        if hasattr(mod_info, 'selected_folders') and mod_info.selected_folders:
+            # Filter asset files to only include those from selected folders
+            asset_files_to_process = []
+            for asset_file in mod_info.asset_files:
+                asset_dir = os.path.dirname(asset_file)
+                if any(asset_dir.startswith(folder) for folder in mod_info.selected_folders):
+                    asset_files_to_process.append(asset_file)
+            log(f"📁 Using {len(asset_files_to_process)} files from selected folders", debug_only=True, log_type='INFO')
+
+        # Link selected asset files into the pack directory (copying only across filesystems)
+        log(f"📋 Classifying {len(asset_files_to_process)} asset files...", debug_only=True, log_type='INFO')
+
+        staging = StagingTree(job.pack_dir)
+        for asset_file in asset_files_to_process:
+            # Calculate relative path from mod root
+            staging.add(asset_file, os.path.relpath(asset_file, mod_info.mod_path))
+
+        log(f"📋 {mod_info.mod_name}: {staging.summary()}", debug_only=True, log_type='INFO')
+        return True, f"Staged {len(asset_files_to_process)} asset files"
+
+    def _batch_repack_archive_assets(self, job: ModRepackJob) -> Tuple[bool, str]:
+        """
+        Archive step (CPU-bound): build BSA/BA2 archives and chunk template ESPs.
+
+        Args:
+            job: Mod job with staged assets
+
+        Returns:
+            Tuple of (success, message)
+        """
+        if job.up_to_date:
+            return True, "Up to date"
+
+        mod_info = job.mod_info
+        temp_dir = job.temp_dir
+
+        # Step 2: Create BSA/BA2 archive from assets only
+        from .packaging.archive_creator import ArchiveCreator
+        archive_creator = ArchiveCreator(game_type=self.game_type,
+                                         max_parallel_archives=self.config.get('max_parallel_archives'))
+
+        # Recursively find all asset files
+        asset_files = []
+        for root, dirs, files in os.walk(job.pack_dir):
+            for file in files:
+                asset_files.append(os.path.join(root, file))
+
+        if not asset_files:
+            return False, "No asset files found to pack"
+
+        # Create BSA/BA2 archive(s) with plugin name following game-specific rules
+        log(f"📦 Creating {self.game_type.upper()} archive(s): {mod_info.esp_name}", debug_only=True, log_type='INFO')
+
+        # The job's temp dir changes every run, so chunk manifests are keyed by the mod folder
+        archive_success, archive_message, created_archives = archive_creator.create_game_specific_archives(
+            asset_files, mod_info.esp_name, temp_dir, source_path=mod_info.mod_path
+        )
+
+        if not archive_success:
+            return False, f"Archive creation failed: {archive_message}"
+
+        # Validate that the returned archives actually exist
+        if not created_archives:
+            return False, "No archives were created"
+
+        # Verify all returned archives actually exist on disk
+        valid_archives = []
+        for archive_path in created_archives:
+            if os.path.exists(archive_path):
+                valid_archives.append(archive_path)
+                log(f"🔍 Verified archive exists: {os.path.basename(archive_path)}", log_type='DEBUG')
+            else:
+                log(f"⚠️ Archive not found on disk: {archive_path}", log_type='WARNING')
+
+        # If no valid archives from returned list, try fallback discovery methods
+        if not valid_archives:
+            log(f"⚠️ No valid archives from returned list, trying fallback discovery...", log_type='WARNING')
+
+            # Fallback 1: Look for BSA/BA2 files in temp_dir (where ArchiveCreator creates them)
+            archive_ext = ".ba2" if self.game_type == "fallout4" else ".bsa"
+
+            for file in os.listdir(temp_dir):
+                if file.startswith(mod_info.esp_name) and file.endswith(archive_ext):
+                    file_path = os.path.join(temp_dir, file)
+                    if os.path.exists(file_path):
+                        valid_archives.append(file_path)
+                        log(f"🔍 Found archive via fallback: {file}", log_type='DEBUG')
+
+            # Fallback 2: Check if ArchiveCreator created them at the exact bsa_path
+            if not valid_archives:
+                bsa_path = os.path.join(temp_dir, f"{mod_info.esp_name}")
+                expected_archive_path = bsa_path + archive_ext
+                if os.path.exists(expected_archive_path):
+                    valid_archives.append(expected_archive_path)
+                    log(f"🔍 Found archive at expected path: {expected_archive_path}", log_type='DEBUG')
                 else:
-                    # Single archive = no chunking
-                    # Use original plugin only, no template ESPs needed
-                    log(f"📄 Single archive created - using original plugin only: {mod_info.esp_name}", log_type='INFO')
-
-                # Step 3.5: Copy unpackable folders (blacklisted folders that should stay loose)
-                unpackable_folders_copied = []
-                if hasattr(mod_info, 'available_folders') and mod_info.available_folders:
-                    from .constants import get_unpackable_folders_from_list
-                    folder_names = [os.path.basename(folder) for folder in mod_info.available_folders]
-                    unpackable_folder_names = get_unpackable_folders_from_list(folder_names, mod_info.game_type)
-
-                    for folder_path in mod_info.available_folders:
-                        folder_name = os.path.basename(folder_path)
-                        if folder_name in unpackable_folder_names:
-                            # Copy unpackable folder to temp directory using safe method
-                            dest_folder = os.path.join(temp_dir, folder_name)
-                            # Copy unpackable folder to temp directory
-                            shutil.copytree(folder_path, dest_folder, dirs_exist_ok=True)
-                            unpackable_folders_copied.append(folder_name)
-                            log(f"📦 Copied unpackable folder: {folder_name}", debug_only=True, log_type='INFO')
-
-                if unpackable_folders_copied:
-                    log(f"📦 Unpackable folders included: {', '.join(unpackable_folders_copied)}", debug_only=True, log_type='INFO')
-
-                # Step 4: Create final 7z package with BSA + original plugin + unpackable folders
-                # Create final package name using configurable naming pattern
-                naming = self.config['package_naming']
-                if naming['use_esp_name']:
-                    base_name = mod_info.esp_name
+                    # Fallback 3: Check if archive was created without extension (BSArch sometimes does this)
+                    expected_archive_path_no_ext = bsa_path
+                    if os.path.exists(expected_archive_path_no_ext):
+                        valid_archives.append(expected_archive_path_no_ext)
+                        log(f"🔍 Found archive without extension: {expected_archive_path_no_ext}", log_type='DEBUG')
+                    else:
+                        log(f"⚠️ No archives found in temp_dir: {temp_dir}", log_type='WARNING')
+                        log(f"🔍 Contents of temp_dir: {os.listdir(temp_dir)}", log_type='DEBUG')
+                        log(f"🔍 Expected archive path (with ext): {expected_archive_path}", log_type='DEBUG')
+                        log(f"🔍 Expected archive path (no ext): {expected_archive_path_no_ext}", log_type='DEBUG')
+                        return False, f"No archive files found for {mod_info.esp_name} in {temp_dir}"
+
+        created_archives = valid_archives
+        job.created_archives = created_archives
+
+        # Log created archives
+        if len(created_archives) == 1:
+            log(f"✅ Created single archive: {os.path.basename(created_archives[0])} ({os.path.getsize(created_archives[0])} bytes)", debug_only=True, log_type='INFO')
+        else:
+            log(f"✅ Created {len(created_archives)} chunked archives:", debug_only=True, log_type='INFO')
+            total_size = 0
+            for archive_path in created_archives:
+                size = os.path.getsize(archive_path)
+                total_size += size
+                log(f"  • {os.path.basename(archive_path)} ({size} bytes)", debug_only=True, log_type='INFO')
+            log(f"📊 Total chunked size: {total_size} bytes", debug_only=True, log_type='INFO')
+
+        # The loose copies are no longer needed once they are archived
+        shutil.rmtree(job.pack_dir, ignore_errors=True)
+
+        # Step 3: Create template ESP files ONLY for additional chunks (if chunking occurred)
+        # The main plugin should remain original, but additional chunks need template ESPs
+        esp_files = job.esp_files
+        first_esp_names = job.first_esp_names  # Original plugin path -> name of the ESP it replaces
+
+        if len(created_archives) > 1:
+            # Multiple archives = chunking occurred
+            # Let ESPManager create all template ESPs, then replace the first one with original
+            log(f"📄 Chunking detected: {len(created_archives)} archives created", log_type='INFO')
+
+            from .packaging.esp_manager import ESPManager
+            esp_manager = ESPManager()
+
+            # Create template ESPs for all archives (including first one)
+            esp_creation_success, esp_file_path = esp_manager.create_esp(
+                mod_name=mod_info.esp_name,
+                output_path=temp_dir,
+                game_type=self.game_type,
+                bsa_files=created_archives
+            )
+
+            if not esp_creation_success:
+                log(f"ESP creation failed: {esp_file_path}", log_type='ERROR')
+                return False, f"ESP creation failed: {esp_file_path}"
+
+            # Find all ESP files that were created
+            for archive_path in created_archives:
+                archive_basename = os.path.basename(archive_path)
+                esp_basename = os.path.splitext(archive_basename)[0] + ".esp"
+                esp_path = os.path.join(temp_dir, esp_basename)
+                if os.path.exists(esp_path):
+                    esp_files.append(esp_path)
+
+            # Now replace the FIRST template ESP with the original plugin
+            if esp_files:
+                first_esp_path = esp_files[0]  # This corresponds to the first archive
+                first_esp_name = os.path.basename(first_esp_path)
+
+                # Find the original plugin file
+                original_plugin_path = None
+                for plugin_path, plugin_type in mod_info.available_plugins:
+                    if os.path.basename(plugin_path).lower() == f"{mod_info.esp_name}.esp".lower():
+                        original_plugin_path = plugin_path
+                        break
+
+                if original_plugin_path and os.path.exists(original_plugin_path):
+                    # Replace template ESP with original plugin (mapped at packaging time)
+                    esp_files[0] = original_plugin_path
+                    first_esp_names[original_plugin_path] = first_esp_name
+                    log(f"📄 Replaced template ESP with original plugin: {first_esp_name}", log_type='INFO')
                 else:
-                    base_name = mod_info.mod_name
+                    log(f"⚠️ Original plugin not found, keeping template ESP: {first_esp_name}", log_type='WARNING')
 
-                final_package_name = f"{base_name}{naming['separator']}{naming['version']}{naming['suffix']}.7z"
-                final_package_path = os.path.join(output_path, final_package_name)
+            log(f"📄 Final ESP files: {len(esp_files)} (first is original, rest are templates)", log_type='INFO')
 
-                # Use our new compression method to pack BSA + plugin
-                from .packaging.compression_service import Compressor
-                compression_level = self.config.get('compression_level', 3)
-                compressor = Compressor(compression_level=compression_level)
+        else:
+            # Single archive = no chunking
+            # Use original plugin only, no template ESPs needed
+            log(f"📄 Single archive created - using original plugin only: {mod_info.esp_name}", log_type='INFO')
 
-                # Create a clean temporary folder with only the final files
-                final_temp_dir = os.path.join(temp_dir, "final")
-                os.makedirs(final_temp_dir, exist_ok=True)
+        return True, f"Created {len(created_archives)} archive(s)"
 
-                # Copy all BSA/BA2 chunks and template ESP files (for additional chunks) to final temp directory
-                for esp_path in esp_files:
-                    final_esp_path = os.path.join(final_temp_dir, os.path.basename(esp_path))
-                    shutil.copy2(esp_path, final_esp_path)
-                    log(f"📄 Copied template ESP for chunk: {os.path.basename(esp_path)}", log_type='INFO')
+    def _batch_repack_compress_package(self, job: ModRepackJob) -> Tuple[bool, str]:
+        """
+        Compress step (CPU-bound): build the final 7z package of the mod.
 
-                # IMPORTANT: Copy ALL original ESP files from the mod folder (not just the selected one)
-                # This ensures that additional plugins that weren't selected for BSA naming are preserved
-                for plugin_path, plugin_type in mod_info.available_plugins:
-                    plugin_filename = os.path.basename(plugin_path)
-                    final_plugin_path = os.path.join(final_temp_dir, plugin_filename)
+        Args:
+            job: Mod job with created archives
 
-                    # Only copy if it's not already copied (avoid duplicates)
-                    if not os.path.exists(final_plugin_path):
-                        shutil.copy2(plugin_path, final_plugin_path)
-                        log(f"📄 Copied original plugin: {plugin_filename}", log_type='INFO')
-                    else:
-                        log(f"📄 Original plugin already exists (created ESP): {plugin_filename}", log_type='DEBUG')
-
-                # Copy all archive chunks
-                for archive_path in created_archives:
-                    final_archive_path = os.path.join(final_temp_dir, os.path.basename(archive_path))
-                    shutil.copy2(archive_path, final_archive_path)
-                    log(f"📦 Copied archive chunk: {os.path.basename(archive_path)}", log_type='INFO')
-
-                # Copy blacklisted folders to final temp directory
-                for folder_name in unpackable_folders_copied:
-                    source_folder = os.path.join(temp_dir, folder_name)
-                    dest_folder = os.path.join(final_temp_dir, folder_name)
-                    if os.path.exists(source_folder):
-                        shutil.copytree(source_folder, dest_folder, dirs_exist_ok=True)
-                        log(f"📦 Copied blacklisted folder to final package: {folder_name}", log_type='INFO')
-                    else:
-                        log(f"⚠️ Blacklisted folder not found in temp dir: {source_folder}", log_type='WARNING')
+        Returns:
+            Tuple of (success, final_package_path_or_error_message)
+        """
+        mod_info = job.mod_info
+        if job.up_to_date:
+            return True, self._batch_repack_package_path(mod_info, job.output_path)
+
+        temp_dir = job.temp_dir
+        esp_files = job.esp_files
+        first_esp_names = job.first_esp_names
+        created_archives = job.created_archives
+
+        # Step 3.5: Copy unpackable folders (blacklisted folders that should stay loose)
+        unpackable_folders_copied = []
+        if hasattr(mod_info, 'available_folders') and mod_info.available_folders:
+            from .constants import get_unpackable_folders_from_list
+            folder_names = [os.path.basename(folder) for folder in mod_info.available_folders]
+            unpackable_folder_names = get_unpackable_folders_from_list(folder_names, mod_info.game_type)
+
+            for folder_path in mod_info.available_folders:
+                folder_name = os.path.basename(folder_path)
+                if folder_name in unpackable_folder_names:
+                    # Unpackable folders are packaged straight from the mod folder
+                    unpackable_folders_copied.append(folder_path)
+                    log(f"📦 Keeping unpackable folder loose: {folder_name}", debug_only=True, log_type='INFO')
+
+        if unpackable_folders_copied:
+            log(f"📦 Unpackable folders included: {', '.join(os.path.basename(f) for f in unpackable_folders_copied)}", debug_only=True, log_type='INFO')
+
+        # Step 4: Create final 7z package with BSA + original plugin + unpackable folders
+        final_package_path = self._batch_repack_package_path(mod_info, job.output_path)
+
+        # Use our new compression method to pack BSA + plugin
+        from .packaging.compression_service import Compressor
+        compression_level = self.config.get('compression_level', 3)
+        compressor = Compressor(compression_level=compression_level,
+                                compression_profile=self.config.get('compression_profile'))
+
+        # Map every final file to its name in the package; 7z reads them in place
+        # instead of duplicating multi-GB archives into a staging folder
+        package_entries = {}
+
+        def add_entry(source_path, archive_name, replace=True):
+            key = archive_name.lower()
+            if replace or key not in package_entries:
+                package_entries[key] = (source_path, archive_name)
+                return True
+            return False
 
-                # Copy ALL top-level files from mod directory (preserve everything - not our business to filter)
-                log(f"🔍 Scanning for top-level files in: {mod_info.mod_path}", log_type='INFO')
-                top_level_files_copied = []
-                all_items_found = []
-                try:
-                    for item in os.listdir(mod_info.mod_path):
-                        item_path = os.path.join(mod_info.mod_path, item)
-                        all_items_found.append(f"{item} ({'file' if os.path.isfile(item_path) else 'dir'})")
-                        
-                        if os.path.isfile(item_path):
-                            # Only skip plugin files (already handled separately)
-                            if not self._is_plugin_file(item):
-                                dest_file = os.path.join(final_temp_dir, item)
-                                try:
-                                    shutil.copy2(item_path, dest_file)
-                                    top_level_files_copied.append(item)
-                                    log(f"📄 Copied top-level file: {item}", log_type='INFO')
-                                except Exception as e:
-                                    log(f"❌ Failed to copy top-level file {item}: {e}", log_type='WARNING')
-                            else:
-                                log(f"⏭️ Skipped plugin file: {item}", log_type='DEBUG')
-                    
-                    log(f"🔍 Found {len(all_items_found)} total items in mod root: {', '.join(all_items_found)}", log_type='INFO')
-                    
-                    if top_level_files_copied:
-                        log(f"📄 Preserved {len(top_level_files_copied)} top-level files: {', '.join(top_level_files_copied)}", log_type='INFO')
-                    else:
-                        log(f"⚠️ No top-level files were copied (all were plugin files or directories)", log_type='WARNING')
-                        
-                except Exception as e:
-                    log(f"⚠️ Failed to scan for top-level files: {e}", log_type='WARNING')
-
-                # Debug: Show what's in the final temp directory
-                final_contents = []
-                for root, dirs, files in os.walk(final_temp_dir):
-                    for file in files:
-                        rel_path = os.path.relpath(os.path.join(root, file), final_temp_dir)
-                        final_contents.append(rel_path)
-                    for dir_name in dirs:
-                        rel_path = os.path.relpath(os.path.join(root, dir_name), final_temp_dir)
-                        final_contents.append(rel_path + '/')
-
-                log(f"📦 Final package contents: {final_contents}", log_type='INFO')
-
-                # Compress only the final files with proper folder structure
-                compress_success, compress_message = compressor.compress_directory_with_folder_name(
-                    source_dir=final_temp_dir,
-                    archive_path=final_package_path,
-                    folder_name=base_name
-                )
-
-                if not compress_success:
-                    self.logger.log_operation_end('Process Single Mod', False, f"Final compression failed: {compress_message}")
-                    self.logger.end_timing(timing_id, False, {'error': 'compression_failed'})
-                    return False, f"Final compression failed: {compress_message}"
-
-                # Log success
-                self.logger.log_operation_end('Process Single Mod', True, {
-                    'final_package_path': final_package_path,
-                    'package_size': os.path.getsize(final_package_path) if os.path.exists(final_package_path) else 0
-                })
-                self.logger.end_timing(timing_id, True, {
-                    'final_package_path': final_package_path
-                })
-
-                return True, final_package_path
+        # All template ESP files (for additional chunks), the first being the original plugin
+        for esp_path in esp_files:
+            add_entry(esp_path, first_esp_names.get(esp_path, os.path.basename(esp_path)))
+            log(f"📄 Added template ESP for chunk: {os.path.basename(esp_path)}", log_type='INFO')
 
+        # IMPORTANT: Include ALL original ESP files from the mod folder (not just the selected one)
+        # This ensures that additional plugins that weren't selected for BSA naming are preserved
+        for plugin_path, plugin_type in mod_info.available_plugins:
+            plugin_filename = os.path.basename(plugin_path)
+
+            # Only add if not already included (avoid duplicates)
+            if add_entry(plugin_path, plugin_filename, replace=False):
+                log(f"📄 Added original plugin: {plugin_filename}", log_type='INFO')
+            else:
+                log(f"📄 Original plugin already exists (created ESP): {plugin_filename}", log_type='DEBUG')
+
+        # All archive chunks
+        for archive_path in created_archives:
+            add_entry(archive_path, os.path.basename(archive_path))
+            log(f"📦 Added archive chunk: {os.path.basename(archive_path)}", log_type='INFO')
+
+        # Blacklisted folders stay loose in the final package
+        for folder_path in unpackable_folders_copied:
+            folder_name = os.path.basename(folder_path)
+            if os.path.exists(folder_path):
+                add_entry(folder_path, folder_name)
+                log(f"📦 Added blacklisted folder to final package: {folder_name}", log_type='INFO')
+            else:
+                log(f"⚠️ Blacklisted folder not found: {folder_path}", log_type='WARNING')
+
+        # Include ALL top-level files from mod directory (preserve everything - not our business to filter)
+        log(f"🔍 Scanning for top-level files in: {mod_info.mod_path}", log_type='INFO')
+        top_level_files_copied = []
+        all_items_found = []
+        try:
+            for item in os.listdir(mod_info.mod_path):
+                item_path = os.path.join(mod_info.mod_path, item)
+                all_items_found.append(f"{item} ({'file' if os.path.isfile(item_path) else 'dir'})")
+                
+                if os.path.isfile(item_path):
+                    # Only skip plugin files (already handled separately)
+                    if not self._is_plugin_file(item):
+                        add_entry(item_path, item)
+                        top_level_files_copied.append(item)
+                        log(f"📄 Added top-level file: {item}", log_type='INFO')
+                    else:
+                        log(f"⏭️ Skipped plugin file: {item}", log_type='DEBUG')
+            
+            log(f"🔍 Found {len(all_items_found)} total items in mod root: {', '.join(all_items_found)}", log_type='INFO')
+            
+            if top_level_files_copied:
+                log(f"📄 Preserved {len(top_level_files_copied)} top-level files: {', '.join(top_level_files_copied)}", log_type='INFO')
+            else:
+                log(f"⚠️ No top-level files were included (all were plugin files or directories)", log_type='WARNING')
+                
         except Exception as e:
-            # Log error
-            self.logger.log_error(e, 'Process Single Mod', {
-                'mod_name': mod_info.mod_name,
-                'esp_name': mod_info.esp_name
-            })
-            self.logger.log_operation_end('Process Single Mod', False, str(e))
-            self.logger.end_timing(timing_id, False, {'error': str(e)})
-            return False, str(e)
+            log(f"⚠️ Failed to scan for top-level files: {e}", log_type='WARNING')
+
+        final_contents = [name + ('/' if os.path.isdir(source) else '') for source, name in package_entries.values()]
+        log(f"📦 Final package contents: {final_contents}", log_type='INFO')
+
+        # Compress only the final files, at the root of the package
+        compress_success, compress_message = compressor.compress_entries(
+            list(package_entries.values()),
+            final_package_path,
+            staging_root=temp_dir
+        )
+
+        records = self._get_build_records(job.output_path)
+        if not compress_success:
+            if records:
+                records.forget(final_package_path)
+            return False, f"Final compression failed: {compress_message}"
+
+        if records:
+            records.record(final_package_path, job.fingerprint, mod_info.mod_name)
+
+        return True, final_package_path
+
+    def _batch_repack_package_path(self, mod_info: ModInfo, output_path: str) -> str:
+        """Get the final package path of a mod using the configurable naming pattern."""
+        naming = self.config['package_naming']
+        if naming['use_esp_name']:
+            base_name = mod_info.esp_name
+        else:
+            base_name = mod_info.mod_name
+
+        final_package_name = f"{base_name}{naming['separator']}{naming['version']}{naming['suffix']}.7z"
+        return os.path.join(output_path, final_package_name)
+
+    def _get_build_records(self, output_path: str) -> Optional[BuildRecords]:
+        """Get the build records of an output directory (None if incremental builds are off)."""
+        if not self.config.get('incremental', True):
+            return None
+        key = os.path.normcase(os.path.abspath(output_path))
+        with self._build_records_lock:
+            if key not in self._build_records:
+                self._build_records[key] = BuildRecords(output_path)
+            return self._build_records[key]
+
+    def _batch_repack_is_forced(self, mod_info: ModInfo) -> bool:
+        """Check whether a mod must be rebuilt even if its package is up to date."""
+        if self.config.get('force'):
+            return True
+        forced = {name.lower() for name in self.config.get('force_mods', [])}
+        return mod_info.mod_name.lower() in forced or (mod_info.esp_name or '').lower() in forced
+
+    def _batch_repack_fingerprint(self, mod_info: ModInfo) -> Optional[str]:
+        """
+        Fingerprint everything a mod's package is built from.
+
+        Args:
+            mod_info: ModInfo object with plugin and folder selections applied
+
+        Returns:
+            Hex digest, or None if an input could not be read
+        """
+        if self._tool_versions is None:
+            self._tool_versions = tool_versions(self.game_type)
+
+        files = set(mod_info.asset_files)
+        files.update(plugin_path for plugin_path, _ in mod_info.available_plugins)
+        try:
+            # Top-level files are packaged even when they aren't assets (readme.txt, ...)
+            for item in os.listdir(mod_info.mod_path):
+                item_path = os.path.join(mod_info.mod_path, item)
+                if os.path.isfile(item_path):
+                    files.add(item_path)
+        except OSError:
+            return None
+
+        settings = {
+            'format': 1,
+            'game_type': self.game_type,
+            'plugin': os.path.relpath(mod_info.esp_file, mod_info.mod_path) if mod_info.esp_file else None,
+            'folders': sorted(os.path.relpath(folder, mod_info.mod_path)
+                              for folder in getattr(mod_info, 'selected_folders', None) or []),
+            'compression_level': self.config.get('compression_level', 3),
+            'compression_profile': self.config.get('compression_profile'),
+            'package_naming': self.config['package_naming'],
+            'tools': self._tool_versions
+        }
+        return input_fingerprint(list(files), mod_info.mod_path, settings, get_archive_cache().file_digest)
 
     def get_summary_report(self) -> str:
         """
@@ -1068,6 +1579,9 @@ class BatchModRepacker:
         report.append("=" * 50)
         report.append(f"Total mods discovered: {len(self.discovered_mods)}")
         report.append(f"Successfully processed: {len(self.processed_mods)}")
+        report.append(f"Up to date: {len(self.up_to_date_mods)}")
+        if self.resumed_mods:
+            report.append(f"Finished before interruption: {len(self.resumed_mods)}")
         report.append(f"Failed: {len(self.failed_mods)}")
         report.append("")
 
@@ -1079,6 +1593,12 @@ class BatchModRepacker:
                 report.append(f"    → {os.path.basename(result_path)}")
             report.append("")
 
+        if self.up_to_date_mods:
+            report.append("⏭️ UP TO DATE (skipped):")
+            for mod_info, result_path in self.up_to_date_mods:
+                report.append(f"  • {mod_info.mod_name} → {os.path.basename(result_path)}")
+            report.append("")
+
         if self.failed_mods:
             report.append("❌ FAILED TO PROCESS:")
             for mod_info, error_msg in self.failed_mods:
@@ -1086,4 +1606,20 @@ class BatchModRepacker:
                 report.append(f"    Error: {error_msg}")
             report.append("")
 
+        if self.completion_times:
+            report.append("⏱️ PREDICTED VS ACTUAL COMPLETION:")
+            for mod_name, (predicted, actual) in sorted(self.completion_times.items(), key=lambda item: item[1][1]):
+                report.append(f"  • {mod_name}: predicted {predicted:.0f}s, actual {actual:.0f}s")
+            predicted_total = max(predicted for predicted, _ in self.completion_times.values())
+            actual_total = max(actual for _, actual in self.completion_times.values())
+            report.append(f"  Batch: predicted {predicted_total:.0f}s, actual {actual_total:.0f}s")
+            report.append("")
+
+        if self.last_pipeline:
+            report.append("📊 STAGE UTILIZATION:")
+            for stage_name, stats in self.last_pipeline.utilization().items():
+                report.append(f"  • {stage_name}: {stats['items']} mod(s), {stats['workers']} worker(s), "
+                              f"busy {stats['busy']:.1f}s ({stats['utilization']:.0%})")
+            report.append("")
+
         return "\n".join(report)
@@ -13,6 +13,7 @@ from pathlib import Path
 from typing import Tuple, Optional, Dict, Any
 from .config_cache import get_config_cache
 from .dynamic_progress import log
+from .progress_events import headless_requested
 
 
 class BSArchDetector:
@@ -158,6 +159,11 @@ class BSArchDetector:
         Returns:
             Path to BSArch executable or None if user cancels
         """
+        if headless_requested():
+            # Nobody at the keyboard in automation runs; don't block on a prompt
+            log("❌ BSArch not found and --progress=jsonl runs can't prompt for it", log_type='WARNING')
+            return None
+
         try:
             # Try to import Rich for better UI
             try:
@@ -6,14 +6,20 @@ Handles all BSArch operations with proper error handling and logging.
 """
 
 import os
-import subprocess
-import shutil
-import tempfile
+import threading
 from pathlib import Path
 from typing import Tuple, Optional, List, Dict, Any
 from .bsarch_detector import get_bsarch_detector, detect_bsarch_global
+from .archive_jobs import ArchiveJob, ArchiveJobExecutor, archive_build_slot, mark_reused
+from .archive_cache import get_archive_cache
+from .chunk_manifest import get_chunk_manifest_store
+from .chunk_planner import ChunkPlanner
 from .dynamic_progress import log
+from .process_runner import run_streaming, BSArchProgressCounter, tool_progress, inactivity_timeout_for
+from .tool_registry import get_tool_registry
 from .utils import format_bytes
+from .staging import StagingTree
+from .scratch import get_scratch_manager
 
 
 class BSArchService:
@@ -95,21 +101,13 @@ class BSArchService:
                 log(f"❌ BSArch file too small ({file_size} bytes): {path}", log_type='DEBUG')
                 return False
 
-            # Try to run BSArch with --help to verify it's actually BSArch
-            try:
-                result = subprocess.run([path, "--help"],
-                                      capture_output=True, text=True, timeout=10)
-                if result.returncode == 0 and "BSArch" in result.stdout:
-                    log(f"✅ BSArch validation successful: {path}", log_type='DEBUG')
-                    return True
-                else:
-                    log(f"❌ BSArch validation failed - not a valid BSArch executable: {path}", log_type='DEBUG')
-                    return False
-            except subprocess.TimeoutExpired:
-                log(f"❌ BSArch validation timeout: {path}", log_type='DEBUG')
-                return False
-            except Exception as e:
-                log(f"❌ BSArch validation error: {e}", log_type='DEBUG')
+            # Verify it's actually BSArch (probed once per binary, then cached)
+            capabilities = get_tool_registry().bsarch(path)
+            if capabilities.get('valid'):
+                log(f"✅ BSArch validation successful: {path}", log_type='DEBUG')
+                return True
+            else:
+                log(f"❌ BSArch validation failed - not a valid BSArch executable: {path}", log_type='DEBUG')
                 return False
 
         except Exception as e:
@@ -129,6 +127,8 @@ class BSArchService:
         """
         if force_refresh:
             log("🔄 Force refreshing BSArch detection...", log_type='INFO')
+            if self._bsarch_path:
+                get_tool_registry().invalidate(self._bsarch_path)
             self._bsarch_path = None
             self._bsarch_validated = False
             self.detector.clear_bsarch_cache()
@@ -145,7 +145,10 @@ class BSArchService:
                               files: List[str],
                               max_chunk_size_gb: float = 2.0,
                               interactive: bool = False,
-                              is_texture_archive: bool = False) -> Tuple[bool, str, List[str]]:
+                              is_texture_archive: bool = False,
+                              max_parallel: Optional[int] = None,
+                              cancel_event: Optional[threading.Event] = None,
+                              source_path: Optional[str] = None) -> Tuple[bool, str, List[str]]:
         """
         Execute BSArch to create chunked archives (like CAO does).
 
@@ -156,6 +159,10 @@ class BSArchService:
             max_chunk_size_gb: Maximum size per chunk in GB (default 2.0)
             interactive: Whether to ask user if BSArch not found
             is_texture_archive: Whether this archive contains texture files (affects --dds flag usage)
+            max_parallel: Maximum number of chunks built concurrently
+            cancel_event: Event that aborts BSArch when set
+            source_path: Path identifying the archive set across runs, for its chunk manifest
+                         (defaults to the output folder)
 
         Returns:
             Tuple of (success: bool, message: str, created_archives: List[str])
@@ -185,16 +192,22 @@ class BSArchService:
                 return False, "No files to pack", []
 
             # Calculate total size and determine if chunking is needed
-            total_size = sum(os.path.getsize(f) for f in files if os.path.exists(f))
-            max_chunk_size_bytes = max_chunk_size_gb * 1024 * 1024 * 1024  # Convert GB to bytes
+            file_info = [(f, os.path.getsize(f)) for f in files if os.path.exists(f)]
+            total_size = sum(size for _, size in file_info)
+            max_chunk_size_bytes = int(max_chunk_size_gb * 1024 * 1024 * 1024)  # Convert GB to bytes
+
+            # The limit applies to the compressed archive, so compare predicted sizes
+            planner = ChunkPlanner()
+            predicted_size = sum(size for _, size in planner.predict(file_info))
 
-            log(f"📊 Total files size: {format_bytes(total_size)}", log_type='INFO')
+            log(f"📊 Total files size: {format_bytes(total_size)} (~{format_bytes(predicted_size)} packed)", log_type='INFO')
             log(f"📊 Max chunk size: {format_bytes(max_chunk_size_bytes)}", log_type='INFO')
 
-            if total_size <= max_chunk_size_bytes:
+            if predicted_size <= max_chunk_size_bytes * planner.fill_target:
                 # Single archive is sufficient
                 log(f"📦 Creating single archive (size within limit)", log_type='INFO')
-                success, message = self.execute_bsarch(source_dir, output_base_path, files, interactive)
+                success, message = self.execute_bsarch(source_dir, output_base_path, files, interactive,
+                                                       cancel_event=cancel_event)
                 if success:
                     archive_ext = ".ba2" if self.game_type == "fallout4" else ".bsa"
                     archive_path = output_base_path + archive_ext
@@ -204,7 +217,8 @@ class BSArchService:
 
             # Need to create chunks
             log(f"📦 Creating chunked archives (total size exceeds {max_chunk_size_gb}GB limit)", log_type='INFO')
-            return self._create_chunked_archives(bsarch_path, source_dir, output_base_path, files, max_chunk_size_bytes, is_texture_archive)
+            return self._create_chunked_archives(bsarch_path, source_dir, output_base_path, files, max_chunk_size_bytes,
+                                                is_texture_archive, max_parallel, cancel_event, source_path)
 
         except Exception as e:
             log(f"❌ Chunked BSArch execution error: {e}", log_type='ERROR')
@@ -215,7 +229,8 @@ class BSArchService:
                       output_path: str,
                       files: List[str],
                       interactive: bool = False,
-                      is_texture_archive: bool = False) -> Tuple[bool, str]:
+                      is_texture_archive: bool = False,
+                      cancel_event: Optional[threading.Event] = None) -> Tuple[bool, str]:
         """
         Execute BSArch to create archive.
 
@@ -225,6 +240,7 @@ class BSArchService:
             files: List of files to include in archive
             interactive: Whether to ask user if BSArch not found
             is_texture_archive: Whether this archive contains texture files (affects --dds flag usage)
+            cancel_event: Event that aborts BSArch when set
 
         Returns:
             Tuple of (success, message)
@@ -244,19 +260,6 @@ class BSArchService:
                 log(f"❌ BSArch path is not executable: {bsarch_path}", log_type='ERROR')
                 return False, f"BSArch path is not executable: {bsarch_path}"
 
-            # Test BSArch with a simple command to verify it works
-            log(f"🔧 Testing BSArch with --help command...", log_type='DEBUG')
-            try:
-                test_result = subprocess.run([bsarch_path, "--help"],
-                                           capture_output=True, text=True, timeout=10,
-                                           cwd=os.path.dirname(bsarch_path) if os.path.dirname(bsarch_path) else None)
-                if test_result.returncode != 0:
-                    log(f"⚠️ BSArch --help test failed: {test_result.stderr}", log_type='WARNING')
-                else:
-                    log(f"✅ BSArch --help test successful", log_type='DEBUG')
-            except Exception as e:
-                log(f"⚠️ BSArch --help test error: {e}", log_type='WARNING')
-
             # Validate inputs
             if not os.path.exists(source_dir):
                 return False, f"Source directory does not exist: {source_dir}"
@@ -296,7 +299,6 @@ class BSArchService:
             log(f"🔧 Working directory: {os.getcwd()}", log_type='DEBUG')
 
             # Execute BSArch with better error handling
-            timeout = 300 + (len(staged_files) // 100) * 60  # Base 5min + 1min per 100 files
             try:
                 # Set working directory to BSArch's directory (Windows requirement)
                 bsarch_dir = os.path.dirname(bsarch_path)
@@ -305,8 +307,14 @@ class BSArchService:
 
                 log(f"🔧 Running BSArch from directory: {bsarch_dir}", log_type='DEBUG')
 
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout,
-                                      cwd=bsarch_dir, shell=False)
+                with archive_build_slot(cancel_event) as acquired:
+                    if not acquired:
+                        return False, "Cancelled"
+                    with tool_progress(f"BSArch {os.path.basename(actual_output_path)}") as on_progress:
+                        result = run_streaming(cmd, cwd=bsarch_dir, tool="BSArch", cancel_event=cancel_event,
+                                               inactivity_timeout=inactivity_timeout_for("BSArch"),
+                                               progress_parser=BSArchProgressCounter(len(staged_files)),
+                                               on_progress=on_progress)
             except FileNotFoundError as e:
                 log(f"❌ BSArch executable not found: {e}", log_type='ERROR')
                 log(f"❌ Command was: {' '.join(cmd)}", log_type='ERROR')
@@ -318,6 +326,11 @@ class BSArchService:
                 log(f"❌ Working directory was: {bsarch_dir}", log_type='ERROR')
                 return False, f"BSArch execution error: {e}"
 
+            if result.cancelled:
+                return False, "Cancelled"
+            if result.timed_out:
+                return False, f"BSArch stalled ({result.stall_description})"
+
             if result.returncode == 0:
                 # Verify archive was created at the actual output path (with extension)
                 if os.path.exists(actual_output_path):
@@ -334,8 +347,6 @@ class BSArchService:
                 log(f"❌ BSArch stdout: {stdout_msg}", log_type='ERROR')
                 return False, f"BSArch execution failed: {error_msg}"
 
-        except subprocess.TimeoutExpired:
-            return False, f"BSArch timed out after {timeout // 60} minutes"
         except Exception as e:
             log(f"❌ BSArch execution error: {e}", log_type='ERROR')
             return False, f"BSArch execution error: {e}"
@@ -349,24 +360,9 @@ class BSArchService:
             temp_dir: Temporary directory for staging
             source_dir: Source directory (for relative paths)
         """
-        for file_path in files:
-            if not os.path.exists(file_path):
-                log(f"⚠️ File not found, skipping: {file_path}", log_type='WARNING')
-                continue
-
-            # Calculate relative path from source directory
-            try:
-                rel_path = os.path.relpath(file_path, source_dir)
-                dest_path = os.path.join(temp_dir, rel_path)
-
-                # Create destination directory
-                os.makedirs(os.path.dirname(dest_path), exist_ok=True)
-
-                # Copy file
-                shutil.copy2(file_path, dest_path)
-
-            except Exception as e:
-                log(f"⚠️ Failed to stage file {file_path}: {e}", log_type='WARNING')
+        staging = StagingTree(temp_dir)
+        staging.add_files(files, lambda file_path: os.path.relpath(file_path, source_dir))
+        log(f"🔧 {staging.summary()}", log_type='DEBUG')
 
     def _build_bsarch_command(self, bsarch_path: str, source_dir: str, output_path: str, is_texture_archive: bool = False) -> List[str]:
         """
@@ -417,7 +413,10 @@ class BSArchService:
         return cmd
 
     def _create_chunked_archives(self, bsarch_path: str, source_dir: str, output_base_path: str,
-                                files: List[str], max_chunk_size_bytes: int, is_texture_archive: bool = False) -> Tuple[bool, str, List[str]]:
+                                files: List[str], max_chunk_size_bytes: int, is_texture_archive: bool = False,
+                                max_parallel: Optional[int] = None,
+                                cancel_event: Optional[threading.Event] = None,
+                                source_path: Optional[str] = None) -> Tuple[bool, str, List[str]]:
         """
         Create multiple chunked archives from files.
 
@@ -428,12 +427,15 @@ class BSArchService:
             files: List of files to include
             max_chunk_size_bytes: Maximum size per chunk in bytes
             is_texture_archive: Whether this archive contains texture files (affects --dds flag usage)
+            max_parallel: Maximum number of chunks built concurrently
+            cancel_event: Event of the enclosing job that cancels the chunk builds
+            source_path: Path identifying the archive set across runs (defaults to the output folder)
 
         Returns:
             Tuple of (success: bool, message: str, created_archives: List[str])
         """
         try:
-            # Get file sizes and sort by size (largest first to optimize packing)
+            # Get file sizes (the chunk planner orders them for packing)
             file_info = []
             for file_path in files:
                 if os.path.exists(file_path):
@@ -442,77 +444,72 @@ class BSArchService:
                 else:
                     log(f"⚠️ File not found, skipping: {file_path}", log_type='WARNING')
 
-            # Sort by size (largest first) to optimize chunk packing
-            file_info.sort(key=lambda x: x[1], reverse=True)
-
             log(f"📋 Processing {len(file_info)} files for chunking", log_type='INFO')
 
-            # Distribute files into chunks
-            chunks = self._distribute_files_into_chunks(file_info, max_chunk_size_bytes)
+            # Keep files in the chunks they had last time so unchanged chunks can be reused
+            manifest_store = get_chunk_manifest_store()
+            manifest = manifest_store.load(self.game_type, output_base_path, source_path)
+
+            def chunk_key(path: str) -> str:
+                return os.path.relpath(path, source_dir).replace('\\', '/').lower()
 
+            digests = manifest.digest_files([(chunk_key(path), path) for path, _ in file_info])
+
+            # One planner (and compression model) per archive set
+            planner = ChunkPlanner()
+            chunks = self._distribute_files_into_chunks(file_info, max_chunk_size_bytes,
+                                                        manifest.assignment(), chunk_key, planner)
             if not chunks:
                 return False, "Failed to distribute files into chunks", []
-
             log(f"📦 Created {len(chunks)} chunks", log_type='INFO')
 
-            # Create archives for each chunk
-            created_archives = []
-            archive_ext = ".ba2" if self.game_type == "fallout4" else ".bsa"
-
-            for i, chunk_files in enumerate(chunks):
-                # Generate chunk name based on mod name
-                # First chunk (i=0): modname.bsa (no number)
-                # Subsequent chunks: modname0.bsa, modname1.bsa, etc. (starting from 0)
-                mod_name = os.path.basename(output_base_path)
-
-                if i == 0:
-                    # First chunk gets the main name
-                    chunk_output_path = f"{output_base_path}{archive_ext}"
-                else:
-                    # Subsequent chunks start numbering from 0
-                    chunk_output_path = f"{output_base_path}{i-1}{archive_ext}"
-
-                log(f"📦 Creating chunk {i+1}/{len(chunks)}: {os.path.basename(chunk_output_path)}", log_type='INFO')
-                log(f"📊 Chunk {i+1} contains {len(chunk_files)} files", log_type='DEBUG')
-
-                # Create staging directory for this chunk (use temp directory to avoid conflicts)
-                import tempfile
-                chunk_staging_dir = tempfile.mkdtemp(prefix=f"bsa_chunk_{i}_")
-
-                try:
-                    # Stage files for this chunk
-                    self._stage_files_for_chunk(chunk_files, chunk_staging_dir, source_dir)
-
-                    # Verify staging directory has files
-                    staged_files = []
-                    for root, dirs, files in os.walk(chunk_staging_dir):
-                        staged_files.extend([os.path.join(root, f) for f in files])
-
-                    if not staged_files:
-                        log(f"❌ No files staged for chunk {i+1}", log_type='ERROR')
-                        return False, f"No files staged for chunk {i+1}", []
-
-                    log(f"📁 Staged {len(staged_files)} files for chunk {i+1}", log_type='DEBUG')
-
-                    # Create archive for this chunk
-                    success, message = self._create_single_chunk_archive(
-                        bsarch_path, chunk_staging_dir, chunk_output_path, is_texture_archive
-                    )
-
-                    if success:
-                        created_archives.append(chunk_output_path)
-                        chunk_size = os.path.getsize(chunk_output_path)
-                        log(f"✅ Created chunk {i+1}: {os.path.basename(chunk_output_path)} ({format_bytes(chunk_size)})", log_type='SUCCESS')
-                    else:
-                        log(f"❌ Failed to create chunk {i+1}: {message}", log_type='ERROR')
-                        return False, f"Failed to create chunk {i+1}: {message}", []
-
-                finally:
-                    # Clean up staging directory
+            # Build every chunk, then split and rebuild only those that came out over the limit
+            file_sizes = dict(file_info)
+            to_build = list(range(len(chunks)))
+            while to_build:
+                chunk_keys = [[chunk_key(path) for path in chunk_files] for chunk_files in chunks]
+                jobs = self._make_chunk_jobs(bsarch_path, source_dir, output_base_path, chunks, chunk_keys,
+                                             is_texture_archive)
+
+                success, message, _ = ArchiveJobExecutor(max_parallel=max_parallel, cancel_event=cancel_event).run(
+                    [jobs[i] for i in to_build])
+                if not success:
+                    log(f"❌ Failed to create {message}", log_type='ERROR')
+                    return False, f"Failed to create {message}", []
+
+                # Single-file chunks can't be split any further
+                oversized = [(i, os.path.getsize(jobs[i].output_path)) for i in to_build
+                             if len(chunks[i]) > 1 and os.path.exists(jobs[i].output_path)
+                             and os.path.getsize(jobs[i].output_path) > max_chunk_size_bytes]
+                to_build = []
+                for i, actual_size in oversized:
+                    log(f"⚠️ Chunk {i+1} came out at {format_bytes(actual_size)}, over the "
+                        f"{format_bytes(max_chunk_size_bytes)} limit - splitting it", log_type='WARNING')
+                    pieces = planner.split([(path, file_sizes[path]) for path in chunks[i]],
+                                           max_chunk_size_bytes, actual_size)
+                    # Extra pieces go at the end so the other chunks keep their names
+                    chunks[i] = pieces[0]
+                    to_build.append(i)
+                    for piece in pieces[1:]:
+                        to_build.append(len(chunks))
+                        chunks.append(piece)
+
+            created_archives = [job.output_path for job in jobs if os.path.exists(job.output_path)]
+
+            # Drop trailing chunks left over from a previous build that needed more of them
+            output_paths = {os.path.abspath(job.output_path) for job in jobs}
+            for previous in manifest.chunks[len(chunks):]:
+                stale = previous.get('archive')
+                if (stale and stale not in output_paths and os.path.exists(stale)
+                        and os.path.dirname(stale) == os.path.dirname(os.path.abspath(output_base_path))):
                     try:
-                        shutil.rmtree(chunk_staging_dir, ignore_errors=True)
-                    except Exception as cleanup_error:
-                        log(f"⚠️ Failed to cleanup chunk staging directory: {cleanup_error}", log_type='WARNING')
+                        os.remove(stale)
+                        log(f"🧹 Removed stale chunk archive: {os.path.basename(stale)}", log_type='INFO')
+                    except OSError as e:
+                        log(f"⚠️ Failed to remove stale chunk archive {stale}: {e}", log_type='WARNING')
+
+            manifest.update(chunk_keys, digests, created_archives)
+            manifest_store.save(self.game_type, output_base_path, manifest, source_path)
 
             # Verify all chunks were created successfully
             if len(created_archives) == len(chunks):
@@ -531,98 +528,207 @@ class BSArchService:
             log(f"❌ Error creating chunked archives: {e}", log_type='ERROR')
             return False, f"Error creating chunked archives: {e}", []
 
-    def _distribute_files_into_chunks(self, file_info: List[Tuple[str, int]], max_chunk_size_bytes: int) -> List[List[str]]:
+    def _make_chunk_jobs(self, bsarch_path: str, source_dir: str, output_base_path: str, chunks: List[List[str]],
+                         chunk_keys: List[List[str]], is_texture_archive: bool) -> List[ArchiveJob]:
         """
-        Distribute files into chunks using bin packing algorithm.
+        Create one archive job per chunk; unchanged chunks are restored from the archive cache.
 
         Args:
-            file_info: List of (file_path, file_size) tuples
-            max_chunk_size_bytes: Maximum size per chunk
+            bsarch_path: Path to BSArch executable
+            source_dir: Directory containing files to pack
+            output_base_path: Base path for output archives
+            chunks: Planned chunks as lists of file paths
+            chunk_keys: The same chunks as lists of manifest keys
+            is_texture_archive: Whether this archive contains texture files (affects --dds flag usage)
 
         Returns:
-            List of chunks, where each chunk is a list of file paths
+            Jobs in chunk order
         """
-        chunks = []
-        current_chunk = []
-        current_chunk_size = 0
-
-        for file_path, file_size in file_info:
-            # If single file exceeds chunk limit, we need to handle it specially
-            if file_size > max_chunk_size_bytes:
-                log(f"⚠️ File {os.path.basename(file_path)} ({format_bytes(file_size)}) exceeds chunk limit", log_type='WARNING')
-                log(f"⚠️ This file will be placed in its own chunk", log_type='WARNING')
-
-                # Finish current chunk if it has files
-                if current_chunk:
-                    chunks.append(current_chunk)
-                    current_chunk = []
-                    current_chunk_size = 0
-
-                # Create single-file chunk
-                chunks.append([file_path])
-                continue
-
-            # Check if adding this file would exceed the limit
-            if current_chunk_size + file_size > max_chunk_size_bytes and current_chunk:
-                # Finish current chunk and start new one
-                chunks.append(current_chunk)
-                current_chunk = [file_path]
-                current_chunk_size = file_size
+        # Create archives for each chunk (independent staging dirs, built concurrently)
+        archive_ext = ".ba2" if self.game_type == "fallout4" else ".bsa"
+        jobs = []
+
+        for i, chunk_files in enumerate(chunks):
+            # Generate chunk name based on mod name
+            # First chunk (i=0): modname.bsa (no number)
+            # Subsequent chunks: modname0.bsa, modname1.bsa, etc. (starting from 0)
+            if i == 0:
+                # First chunk gets the main name
+                chunk_output_path = f"{output_base_path}{archive_ext}"
             else:
-                # Add file to current chunk
-                current_chunk.append(file_path)
-                current_chunk_size += file_size
+                # Subsequent chunks start numbering from 0
+                chunk_output_path = f"{output_base_path}{i-1}{archive_ext}"
 
-        # Add final chunk if it has files
-        if current_chunk:
-            chunks.append(current_chunk)
+            build = self._make_chunk_build(bsarch_path, source_dir, chunk_files, chunk_output_path,
+                                           i, len(chunks), is_texture_archive)
+            cache_key = self._chunk_cache_key(bsarch_path, chunk_files, chunk_keys[i], is_texture_archive)
+            if cache_key:
+                build = self._make_cached_chunk_build(build, cache_key, chunk_output_path, i)
+            jobs.append(ArchiveJob(f"chunk {i+1}/{len(chunks)}", chunk_output_path, build))
 
-        # Log chunk distribution
-        for i, chunk in enumerate(chunks):
-            chunk_size = sum(file_info[j][1] for j, (fp, _) in enumerate(file_info) if fp in chunk)
-            log(f"📊 Chunk {i+1}: {len(chunk)} files, {format_bytes(chunk_size)}", log_type='DEBUG')
+        return jobs
 
-        return chunks
+    def _chunk_cache_key(self, bsarch_path: str, chunk_files: List[str], chunk_keys: List[str],
+                         is_texture_archive: bool) -> Optional[str]:
+        """
+        Build the archive cache key of one chunk, or None if caching is not possible.
 
-    def _stage_files_for_chunk(self, chunk_files: List[str], chunk_staging_dir: str, source_dir: str):
+        Args:
+            bsarch_path: Path to BSArch executable
+            chunk_files: Files belonging to this chunk
+            chunk_keys: The same files as Data-relative keys
+            is_texture_archive: Whether the chunk is built with -dds
+
+        Returns:
+            Cache key or None
         """
-        Stage files for a specific chunk maintaining directory structure.
+        capabilities = get_tool_registry().bsarch(bsarch_path)
+        if not capabilities.get('valid'):
+            return None
+        params = {
+            'format': 1,
+            'game_type': self.game_type,
+            'dds': is_texture_archive,
+            'compress': True,
+            'chunk': True,
+            'backend': f"bsarch:{capabilities.get('version') or 'unknown'}:{capabilities['size']}:{capabilities['mtime_ns']}"
+        }
+        try:
+            return get_archive_cache().make_key(list(zip(chunk_keys, chunk_files)), params)
+        except Exception as e:
+            log(f"⚠️ Archive cache unavailable for chunks: {e}", log_type='WARNING')
+            return None
+
+    def _make_chunk_build(self, bsarch_path: str, source_dir: str, chunk_files: List[str], chunk_output_path: str,
+                          index: int, total: int, is_texture_archive: bool):
+        """
+        Create the build callable for one chunk job.
 
         Args:
-            chunk_files: List of files for this chunk
-            chunk_staging_dir: Directory to stage files in
+            bsarch_path: Path to BSArch executable
             source_dir: Original source directory
+            chunk_files: Files belonging to this chunk
+            chunk_output_path: Output archive path for this chunk
+            index: Zero-based chunk index
+            total: Total number of chunks
+            is_texture_archive: Whether this archive contains texture files (affects --dds flag usage)
+
+        Returns:
+            Callable taking the executor's cancel event and returning (success, message, created_archives)
         """
-        log(f"🔧 Staging {len(chunk_files)} files for chunk", log_type='DEBUG')
-        log(f"🔧 Source directory: {source_dir}", log_type='DEBUG')
-        log(f"🔧 Staging directory: {chunk_staging_dir}", log_type='DEBUG')
+        def build(cancel_event):
+            log(f"📦 Creating chunk {index+1}/{total}: {os.path.basename(chunk_output_path)}", log_type='INFO')
+            log(f"📊 Chunk {index+1} contains {len(chunk_files)} files", log_type='DEBUG')
 
-        staged_count = 0
-        for file_path in chunk_files:
-            if not os.path.exists(file_path):
-                log(f"⚠️ File not found, skipping: {file_path}", log_type='WARNING')
-                continue
+            # Create staging directory for this chunk on the sources' filesystem so files can be linked
+            chunk_staging_dir = get_scratch_manager().mkdtemp(prefix=f"bsa_chunk_{index}_", near=source_dir)
 
-            # Calculate relative path from source directory
             try:
-                rel_path = os.path.relpath(file_path, source_dir)
-                dest_path = os.path.join(chunk_staging_dir, rel_path)
+                # Stage files for this chunk
+                self._stage_files_for_chunk(chunk_files, chunk_staging_dir, source_dir)
 
-                log(f"🔧 Staging: {file_path} -> {dest_path}", log_type='DEBUG')
+                # Verify staging directory has files
+                staged_files = []
+                for root, dirs, files in os.walk(chunk_staging_dir):
+                    staged_files.extend([os.path.join(root, f) for f in files])
 
-                # Create destination directory
-                os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+                if not staged_files:
+                    log(f"❌ No files staged for chunk {index+1}", log_type='ERROR')
+                    return False, "No files staged", []
 
-                # Copy file
-                shutil.copy2(file_path, dest_path)
-                staged_count += 1
+                log(f"📁 Staged {len(staged_files)} files for chunk {index+1}", log_type='DEBUG')
 
-            except Exception as e:
-                log(f"⚠️ Failed to stage file {file_path}: {e}", log_type='WARNING')
+                if cancel_event.is_set():
+                    return False, "Cancelled", []
+
+                # Create archive for this chunk
+                success, message = self._create_single_chunk_archive(
+                    bsarch_path, chunk_staging_dir, chunk_output_path, is_texture_archive,
+                    file_count=len(staged_files), cancel_event=cancel_event
+                )
 
-        log(f"🔧 Successfully staged {staged_count} files", log_type='DEBUG')
+                if not success:
+                    log(f"❌ Failed to create chunk {index+1}: {message}", log_type='ERROR')
+                    return False, message, []
 
-    def _create_single_chunk_archive(self, bsarch_path: str, staging_dir: str, output_path: str, is_texture_archive: bool = False) -> Tuple[bool, str]:
+                chunk_size = os.path.getsize(chunk_output_path)
+                log(f"✅ Created chunk {index+1}: {os.path.basename(chunk_output_path)} ({format_bytes(chunk_size)})", log_type='SUCCESS')
+                return True, message, [chunk_output_path]
+
+            finally:
+                # Clean up staging directory
+                try:
+                    get_scratch_manager().release(chunk_staging_dir)
+                except Exception as cleanup_error:
+                    log(f"⚠️ Failed to cleanup chunk staging directory: {cleanup_error}", log_type='WARNING')
+
+        return build
+
+    def _make_cached_chunk_build(self, build, cache_key: str, chunk_output_path: str, index: int):
+        """
+        Wrap a chunk build so an unchanged chunk is restored from the archive cache.
+
+        Args:
+            build: Build callable of the chunk
+            cache_key: Archive cache key of the chunk's contents
+            chunk_output_path: Output archive path for this chunk
+            index: Zero-based chunk index
+
+        Returns:
+            Callable taking the executor's cancel event and returning (success, message, created_archives)
+        """
+        def cached_build(cancel_event):
+            archive_cache = get_archive_cache()
+            if archive_cache.restore(cache_key, lambda _: chunk_output_path):
+                mark_reused(chunk_output_path)  # A failing sibling must not delete it
+                log(f"♻️ Chunk {index+1} unchanged, reused: {os.path.basename(chunk_output_path)}", log_type='INFO')
+                return True, "Reused unchanged chunk", [chunk_output_path]
+
+            success, message, created = build(cancel_event)
+            if success:
+                archive_cache.store(cache_key, created)
+            return success, message, created
+
+        return cached_build
+
+    def _distribute_files_into_chunks(self, file_info: List[Tuple[str, int]], max_chunk_size_bytes: int,
+                                      previous_assignment: Optional[Dict[str, int]] = None,
+                                      key=None, planner: Optional[ChunkPlanner] = None) -> List[List[str]]:
+        """
+        Distribute files into chunks using first-fit-decreasing on predicted archive sizes.
+
+        Args:
+            file_info: List of (file_path, file_size) tuples
+            max_chunk_size_bytes: Maximum size per chunk
+            previous_assignment: Optional file key -> chunk index mapping from the last build
+            key: Function mapping a file path to its assignment key
+            planner: Planner to use (defaults to a new one)
+
+        Returns:
+            List of chunks, where each chunk is a list of file paths
+        """
+        return (planner or ChunkPlanner()).plan(file_info, max_chunk_size_bytes, previous_assignment, key)
+
+    def _stage_files_for_chunk(self, chunk_files: List[str], chunk_staging_dir: str, source_dir: str):
+        """
+        Stage files for a specific chunk maintaining directory structure.
+
+        Args:
+            chunk_files: List of files for this chunk
+            chunk_staging_dir: Directory to stage files in
+            source_dir: Original source directory
+        """
+        log(f"🔧 Staging {len(chunk_files)} files for chunk", log_type='DEBUG')
+        log(f"🔧 Source directory: {source_dir}", log_type='DEBUG')
+        log(f"🔧 Staging directory: {chunk_staging_dir}", log_type='DEBUG')
+
+        # Links to the source files: BSArch only reads them
+        staging = StagingTree(chunk_staging_dir)
+        staging.add_files(chunk_files, lambda file_path: os.path.relpath(file_path, source_dir))
+        log(f"🔧 {staging.summary()}", log_type='DEBUG')
+
+    def _create_single_chunk_archive(self, bsarch_path: str, staging_dir: str, output_path: str, is_texture_archive: bool = False,
+                                     file_count: int = 0, cancel_event: Optional[threading.Event] = None) -> Tuple[bool, str]:
         """
         Create a single archive for one chunk.
 
@@ -631,6 +737,8 @@ class BSArchService:
             staging_dir: Directory containing staged files
             output_path: Path for output archive
             is_texture_archive: Whether this archive contains texture files (affects --dds flag usage)
+            file_count: Number of staged files (for progress estimation)
+            cancel_event: Event that aborts BSArch when set
 
         Returns:
             Tuple of (success: bool, message: str)
@@ -639,9 +747,6 @@ class BSArchService:
             # Build BSArch command
             cmd = self._build_bsarch_command(bsarch_path, staging_dir, output_path, is_texture_archive)
 
-            # Execute BSArch
-            timeout = 300 + (len(os.listdir(staging_dir)) // 100) * 60  # Base 5min + 1min per 100 files
-
             # Log command details for debugging
             log(f"🔧 BSArch command: {' '.join(cmd)}", log_type='DEBUG')
             log(f"📁 Staging directory: {staging_dir}", log_type='DEBUG')
@@ -653,13 +758,22 @@ class BSArchService:
                 if not bsarch_dir:
                     bsarch_dir = os.getcwd()
 
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout,
-                                      cwd=bsarch_dir, shell=False)
-            except subprocess.TimeoutExpired:
-                return False, f"BSArch timed out after {timeout // 60} minutes"
+                with archive_build_slot(cancel_event) as acquired:
+                    if not acquired:
+                        return False, "Cancelled"
+                    with tool_progress(f"BSArch {os.path.basename(output_path)}") as on_progress:
+                        result = run_streaming(cmd, cwd=bsarch_dir, tool="BSArch", cancel_event=cancel_event,
+                                               inactivity_timeout=inactivity_timeout_for("BSArch"),
+                                               progress_parser=BSArchProgressCounter(file_count),
+                                               on_progress=on_progress)
             except Exception as e:
                 return False, f"BSArch execution error: {e}"
 
+            if result.cancelled:
+                return False, "Cancelled"
+            if result.timed_out:
+                return False, f"BSArch stalled ({result.stall_description})"
+
             # Log BSArch output for debugging
             log(f"🔧 BSArch return code: {result.returncode}", log_type='DEBUG')
             if result.stdout:
@@ -750,7 +864,8 @@ def execute_bsarch_universal(source_dir: str,
                             files: List[str],
                             game_type: str = "skyrim",
                             interactive: bool = False,
-                            is_texture_archive: bool = False) -> Tuple[bool, str]:
+                            is_texture_archive: bool = False,
+                            cancel_event: Optional[threading.Event] = None) -> Tuple[bool, str]:
     """
     Universal function to execute BSArch.
 
@@ -761,12 +876,14 @@ def execute_bsarch_universal(source_dir: str,
         game_type: Target game type
         interactive: Whether to ask user if BSArch not found
         is_texture_archive: Whether this archive contains texture files (affects --dds flag usage)
+        cancel_event: Event that aborts BSArch when set
 
     Returns:
         Tuple of (success, message)
     """
     service = get_bsarch_service(game_type)
-    return service.execute_bsarch(source_dir, output_path, files, interactive=interactive, is_texture_archive=is_texture_archive)
+    return service.execute_bsarch(source_dir, output_path, files, interactive=interactive, is_texture_archive=is_texture_archive,
+                                  cancel_event=cancel_event)
 
 
 def execute_bsarch_chunked_universal(source_dir: str,
@@ -775,7 +892,10 @@ def execute_bsarch_chunked_universal(source_dir: str,
                                     game_type: str = "skyrim",
                                     max_chunk_size_gb: float = 2.0,
                                     interactive: bool = False,
-                                    is_texture_archive: bool = False) -> Tuple[bool, str, List[str]]:
+                                    is_texture_archive: bool = False,
+                                    max_parallel: Optional[int] = None,
+                                    cancel_event: Optional[threading.Event] = None,
+                                    source_path: Optional[str] = None) -> Tuple[bool, str, List[str]]:
     """
     Universal function to execute chunked BSArch.
 
@@ -787,12 +907,16 @@ def execute_bsarch_chunked_universal(source_dir: str,
         max_chunk_size_gb: Maximum size per chunk in GB (default 2.0)
         interactive: Whether to ask user if BSArch not found
         is_texture_archive: Whether this archive contains texture files (affects --dds flag usage)
+        max_parallel: Maximum number of chunks built concurrently
+        cancel_event: Event that aborts BSArch when set
+        source_path: Path identifying the archive set across runs (defaults to the output folder)
 
     Returns:
         Tuple of (success: bool, message: str, created_archives: List[str])
     """
     service = get_bsarch_service(game_type)
-    return service.execute_bsarch_chunked(source_dir, output_base_path, files, max_chunk_size_gb, interactive, is_texture_archive)
+    return service.execute_bsarch_chunked(source_dir, output_base_path, files, max_chunk_size_gb, interactive,
+                                          is_texture_archive, max_parallel, cancel_event, source_path)
 
 def check_bsarch_availability_universal(game_type: str = "skyrim",
                                         interactive: bool = False,
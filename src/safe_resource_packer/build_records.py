@@ -0,0 +1,174 @@
+"""
+Incremental Build Records
+
+Remembers, per output package, the fingerprint of everything that went into
+it: asset and plugin content digests, the selected plugin and folders, game
+type, compression settings and tool versions. A batch re-run skips mods whose
+inputs and output .7z are unchanged. Records live in a small JSON file in the
+output directory.
+"""
+
+import os
+import json
+import shutil
+import hashlib
+import threading
+from typing import Any, Callable, Dict, List, Optional
+from .dynamic_progress import log
+from .tool_registry import get_tool_registry
+
+
+RECORDS_FORMAT_VERSION = 1
+RECORDS_FILE_NAME = ".srp_build_records.json"
+
+
+class BuildRecords:
+    """Build records of the packages in one output directory."""
+
+    def __init__(self, output_path: str):
+        """
+        Initialize build records.
+
+        Args:
+            output_path: Directory the packages are written to
+        """
+        self.output_path = output_path
+        self.records_file = os.path.join(output_path, RECORDS_FILE_NAME)
+        self._lock = threading.Lock()
+        self._records = self._load()
+
+    def _load(self) -> Dict[str, Any]:
+        """Load records of previous runs."""
+        try:
+            if os.path.exists(self.records_file):
+                with open(self.records_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get('version') == RECORDS_FORMAT_VERSION:
+                    return data.get('packages', {})
+        except Exception as e:
+            log(f"⚠️ Failed to load build records: {e}", log_type='WARNING')
+        return {}
+
+    def _save(self) -> None:
+        """Atomically persist the records (caller holds the lock)."""
+        try:
+            os.makedirs(self.output_path, exist_ok=True)
+            tmp_path = f"{self.records_file}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': RECORDS_FORMAT_VERSION, 'packages': self._records}, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_path, self.records_file)
+        except Exception as e:
+            log(f"⚠️ Failed to save build records: {e}", log_type='WARNING')
+
+    def is_up_to_date(self, package_path: str, fingerprint: Optional[str]) -> bool:
+        """
+        Check whether a package was built from the same inputs and is untouched since.
+
+        Args:
+            package_path: Path of the output package
+            fingerprint: Input fingerprint of the current run
+
+        Returns:
+            True if the package can be kept as is
+        """
+        if not fingerprint:
+            return False
+        with self._lock:
+            record = self._records.get(os.path.basename(package_path))
+        if not record or record.get('fingerprint') != fingerprint:
+            return False
+        try:
+            stat = os.stat(package_path)
+        except OSError:
+            return False
+        return record.get('size') == stat.st_size and record.get('mtime_ns') == stat.st_mtime_ns
+
+    def record(self, package_path: str, fingerprint: Optional[str], mod_name: str) -> None:
+        """
+        Record a freshly built package.
+
+        Args:
+            package_path: Path of the output package
+            fingerprint: Input fingerprint the package was built from
+            mod_name: Name of the source mod
+        """
+        if not fingerprint:
+            return
+        try:
+            stat = os.stat(package_path)
+        except OSError:
+            return
+        with self._lock:
+            self._records[os.path.basename(package_path)] = {
+                'fingerprint': fingerprint,
+                'mod_name': mod_name,
+                'size': stat.st_size,
+                'mtime_ns': stat.st_mtime_ns
+            }
+            self._save()
+
+    def forget(self, package_path: str) -> None:
+        """Drop the record of a package (e.g. after a failed rebuild)."""
+        with self._lock:
+            if self._records.pop(os.path.basename(package_path), None) is not None:
+                self._save()
+
+
+def input_fingerprint(files: List[str], base_path: str, settings: Dict[str, Any],
+                      digest: Callable[[str], Optional[str]]) -> Optional[str]:
+    """
+    Fingerprint the inputs of a package.
+
+    Args:
+        files: Input files (assets and plugins)
+        base_path: Mod folder the files are relative to
+        settings: Build settings (selections, game type, compression, tools)
+        digest: Returns a file's content digest (None if unreadable)
+
+    Returns:
+        Hex digest, or None if a file could not be digested
+    """
+    hash_obj = hashlib.sha256()
+    hash_obj.update(json.dumps(settings, sort_keys=True, default=str).encode('utf-8'))
+    for file_path in sorted(files, key=lambda path: os.path.relpath(path, base_path).lower()):
+        file_digest = digest(file_path)
+        if not file_digest:
+            return None
+        hash_obj.update(os.path.relpath(file_path, base_path).replace('\\', '/').lower().encode('utf-8'))
+        hash_obj.update(b'\0')
+        hash_obj.update(file_digest.encode('ascii'))
+        hash_obj.update(b'\n')
+    return hash_obj.hexdigest()
+
+
+def tool_versions(game_type: str) -> Dict[str, Optional[str]]:
+    """
+    Identify the BSArch and 7z binaries a build would use.
+
+    Args:
+        game_type: Target game (selects the BSArch service)
+
+    Returns:
+        Dictionary with 'bsarch' and '7z' identifiers (None if not found)
+    """
+    registry = get_tool_registry()
+    versions = {'bsarch': None, '7z': None}
+
+    try:
+        from .bsarch_service import get_bsarch_service
+        bsarch_path = get_bsarch_service(game_type).detector.get_bsarch_path()
+        if bsarch_path and os.path.exists(bsarch_path):
+            capabilities = registry.bsarch(bsarch_path)
+            if capabilities.get('valid'):
+                versions['bsarch'] = f"{capabilities.get('version') or 'unknown'}:{capabilities['size']}:{capabilities['mtime_ns']}"
+    except Exception:
+        pass
+
+    for command in ['7z', '7za', '7zz']:
+        if shutil.which(command):
+            capabilities = registry.sevenzip(command)
+            if capabilities.get('valid'):
+                versions['7z'] = f"{capabilities.get('flavor')}:{capabilities.get('version') or 'unknown'}:{capabilities.get('size')}"
+                break
+
+    return versions
@@ -0,0 +1,195 @@
+"""
+Chunk Manifest Store
+
+Persists which chunk every file of a chunked BSA was assigned to, together with
+per-file content digests and per-chunk digests. On the next build the chunk
+planner keeps files in their previous chunks, so a change only alters the
+contents of the chunks it touches; the built chunk archives themselves live
+in the archive cache, keyed by their contents, and unchanged chunks are
+restored from there instead of being re-archived. File digests come from the
+archive cache's digest store, so a file hashed for the archive cache key is
+not hashed again here.
+
+Manifests are keyed by game type, archive name and the archive set's source
+(or output folder), and are stored next to the archive cache.
+"""
+
+import os
+import json
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
+from .dynamic_progress import log
+from .archive_cache import get_archive_cache
+
+
+MANIFEST_VERSION = 2
+
+
+class ChunkManifest:
+    """Chunk assignment and digests for one chunked archive set."""
+
+    def __init__(self, data: Optional[Dict[str, Any]] = None):
+        """
+        Initialize manifest.
+
+        Args:
+            data: Previously persisted manifest data
+        """
+        data = data or {}
+        self.files: Dict[str, Dict[str, Any]] = data.get('files', {})
+        self.chunks: List[Dict[str, Any]] = data.get('chunks', [])
+        self._stats: Dict[str, Tuple[int, int]] = {}
+
+    def assignment(self) -> Dict[str, int]:
+        """Get the previous file -> chunk index assignment."""
+        return {rel: info['chunk'] for rel, info in self.files.items() if 'chunk' in info}
+
+    def digest_files(self, files: List[Tuple[str, str]], threads: int = 4) -> Dict[str, str]:
+        """
+        Get content digests for files from the shared digest store.
+
+        Args:
+            files: List of (relative_key, file_path) tuples
+            threads: Number of hashing threads
+
+        Returns:
+            Dict mapping relative key to SHA1 digest
+        """
+        digests = {}
+        to_digest = []
+        stats = {}
+
+        for rel, path in files:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            stats[rel] = (stat.st_size, stat.st_mtime_ns)
+            to_digest.append((rel, path))
+
+        # Keyed by (relative path, size, mtime) like the archive cache key, so
+        # files it already digested are not read again
+        archive_cache = get_archive_cache()
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            for (rel, _), digest in zip(to_digest, executor.map(lambda item: archive_cache.file_digest(item[1], item[0]),
+                                                                to_digest)):
+                if digest:
+                    digests[rel] = digest
+
+        self._stats = stats
+        return digests
+
+    @staticmethod
+    def chunk_digest(members: List[str], digests: Dict[str, str]) -> str:
+        """Compute a digest over a chunk's sorted (path, content digest) pairs."""
+        hash_obj = hashlib.sha1()
+        for rel in sorted(members):
+            hash_obj.update(rel.encode('utf-8'))
+            hash_obj.update(b'\0')
+            hash_obj.update(digests.get(rel, '').encode('ascii'))
+            hash_obj.update(b'\n')
+        return hash_obj.hexdigest()
+
+    def update(self, chunks: List[List[str]], digests: Dict[str, str], archives: List[str]) -> None:
+        """
+        Record a completed build.
+
+        Args:
+            chunks: Chunks as lists of relative keys
+            digests: Relative key -> content digest
+            archives: Archive path for each chunk
+        """
+        stats = self._stats
+        self.files = {}
+        self.chunks = []
+        for index, (members, archive) in enumerate(zip(chunks, archives)):
+            for rel in members:
+                size, mtime_ns = stats.get(rel, (None, None))
+                self.files[rel] = {'size': size, 'mtime_ns': mtime_ns, 'sha1': digests.get(rel, ''), 'chunk': index}
+            self.chunks.append({
+                'archive': os.path.abspath(archive),
+                'digest': self.chunk_digest(members, digests)
+            })
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize manifest."""
+        return {'version': MANIFEST_VERSION, 'files': self.files, 'chunks': self.chunks}
+
+
+class ChunkManifestStore:
+    """Loads and saves chunk manifests keyed by game type, source and archive name."""
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        """
+        Initialize manifest store.
+
+        Args:
+            cache_dir: Directory to store manifests (defaults to chunk_manifests in the archive cache)
+        """
+        if cache_dir is None:
+            cache_dir = os.path.join(get_archive_cache().cache_dir, "chunk_manifests")
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _manifest_path(self, game_type: str, output_base_path: str, source_path: Optional[str] = None) -> str:
+        """Get manifest file path for an archive set."""
+        # Batch builds write into a fresh temp dir each run, so they pass the mod folder as source
+        scope = os.path.normcase(os.path.abspath(source_path or os.path.dirname(os.path.abspath(output_base_path))))
+        key = f"{game_type.lower()}|{scope.lower()}|{os.path.basename(output_base_path).lower()}"
+        return os.path.join(self.cache_dir, hashlib.sha1(key.encode('utf-8')).hexdigest() + ".json")
+
+    def load(self, game_type: str, output_base_path: str, source_path: Optional[str] = None) -> ChunkManifest:
+        """
+        Load manifest for an archive set.
+
+        Args:
+            game_type: Target game type
+            output_base_path: Base path of the chunked archives (without extension)
+            source_path: Path identifying the archive set across runs (defaults to the output folder)
+
+        Returns:
+            ChunkManifest (empty if none stored)
+        """
+        path = self._manifest_path(game_type, output_base_path, source_path)
+        try:
+            if os.path.exists(path):
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get('version') == MANIFEST_VERSION:
+                    return ChunkManifest(data)
+        except Exception as e:
+            log(f"⚠️ Failed to load chunk manifest: {e}", log_type='WARNING')
+        return ChunkManifest()
+
+    def save(self, game_type: str, output_base_path: str, manifest: ChunkManifest,
+             source_path: Optional[str] = None) -> None:
+        """
+        Save manifest for an archive set.
+
+        Args:
+            game_type: Target game type
+            output_base_path: Base path of the chunked archives (without extension)
+            manifest: Manifest to save
+            source_path: Path identifying the archive set across runs (defaults to the output folder)
+        """
+        path = self._manifest_path(game_type, output_base_path, source_path)
+        try:
+            tmp_path = path + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(manifest.to_dict(), f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            log(f"⚠️ Failed to save chunk manifest: {e}", log_type='WARNING')
+
+
+# Global manifest store instance
+_chunk_manifest_store = None
+
+
+def get_chunk_manifest_store() -> ChunkManifestStore:
+    """Get global chunk manifest store."""
+    global _chunk_manifest_store
+    if _chunk_manifest_store is None:
+        _chunk_manifest_store = ChunkManifestStore()
+    return _chunk_manifest_store
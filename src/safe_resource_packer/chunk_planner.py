@@ -0,0 +1,334 @@
+"""
+Chunk Planner - Compressed-size aware BSA chunk distribution
+
+Predicts the on-disk size of each file inside a compressed BSA using a
+per-extension compression-ratio model, then bin-packs files into chunks with
+first-fit-decreasing so every chunk gets as close to the archive limit as
+possible. Fewer chunks means fewer dummy ESPs and fewer plugin slots.
+
+Each archive set is planned with its own model: ratios calibrated on one
+mod's textures say little about the next mod's. Calibrated ratios carry a
+safety margin, and a chunk that still comes out over the limit is split on
+its own with split(), leaving the chunks that fit untouched.
+"""
+
+import os
+import random
+import threading
+import zlib
+from typing import Callable, Dict, List, Optional, Tuple
+from .dynamic_progress import log
+from .utils import format_bytes
+
+try:
+    import lz4.frame as lz4_frame
+    LZ4_AVAILABLE = True
+except ImportError:
+    lz4_frame = None
+    LZ4_AVAILABLE = False
+
+
+# Typical compressed/uncompressed ratios inside SSE archives, used until calibrated
+DEFAULT_COMPRESSION_RATIOS = {
+    '.nif': 0.45,
+    '.hkx': 0.55,
+    '.tri': 0.50,
+    '.pex': 0.60,
+    '.psc': 0.30,
+    '.seq': 0.40,
+    '.txt': 0.35,
+    '.json': 0.30,
+    '.ini': 0.35,
+    '.xml': 0.25,
+    '.swf': 0.95,
+    '.dds': 0.70,
+    '.png': 1.00,
+    '.wav': 0.85,
+    '.xwm': 1.00,
+    '.fuz': 1.00,
+    '.lip': 0.60,
+    '.bik': 1.00,
+}
+DEFAULT_UNKNOWN_RATIO = 0.75
+
+# Per-file record overhead in the archive (folder/file records and names)
+FILE_RECORD_OVERHEAD = 128
+
+# Keep chunks slightly under the limit to absorb prediction error
+DEFAULT_FILL_TARGET = 0.95
+
+# Calibrated ratios are inflated by this factor: samples are small and LZ4 on a
+# 1 MB prefix is not exactly what BSArch achieves on whole files
+CALIBRATION_MARGIN = 1.10
+
+
+class CompressionRatioModel:
+    """Per-extension compression ratio model, calibrated by sampling real files."""
+
+    def __init__(self, sample_files_per_ext: int = 3, sample_bytes: int = 1024 * 1024):
+        """
+        Initialize the model.
+
+        Args:
+            sample_files_per_ext: How many files to sample for each extension
+            sample_bytes: Maximum bytes read from each sampled file
+        """
+        self.sample_files_per_ext = sample_files_per_ext
+        self.sample_bytes = sample_bytes
+        self.ratios: Dict[str, float] = dict(DEFAULT_COMPRESSION_RATIOS)
+        self.calibrated: Dict[str, float] = {}
+        self.correction = 1.0  # Raised by correct() after an archive came out larger than predicted
+        self._samples: Dict[str, List[int]] = {}  # ext -> [raw bytes, compressed bytes]
+        self._sampled = set()
+        self._lock = threading.Lock()
+
+    def ratio_for(self, file_path: str) -> float:
+        """Get the expected compression ratio for a file."""
+        ext = os.path.splitext(file_path)[1].lower()
+        return self.ratios.get(ext, DEFAULT_UNKNOWN_RATIO)
+
+    def predict_size(self, file_path: str, file_size: int, compressed: bool = True) -> int:
+        """
+        Predict the space a file takes inside the archive.
+
+        Args:
+            file_path: Path to the file
+            file_size: Uncompressed size in bytes
+            compressed: Whether the archive is compressed
+
+        Returns:
+            Predicted size in bytes
+        """
+        ratio = self.ratio_for(file_path) if compressed else 1.0
+        return int(file_size * ratio * self.correction) + FILE_RECORD_OVERHEAD
+
+    def correct(self, factor: float) -> None:
+        """
+        Scale all predictions up after a build exceeded them.
+
+        Args:
+            factor: Actual size divided by the size the plan allowed
+        """
+        with self._lock:
+            self.correction *= max(1.0, factor)
+
+    def calibrate(self, file_info: List[Tuple[str, int]]) -> None:
+        """
+        Calibrate ratios for the extensions present in file_info.
+
+        Samples a few files per extension and compresses their first
+        sample_bytes with LZ4 (what SSE archives use) or zlib as a fallback.
+        Repeated calls sample files not seen before and keep a byte-weighted
+        average, so the ratio converges instead of freezing on the first sample.
+
+        Args:
+            file_info: List of (file_path, file_size) tuples
+        """
+        by_ext: Dict[str, List[str]] = {}
+        with self._lock:
+            for file_path, file_size in file_info:
+                if file_size <= 0 or file_path in self._sampled:
+                    continue
+                by_ext.setdefault(os.path.splitext(file_path)[1].lower(), []).append(file_path)
+
+        rng = random.Random(0)  # Deterministic sampling
+        for ext, paths in sorted(by_ext.items()):
+            sample = paths if len(paths) <= self.sample_files_per_ext else rng.sample(sorted(paths), self.sample_files_per_ext)
+            raw_total = 0
+            compressed_total = 0
+            for path in sample:
+                try:
+                    with open(path, 'rb') as f:
+                        data = f.read(self.sample_bytes)
+                except OSError:
+                    continue
+                if not data:
+                    continue
+                raw_total += len(data)
+                compressed_total += len(self._compress(data))
+
+            with self._lock:
+                self._sampled.update(sample)
+                if not raw_total:
+                    continue
+                totals = self._samples.setdefault(ext, [0, 0])
+                totals[0] += raw_total
+                totals[1] += compressed_total
+                ratio = min(1.0, totals[1] / totals[0] * CALIBRATION_MARGIN)
+                self.calibrated[ext] = ratio
+                self.ratios[ext] = ratio
+            log(f"📐 Compression ratio {ext or '<none>'}: {ratio:.2f} ({len(sample)} more sampled)", debug_only=True, log_type='DEBUG')
+
+    def _compress(self, data: bytes) -> bytes:
+        """Compress a sample with the codec closest to BSArch's."""
+        if LZ4_AVAILABLE:
+            return lz4_frame.compress(data)
+        return zlib.compress(data, 1)
+
+
+class ChunkPlanner:
+    """First-fit-decreasing chunk planner driven by predicted compressed sizes."""
+
+    def __init__(self, model: Optional[CompressionRatioModel] = None,
+                 fill_target: float = DEFAULT_FILL_TARGET, compressed: bool = True):
+        """
+        Initialize planner.
+
+        Args:
+            model: Compression ratio model (defaults to a new model for this archive set)
+            fill_target: Fraction of the limit each chunk may be filled to
+            compressed: Whether archives are built with compression
+        """
+        self.model = model or CompressionRatioModel()
+        self.fill_target = fill_target
+        self.compressed = compressed
+
+    def predict(self, file_info: List[Tuple[str, int]], calibrate: bool = True) -> List[Tuple[str, int]]:
+        """
+        Predict archive sizes for files.
+
+        Args:
+            file_info: List of (file_path, file_size) tuples
+            calibrate: Whether to calibrate the model on these files first
+
+        Returns:
+            List of (file_path, predicted_size) tuples
+        """
+        if calibrate and self.compressed:
+            self.model.calibrate(file_info)
+        return [(path, self.model.predict_size(path, size, self.compressed)) for path, size in file_info]
+
+    def plan(self, file_info: List[Tuple[str, int]], max_chunk_size_bytes: int,
+             previous_assignment: Optional[Dict[str, int]] = None,
+             key: Optional[Callable[[str], str]] = None) -> List[List[str]]:
+        """
+        Distribute files into chunks using first-fit-decreasing on predicted sizes.
+
+        When a previous assignment is given, files keep their previous chunk as long
+        as it still fits; only new files and files evicted from overfull chunks are
+        placed first-fit-decreasing, so unchanged chunks keep identical contents.
+
+        Args:
+            file_info: List of (file_path, file_size) tuples
+            max_chunk_size_bytes: Maximum archive size per chunk
+            previous_assignment: Optional mapping of file key -> previous chunk index
+            key: Function mapping a file path to its assignment key (defaults to the path)
+
+        Returns:
+            List of chunks, where each chunk is a list of file paths
+        """
+        capacity = int(max_chunk_size_bytes * self.fill_target)
+        predicted = self.predict(file_info)
+        # Size descending, path as tie-breaker so plans are reproducible
+        predicted.sort(key=lambda item: (-item[1], item[0]))
+
+        chunks: List[List[str]] = []
+        chunk_sizes: List[int] = []
+        unplaced = predicted
+
+        if previous_assignment:
+            chunks, chunk_sizes, unplaced = self._keep_previous(predicted, capacity, previous_assignment, key or (lambda p: p))
+            if chunks:
+                log(f"📌 Kept {sum(len(c) for c in chunks)} files in their previous {len(chunks)} chunk(s)", log_type='DEBUG')
+
+        for file_path, size in unplaced:
+            if size > capacity:
+                log(f"⚠️ File {os.path.basename(file_path)} (~{format_bytes(size)} packed) exceeds chunk limit", log_type='WARNING')
+                log("⚠️ This file will be placed in its own chunk", log_type='WARNING')
+                chunks.append([file_path])
+                chunk_sizes.append(size)
+                continue
+
+            for index, used in enumerate(chunk_sizes):
+                if used + size <= capacity:
+                    chunks[index].append(file_path)
+                    chunk_sizes[index] = used + size
+                    break
+            else:
+                chunks.append([file_path])
+                chunk_sizes.append(size)
+
+        for i, (chunk, used) in enumerate(zip(chunks, chunk_sizes)):
+            log(f"📊 Chunk {i+1}: {len(chunk)} files, ~{format_bytes(used)} predicted", log_type='DEBUG')
+
+        return chunks
+
+    def split(self, file_info: List[Tuple[str, int]], max_chunk_size_bytes: int,
+              actual_size: int) -> List[List[str]]:
+        """
+        Split one chunk whose archive came out over the limit.
+
+        Predictions for the chunk's files are scaled by how far the built archive
+        overshot them, then the files are spread over enough pieces to fit. A
+        chunk of several files always yields at least two pieces, so repeated
+        splits of the same files end.
+
+        Args:
+            file_info: (file_path, file_size) tuples of the chunk's files
+            max_chunk_size_bytes: Maximum archive size per chunk
+            actual_size: Size of the archive built from the chunk
+
+        Returns:
+            List of chunks, where each chunk is a list of file paths
+        """
+        predicted = self.predict(file_info, calibrate=False)
+        total = sum(size for _, size in predicted) or 1
+        scale = actual_size / total
+        capacity = max(1, int(max_chunk_size_bytes * self.fill_target))
+        pieces = min(len(predicted), max(2, -(-actual_size // capacity)))
+
+        # Largest first onto the lightest piece; path as tie-breaker so splits are reproducible
+        predicted.sort(key=lambda item: (-item[1], item[0]))
+        chunks: List[List[str]] = [[] for _ in range(pieces)]
+        chunk_sizes = [0] * pieces
+        for file_path, size in predicted:
+            index = min(range(pieces), key=lambda i: (chunk_sizes[i], i))
+            chunks[index].append(file_path)
+            chunk_sizes[index] += int(size * scale)
+
+        for i, (chunk, used) in enumerate(zip(chunks, chunk_sizes)):
+            log(f"📊 Split piece {i+1}: {len(chunk)} files, ~{format_bytes(used)} expected", log_type='DEBUG')
+
+        return chunks
+
+    def _keep_previous(self, predicted: List[Tuple[str, int]], capacity: int,
+                       previous_assignment: Dict[str, int], key: Callable[[str], str]):
+        """
+        Seed chunks from a previous assignment.
+
+        Args:
+            predicted: (file_path, predicted_size) tuples sorted size descending
+            capacity: Usable bytes per chunk
+            previous_assignment: Mapping of file key -> previous chunk index
+            key: Function mapping a file path to its assignment key
+
+        Returns:
+            Tuple of (chunks, chunk_sizes, unplaced files)
+        """
+        groups: Dict[int, List[Tuple[str, int]]] = {}
+        unplaced = []
+        for file_path, size in predicted:
+            index = previous_assignment.get(key(file_path))
+            if index is None:
+                unplaced.append((file_path, size))
+            else:
+                groups.setdefault(index, []).append((file_path, size))
+
+        chunks: List[List[str]] = []
+        chunk_sizes: List[int] = []
+        # Previous chunk order is preserved; chunks that lost all files are dropped
+        for index in sorted(groups):
+            members = []
+            used = 0
+            # Smallest first, so growth evicts the fewest bytes from an overfull chunk
+            for file_path, size in sorted(groups[index], key=lambda item: (item[1], item[0])):
+                if used + size <= capacity or not members:
+                    members.append(file_path)
+                    used += size
+                else:
+                    unplaced.append((file_path, size))
+            chunks.append(members)
+            chunk_sizes.append(used)
+
+        unplaced.sort(key=lambda item: (-item[1], item[0]))
+        return chunks, chunk_sizes, unplaced
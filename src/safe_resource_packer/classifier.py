@@ -10,6 +10,8 @@ from .dynamic_progress import log, print_progress, log_classification_progress
 from .utils import file_hash, validate_path_length, sanitize_filename, check_disk_space, format_bytes, safe_walk, is_file_locked, wait_for_file_unlock
 from .game_scanner import get_game_scanner
 from .constants import is_unpackable_folder
+from .scratch import get_scratch_manager
+from .progress_events import get_progress_events
 from .comprehensive_logging import (
     ComprehensiveLogger, log_classification_start, log_classification_end,
     log_classification_progress, log_file_operation_context
@@ -128,8 +130,9 @@ class PathClassifier:
             max_retries = 3
             for attempt in range(max_retries):
                 try:
-                    shutil.copy2(src, dest_path)
-                    log(f"Copied with Data structure: {src} → {data_rel_path}", debug_only=True, log_type='SPAM')
+                    with log_file_operation_context('copy', src, dest_path, stage='classify'):
+                        shutil.copy2(src, dest_path)
+                    log("Copied with Data structure: %s → %s", src, data_rel_path, debug_only=True, log_type='SPAM')
                     return True
                 except (OSError, IOError) as e:
                     if attempt < max_retries - 1:
@@ -183,20 +186,20 @@ class PathClassifier:
 
             src_path = self.find_file_case_insensitive(source_root, rel_path)
             if not src_path:
-                log(f"[NO MATCH] {rel_path} → pack", debug_only=True, log_type='SPAM')
+                log("[NO MATCH] %s → pack", rel_path, debug_only=True, log_type='SPAM')
                 if self.copy_file(gen_path, rel_path, out_pack):
                     return 'pack', data_rel_path
             else:
-                log(f"[MATCH FOUND] {rel_path} matched to {src_path}", debug_only=True, log_type='SPAM')
+                log("[MATCH FOUND] %s matched to %s", rel_path, src_path, debug_only=True, log_type='SPAM')
                 gen_hash = file_hash(gen_path)
                 src_hash = file_hash(src_path)
                 if gen_hash is None or src_hash is None:
                     return 'fail', data_rel_path
                 if gen_hash == src_hash:
-                    log(f"[SKIP] {rel_path} identical", debug_only=True, log_type='SPAM')
+                    log("[SKIP] %s identical", rel_path, debug_only=True, log_type='SPAM')
                     return 'skip', data_rel_path
                 else:
-                    log(f"[OVERRIDE] {rel_path} differs", debug_only=True, log_type='SPAM')
+                    log("[OVERRIDE] %s differs", rel_path, debug_only=True, log_type='SPAM')
                     if self.copy_file(gen_path, rel_path, out_loose):
                         return 'loose', data_rel_path
                     else:
@@ -264,27 +267,12 @@ class PathClassifier:
                 shutil.rmtree(out_loose, ignore_errors=True)
                 log(f"🧹 Cleaned existing loose directory: {out_loose}", log_type='INFO')
 
-        # Create temporary directories for this classification session
-        import tempfile
-        import uuid
-        
-        # Create unique temp directories for this session
-        session_id = str(uuid.uuid4())[:8]
-        temp_pack_dir = os.path.join(tempfile.gettempdir(), f"srp_pack_{session_id}")
-        temp_loose_dir = os.path.join(tempfile.gettempdir(), f"srp_loose_{session_id}")
-        temp_blacklisted_dir = os.path.join(tempfile.gettempdir(), f"srp_blacklisted_{session_id}")
-        
-        # Clean and create temp directories
-        if os.path.exists(temp_pack_dir):
-            shutil.rmtree(temp_pack_dir)
-        if os.path.exists(temp_loose_dir):
-            shutil.rmtree(temp_loose_dir)
-        if os.path.exists(temp_blacklisted_dir):
-            shutil.rmtree(temp_blacklisted_dir)
-        
-        os.makedirs(temp_pack_dir, exist_ok=True)
-        os.makedirs(temp_loose_dir, exist_ok=True)
-        os.makedirs(temp_blacklisted_dir, exist_ok=True)
+        # Create unique scratch directories for this classification session, on the
+        # outputs' filesystem where possible so results can be moved instead of copied
+        scratch = get_scratch_manager()
+        temp_pack_dir = scratch.mkdtemp(prefix="srp_pack_", near=out_pack)
+        temp_loose_dir = scratch.mkdtemp(prefix="srp_loose_", near=out_loose)
+        temp_blacklisted_dir = scratch.mkdtemp(prefix="srp_blacklisted_", near=out_loose)
         
         log(f"📁 Created temp pack directory: {temp_pack_dir}", log_type='INFO')
         log(f"📁 Created temp loose directory: {temp_loose_dir}", log_type='INFO')
@@ -316,10 +304,12 @@ class PathClassifier:
         # Choose the best progress system (avoid conflicts)
         dynamic_progress_active = False
         try:
-            from .dynamic_progress import start_dynamic_progress, is_dynamic_progress_enabled
+            from .dynamic_progress import (
+                start_classification_progress, update_classification_progress, is_dynamic_progress_enabled
+            )
             # Only use dynamic progress if no other Rich-based progress callback is active
             if is_dynamic_progress_enabled() and not hasattr(progress_callback, 'start_processing'):
-                start_dynamic_progress("Classification", total)
+                start_classification_progress(total)
                 dynamic_progress_active = True
         except ImportError:
             pass
@@ -328,6 +318,9 @@ class PathClassifier:
         if hasattr(progress_callback, 'start_processing') and not dynamic_progress_active:
             progress_callback.start_processing(total)
 
+        events = get_progress_events()
+        events.stage_start('classify', total)
+
         with ThreadPoolExecutor(max_workers=threads) as executor:
             futures = [
                 executor.submit(self.process_file, source_root, temp_pack_dir, temp_loose_dir, gp, rp)
@@ -349,22 +342,19 @@ class PathClassifier:
 
                 # Update progress with the active progress system
                 if dynamic_progress_active:
-                    # Use separate classification progress system
-                    try:
-                        from .dynamic_progress import update_classification_progress
-                        # Update progress with current file and increment counter
-                        update_classification_progress(path, result, increment=True)
-                    except ImportError:
-                        pass
+                    # Only bumps counters; the render thread redraws the display
+                    update_classification_progress(path, result, increment=True)
                 elif hasattr(progress_callback, 'update_progress'):
                     progress_callback.update_progress(path, result)
                 elif progress_callback:
                     progress_callback(current, total, "Classifying", path)
-                else:
+                elif not events.enabled:
                     # Show beautiful progress every 10 files or on important milestones
                     if current % 10 == 0 or current == total or current <= 5:
                         log_classification_progress(current, total, path)
                     print_progress(current, total, "Classifying", path)
+                events.progress('classify', current, total, pack=pack_count, loose=loose_count,
+                                blacklisted=blacklisted_count, skip=skip_count)
 
         # Finish the active progress system
         if dynamic_progress_active:
@@ -376,7 +366,7 @@ class PathClassifier:
         elif hasattr(progress_callback, 'finish_processing'):
             progress_callback.finish_processing()
         
-        # Copy files from temp directories to final output directories
+        # Move files from temp directories to final output directories
         try:
             # Clean final output directories
             if os.path.exists(out_pack):
@@ -388,7 +378,7 @@ class PathClassifier:
             os.makedirs(out_pack, exist_ok=True)
             os.makedirs(out_loose, exist_ok=True)
             
-            # Copy pack files
+            # Move pack files
             if pack_count > 0 and os.path.exists(temp_pack_dir):
                 copied_count = 0
                 for root, dirs, files in os.walk(temp_pack_dir):
@@ -397,13 +387,13 @@ class PathClassifier:
                         rel_path = os.path.relpath(src_path, temp_pack_dir)
                         dst_path = os.path.join(out_pack, rel_path)
                         os.makedirs(os.path.dirname(dst_path), exist_ok=True)
-                        shutil.copy2(src_path, dst_path)
+                        shutil.move(src_path, dst_path)  # Rename on the same filesystem
                         copied_count += 1
-                        log(f"📦 Copied: {src_path} → {dst_path}", debug_only=True, log_type='SPAM')
-                log(f"📦 Copied {copied_count} files to pack directory: {out_pack}", log_type='INFO')
-                log(f"📦 Expected {pack_count} files, actually copied {copied_count} files", log_type='DEBUG')
+                        log("📦 Moved: %s → %s", src_path, dst_path, debug_only=True, log_type='SPAM')
+                log(f"📦 Moved {copied_count} files to pack directory: {out_pack}", log_type='INFO')
+                log(f"📦 Expected {pack_count} files, actually moved {copied_count} files", log_type='DEBUG')
             
-            # Copy loose files
+            # Move loose files
             if loose_count > 0 and os.path.exists(temp_loose_dir):
                 copied_count = 0
                 for root, dirs, files in os.walk(temp_loose_dir):
@@ -412,11 +402,11 @@ class PathClassifier:
                         rel_path = os.path.relpath(src_path, temp_loose_dir)
                         dst_path = os.path.join(out_loose, rel_path)
                         os.makedirs(os.path.dirname(dst_path), exist_ok=True)
-                        shutil.copy2(src_path, dst_path)
+                        shutil.move(src_path, dst_path)  # Rename on the same filesystem
                         copied_count += 1
-                        log(f"📁 Copied: {src_path} → {dst_path}", debug_only=True, log_type='SPAM')
-                log(f"📁 Copied {copied_count} files to loose directory: {out_loose}", log_type='INFO')
-                log(f"📁 Expected {loose_count} files, actually copied {copied_count} files", log_type='DEBUG')
+                        log("📁 Moved: %s → %s", src_path, dst_path, debug_only=True, log_type='SPAM')
+                log(f"📁 Moved {copied_count} files to loose directory: {out_loose}", log_type='INFO')
+                log(f"📁 Expected {loose_count} files, actually moved {copied_count} files", log_type='DEBUG')
             
             # Note: Blacklisted files are kept in temp_blacklisted_dir until final packaging step
             # This prevents double-counting since both loose and blacklisted files would go to out_loose
@@ -424,8 +414,8 @@ class PathClassifier:
                 log(f"🚫 Keeping {blacklisted_count} blacklisted files in temp directory for final packaging", log_type='INFO')
             
             # Clean up temp directories (except blacklisted_dir which is kept for final packaging)
-            shutil.rmtree(temp_pack_dir, ignore_errors=True)
-            shutil.rmtree(temp_loose_dir, ignore_errors=True)
+            scratch.release(temp_pack_dir)
+            scratch.release(temp_loose_dir)
             # Note: temp_blacklisted_dir is kept for final packaging step
             log(f"🧹 Cleaned up temp directories", log_type='INFO')
             
@@ -445,6 +435,8 @@ class PathClassifier:
         
         self.logger.log_operation_end('Classify by Path', True, results)
         self.logger.end_timing(timing_id, True, results)
+        events.stage_end('classify', True, pack=pack_count, loose=loose_count,
+                         blacklisted=blacklisted_count, skip=skip_count)
         
         return pack_count, loose_count, blacklisted_count, skip_count, temp_blacklisted_dir
 
@@ -486,7 +478,7 @@ class PathClassifier:
             if part.lower() in known_dirs:
                 # Found a game directory! Return path from here onwards
                 data_relative = '/'.join(path_parts[i:])
-                log(f"Found game dir '{part}': {file_path} → {data_relative}", debug_only=True, log_type='SPAM')
+                log("Found game dir '%s': %s → %s", part, file_path, data_relative, debug_only=True, log_type='SPAM')
                 return data_relative
 
         # Step 2: Look for explicit "Data" directory
@@ -494,7 +486,7 @@ class PathClassifier:
             if part.lower() == 'data' and i < len(path_parts) - 1:
                 # Found Data directory! Return everything after it
                 data_relative = '/'.join(path_parts[i+1:])
-                log(f"Found Data folder: {file_path} → {data_relative}", debug_only=True, log_type='SPAM')
+                log("Found Data folder: %s → %s", file_path, data_relative, debug_only=True, log_type='SPAM')
                 return data_relative
 
         # Step 3: Final fallback - preserve directory structure (bulletproof approach!)
@@ -16,6 +16,7 @@ from .logging_service import (
     log_error, log_configuration_change, log_performance_metric,
     start_timing, end_timing
 )
+from .file_op_telemetry import get_file_op_telemetry
 
 
 def log_operation(operation_name: str, config: Dict[str, Any] = None):
@@ -52,22 +53,16 @@ def log_operation(operation_name: str, config: Dict[str, Any] = None):
 
 
 def log_file_operations(func: Callable) -> Callable:
-    """Decorator to log file operations."""
+    """Decorator to record file operations in the aggregated telemetry."""
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
+        start_time = time.perf_counter()
         try:
             result = func(*args, **kwargs)
-            log_file_operation(
-                operation=func.__name__,
-                success=True
-            )
+            get_file_op_telemetry().record(func.__name__, latency=time.perf_counter() - start_time)
             return result
         except Exception as e:
-            log_file_operation(
-                operation=func.__name__,
-                success=False,
-                error=str(e)
-            )
+            get_file_op_telemetry().record(func.__name__, latency=time.perf_counter() - start_time, error=str(e))
             raise
     
     return wrapper
@@ -109,32 +104,22 @@ def log_configuration_access(component_name: str):
 
 
 @contextmanager
-def log_file_operation_context(operation: str, source: str = None, destination: str = None):
-    """Context manager for file operations with comprehensive logging."""
-    start_time = time.time()
-    log_file_operation(operation, source, destination, success=True)
-    
+def log_file_operation_context(operation: str, source: str = None, destination: str = None,
+                               size: int = None, stage: str = 'default'):
+    """
+    Context manager for file operations, recorded in the aggregated telemetry.
+
+    Only failures and a sample of successes are logged in full; everything
+    else is folded into the per-stage counters and histograms.
+    """
+    start_time = time.perf_counter()
     try:
         yield
-        duration = time.time() - start_time
-        log_file_operation(
-            operation=f"{operation}_completed",
-            source=source,
-            destination=destination,
-            success=True
-        )
-        log_performance_metric(f"{operation}_duration", duration, "seconds")
-        
+        get_file_op_telemetry().record(operation, source, destination, size,
+                                       latency=time.perf_counter() - start_time, stage=stage)
     except Exception as e:
-        duration = time.time() - start_time
-        log_file_operation(
-            operation=f"{operation}_failed",
-            source=source,
-            destination=destination,
-            success=False,
-            error=str(e)
-        )
-        log_performance_metric(f"{operation}_duration", duration, "seconds")
+        get_file_op_telemetry().record(operation, source, destination, size,
+                                       latency=time.perf_counter() - start_time, error=str(e), stage=stage)
         raise
 
 
@@ -196,6 +196,7 @@ class ConfigService:
         if config_type == "batch_repacking":
             config['collection'] = cached_config.get('collection', '')
             config['output_path'] = cached_config.get('output_path', '')
+            config['job_order'] = cached_config.get('job_order', 'lpt')
 
         return config
 
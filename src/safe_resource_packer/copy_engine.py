@@ -0,0 +1,255 @@
+"""
+Parallel File Copy Engine
+
+Copying a game Data folder file by file leaves most of the disk's throughput
+unused: each small file costs an open, a read, a write and a metadata update,
+and one thread only ever has one of them in flight. The engine walks the
+source once on the calling thread (creating destination directories as it
+goes) and hands files to a worker pool in batches. The pool is sized for the
+storage the data lives on: many workers for SSDs and network shares, where
+parallel requests hide latency, and only a couple for spinning disks, where
+they would just make the heads seek. Progress is reported once per batch and
+results are aggregated, so per-file bookkeeping never becomes the bottleneck.
+"""
+
+import os
+import sys
+import time
+import shutil
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Callable, Iterable, List, Optional, Tuple
+from .file_op_telemetry import FileOpTelemetry, get_file_op_telemetry
+
+
+STORAGE_SSD = 'ssd'
+STORAGE_HDD = 'hdd'
+STORAGE_NETWORK = 'network'
+STORAGE_UNKNOWN = 'unknown'
+
+# Copy workers per storage type (SSD scales with the CPU count)
+STORAGE_WORKERS = {
+    STORAGE_HDD: 2,
+    STORAGE_NETWORK: 16,
+    STORAGE_UNKNOWN: 8,
+}
+MAX_SSD_WORKERS = 32
+
+NETWORK_FILESYSTEMS = ('nfs', 'nfs4', 'cifs', 'smb3', 'smbfs', '9p', 'fuse.sshfs', 'afs')
+
+DEFAULT_BATCH_SIZE = 32
+MAX_REPORTED_ERRORS = 20
+
+
+def _linux_mount_type(path: str) -> Optional[str]:
+    """Filesystem type of the mount containing path, from /proc/mounts."""
+    try:
+        with open('/proc/mounts', 'r', encoding='utf-8') as f:
+            mounts = [line.split() for line in f]
+    except OSError:
+        return None
+    path = os.path.realpath(path)
+    best, fs_type = '', None
+    for fields in mounts:
+        if len(fields) < 3:
+            continue
+        mount_point = fields[1].replace('\\040', ' ')
+        if (path == mount_point or path.startswith(mount_point.rstrip('/') + '/')) and len(mount_point) > len(best):
+            best, fs_type = mount_point, fields[2]
+    return fs_type
+
+
+def _linux_is_rotational(path: str) -> Optional[bool]:
+    """Whether the block device holding path is a spinning disk (None if unknown)."""
+    try:
+        device = os.stat(path).st_dev
+        block = os.path.realpath(f"/sys/dev/block/{os.major(device)}:{os.minor(device)}")
+    except (OSError, AttributeError):
+        return None
+    # Partitions don't have a queue/ directory, their parent disk does
+    for candidate in (block, os.path.dirname(block)):
+        try:
+            with open(os.path.join(candidate, 'queue', 'rotational'), 'r') as f:
+                return f.read().strip() == '1'
+        except OSError:
+            continue
+    return None
+
+
+def detect_storage_type(path: str) -> str:
+    """
+    Guess what kind of storage a path lives on.
+
+    Args:
+        path: File or directory on the storage to inspect
+
+    Returns:
+        One of STORAGE_SSD, STORAGE_HDD, STORAGE_NETWORK, STORAGE_UNKNOWN
+    """
+    path = os.path.abspath(path)
+    if path.startswith('\\\\') or path.startswith('//'):
+        return STORAGE_NETWORK
+    if sys.platform.startswith('linux'):
+        fs_type = _linux_mount_type(path)
+        if fs_type in NETWORK_FILESYSTEMS:
+            return STORAGE_NETWORK
+        rotational = _linux_is_rotational(path)
+        if rotational is not None:
+            return STORAGE_HDD if rotational else STORAGE_SSD
+    return STORAGE_UNKNOWN
+
+
+def copy_workers_for(*paths: str) -> int:
+    """
+    Worker count for copying between paths.
+
+    The slowest storage involved decides: a spinning disk on either side
+    limits the pool to what that disk can serve without seeking.
+
+    Args:
+        paths: Source and destination paths (missing ones are skipped)
+
+    Returns:
+        Number of copy workers
+    """
+    types = set()
+    for path in paths:
+        while path and not os.path.exists(path):
+            parent = os.path.dirname(path)
+            path = parent if parent != path else None
+        if path:
+            types.add(detect_storage_type(path))
+
+    if STORAGE_HDD in types:
+        return STORAGE_WORKERS[STORAGE_HDD]
+    if types == {STORAGE_SSD}:
+        return min(MAX_SSD_WORKERS, (os.cpu_count() or 4) * 4)
+    if STORAGE_NETWORK in types:
+        return STORAGE_WORKERS[STORAGE_NETWORK]
+    return STORAGE_WORKERS[STORAGE_UNKNOWN]
+
+
+class CopyResult:
+    """Aggregated outcome of a copy run."""
+
+    def __init__(self):
+        self.copied = 0
+        self.failed = 0
+        self.bytes_copied = 0
+        self.elapsed = 0.0
+        self.workers = 0
+        self.errors = []  # (source, error) for the first MAX_REPORTED_ERRORS failures
+
+    @property
+    def files_per_second(self) -> float:
+        return self.copied / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.bytes_copied / self.elapsed if self.elapsed > 0 else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            'copied_files': self.copied,
+            'error_files': self.failed,
+            'bytes_copied': self.bytes_copied,
+            'elapsed': round(self.elapsed, 3),
+            'workers': self.workers,
+            'files_per_second': round(self.files_per_second, 1),
+        }
+
+
+def _copy_batch(batch: List[Tuple[str, str]], telemetry: FileOpTelemetry,
+                stage: str) -> Tuple[int, int, List[Tuple[str, str]], str]:
+    """Copy one batch of files (worker thread)."""
+    copied = 0
+    size = 0
+    errors = []
+    for src, dst in batch:
+        start = time.perf_counter()
+        try:
+            shutil.copy2(src, dst)
+            file_size = os.path.getsize(dst)
+            telemetry.record('copy', src, dst, file_size, time.perf_counter() - start, stage=stage)
+            copied += 1
+            size += file_size
+        except Exception as e:
+            # One bad file (e.g. an unencodable name) must not abort the rest of the batch
+            telemetry.record('copy', src, dst, latency=time.perf_counter() - start, error=str(e), stage=stage)
+            errors.append((src, str(e)))
+    return copied, size, errors, os.path.basename(batch[-1][0])
+
+
+class ParallelCopier:
+    """Copies directory trees with a storage-sized worker pool."""
+
+    def __init__(self, workers: Optional[int] = None, batch_size: int = DEFAULT_BATCH_SIZE,
+                 progress_callback: Optional[Callable[[int, int, str], None]] = None, stage: str = 'copy'):
+        """
+        Initialize parallel copier.
+
+        Args:
+            workers: Copy threads (None sizes the pool for the storage involved)
+            batch_size: Files per worker task and per progress update
+            progress_callback: Called as (copied, failed, last_file) once per finished batch
+            stage: Stage name for the file operation telemetry
+        """
+        self.workers = workers
+        self.batch_size = max(1, batch_size)
+        self.progress_callback = progress_callback
+        self.stage = stage
+        self.result = None  # Running totals of the current copy, updated before each callback
+
+    def copy_trees(self, pairs: Iterable[Tuple[str, str]]) -> CopyResult:
+        """
+        Copy directory trees.
+
+        Args:
+            pairs: (source_dir, dest_dir) pairs; missing sources are skipped
+
+        Returns:
+            CopyResult with aggregated counts
+        """
+        pairs = [(src, dst) for src, dst in pairs if os.path.isdir(src)]
+        result = self.result = CopyResult()
+        result.workers = self.workers or copy_workers_for(*(path for pair in pairs for path in pair))
+        telemetry = get_file_op_telemetry()
+        start = time.time()
+
+        with ThreadPoolExecutor(max_workers=result.workers, thread_name_prefix='srp-copy') as pool:
+            in_flight = set()
+            batch = []
+            for source_dir, dest_dir in pairs:
+                for root, dirs, files in os.walk(source_dir):
+                    rel_root = os.path.relpath(root, source_dir)
+                    current_dest = dest_dir if rel_root == '.' else os.path.join(dest_dir, rel_root)
+                    os.makedirs(current_dest, exist_ok=True)
+
+                    for name in files:
+                        batch.append((os.path.join(root, name), os.path.join(current_dest, name)))
+                        if len(batch) >= self.batch_size:
+                            in_flight.add(pool.submit(_copy_batch, batch, telemetry, self.stage))
+                            batch = []
+                    # Keep the walk from racing arbitrarily far ahead of the workers
+                    if len(in_flight) > result.workers * 4:
+                        done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                        self._collect(done, result)
+            if batch:
+                in_flight.add(pool.submit(_copy_batch, batch, telemetry, self.stage))
+            done, _ = wait(in_flight)
+            self._collect(done, result)
+
+        result.elapsed = time.time() - start
+        return result
+
+    def _collect(self, futures, result: CopyResult) -> None:
+        """Fold finished batches into the result and report progress."""
+        for future in futures:
+            copied, size, errors, last_file = future.result()
+            result.copied += copied
+            result.bytes_copied += size
+            result.failed += len(errors)
+            room = MAX_REPORTED_ERRORS - len(result.errors)
+            if room > 0:
+                result.errors.extend(errors[:room])
+            if self.progress_callback:
+                self.progress_callback(copied, len(errors), last_file)
@@ -9,18 +9,22 @@ Naming Conventions:
 
 import os
 import shutil
-import tempfile
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from .classifier import PathClassifier
 from .dynamic_progress import log, print_progress
-from .utils import safe_walk
+from .utils import safe_walk, format_bytes
+from .scratch import get_scratch_manager
+from .copy_engine import ParallelCopier
+from .file_op_telemetry import get_file_op_telemetry
+from .progress_events import headless_requested, get_progress_events
 from .comprehensive_logging import (
-    ComprehensiveLogger, log_file_operation_context, 
-    log_progress_context, log_performance_metric
+    ComprehensiveLogger, log_progress_context, log_performance_metric
 )
 
 try:
+    if headless_requested():
+        raise ImportError("Rich output disabled for --progress=jsonl")
     from rich.console import Console
     from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn, TimeElapsedColumn
     RICH_AVAILABLE = True
@@ -76,7 +80,7 @@ class SafeResourcePacker:
         timing_id = self.logger.start_timing('copy_folder_to_temp')
         
         try:
-            self.temp_dir = tempfile.mkdtemp()
+            self.temp_dir = get_scratch_manager().mkdtemp(prefix="srp_source_", near=source)
             dest_path = os.path.join(self.temp_dir, 'source')
             
             self.logger.log_file_operation('create_temp_dir', None, self.temp_dir, success=True)
@@ -325,173 +329,85 @@ class SafeResourcePacker:
         else:
             return f"{size_bytes/(1024**3):.1f} GB"
 
-    def _selective_copy_with_progress(self, source, dest_path, source_directories, total_files):
-        """Copy directories with Dynamic progress."""
-        try:
-            # Import Dynamic Progress
-            from .dynamic_progress import start_copy_progress, update_dynamic_progress, finish_dynamic_progress, is_dynamic_progress_enabled
-            
-            # Use Dynamic Progress if available, otherwise fall back to Rich Progress
-            if is_dynamic_progress_enabled():
-                self._selective_copy_with_dynamic_progress(source, dest_path, source_directories, total_files)
-            else:
-                self._selective_copy_with_rich_progress(source, dest_path, source_directories, total_files)
-                
-        except Exception as e:
-            log(f"Progress copy failed, falling back to simple copy: {e}", log_type='WARNING')
-            self._selective_copy_simple(source, dest_path, source_directories, total_files)
-
     def _selective_copy_with_separate_progress(self, source, dest_path, source_directories, total_files):
-        """Copy directories with separate progress system."""
-        from .dynamic_progress import start_copy_progress, update_copy_progress, finish_copy_progress
-        
-        # Log copy operation start
-        self.logger.log_operation_start('Selective Copy with Separate Progress', {
-            'source': source,
-            'dest_path': dest_path,
-            'directories': source_directories,
-            'total_files': total_files
-        })
-        
-        timing_id = self.logger.start_timing('selective_copy_separate')
-        
-        try:
-            # Start separate copy progress
-            start_copy_progress(total_files)
-            
-            copied_files = 0
-            skipped_files = 0
-            error_files = 0
-
-            for dir_name in source_directories:
-                source_dir = os.path.join(source, dir_name)
-                dest_dir = os.path.join(dest_path, dir_name)
-
-                if os.path.exists(source_dir):
-                    for root, dirs, files in os.walk(source_dir):
-                        # Create directory structure
-                        rel_root = os.path.relpath(root, source_dir)
-                        if rel_root == '.':
-                            current_dest = dest_dir
-                        else:
-                            current_dest = os.path.join(dest_dir, rel_root)
-                        os.makedirs(current_dest, exist_ok=True)
-
-                        # Copy files
-                        for file in files:
-                            src_file = os.path.join(root, file)
-                            dst_file = os.path.join(current_dest, file)
-                            try:
-                                with log_file_operation_context('copy', src_file, dst_file):
-                                    shutil.copy2(src_file, dst_file)
-                                    copied_files += 1
-                                    update_copy_progress(file, "copy", increment=True)
-                            except Exception as e:
-                                error_files += 1
-                                log(f"Failed to copy {src_file}: {e}", debug_only=True, log_type='WARNING')
-                                self.logger.log_file_operation('copy', src_file, dst_file, success=False, error=str(e))
-                                update_copy_progress(file, "error", increment=True)
-
-            # Finish copy progress
-            finish_copy_progress()
-            
-            # Log success
-            self.logger.log_operation_end('Selective Copy with Separate Progress', True, {
-                'copied_files': copied_files,
-                'error_files': error_files,
-                'total_files': total_files
-            })
-            self.logger.end_timing(timing_id, True, {
-                'copied_files': copied_files,
-                'error_files': error_files
-            })
-            
-        except Exception as e:
-            try:
-                from .dynamic_progress import finish_dynamic_progress
-                finish_dynamic_progress()
-            except ImportError:
-                pass
-            self.logger.log_error(e, 'Selective Copy with Dynamic Progress')
-            self.logger.log_operation_end('Selective Copy with Dynamic Progress', False, str(e))
-            self.logger.end_timing(timing_id, False, {'error': str(e)})
-            raise
-
-    def _selective_copy_with_rich_progress(self, source, dest_path, source_directories, total_files):
-        """Copy directories with Rich progress bar (fallback)."""
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TaskProgressColumn(),
-            TimeElapsedColumn(),
-        ) as progress:
-
-            task = progress.add_task("Copying directories...", total=total_files)
-            copied_files = 0
-
-            for dir_name in source_directories:
-                source_dir = os.path.join(source, dir_name)
-                dest_dir = os.path.join(dest_path, dir_name)
-
-                if os.path.exists(source_dir):
-                    progress.update(task, description=f"Copying {dir_name}/...")
-
-                    for root, dirs, files in os.walk(source_dir):
-                        # Create directory structure
-                        rel_root = os.path.relpath(root, source_dir)
-                        if rel_root == '.':
-                            current_dest = dest_dir
-                        else:
-                            current_dest = os.path.join(dest_dir, rel_root)
-                        os.makedirs(current_dest, exist_ok=True)
-
-                        # Copy files
-                        for file in files:
-                            src_file = os.path.join(root, file)
-                            dst_file = os.path.join(current_dest, file)
-                            try:
-                                shutil.copy2(src_file, dst_file)
-                                copied_files += 1
-                                progress.update(task, advance=1)
-                            except Exception as e:
-                                log(f"Failed to copy {src_file}: {e}", debug_only=True, log_type='WARNING')
-
-            progress.update(task, description=f"Completed! Copied {len(source_directories)} directories")
-
-    def _selective_copy_simple(self, source, dest_path, source_directories, total_files):
-        """Copy directories with simple progress."""
-        if total_files > 50:
-            print(f"📁 Copying {len(source_directories)} directories ({total_files} files)...")
-
-        for i, dir_name in enumerate(source_directories):
-            source_dir = os.path.join(source, dir_name)
-            dest_dir = os.path.join(dest_path, dir_name)
-
-            if os.path.exists(source_dir):
-                if total_files > 50:
-                    print(f"  [{i+1}/{len(source_directories)}] {dir_name}/")
-
-                try:
-                    shutil.copytree(source_dir, dest_dir, dirs_exist_ok=True)
-                except Exception as e:
-                    log(f"Failed to copy directory {dir_name}: {e}", log_type='WARNING')
+        """Copy the selected source directories with the separate copy progress display."""
+        pairs = [(os.path.join(source, d), os.path.join(dest_path, d)) for d in source_directories]
+        self._copy_trees(pairs, total_files, 'Selective Copy')
 
     def _full_copy(self, source, dest_path):
         """Fallback to full copy when no generated path provided."""
         # Count total files for progress
         total_files = sum(len(files) for _, _, files in os.walk(source))
-
-        if RICH_AVAILABLE and total_files > 100:  # Show progress for large folders
-            self._copy_with_progress(source, dest_path, total_files)
-        else:
-            # Simple copy for small folders or when Rich not available
-            if total_files > 100:
-                print(f"📁 Copying {total_files} files to temporary directory...")
-            shutil.copytree(source, dest_path, dirs_exist_ok=True)
+        log(f"📁 Copying {total_files} files to temporary directory...", log_type='INFO')
+        self._copy_trees([(source, dest_path)], total_files, 'Full Copy')
 
         return dest_path, self.temp_dir
 
+    def _copy_trees(self, pairs, total_files, operation):
+        """
+        Copy directory trees with the parallel copy engine.
+
+        Files are copied by a worker pool sized for the storage involved.
+        Progress advances once per batch and the operation is logged as a
+        whole, not per file.
+
+        Args:
+            pairs (list): (source_dir, dest_dir) pairs to copy
+            total_files (int): Number of files expected (for progress)
+            operation (str): Operation name for logging
+
+        Returns:
+            CopyResult: Aggregated copy counts
+        """
+        from .dynamic_progress import start_copy_progress, update_copy_progress, finish_copy_progress
+
+        self.logger.log_operation_start(operation, {
+            'directories': [src for src, _ in pairs],
+            'total_files': total_files
+        })
+        timing_id = self.logger.start_timing(operation.lower().replace(' ', '_'))
+
+        events = get_progress_events()
+
+        def on_batch(copied, failed, last_file):
+            if copied:
+                update_copy_progress(last_file, "copy", increment=True, count=copied)
+            if failed:
+                update_copy_progress(last_file, "errors", increment=True, count=failed)
+            if events.enabled:
+                totals = copier.result  # Already includes this batch
+                events.progress('copy', totals.copied + totals.failed, total_files,
+                                bytes_done=totals.bytes_copied, failed=totals.failed)
+
+        start_copy_progress(total_files)
+        events.stage_start('copy', total_files, operation=operation)
+        try:
+            copier = ParallelCopier(progress_callback=on_batch, stage=operation)
+            result = copier.copy_trees(pairs)
+        except Exception as e:
+            finish_copy_progress()
+            events.stage_end('copy', False, operation=operation, error=str(e))
+            self.logger.log_error(e, operation)
+            self.logger.log_operation_end(operation, False, str(e))
+            self.logger.end_timing(timing_id, False, {'error': str(e)})
+            raise
+        finish_copy_progress()
+        get_file_op_telemetry().flush()
+
+        for src_file, error in result.errors:
+            log(f"Failed to copy {src_file}: {error}", debug_only=True, log_type='WARNING')
+        if result.failed > len(result.errors):
+            log(f"...and {result.failed - len(result.errors)} more copy failures", debug_only=True, log_type='WARNING')
+
+        log(f"📁 Copied {result.copied} files ({format_bytes(result.bytes_copied)}) in {result.elapsed:.1f}s "
+            f"with {result.workers} workers ({result.files_per_second:.0f} files/s)", log_type='INFO')
+        self.logger.log_performance_metric('copy_throughput', round(result.files_per_second, 1), 'files/s', result.to_dict())
+        self.logger.log_operation_end(operation, True, result.to_dict())
+        self.logger.end_timing(timing_id, True, result.to_dict())
+        events.stage_end('copy', True, operation=operation, copied=result.copied, failed=result.failed,
+                         bytes=result.bytes_copied, bytes_per_second=round(result.bytes_per_second))
+        return result
+
     def process_single_mod_resources(self, source_path, generated_path, output_pack, output_loose, progress_callback=None):
         """
         Process single mod resources and classify them for packing or loose deployment.
@@ -518,9 +434,24 @@ class SafeResourcePacker:
         finally:
             self.cleanup_temp()
 
-    def cleanup_temp(self):
-        """Clean up temporary directories."""
+    def cleanup_temp(self, background=True):
+        """
+        Clean up temporary directories.
+
+        Args:
+            background (bool): Move the temp tree aside and delete it on a background
+                thread instead of waiting for every file to be removed
+        """
         if self.temp_dir:
+            if background:
+                try:
+                    get_scratch_manager().release(self.temp_dir)
+                    log(f"Scheduled background cleanup of temp directory: {self.temp_dir}", log_type='SUCCESS')
+                    self.temp_dir = None
+                    return
+                except Exception as e:
+                    log(f"Background cleanup unavailable ({e}), cleaning up now", log_type='WARNING')
+
             try:
                 # Count files for progress if it's a large directory
                 total_files = 0
@@ -536,47 +467,13 @@ class SafeResourcePacker:
                         print(f"🧹 Cleaning up {total_files} temporary files...")
                     shutil.rmtree(self.temp_dir)
 
+                get_scratch_manager().release(self.temp_dir, remove=False)
                 log(f"Cleaned up temp directory: {self.temp_dir}", log_type='SUCCESS')
             except Exception as e:
                 log(f"Failed to clean temp directory: {e}", log_type='ERROR')
             finally:
                 self.temp_dir = None
 
-    def _copy_with_progress(self, source, dest, total_files):
-        """Copy files with Rich progress bar."""
-        console = Console()
-
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TaskProgressColumn(),
-            TimeElapsedColumn(),
-            console=console
-        ) as progress:
-            task = progress.add_task("📁 Copying source files...", total=total_files)
-
-            def copy_with_callback(src, dst, *, follow_symlinks=True):
-                """Copy function that updates progress."""
-                for root, dirs, files in os.walk(src):
-                    # Create destination directories
-                    rel_root = os.path.relpath(root, src)
-                    dest_root = os.path.join(dst, rel_root) if rel_root != '.' else dst
-                    os.makedirs(dest_root, exist_ok=True)
-
-                    # Copy files
-                    for file in files:
-                        src_file = os.path.join(root, file)
-                        dst_file = os.path.join(dest_root, file)
-                        try:
-                            shutil.copy2(src_file, dst_file)
-                            progress.update(task, advance=1)
-                        except Exception as e:
-                            log(f"Failed to copy {src_file}: {e}", log_type='WARNING')
-                            progress.update(task, advance=1)
-
-            copy_with_callback(source, dest)
-
     def _cleanup_with_progress(self, temp_dir, total_files):
         """Clean up files with Rich progress bar."""
         console = Console()
@@ -0,0 +1,153 @@
+"""
+Mod Discovery Cache
+
+Persists batch discovery results (plugins, asset lists, sizes, top-level folder
+classification) per mod folder so re-opening the batch wizard on a huge
+collection doesn't re-walk every mod. Each entry is keyed by a fingerprint of
+the folder: by default the modification time and entry count of every
+directory, which changes whenever files are added, removed or renamed. The
+optional full digest also covers each file's size and modification time, so
+in-place edits are caught too.
+"""
+
+import os
+import json
+import hashlib
+import tempfile
+import threading
+from typing import Any, Dict, Optional
+from .dynamic_progress import log
+
+
+CACHE_FORMAT_VERSION = 1
+
+
+class DiscoveryCache:
+    """Per-mod-folder store of discovery results validated by folder fingerprints."""
+
+    def __init__(self, cache_dir: Optional[str] = None, full_digest: bool = False):
+        """
+        Initialize discovery cache.
+
+        Args:
+            cache_dir: Directory to store the cache file (defaults to temp directory)
+            full_digest: Fingerprint every file's size and mtime instead of only
+                         directory mtimes and entry counts
+        """
+        if cache_dir is None:
+            cache_dir = os.path.join(tempfile.gettempdir(), "srp_discovery_cache")
+
+        self.cache_dir = cache_dir
+        self.cache_file = os.path.join(cache_dir, "discovery.json")
+        self.full_digest = full_digest
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._entries = self._load()
+
+    def _load(self) -> Dict[str, Any]:
+        """Load cached discovery results."""
+        try:
+            if os.path.exists(self.cache_file):
+                with open(self.cache_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get('version') == CACHE_FORMAT_VERSION:
+                    return data.get('entries', {})
+        except Exception as e:
+            log(f"⚠️ Failed to load discovery cache: {e}", log_type='WARNING')
+        return {}
+
+    def save(self) -> None:
+        """Atomically persist the cache if anything changed."""
+        with self._lock:
+            if not self._dirty:
+                return
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                tmp_path = f"{self.cache_file}.{os.getpid()}.tmp"
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump({'version': CACHE_FORMAT_VERSION, 'entries': self._entries}, f, ensure_ascii=False)
+                os.replace(tmp_path, self.cache_file)
+                self._dirty = False
+            except Exception as e:
+                log(f"⚠️ Failed to save discovery cache: {e}", log_type='WARNING')
+
+    def fingerprint(self, mod_path: str) -> Optional[str]:
+        """
+        Fingerprint a mod folder.
+
+        Args:
+            mod_path: Path to mod folder
+
+        Returns:
+            Hex digest, or None if the folder can't be read
+        """
+        digest = hashlib.sha1(b'full' if self.full_digest else b'dirs')
+        stack = [mod_path]
+        try:
+            while stack:
+                current = stack.pop()
+                entries = 0
+                with os.scandir(current) as listing:
+                    for entry in listing:
+                        entries += 1
+                        if entry.is_symlink():
+                            continue
+                        if entry.is_dir():
+                            stack.append(entry.path)
+                        elif self.full_digest:
+                            stat = entry.stat()
+                            digest.update(f"{entry.path}|{stat.st_size}|{stat.st_mtime_ns}\n".encode('utf-8', 'surrogatepass'))
+                stat = os.stat(current)
+                digest.update(f"{current}|{stat.st_mtime_ns}|{entries}\n".encode('utf-8', 'surrogatepass'))
+        except OSError:
+            return None
+        return digest.hexdigest()
+
+    def get(self, mod_path: str, fingerprint: Optional[str], context: str) -> Optional[Dict[str, Any]]:
+        """
+        Get cached discovery data for a mod folder.
+
+        Args:
+            mod_path: Path to mod folder
+            fingerprint: Current folder fingerprint
+            context: Settings the result depends on (game type, plugin extensions)
+
+        Returns:
+            Cached entry ({'mod': data or None}) or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(os.path.normcase(os.path.abspath(mod_path)))
+            if fingerprint and entry and entry.get('fingerprint') == fingerprint and entry.get('context') == context:
+                self.hits += 1
+                return entry
+            self.misses += 1
+            return None
+
+    def put(self, mod_path: str, fingerprint: Optional[str], context: str, data: Optional[Dict[str, Any]]) -> None:
+        """
+        Store discovery data for a mod folder.
+
+        Args:
+            mod_path: Path to mod folder
+            fingerprint: Folder fingerprint taken before the folder was analyzed
+            context: Settings the result depends on
+            data: Serialized discovery result (None for folders that aren't mods)
+        """
+        if not fingerprint:
+            return
+        with self._lock:
+            self._entries[os.path.normcase(os.path.abspath(mod_path))] = {
+                'fingerprint': fingerprint,
+                'context': context,
+                'mod': data
+            }
+            self._dirty = True
+
+    def clear(self) -> None:
+        """Forget all cached discovery results."""
+        with self._lock:
+            self._entries = {}
+            self._dirty = True
+        self.save()
@@ -6,11 +6,15 @@ both dynamic_progress.py and clean_output.py with one clean implementation.
 """
 
 import os
+import re
 import time
+import atexit
 import threading
+from collections import deque
 from datetime import datetime
 from typing import Optional, Dict, Any
 from pathlib import Path
+from .progress_events import headless_requested
 
 # Global state for progress display and logging
 PROGRESS_ENABLED = False
@@ -67,10 +71,21 @@ COPY_PROGRESS = {
 }
 
 # Global state for logging
-LOGS = []
+LOG_BUFFER_SIZE = 10000  # In-memory log keeps the most recent entries only
+LOG_FLUSH_ENTRIES = 256  # Per-thread entries buffered before a stream write
+LOG_FLUSH_INTERVAL = 1.0  # Seconds before a thread's buffer is written anyway
+LOGS = deque(maxlen=LOG_BUFFER_SIZE)  # (time, message) records
 SKIPPED = []
 DEBUG = False
 
+# Streaming log file: every entry, fed by per-thread buffers
+LOG_STREAM = None
+LOG_STREAM_PATH = None
+LOG_STREAM_LOCK = threading.Lock()
+_LOG_THREAD_BUFFERS = []  # (thread, buffer) of every logging thread, so a flush can drain them
+_LOG_REAP_STATE = {'last': 0.0}  # When buffers of exited threads were last dropped
+_log_thread_state = threading.local()
+
 # Enhanced color mapping for beautiful logging
 LOG_COLORS = {
     'MATCH FOUND': 'bright_green',
@@ -112,8 +127,35 @@ LOG_ICONS = {
 # Display update throttling (prevent flicker)
 MIN_UPDATE_INTERVAL = 0.1  # Minimum 100ms between updates (reduced for smoother progress)
 
-# Try to import Rich for beautiful display
+# Live displays redraw from the counters at this rate on Rich's refresh thread;
+# workers never render anything themselves
+RENDER_FPS = 4
+
+
+# Pinned layout message area: bounded scrollback, rate limited, with runs of
+# similar messages collapsed into one "×N" line, so redraws cost the same at
+# the end of a long run as at the start
+SCROLLBACK_LINES = 100
+LAYOUT_MESSAGE_RATE = 20  # Messages per second shown before bursts are summarized
+LAYOUT_MESSAGES = deque(maxlen=SCROLLBACK_LINES)  # [timestamp, message, log_type, count, key]
+LAYOUT_MESSAGE_STATE = {'tokens': LAYOUT_MESSAGE_RATE, 'last_refill': 0.0, 'suppressed': 0}
+LAYOUT_LOCK = threading.Lock()
+_SIMILAR_PATTERN = re.compile(r'\S*[\\/.]\S*|\d+')  # Paths, file names and numbers
+
+
+class _LiveRenderable:
+    """Renders a progress display from the current counters on every refresh."""
+
+    def __init__(self, render):
+        self.render = render
+
+    def __rich__(self):
+        return self.render()
+
+# Try to import Rich for beautiful display (never for machine-readable progress)
 try:
+    if headless_requested():
+        raise ImportError("Rich output disabled for --progress=jsonl")
     from rich.console import Console
     from rich.live import Live
     from rich.panel import Panel
@@ -248,9 +290,9 @@ def start_dynamic_progress(stage: str, total: int, preserve_stats: bool = False,
     # Create live display with smoother refresh
     if RICH_CONSOLE:
         PROGRESS_LIVE = Live(
-            _generate_progress_display(),
+            _LiveRenderable(_generate_progress_display),
             console=RICH_CONSOLE,
-            refresh_per_second=4,  # Increased from 2 to 4 for smoother updates
+            refresh_per_second=RENDER_FPS,
             transient=False,
             auto_refresh=True
         )
@@ -290,10 +332,6 @@ def update_dynamic_progress(file_path: str, result: str = "", log_type: str = ""
         counter_name = counter_mapping.get(result, 'skip')
         if counter_name in PROGRESS_STATS['counters']:
             PROGRESS_STATS['counters'][counter_name] += 1
-    
-    # Update display
-    if PROGRESS_LIVE:
-        PROGRESS_LIVE.update(_generate_progress_display())
 
 
 def update_classification_progress(file_path: str, result: str = "", increment: bool = False):
@@ -322,22 +360,10 @@ def update_classification_progress(file_path: str, result: str = "", increment:
         # Update counters based on result
         if result in stats['counters']:
             stats['counters'][result] += 1
-    
-    # Update display
-    if CLASSIFICATION_PROGRESS['live'] and PROGRESS_LAYOUT:
-        # Update the progress panel within the layout
-        progress_panel = Panel(
-            _generate_classification_display(),
-            title="🚀 Classification Progress",
-            border_style="green",
-            padding=(1, 1)
-        )
-        PROGRESS_LAYOUT["progress"].update(progress_panel)
-        CLASSIFICATION_PROGRESS['live'].update(PROGRESS_LAYOUT)
 
 
-def update_copy_progress(file_path: str, result: str = "", increment: bool = False):
-    """Update copy progress."""
+def update_copy_progress(file_path: str, result: str = "", increment: bool = False, count: int = 1):
+    """Update copy progress (count files at once when increment is set)."""
     global COPY_PROGRESS
     
     if not PROGRESS_ENABLED or not COPY_PROGRESS['live']:
@@ -355,21 +381,17 @@ def update_copy_progress(file_path: str, result: str = "", increment: bool = Fal
         stats['last_update_time'] = current_time
         
         if increment:
-            stats['current'] += 1
+            stats['current'] += count
         
         stats['current_file'] = os.path.basename(file_path) if file_path else ''
         
         # Update counters based on result
         if result in stats['counters']:
-            stats['counters'][result] += 1
-    
-    # Update display
-    if COPY_PROGRESS['live']:
-        COPY_PROGRESS['live'].update(_generate_copy_display())
+            stats['counters'][result] += count if increment else 1
 
 
 def finish_dynamic_progress():
-    """Finish progress tracking."""
+    """Finish progress tracking (the final frame stays on screen, no pause)."""
     global PROGRESS_LIVE, PROGRESS_STATS
     
     if not PROGRESS_ENABLED or not PROGRESS_LIVE:
@@ -380,33 +402,26 @@ def finish_dynamic_progress():
         PROGRESS_STATS['current'] = PROGRESS_STATS['total']
         PROGRESS_STATS['current_file'] = 'Complete'
     
-    # Update display one final time
-    if PROGRESS_LIVE:
-        PROGRESS_LIVE.update(_generate_progress_display())
-        time.sleep(0.5)  # Brief pause to show completion
+    # Stopping renders the final frame once
+    PROGRESS_LIVE.stop()
+    PROGRESS_LIVE = None
     
-    # Show final stats briefly then stop
-    if RICH_CONSOLE:
-        time.sleep(1)  # Show final stats briefly
-        PROGRESS_LIVE.stop()
-        PROGRESS_LIVE = None
-        
-        # Show completion message
-        with PROGRESS_LOCK:
-            stats = PROGRESS_STATS.copy()
-        
-        elapsed = time.time() - stats['start_time'] if stats['start_time'] > 0 else 0
-        rate = stats['current'] / elapsed if elapsed > 0 else 0
-        
-        RICH_CONSOLE.print(Panel.fit(
-            f"✅ [bold green]Completed {stats['stage']}[/bold green]\n"
-            f"Processed {stats['current']:,} files in {elapsed:.1f}s ({rate:.1f} files/s)",
-            border_style="green"
-        ))
+    # Show completion message
+    with PROGRESS_LOCK:
+        stats = PROGRESS_STATS.copy()
+    
+    elapsed = time.time() - stats['start_time'] if stats['start_time'] > 0 else 0
+    rate = stats['current'] / elapsed if elapsed > 0 else 0
+    
+    RICH_CONSOLE.print(Panel.fit(
+        f"✅ [bold green]Completed {stats['stage']}[/bold green]\n"
+        f"Processed {stats['current']:,} files in {elapsed:.1f}s ({rate:.1f} files/s)",
+        border_style="green"
+    ))
 
 
 def finish_classification_progress():
-    """Finish classification progress."""
+    """Finish classification progress (the final frame stays on screen, no pause)."""
     global CLASSIFICATION_PROGRESS, PROGRESS_LAYOUT
     
     if not PROGRESS_ENABLED or not CLASSIFICATION_PROGRESS['live']:
@@ -417,29 +432,23 @@ def finish_classification_progress():
         CLASSIFICATION_PROGRESS['stats']['current'] = CLASSIFICATION_PROGRESS['stats']['total']
         CLASSIFICATION_PROGRESS['stats']['current_file'] = 'Complete'
     
-    # Update display one final time
-    if CLASSIFICATION_PROGRESS['live'] and PROGRESS_LAYOUT:
-        # Update the progress panel within the layout
-        progress_panel = Panel(
-            _generate_classification_display(),
+    if PROGRESS_LAYOUT:
+        PROGRESS_LAYOUT["progress"].update(Panel(
+            _LiveRenderable(_generate_classification_display),
             title="🚀 Classification Progress - Complete!",
             border_style="bright_green",
             padding=(1, 1)
-        )
-        PROGRESS_LAYOUT["progress"].update(progress_panel)
-        CLASSIFICATION_PROGRESS['live'].update(PROGRESS_LAYOUT)
-        time.sleep(0.5)  # Brief pause to show completion
+        ))
     
-    # Show final stats briefly then stop
-    if RICH_CONSOLE:
-        time.sleep(1)  # Show final stats briefly
-        CLASSIFICATION_PROGRESS['live'].stop()
-        CLASSIFICATION_PROGRESS['live'] = None
-        PROGRESS_LAYOUT = None  # Clean up layout
+    # Stopping renders the final frame once
+    CLASSIFICATION_PROGRESS['live'].stop()
+    CLASSIFICATION_PROGRESS['live'] = None
+    PROGRESS_LAYOUT = None  # Clean up layout
+    _reset_layout_messages()
 
 
 def finish_copy_progress():
-    """Finish copy progress."""
+    """Finish copy progress (the final frame stays on screen, no pause)."""
     global COPY_PROGRESS
     
     if not PROGRESS_ENABLED or not COPY_PROGRESS['live']:
@@ -450,16 +459,9 @@ def finish_copy_progress():
         COPY_PROGRESS['stats']['current'] = COPY_PROGRESS['stats']['total']
         COPY_PROGRESS['stats']['current_file'] = 'Complete'
     
-    # Update display one final time
-    if COPY_PROGRESS['live']:
-        COPY_PROGRESS['live'].update(_generate_copy_display())
-        time.sleep(0.5)  # Brief pause to show completion
-    
-    # Show final stats briefly then stop
-    if RICH_CONSOLE:
-        time.sleep(1)  # Show final stats briefly
-        COPY_PROGRESS['live'].stop()
-        COPY_PROGRESS['live'] = None
+    # Stopping renders the final frame once
+    COPY_PROGRESS['live'].stop()
+    COPY_PROGRESS['live'] = None
 
 
 def _generate_progress_display():
@@ -469,6 +471,7 @@ def _generate_progress_display():
         
     with PROGRESS_LOCK:
         stats = PROGRESS_STATS.copy()
+        stats['tools'] = dict(PROGRESS_STATS.get('tools', {}))
     
     current = stats['current']
     total = stats['total']
@@ -535,6 +538,16 @@ def _generate_progress_display():
             current_file_display = "..." + current_file_display[-47:]
         table.add_row("Current:", f"[cyan]{current_file_display}[/cyan]")
     
+    # Running BSArch/7z processes
+    if stats['tools']:
+        tools_line = Text()
+        for label, tool_percent in sorted(stats['tools'].items())[:3]:
+            tools_line.append(f"{label} ", style="white")
+            tools_line.append(f"{tool_percent:.0f}%  ", style="bright_yellow")
+        if len(stats['tools']) > 3:
+            tools_line.append(f"+{len(stats['tools']) - 3} more", style="dim")
+        table.add_row("Tools:", tools_line)
+    
     # Stats line with custom labels
     counters = stats['counters']
     custom_labels = stats.get('custom_labels', {
@@ -765,10 +778,12 @@ def start_classification_progress(total: int):
             Layout(name="main", size=None),  # Main area for classification messages
             Layout(name="progress", size=8)  # Fixed height for progress bar
         )
+        _reset_layout_messages()
+        PROGRESS_LAYOUT["main"].update(_ScrollbackRenderable())
         
         # Create progress panel pinned to bottom
         progress_panel = Panel(
-            _generate_classification_display(),
+            _LiveRenderable(_generate_classification_display),
             title="🚀 Classification Progress",
             border_style="green",
             padding=(1, 1)
@@ -779,7 +794,7 @@ def start_classification_progress(total: int):
         CLASSIFICATION_PROGRESS['live'] = Live(
             PROGRESS_LAYOUT,
             console=RICH_CONSOLE,
-            refresh_per_second=4,
+            refresh_per_second=RENDER_FPS,
             transient=False,
             auto_refresh=True
         )
@@ -816,9 +831,9 @@ def start_copy_progress(total: int):
     # Create new live display for copying
     if RICH_CONSOLE:
         COPY_PROGRESS['live'] = Live(
-            _generate_copy_display(),
+            _LiveRenderable(_generate_copy_display),
             console=RICH_CONSOLE,
-            refresh_per_second=4,
+            refresh_per_second=RENDER_FPS,
             transient=False,
             auto_refresh=True
         )
@@ -858,6 +873,16 @@ def set_dynamic_progress_current(current: int):
         PROGRESS_STATS['current'] = current
 
 
+def set_tool_progress(label: str, percent: Optional[float] = None):
+    """Show a running external tool's percentage on the live display (None removes it)."""
+    with PROGRESS_LOCK:
+        tools = PROGRESS_STATS.setdefault('tools', {})
+        if percent is None:
+            tools.pop(label, None)
+        else:
+            tools[label] = percent
+
+
 def handle_dynamic_progress_log(message: str, log_type: str):
     """Handle progress log messages."""
     if not PROGRESS_ENABLED:
@@ -1045,50 +1070,55 @@ def set_debug(debug_mode, dynamic_progress=True, table_view=False):
         enable_dynamic_progress(dynamic_progress and not table_view)
 
 
-def log(message, debug_only=False, quiet_mode=False, log_type=None):
+def log(message, *args, debug_only=False, quiet_mode=False, log_type=None):
     """
     Log a message with timestamp and optional coloring.
     Now supports pinned layout with progress bar at bottom!
 
+    The message is only formatted (and timestamped) once it has passed the
+    level checks, so filtered messages cost next to nothing.
+
     Args:
-        message (str): Message to log
+        message (str): Message to log, or a %-format string for args
+        args: Deferred format arguments
         debug_only (bool): Only log if debug mode is enabled
         quiet_mode (bool): Suppress console output if quiet mode
         log_type (str): Type of log for coloring (e.g., 'MATCH FOUND', 'SKIP', etc.)
     """
     if debug_only and not DEBUG:
         return
-    
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    with PROGRESS_LOCK:
-        LOGS.append(f"[{timestamp}] {message}")
+    # SPAM never reaches the console; outside debug mode and without a log stream it goes nowhere
+    if log_type == 'SPAM' and LOG_STREAM is None and not DEBUG:
+        return
+
+    if args:
+        message = message % args
+    now = time.time()
+    LOGS.append((now, message))  # deque appends are atomic, no lock needed
+    if LOG_STREAM is not None:
+        _buffer_log_entry(now, message)
+
+    if log_type == 'SPAM':
+        return  # SPAM messages only go to log files, never to console
 
     # Handle pinned layout for classification messages
     if debug_only and log_type and PROGRESS_LAYOUT and CLASSIFICATION_PROGRESS['live']:
-        # SPAM type should never appear in console, only in log files
-        if log_type == 'SPAM':
-            # SPAM messages only go to log files, never to console
-            return
-        
         # Only show essential classification messages in console
         essential_types = ['MATCH FOUND', 'NO MATCH', 'SKIP', 'OVERRIDE', 'ERROR', 'EXCEPTION', 'INFO']
         
         if log_type in essential_types:
             # Add message to main area of layout (above progress bar)
-            _add_message_to_layout(timestamp, message, log_type)
+            _add_message_to_layout(_format_log_time(now), message, log_type)
         # All messages (including verbose ones) are still logged to log files
         return  # Message handled by pinned layout
 
     # Only print to console if not in quiet mode and not using pinned layout
     if not quiet_mode and not (PROGRESS_LAYOUT and CLASSIFICATION_PROGRESS['live']):
-        # SPAM type should never appear in console, only in log files
-        if log_type == 'SPAM':
-            return  # SPAM messages only go to log files, never to console
-        
         # Only show essential classification messages in console
         essential_types = ['MATCH FOUND', 'NO MATCH', 'SKIP', 'OVERRIDE', 'ERROR', 'EXCEPTION', 'SUCCESS', 'INFO', 'WARNING']
         
         if log_type in essential_types:
+            timestamp = _format_log_time(now)
             if RICH_AVAILABLE and DEBUG and log_type:
                 # Beautiful colored output for debug mode
                 _print_colored_log(timestamp, message, log_type)
@@ -1099,37 +1129,81 @@ def log(message, debug_only=False, quiet_mode=False, log_type=None):
 
 
 def _add_message_to_layout(timestamp, message, log_type):
-    """Add message to the main area of the pinned layout."""
-    global PROGRESS_LAYOUT
-    
+    """Add message to the scrollback shown in the main area of the pinned layout."""
     if not RICH_AVAILABLE or not PROGRESS_LAYOUT:
         return
     
-    # Create colored message
-    color = LOG_COLORS.get(log_type, 'white')
-    icon = LOG_ICONS.get(log_type, '💡')
-    
-    colored_message = Text()
-    colored_message.append(f"[{timestamp}] ", style="dim")
-    colored_message.append(f"{icon} ", style=color)
-    colored_message.append(message, style=color)
-    
-    # Get current content of main area
-    current_content = PROGRESS_LAYOUT["main"].renderable
-    if current_content is None:
-        current_content = Text()
-    
-    # Add new message to content
-    if isinstance(current_content, Text):
-        current_content.append("\n")
-        current_content.append(colored_message)
-    else:
-        # If it's not Text, create a new Text with the message
-        current_content = Text()
-        current_content.append(colored_message)
-    
-    # Update the main area with new content
-    PROGRESS_LAYOUT["main"].update(current_content)
+    key = (log_type, _SIMILAR_PATTERN.sub('…', message))
+    now = time.time()
+    with LAYOUT_LOCK:
+        # Same kind of message as the last line: collapse into it
+        if LAYOUT_MESSAGES and LAYOUT_MESSAGES[-1][4] == key:
+            entry = LAYOUT_MESSAGES[-1]
+            entry[0], entry[1] = timestamp, message
+            entry[3] += 1
+            return
+        
+        # Token bucket: bursts beyond the rate are only counted
+        state = LAYOUT_MESSAGE_STATE
+        state['tokens'] = min(LAYOUT_MESSAGE_RATE, state['tokens'] + (now - state['last_refill']) * LAYOUT_MESSAGE_RATE)
+        state['last_refill'] = now
+        if state['tokens'] < 1:
+            state['suppressed'] += 1
+            return
+        state['tokens'] -= 1
+        if state['suppressed']:
+            # Burst is over: leave its size in the scrollback where it happened
+            LAYOUT_MESSAGES.append([timestamp, _suppressed_summary(state['suppressed']), None, 1, None])
+            state['suppressed'] = 0
+        LAYOUT_MESSAGES.append([timestamp, message, log_type, 1, key])
+
+
+def _suppressed_summary(count):
+    """Scrollback line for messages dropped by the rate limit."""
+    where = "in the log file" if LOG_STREAM is not None else "not shown"
+    return f"… {count:,} more messages {where}"
+
+
+def _reset_layout_messages():
+    """Empty the pinned layout scrollback."""
+    with LAYOUT_LOCK:
+        LAYOUT_MESSAGES.clear()
+        LAYOUT_MESSAGE_STATE.update({'tokens': LAYOUT_MESSAGE_RATE, 'last_refill': time.time(), 'suppressed': 0})
+
+
+def _render_layout_messages(max_lines=SCROLLBACK_LINES):
+    """Render the newest scrollback lines, one row each, whatever the run length."""
+    with LAYOUT_LOCK:
+        suppressed = LAYOUT_MESSAGE_STATE['suppressed']
+        visible = max(0, max_lines - (1 if suppressed else 0))
+        entries = [list(entry) for entry in LAYOUT_MESSAGES][-visible:] if visible else []
+    
+    content = Text(no_wrap=True, overflow='ellipsis')
+    for timestamp, message, log_type, count, _ in entries:
+        if len(content):
+            content.append("\n")
+        if log_type is None:
+            content.append(message, style="dim")
+            continue
+        color = LOG_COLORS.get(log_type, 'white')
+        icon = LOG_ICONS.get(log_type, '💡')
+        content.append(f"[{timestamp}] ", style="dim")
+        content.append(f"{icon} ", style=color)
+        content.append(message, style=color)
+        if count > 1:
+            content.append(f"  ×{count} similar", style="dim")
+    if suppressed:
+        if len(content):
+            content.append("\n")
+        content.append(_suppressed_summary(suppressed), style="dim")
+    return content
+
+
+class _ScrollbackRenderable:
+    """Fills the layout's main area with as many recent messages as fit."""
+
+    def __rich_console__(self, console, options):
+        yield _render_layout_messages(min(options.height or SCROLLBACK_LINES, SCROLLBACK_LINES))
 
 
 def _print_colored_log(timestamp, message, log_type):
@@ -1145,10 +1219,106 @@ def _print_colored_log(timestamp, message, log_type):
     RICH_CONSOLE.print(f"[{color}]{message}[/{color}]")
 
 
+def _format_log_time(timestamp):
+    """Format a log record's time."""
+    return datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _format_log_entry(entry):
+    """Format a (time, message) log record as a log line."""
+    return f"[{_format_log_time(entry[0])}] {entry[1]}"
+
+
+def _buffer_log_entry(timestamp, message):
+    """Queue an entry in this thread's stream buffer, writing it out in batches."""
+    state = _log_thread_state
+    buffer = getattr(state, 'buffer', None)
+    if buffer is None or state.stream is not LOG_STREAM:
+        # First entry of this thread for the current stream
+        buffer = state.buffer = []
+        state.stream = LOG_STREAM
+        state.last_flush = timestamp
+        with LOG_STREAM_LOCK:
+            _reap_log_buffers(timestamp)
+            _LOG_THREAD_BUFFERS.append((threading.current_thread(), buffer))
+    buffer.append((timestamp, message))
+    if len(buffer) >= LOG_FLUSH_ENTRIES or timestamp - state.last_flush >= LOG_FLUSH_INTERVAL:
+        state.last_flush = timestamp
+        with LOG_STREAM_LOCK:
+            _drain_log_buffer(buffer)
+            if timestamp - _LOG_REAP_STATE['last'] >= LOG_FLUSH_INTERVAL:
+                _reap_log_buffers(timestamp)
+
+
+def _reap_log_buffers(now):
+    """Write out and forget the buffers of exited threads (LOG_STREAM_LOCK held)."""
+    _LOG_REAP_STATE['last'] = now
+    alive = []
+    for thread, buffer in _LOG_THREAD_BUFFERS:
+        if thread.is_alive():
+            alive.append((thread, buffer))
+        else:
+            _drain_log_buffer(buffer)
+    _LOG_THREAD_BUFFERS[:] = alive
+
+
+def _drain_log_buffer(buffer):
+    """Write a thread buffer to the stream (LOG_STREAM_LOCK held)."""
+    entries = buffer[:]
+    del buffer[:len(entries)]  # The owning thread only ever appends
+    if LOG_STREAM is not None and entries:
+        LOG_STREAM.write(''.join(_format_log_entry(entry) + '\n' for entry in entries))
+
+
+def start_log_stream(path):
+    """
+    Stream every log entry to a file as the run goes.
+
+    The in-memory log only keeps the last LOG_BUFFER_SIZE entries; the stream
+    has all of them, including SPAM entries in debug mode.
+
+    Args:
+        path (str): Log file path (truncated)
+    """
+    global LOG_STREAM, LOG_STREAM_PATH
+    stop_log_stream()
+    try:
+        stream = open(path, 'w', encoding='utf-8')
+    except OSError as e:
+        print(f"Failed to open log file: {e}")
+        return
+    with LOG_STREAM_LOCK:
+        LOG_STREAM, LOG_STREAM_PATH = stream, os.path.abspath(path)
+
+
+def flush_logs():
+    """Write all buffered entries to the log stream."""
+    with LOG_STREAM_LOCK:
+        for _, buffer in _LOG_THREAD_BUFFERS:
+            _drain_log_buffer(buffer)
+        _reap_log_buffers(time.time())
+        if LOG_STREAM is not None:
+            LOG_STREAM.flush()
+
+
+def stop_log_stream():
+    """Flush and close the log stream."""
+    global LOG_STREAM, LOG_STREAM_PATH
+    flush_logs()
+    with LOG_STREAM_LOCK:
+        if LOG_STREAM is not None:
+            LOG_STREAM.close()
+        LOG_STREAM, LOG_STREAM_PATH = None, None
+        del _LOG_THREAD_BUFFERS[:]
+
+
+# A run that ends early still leaves a complete log behind
+atexit.register(stop_log_stream)
+
+
 def get_logs():
-    """Get all logs."""
-    with PROGRESS_LOCK:
-        return LOGS.copy()
+    """Get the most recent logs."""
+    return [_format_log_entry(entry) for entry in list(LOGS)]
 
 
 def get_skipped():
@@ -1159,17 +1329,20 @@ def get_skipped():
 
 def clear_logs():
     """Clear all logs and skipped files."""
-    global LOGS, SKIPPED
+    global SKIPPED
     with PROGRESS_LOCK:
-        LOGS = []
+        LOGS.clear()
         SKIPPED = []
+    _reset_layout_messages()
 
 
 def write_log_file(path):
-    """Write logs to file."""
-    with PROGRESS_LOCK:
-        logs = LOGS.copy()
-    
+    """Write logs to file (finishing the log stream if it already targets path)."""
+    if LOG_STREAM_PATH == os.path.abspath(path):
+        stop_log_stream()
+        return
+
+    logs = get_logs()
     try:
         with open(path, 'w', encoding='utf-8') as f:
             for log_entry in logs:
@@ -7,8 +7,13 @@ import sys
 import time
 from pathlib import Path
 from typing import Optional, Tuple
+from .progress_events import headless_requested, configure_progress_events, get_progress_events, PROGRESS_MODES
+
+HEADLESS = headless_requested()
 
 try:
+    if HEADLESS:
+        raise ImportError("Rich output disabled for --progress=jsonl")
     import click
     from rich.console import Console
     from rich.progress import (
@@ -27,10 +32,15 @@ except ImportError:
     click = None
 
 from .core import SafeResourcePacker
-from .dynamic_progress import log, write_log_file, set_debug, get_skipped
+from .dynamic_progress import log, write_log_file, start_log_stream, set_debug, get_skipped
 from .dynamic_progress import CleanOutputManager, create_clean_progress_callback, enhance_classifier_output
 from .packaging import PackageBuilder
+from .packaging.compression_profiles import COMPRESSION_PROFILES, DEFAULT_PROFILE
 from .batch_repacker import BatchModRepacker
+from .scratch import configure_scratch, get_scratch_manager
+from .background_delete import set_wait_at_exit
+from .archive_cache import get_archive_cache
+from .logging_service import initialize_logging
 
 
 class EnhancedCLI:
@@ -71,6 +81,7 @@ class EnhancedCLI:
             print("Available commands:")
             print("  --interactive    Interactive mode")
             print("  --validate       Validate paths only")
+            print("  --progress jsonl Machine-readable progress events (stdout or --progress-fd)")
             print("  --help          Show help")
             return
 
@@ -90,6 +101,8 @@ class EnhancedCLI:
         table.add_row("--quiet", "Quiet mode (minimal output)", "False")
         table.add_row("--clean", "Clean output (less verbose)", "False")
         table.add_row("--philosophy", "Show philosophy and purpose", "False")
+        table.add_row("--progress", "Progress output: rich display or jsonl events for automation", "rich")
+        table.add_row("--progress-fd", "File descriptor for --progress=jsonl events", "stdout")
 
         # Packaging options
         table.add_row("", "", "")  # Separator
@@ -100,12 +113,99 @@ class EnhancedCLI:
         table.add_row("--game-path", "Game installation path for bulletproof detection", "None")
         table.add_row("--esp-template", "Path to ESP template file", "None")
         table.add_row("--compression", "7z compression level (0-9)", "3")
+        table.add_row("--compression-profile", "Per-file-type 7z profile (uniform, balanced, fast, max)", "uniform")
+        table.add_row("--benchmark-compression", "Compare compression profiles on a sample folder", "None")
         table.add_row("--no-cleanup", "Keep temporary packaging files", "False")
         table.add_row("--install-bsarch", "Install BSArch for optimal BSA/BA2 creation", "False")
+        table.add_row("--cache", "Archive cache maintenance (stats or prune)", "None")
+        table.add_row("--cache-max-gb", "Archive cache size limit for this run and for --cache prune (0 clears)", "10")
+        table.add_row("--scratch-dir", "Scratch root for temp data (repeat to spread across disks)", "System temp")
+        table.add_row("--scratch-quota-gb", "Maximum scratch space per run", "Unlimited")
+        table.add_row("--max-parallel-archives", "Maximum BSArch builds running at once", "2")
+        table.add_row("--wait-cleanup", "Wait for background temp cleanup before exiting (CI)", "False")
+
+        # Batch repacking options
+        table.add_row("", "", "")  # Separator
+        table.add_row("[bold]BATCH REPACKING[/bold]", "", "")
+        table.add_row("--batch-repack", "Repack every mod in this collection folder", "None")
+        table.add_row("--batch-output", "Output directory for repacked mods", "[red]Required[/red]")
+        table.add_row("--force", "Rebuild all mods, even unchanged ones", "False")
+        table.add_row("--force-mod", "Rebuild this mod even if unchanged (repeatable)", "None")
+        table.add_row("--resume", "Continue an interrupted batch, keeping finished mods", "False")
 
         self.console.print(table)
         self.console.print()
 
+    def handle_cache_command(self, command: str, max_size_gb: Optional[float] = None) -> int:
+        """
+        Show statistics for, or prune, the archive output cache.
+
+        Args:
+            command: 'stats' or 'prune'
+            max_size_gb: Size limit for pruning (defaults to the configured limit)
+
+        Returns:
+            Exit code
+        """
+        from .utils import format_bytes
+
+        cache = get_archive_cache()
+        if command == 'prune':
+            removed, freed = cache.prune(max_size_gb)
+            self.console.print(f"🧹 Pruned {removed} cached archive set(s), freed {format_bytes(freed)}")
+
+        stats = cache.stats()
+        lookups = stats['hits'] + stats['misses']
+        hit_rate = f"{stats['hits'] / lookups * 100:.1f}%" if lookups else "n/a"
+
+        table = Table(title="Archive Cache", box=box.ROUNDED)
+        table.add_column("Metric", style="cyan")
+        table.add_column("Value", style="white")
+        table.add_row("Location", stats['cache_dir'])
+        table.add_row("Cached archive sets", str(stats['entries']))
+        table.add_row("Size", f"{format_bytes(stats['total_size'])} / {format_bytes(stats['max_size'])}")
+        table.add_row("Hits / misses", f"{stats['hits']} / {stats['misses']} ({hit_rate})")
+        self.console.print(table)
+        return 0
+
+    def handle_compression_benchmark(self, sample_dir: str, compression_level: int = 3) -> int:
+        """
+        Package a sample folder with every compression profile and show time and size.
+
+        Args:
+            sample_dir: Folder to package (e.g. an unpacked mod)
+            compression_level: 7z compression level (0-9)
+
+        Returns:
+            Exit code
+        """
+        from .packaging.compression_service import benchmark_compression_profiles, is_7z_available
+        from .utils import format_bytes
+
+        if not os.path.isdir(sample_dir):
+            self.console.print(f"[red]❌ Sample folder not found: {sample_dir}[/red]")
+            return 1
+        if not is_7z_available():
+            self.console.print("[red]❌ 7z is required for the compression benchmark[/red]")
+            return 1
+
+        with self.console.status("[bold blue]Benchmarking compression profiles..."):
+            results = benchmark_compression_profiles(sample_dir, compression_level)
+
+        table = Table(title=f"Compression Profiles ({format_bytes(results[0]['input_size'])} sample)", box=box.ROUNDED)
+        table.add_column("Profile", style="cyan")
+        table.add_column("Time", style="white")
+        table.add_column("Size", style="white")
+        table.add_column("Ratio", style="white")
+        for result in results:
+            if not result['success']:
+                table.add_row(result['profile'], "failed", result['message'], "")
+                continue
+            ratio = result['size'] / result['input_size'] if result['input_size'] else 0
+            table.add_row(result['profile'], f"{result['seconds']:.1f}s", format_bytes(result['size']), f"{ratio:.1%}")
+        self.console.print(table)
+        return 0 if all(result['success'] for result in results) else 1
+
     def validate_path(self, path: str, path_type: str) -> Tuple[bool, str]:
         """Validate a path and provide helpful feedback."""
         if not path:
@@ -542,6 +642,7 @@ class EnhancedCLI:
             options = {
                 'cleanup_temp': not args.no_cleanup,
                 'compression_level': args.compression,
+                'compression_profile': getattr(args, 'compression_profile', None),
                 'output_loose': args.output_loose,      # Pass the user-defined loose folder
                 'output_pack': args.output_pack,        # Pass the user-defined pack folder
                 'temp_blacklisted_dir': temp_blacklisted_dir  # Pass the temp blacklisted directory
@@ -550,7 +651,9 @@ class EnhancedCLI:
             # Initialize package builder
             builder = PackageBuilder(
                 game_type=args.game_type,
-                compression_level=args.compression
+                compression_level=args.compression,
+                compression_profile=getattr(args, 'compression_profile', None),
+                max_parallel_archives=getattr(args, 'max_parallel_archives', None)
             )
 
             # Add ESP template if provided
@@ -612,12 +715,31 @@ class EnhancedCLI:
             return {'success': False, 'message': error_msg}
 
 
+def _start_session_logs(args) -> None:
+    """
+    Start the comprehensive session logs (logs/<session>/ in the run's output folder).
+
+    Args:
+        args: Parsed command line arguments
+    """
+    if getattr(args, 'batch_repack', None):
+        output_dir = getattr(args, 'batch_output', None)
+    else:
+        output_dir = getattr(args, 'package', None) or getattr(args, 'output_pack', None)
+    if not output_dir:
+        return
+    try:
+        initialize_logging(output_dir)
+    except OSError as e:
+        log(f"⚠️ Session logs disabled: {e}", log_type='WARNING')
+
+
 def enhanced_main():
     """Enhanced main function with beautiful CLI."""
     cli = EnhancedCLI()
 
-    # Check if rich is available
-    if not RICH_AVAILABLE:
+    # Check if rich is available (machine-readable progress runs without it)
+    if not RICH_AVAILABLE and not HEADLESS:
         print("⚠️  Enhanced CLI features require additional packages.")
         print("Install with: pip install rich click colorama")
         print("Falling back to basic CLI...\n")
@@ -626,7 +748,8 @@ def enhanced_main():
         print("Basic CLI not available - enhanced features required")
         return 1
 
-    cli.print_banner()
+    if not HEADLESS:
+        cli.print_banner()
 
     # Parse command line arguments
     import argparse
@@ -650,6 +773,10 @@ def enhanced_main():
     parser.add_argument('--quiet', action='store_true', help='Quiet mode (minimal output)')
     parser.add_argument('--clean', action='store_true', help='Clean output (less verbose)')
     parser.add_argument('--philosophy', action='store_true', help='Show philosophy and purpose')
+    parser.add_argument('--progress', choices=PROGRESS_MODES, default='jsonl' if HEADLESS else 'rich',
+                       help='Progress output: rich display or JSON line events for automation')
+    parser.add_argument('--progress-fd', type=int, metavar='FD',
+                       help='Write --progress=jsonl events to this file descriptor instead of stdout')
 
     # Packaging arguments
     parser.add_argument('--package', help='Create complete mod package at this path')
@@ -660,15 +787,47 @@ def enhanced_main():
     parser.add_argument('--esp-template', help='Path to ESP template file')
     parser.add_argument('--compression', type=int, choices=range(0, 10), default=3,
                        help='7z compression level (0-9, higher = smaller)')
+    parser.add_argument('--compression-profile', choices=list(COMPRESSION_PROFILES), default=DEFAULT_PROFILE,
+                       help='Per-file-type 7z settings for packages')
+    parser.add_argument('--benchmark-compression', metavar='SAMPLE_DIR',
+                       help='Package a sample folder with every compression profile and compare')
     parser.add_argument('--no-cleanup', action='store_true',
                        help='Keep temporary packaging files')
     parser.add_argument('--install-bsarch', action='store_true',
                        help='Install BSArch for optimal BSA/BA2 creation')
+    parser.add_argument('--cache', choices=['stats', 'prune'],
+                       help='Show archive cache statistics or prune the archive cache')
+    parser.add_argument('--cache-max-gb', type=float,
+                       help='Archive cache size limit in GB for this run and for --cache prune (0 clears the cache)')
+    parser.add_argument('--scratch-dir', action='append', default=[], metavar='DIR',
+                       help='Scratch root for temporary data; repeat to round-robin across disks')
+    parser.add_argument('--scratch-quota-gb', type=float,
+                       help='Maximum scratch space a run may use in GB')
+    parser.add_argument('--max-parallel-archives', type=int, metavar='N',
+                       help='Maximum BSArch archive builds running at once (default 2)')
+    parser.add_argument('--wait-cleanup', action='store_true',
+                       help='Wait for background deletion of temp data before exiting')
+
+    # Batch repacking options
+    parser.add_argument('--batch-repack', metavar='COLLECTION',
+                       help='Repack every mod in a collection folder')
+    parser.add_argument('--batch-output', metavar='DIR',
+                       help='Output directory for --batch-repack')
+    parser.add_argument('--force', action='store_true',
+                       help='Rebuild all mods, even those whose package is up to date')
+    parser.add_argument('--force-mod', action='append', default=[], metavar='NAME',
+                       help='Rebuild this mod (folder or plugin name) even if up to date; repeatable')
+    parser.add_argument('--resume', action='store_true',
+                       help='Resume an interrupted --batch-repack, skipping mods it already finished')
 
     parser.add_argument('--help', action='store_true', help='Show help')
 
     args = parser.parse_args()
 
+    # Automation runs get JSON line events and never touch Rich
+    if HEADLESS:
+        return _headless_main(cli, args)
+
     # If no arguments provided, launch console UI
     if len(sys.argv) == 1:
         from .console_ui import run_console_ui
@@ -712,6 +871,34 @@ def enhanced_main():
             cli.console.print("❌ BSArch installation failed or was cancelled")
         return 0 if success else 1
 
+    # Temp trees are deleted in the background; CI may need the disk back before exit
+    if args.wait_cleanup:
+        set_wait_at_exit(True)
+
+    # Place scratch data and sweep leftovers of crashed runs
+    if args.scratch_dir or args.scratch_quota_gb:
+        configure_scratch(args.scratch_dir, args.scratch_quota_gb)
+    else:
+        get_scratch_manager()
+
+    # Handle archive cache maintenance
+    if args.cache:
+        return cli.handle_cache_command(args.cache, args.cache_max_gb)
+    if args.cache_max_gb is not None:
+        get_archive_cache().set_max_size(args.cache_max_gb)
+
+    # Compare compression profiles on a sample corpus
+    if args.benchmark_compression:
+        return cli.handle_compression_benchmark(args.benchmark_compression, args.compression)
+
+    # Batch repack a mod collection
+    if args.batch_repack:
+        if not args.batch_output:
+            cli.console.print("[red]❌ --batch-repack requires --batch-output[/red]")
+            return 1
+        _start_session_logs(args)
+        return _execute_batch_repacking(_batch_config_from_args(args))
+
     # Interactive mode
     if args.interactive:
         config = cli.interactive_mode()
@@ -760,6 +947,11 @@ def enhanced_main():
     # Set debug mode
     set_debug(args.debug)
 
+    # Stream the full log to disk as we go; memory only keeps the recent tail
+    if getattr(args, 'log', None):
+        start_log_stream(args.log)
+    _start_session_logs(args)
+
     # Check for quiet or clean mode
     quiet_mode = getattr(args, 'quiet', False)
     clean_mode = getattr(args, 'clean', False) or quiet_mode
@@ -856,6 +1048,110 @@ def enhanced_main():
             cli.packer.cleanup_temp()
 
 
+def _headless_main(cli, args):
+    """
+    Run without any Rich display, reporting progress as JSON line events.
+
+    Args:
+        cli: EnhancedCLI instance (used for path validation and packaging)
+        args: Parsed command line arguments
+
+    Returns:
+        Exit code (0 for success, 1 for failure)
+    """
+    events = configure_progress_events(fd=args.progress_fd)
+    mode = 'batch_repack' if args.batch_repack else 'validate' if args.validate else 'single_mod'
+    events.emit('run_start', mode=mode, pid=os.getpid())
+
+    exit_code = 1
+    summary = {}
+    try:
+        if args.help:
+            cli.print_help_table()
+            exit_code = 0
+            return exit_code
+
+        if args.wait_cleanup:
+            set_wait_at_exit(True)
+        if args.scratch_dir or args.scratch_quota_gb:
+            configure_scratch(args.scratch_dir, args.scratch_quota_gb)
+        else:
+            get_scratch_manager()
+        if args.cache_max_gb is not None:
+            get_archive_cache().set_max_size(args.cache_max_gb)
+
+        if args.batch_repack:
+            if not args.batch_output:
+                events.emit('error', message='--batch-repack requires --batch-output')
+                return exit_code
+            _start_session_logs(args)
+            exit_code = _execute_batch_repacking(_batch_config_from_args(args))
+            return exit_code
+
+        required_args = ['source', 'generated', 'output_pack', 'output_loose']
+        missing_args = [arg for arg in required_args if not getattr(args, arg, None)]
+        if missing_args and not args.validate:
+            events.emit('error', message=f"Missing required arguments: {', '.join(missing_args)}")
+            return exit_code
+
+        for arg_name, path_type in [
+            ('source', 'source'),
+            ('generated', 'generated'),
+            ('output_pack', 'output pack'),
+            ('output_loose', 'output loose')
+        ]:
+            path = getattr(args, arg_name, None)
+            if path:
+                valid, message = cli.validate_path(path, path_type)
+                if not valid:
+                    events.emit('error', message=message)
+                    return exit_code
+        if args.validate:
+            exit_code = 0
+            return exit_code
+
+        set_debug(args.debug)
+        if args.log:
+            start_log_stream(args.log)
+        _start_session_logs(args)
+
+        cli.packer = SafeResourcePacker(
+            threads=args.threads,
+            debug=args.debug,
+            game_path=args.game_path,
+            game_type=args.game_type
+        )
+        pack_count, loose_count, blacklisted_count, skip_count, temp_blacklisted_dir = cli.packer.process_single_mod_resources(
+            args.source, args.generated, args.output_pack, args.output_loose
+        )
+        summary = {'pack': pack_count, 'loose': loose_count, 'blacklisted': blacklisted_count, 'skip': skip_count}
+
+        exit_code = 0
+        if args.package:
+            events.stage_start('package')
+            package_info = cli._handle_packaging(args, pack_count, loose_count, True, temp_blacklisted_dir)
+            events.stage_end('package', package_info.get('success', False),
+                             package_path=package_info.get('package_path'), message=package_info.get('message'))
+            summary['package_path'] = package_info.get('package_path')
+            if not package_info.get('success'):
+                exit_code = 1
+
+        write_log_file(args.log)
+        summary['log'] = args.log
+        return exit_code
+
+    except KeyboardInterrupt:
+        events.emit('error', message='Process interrupted by user')
+        return exit_code
+    except Exception as e:
+        events.emit('error', message=str(e))
+        return exit_code
+    finally:
+        if cli.packer:
+            cli.packer.cleanup_temp()
+        events.emit('run_end', exit_code=exit_code, **summary)
+
+
 def execute_with_config(config):
     """
     Execute Safe Resource Packer with configuration from console UI.
@@ -922,6 +1218,49 @@ def execute_with_config(config):
         return 1
 
 
+def _batch_config_from_args(args):
+    """Batch repacking configuration for --batch-repack (all discovered mods)."""
+    return {
+        'mode': 'batch_repack',
+        'collection_path': args.batch_repack,
+        'output_path': args.batch_output,
+        'selected_mods': None,  # All discovered mods
+        'game_type': args.game_type,
+        'threads': args.threads,
+        'compression': args.compression,
+        'compression_profile': args.compression_profile,
+        'force': args.force,
+        'force_mods': args.force_mod,
+        'resume': args.resume,
+        'max_parallel_archives': args.max_parallel_archives
+    }
+
+
+def _batch_repacker_config(config):
+    """Translate a batch repacking configuration into BatchModRepacker settings."""
+    repacker_config = {
+        'job_order': config.get('job_order', 'lpt'),
+        'force': config.get('force', False),
+        'force_mods': config.get('force_mods') or [],
+        'resume': config.get('resume', False)
+    }
+    if config.get('compression') is not None:
+        repacker_config['compression_level'] = config['compression']
+    if config.get('compression_profile'):
+        repacker_config['compression_profile'] = config['compression_profile']
+    if config.get('max_parallel_archives'):
+        repacker_config['max_parallel_archives'] = config['max_parallel_archives']
+    return repacker_config
+
+
+def _filter_selected_mods(all_mods, selected_mods):
+    """Keep the mods chosen in the wizard (all of them when nothing was chosen explicitly)."""
+    if selected_mods is None:
+        return list(all_mods)
+    selected_mod_paths = set(selected_mods)
+    return [mod for mod in all_mods if mod.mod_path in selected_mod_paths]
+
+
 def _execute_batch_repacking(config):
     """
     Execute batch mod repacking.
@@ -933,6 +1272,8 @@ def _execute_batch_repacking(config):
         Exit code (0 for success, 1 for failure)
     """
     try:
+        if HEADLESS:
+            raise ImportError("Rich output disabled for --progress=jsonl")
         from rich.console import Console
         from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn, TimeElapsedColumn
 
@@ -943,13 +1284,13 @@ def _execute_batch_repacking(config):
         # Initialize batch repacker
         batch_repacker = BatchModRepacker(
             game_type=config.get('game_type', 'skyrim'),
-            threads=config.get('threads', 8)
+            threads=config.get('threads', 8),
+            config=_batch_repacker_config(config)
         )
 
         # Filter discovered mods to only selected ones
         all_mods = batch_repacker.discover_mods(config['collection_path'])
-        selected_mod_paths = set(config['selected_mods'])
-        selected_mods = [mod for mod in all_mods if mod.mod_path in selected_mod_paths]
+        selected_mods = _filter_selected_mods(all_mods, config.get('selected_mods'))
 
         if not selected_mods:
             console.print("[red]❌ No selected mods found![/red]")
@@ -987,6 +1328,10 @@ def _execute_batch_repacking(config):
         if results['success']:
             console.print(f"\n[bold green]🎉 Batch processing completed successfully![/bold green]")
             console.print(f"✅ Processed: {results['processed']} mods")
+            if results.get('up_to_date'):
+                console.print(f"⏭️ Up to date: {results['up_to_date']} mods")
+            if results.get('resumed'):
+                console.print(f"📒 Finished before interruption: {results['resumed']} mods")
             if results['failed'] > 0:
                 console.print(f"❌ Failed: {results['failed']} mods")
 
@@ -1005,12 +1350,12 @@ def _execute_batch_repacking(config):
 
         batch_repacker = BatchModRepacker(
             game_type=config.get('game_type', 'skyrim'),
-            threads=config.get('threads', 8)
+            threads=config.get('threads', 8),
+            config=_batch_repacker_config(config)
         )
 
         all_mods = batch_repacker.discover_mods(config['collection_path'])
-        selected_mod_paths = set(config['selected_mods'])
-        selected_mods = [mod for mod in all_mods if mod.mod_path in selected_mod_paths]
+        selected_mods = _filter_selected_mods(all_mods, config.get('selected_mods'))
 
         if not selected_mods:
             print("❌ No selected mods found!")
@@ -1047,6 +1392,10 @@ def _execute_batch_repacking(config):
         if results['success']:
             print(f"🎉 Batch processing completed!")
             print(f"✅ Processed: {results['processed']} mods")
+            if results.get('up_to_date'):
+                print(f"⏭️ Up to date: {results['up_to_date']} mods")
+            if results.get('resumed'):
+                print(f"📒 Finished before interruption: {results['resumed']} mods")
             if results['failed'] > 0:
                 print(f"❌ Failed: {results['failed']} mods")
             print("\n" + batch_repacker.get_summary_report())
@@ -0,0 +1,209 @@
+"""
+Aggregated File Operation Telemetry
+
+Logging every copy or move as its own record turns a 100k-file run into
+hundreds of thousands of log lines before any real work is counted. The
+telemetry layer keeps per-stage counters and log2 histograms (bytes and
+latency) in memory instead, and only writes:
+
+- every failed operation, in full
+- one in every sample_every successful operations, in full
+- a summary per stage and operation (counts, bytes, latency percentiles)
+  every summary_interval seconds and when flushed
+"""
+
+import os
+import time
+import atexit
+import threading
+from typing import Any, Dict, List, Optional
+from .logging_service import log_file_operation, log_performance_metric
+
+
+SAMPLE_ENV_VAR = "SRP_FILE_OP_SAMPLE_EVERY"
+DEFAULT_SAMPLE_EVERY = 1000
+DEFAULT_SUMMARY_INTERVAL = 30.0
+
+LATENCY_BUCKETS = 32  # log2 microseconds, up to ~36 minutes
+SIZE_BUCKETS = 48  # log2 bytes, up to 128 TB
+
+
+def _bucket(value: float, buckets: int) -> int:
+    """Log2 histogram bucket for a non-negative value."""
+    return min(int(value).bit_length(), buckets - 1)
+
+
+def _percentile(histogram: List[int], count: int, fraction: float) -> int:
+    """Upper bound of the bucket holding the given fraction of samples."""
+    if not count:
+        return 0
+    target = max(1, int(count * fraction + 0.5))
+    seen = 0
+    for bucket, hits in enumerate(histogram):
+        seen += hits
+        if seen >= target:
+            return 1 << bucket
+    return 1 << (len(histogram) - 1)
+
+
+class OperationStats:
+    """Counters and histograms for one (stage, operation) pair."""
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.bytes = 0
+        self.timed = 0
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+        self.latency_histogram = [0] * LATENCY_BUCKETS
+        self.size_histogram = [0] * SIZE_BUCKETS
+
+    def add(self, size: Optional[int], latency: Optional[float], failed: bool) -> None:
+        self.count += 1
+        if failed:
+            self.errors += 1
+        if size is not None:
+            self.bytes += size
+            self.size_histogram[_bucket(size, SIZE_BUCKETS)] += 1
+        if latency is not None:
+            self.timed += 1
+            self.latency_total += latency
+            self.latency_max = max(self.latency_max, latency)
+            self.latency_histogram[_bucket(latency * 1e6, LATENCY_BUCKETS)] += 1
+
+    def summary(self) -> Dict[str, Any]:
+        sized = sum(self.size_histogram)
+        return {
+            'count': self.count,
+            'errors': self.errors,
+            'bytes': self.bytes,
+            'size_p50_bytes': _percentile(self.size_histogram, sized, 0.5),
+            'size_max_bucket_bytes': _percentile(self.size_histogram, sized, 1.0),
+            'latency_avg_ms': round(self.latency_total / self.timed * 1000, 3) if self.timed else 0,
+            'latency_p50_ms': _percentile(self.latency_histogram, self.timed, 0.5) / 1000,
+            'latency_p90_ms': _percentile(self.latency_histogram, self.timed, 0.9) / 1000,
+            'latency_p99_ms': _percentile(self.latency_histogram, self.timed, 0.99) / 1000,
+            'latency_max_ms': round(self.latency_max * 1000, 3),
+        }
+
+
+class FileOpTelemetry:
+    """Aggregates file operation records per stage."""
+
+    def __init__(self, sample_every: Optional[int] = None, summary_interval: float = DEFAULT_SUMMARY_INTERVAL):
+        """
+        Initialize file operation telemetry.
+
+        Args:
+            sample_every: Log one in this many successes in full, 0 for none
+                          (defaults to $SRP_FILE_OP_SAMPLE_EVERY, else 1000)
+            summary_interval: Seconds between periodic summaries
+        """
+        if sample_every is None:
+            try:
+                sample_every = int(os.environ.get(SAMPLE_ENV_VAR, DEFAULT_SAMPLE_EVERY))
+            except ValueError:
+                sample_every = DEFAULT_SAMPLE_EVERY
+        self.sample_every = max(0, sample_every)
+        self.summary_interval = summary_interval
+        self._stats = {}  # (stage, operation) -> OperationStats
+        self._dirty = set()  # Keys with records since their last summary
+        self._last_summary = time.time()
+        self._lock = threading.Lock()
+
+    def record(self, operation: str, source: str = None, destination: str = None,
+               size: int = None, latency: float = None, error: str = None, stage: str = 'default') -> None:
+        """
+        Record one file operation.
+
+        Args:
+            operation: Operation name ('copy', 'move', ...)
+            source: Source path
+            destination: Destination path
+            size: Bytes handled, if known
+            latency: Seconds the operation took, if measured
+            error: Error message for a failed operation
+            stage: Pipeline stage the operation belongs to
+        """
+        key = (stage, operation)
+        now = time.time()
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = OperationStats()
+            stats.add(size, latency, error is not None)
+            self._dirty.add(key)
+            sampled = error is None and self.sample_every and (stats.count - 1) % self.sample_every == 0
+            due = now - self._last_summary >= self.summary_interval
+            if due:
+                self._last_summary = now
+
+        if error is not None:
+            log_file_operation(operation, source, destination, size, success=False, error=error)
+        elif sampled:
+            log_file_operation(f"{operation}_sampled", source, destination, size, success=True)
+        if due:
+            self.flush()
+
+    def summary(self, stage: str = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Current aggregates.
+
+        Args:
+            stage: Only this stage (None for all)
+
+        Returns:
+            Summary dict keyed by 'stage:operation'
+        """
+        with self._lock:
+            return {f"{key[0]}:{key[1]}": stats.summary()
+                    for key, stats in self._stats.items() if stage is None or key[0] == stage}
+
+    def flush(self) -> None:
+        """Emit a summary for every stage that saw operations since its last one."""
+        with self._lock:
+            keys, self._dirty = self._dirty, set()
+            summaries = [(key, self._stats[key].summary()) for key in keys]
+            self._last_summary = time.time()
+        for (stage, operation), summary in sorted(summaries):
+            log_performance_metric(f"file_ops:{stage}:{operation}", summary['count'], "operations", summary)
+
+    def reset(self) -> None:
+        """Forget all aggregates."""
+        with self._lock:
+            self._stats.clear()
+            self._dirty.clear()
+
+
+# Global telemetry instance
+_file_op_telemetry = None
+_telemetry_lock = threading.Lock()
+
+
+def get_file_op_telemetry() -> FileOpTelemetry:
+    """Get global file operation telemetry instance."""
+    global _file_op_telemetry
+    if _file_op_telemetry is None:
+        with _telemetry_lock:
+            if _file_op_telemetry is None:
+                _file_op_telemetry = FileOpTelemetry()
+    return _file_op_telemetry
+
+
+def configure_file_op_telemetry(sample_every: Optional[int] = None,
+                                summary_interval: float = DEFAULT_SUMMARY_INTERVAL) -> FileOpTelemetry:
+    """Replace the global telemetry instance with new settings."""
+    global _file_op_telemetry
+    with _telemetry_lock:
+        previous, _file_op_telemetry = _file_op_telemetry, FileOpTelemetry(sample_every, summary_interval)
+    if previous is not None:
+        previous.flush()
+    return _file_op_telemetry
+
+
+@atexit.register
+def _flush_file_op_telemetry() -> None:
+    """Emit final summaries at interpreter exit."""
+    if _file_op_telemetry is not None:
+        _file_op_telemetry.flush()
@@ -3,6 +3,10 @@ Ultra-Comprehensive Logging Service for Safe Resource Packer
 
 This service provides maximum information capture for debugging user issues.
 Logs are stored in the user's chosen output folder with detailed context.
+
+Worker threads never touch a log file: every logger hands its records to a
+QueueHandler and one listener thread does the formatting and writing. Logs go
+either to one file per category (text) or to a single events.jsonl stream.
 """
 
 import os
@@ -12,25 +16,67 @@ import json
 import traceback
 import platform
 import psutil
+import atexit
+import queue
 import threading
 from datetime import datetime
 from typing import Dict, Any, Optional, List, Union
 from pathlib import Path
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
+
+
+LOG_FORMATS = ('text', 'jsonl')
+LOG_FORMAT_ENV_VAR = "SRP_LOG_FORMAT"
+LOGGER_PREFIX = "srp_"
+
+# Log category -> (text log file, level)
+LOG_CATEGORIES = {
+    "app": ("application.log", logging.DEBUG),
+    "system": ("system.log", logging.INFO),
+    "performance": ("performance.log", logging.INFO),
+    "error": ("errors.log", logging.ERROR),
+    "user": ("user_actions.log", logging.INFO),
+    "file_ops": ("file_operations.log", logging.DEBUG),
+    "config": ("configuration.log", logging.INFO),
+    "progress": ("progress.log", logging.INFO),
+    "tools": ("external_tools.log", logging.DEBUG),
+}
+EVENTS_FILE = "events.jsonl"
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Formats records as one JSON event per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        event = {
+            "time": datetime.fromtimestamp(record.created).isoformat(timespec='milliseconds'),
+            "category": record.name[len(LOGGER_PREFIX):] if record.name.startswith(LOGGER_PREFIX) else record.name,
+            "level": record.levelname,
+            "thread": record.threadName,
+            "function": record.funcName,
+            "message": record.getMessage(),
+        }
+        return json.dumps(event, ensure_ascii=False)
 
 
 class ComprehensiveLogService:
     """Ultra-comprehensive logging service for maximum debugging information."""
     
-    def __init__(self, output_dir: str, session_name: str = None):
+    def __init__(self, output_dir: str, session_name: str = None, log_format: str = None):
         """
         Initialize the comprehensive logging service.
         
         Args:
             output_dir: Directory where logs will be stored
             session_name: Optional session identifier
+            log_format: 'text' for one file per category, 'jsonl' for a single
+                        event stream (defaults to $SRP_LOG_FORMAT, else 'text')
         """
+        log_format = (log_format or os.environ.get(LOG_FORMAT_ENV_VAR) or 'text').lower()
+        if log_format not in LOG_FORMATS:
+            raise ValueError(f"Unknown log format '{log_format}', expected one of {LOG_FORMATS}")
+        self.log_format = log_format
         self.output_dir = Path(output_dir)
         self.session_name = session_name or f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         self.session_start = datetime.now()
@@ -54,98 +100,90 @@ class ComprehensiveLogService:
         self.operation_timings = {}
         
     def _setup_loggers(self):
-        """Setup multiple specialized loggers for different types of information."""
-        
+        """Setup the specialized loggers and the listener thread that writes them."""
+        self._queue = queue.SimpleQueue()
+        self._queue_handlers = []  # (logger, handler) pairs detached again by close()
+        self._handlers = self._create_handlers()
+        self._listener = QueueListener(self._queue, *self._handlers, respect_handler_level=True)
+        self._listener.start()
+
         # Main application logger
-        self.app_logger = self._create_logger(
-            "app", 
-            self.logs_dir / "application.log",
-            level=logging.DEBUG
-        )
-        
+        self.app_logger = self._create_logger("app")
         # System information logger
-        self.system_logger = self._create_logger(
-            "system",
-            self.logs_dir / "system.log", 
-            level=logging.INFO
-        )
-        
+        self.system_logger = self._create_logger("system")
         # Performance logger
-        self.performance_logger = self._create_logger(
-            "performance",
-            self.logs_dir / "performance.log",
-            level=logging.INFO
-        )
-        
+        self.performance_logger = self._create_logger("performance")
         # Error logger (detailed errors with stack traces)
-        self.error_logger = self._create_logger(
-            "error",
-            self.logs_dir / "errors.log",
-            level=logging.ERROR
-        )
-        
+        self.error_logger = self._create_logger("error")
         # User actions logger
-        self.user_logger = self._create_logger(
-            "user",
-            self.logs_dir / "user_actions.log",
-            level=logging.INFO
-        )
-        
+        self.user_logger = self._create_logger("user")
         # File operations logger
-        self.file_logger = self._create_logger(
-            "file_ops",
-            self.logs_dir / "file_operations.log",
-            level=logging.DEBUG
-        )
-        
+        self.file_logger = self._create_logger("file_ops")
         # Configuration logger
-        self.config_logger = self._create_logger(
-            "config",
-            self.logs_dir / "configuration.log",
-            level=logging.INFO
-        )
-        
+        self.config_logger = self._create_logger("config")
         # Progress logger
-        self.progress_logger = self._create_logger(
-            "progress",
-            self.logs_dir / "progress.log",
-            level=logging.INFO
-        )
-        
+        self.progress_logger = self._create_logger("progress")
         # External tools logger (BSArch, 7z, etc.)
-        self.tools_logger = self._create_logger(
-            "tools",
-            self.logs_dir / "external_tools.log",
-            level=logging.DEBUG
+        self.tools_logger = self._create_logger("tools")
+
+    def _create_handlers(self) -> List[logging.Handler]:
+        """Create the file handlers driven by the listener thread."""
+        if self.log_format == 'jsonl':
+            handler = self._create_file_handler(self.logs_dir / EVENTS_FILE, JsonLinesFormatter())
+            return [handler]
+
+        formatter = logging.Formatter(
+            '%(asctime)s | %(levelname)-8s | %(threadName)-10s | %(funcName)-20s | %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S'
         )
-        
-    def _create_logger(self, name: str, log_file: Path, level: int = logging.INFO) -> logging.Logger:
-        """Create a logger with file rotation."""
-        logger = logging.getLogger(f"srp_{name}")
-        logger.setLevel(level)
-        
-        # Clear existing handlers
-        logger.handlers.clear()
-        
-        # Create rotating file handler (10MB max, keep 5 files)
+        handlers = []
+        for name, (file_name, _) in LOG_CATEGORIES.items():
+            handler = self._create_file_handler(self.logs_dir / file_name, formatter)
+            # Every handler sees every queued record, so route by logger name
+            handler.addFilter(logging.Filter(f"{LOGGER_PREFIX}{name}"))
+            handlers.append(handler)
+        return handlers
+
+    def _create_file_handler(self, log_file: Path, formatter: logging.Formatter) -> logging.Handler:
+        """Create a rotating file handler (10MB max, keep 5 files)."""
         handler = RotatingFileHandler(
             log_file, 
             maxBytes=10*1024*1024,  # 10MB
             backupCount=5,
             encoding='utf-8'
         )
-        
-        # Create formatter
-        formatter = logging.Formatter(
-            '%(asctime)s | %(levelname)-8s | %(threadName)-10s | %(funcName)-20s | %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
         handler.setFormatter(formatter)
+        return handler
+        
+    def _create_logger(self, name: str) -> logging.Logger:
+        """Create a logger that only enqueues its records."""
+        logger = logging.getLogger(f"{LOGGER_PREFIX}{name}")
+        logger.setLevel(LOG_CATEGORIES[name][1])
         
+        # Clear existing handlers
+        logger.handlers.clear()
+        handler = QueueHandler(self._queue)
         logger.addHandler(handler)
+        self._queue_handlers.append((logger, handler))
         logger.propagate = False  # Don't propagate to root logger
         
         return logger
+
+    def close(self):
+        """Write out queued records, detach the loggers and close the log files."""
+        listener, self._listener = self._listener, None
+        if listener is None:
+            return
+        # Detach first so nothing is queued after the listener's last drain;
+        # the NullHandler keeps later records off Python's stderr fallback
+        for logger, handler in self._queue_handlers:
+            logger.removeHandler(handler)
+            if not logger.handlers:
+                logger.addHandler(logging.NullHandler())
+        self._queue_handlers = []
+        listener.stop()
+        for handler in self._handlers:
+            handler.close()
         
     def _capture_system_info(self) -> Dict[str, Any]:
         """Capture comprehensive system information."""
@@ -420,6 +458,8 @@ class ComprehensiveLogService:
                 self.system_logger.info(f"Session summary saved to: {summary_file}")
             except Exception as e:
                 self.system_logger.error(f"Failed to save session summary: {e}")
+
+        self.close()
     
     def get_log_directory(self) -> str:
         """Get the log directory path."""
@@ -434,10 +474,12 @@ class ComprehensiveLogService:
 _global_log_service: Optional[ComprehensiveLogService] = None
 
 
-def initialize_logging(output_dir: str, session_name: str = None) -> ComprehensiveLogService:
+def initialize_logging(output_dir: str, session_name: str = None, log_format: str = None) -> ComprehensiveLogService:
     """Initialize the global logging service."""
     global _global_log_service
-    _global_log_service = ComprehensiveLogService(output_dir, session_name)
+    if _global_log_service:
+        _global_log_service.close()
+    _global_log_service = ComprehensiveLogService(output_dir, session_name, log_format)
     return _global_log_service
 
 
@@ -522,3 +564,10 @@ def log_session_end():
     """Log session end."""
     if _global_log_service:
         _global_log_service.log_session_end()
+
+
+@atexit.register
+def _close_log_service():
+    """Write out queued log records at interpreter exit."""
+    if _global_log_service:
+        _global_log_service.close()
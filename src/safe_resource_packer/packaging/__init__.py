@@ -9,11 +9,14 @@ from .package_builder import PackageBuilder
 from .archive_creator import ArchiveCreator
 from .esp_manager import ESPManager
 from .compression_service import Compressor
+from .compression_profiles import CompressionProfile, get_compression_profile
 
 __all__ = [
     'PackageBuilder',
     'ArchiveCreator',
     'ESPManager',
-    'Compressor'
+    'Compressor',
+    'CompressionProfile',
+    'get_compression_profile'
 ]
 
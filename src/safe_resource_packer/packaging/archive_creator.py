@@ -8,24 +8,39 @@ Supports multiple creation methods with fallback options.
 import os
 import subprocess
 import shutil
+import threading
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 from ..dynamic_progress import log
 from ..utils import sanitize_filename, validate_path_length, check_disk_space, format_bytes
+from ..archive_cache import get_archive_cache
+from ..staging import StagingTree
+from ..scratch import get_scratch_manager
+from ..archive_jobs import ArchiveJob, ArchiveJobExecutor, set_max_parallel_archives
+from ..tool_registry import get_tool_registry
 from .bsarch_installer import install_bsarch_if_needed
 
 
 class ArchiveCreator:
     """Creates BSA/BA2 archives from classified pack files with game-specific rules."""
 
-    def __init__(self, game_type: str = "skyrim"):
+    def __init__(self, game_type: str = "skyrim", max_parallel_archives: Optional[int] = None,
+                 use_archive_cache: bool = True):
         """
         Initialize archive creator.
 
         Args:
             game_type: Target game ("skyrim" or "fallout4")
+            max_parallel_archives: Maximum archives (and chunks) built concurrently; also sets the
+                                   process-wide BSArch limit (defaults to the current limit)
+            use_archive_cache: Whether to reuse archives from the content-addressed output cache
         """
         self.game_type = game_type.lower()
+        self.max_parallel_archives = max_parallel_archives
+        self.use_archive_cache = use_archive_cache
+        if max_parallel_archives:
+            # Executors nest, so a per-creator limit only works if the shared BSArch slots allow it
+            set_max_parallel_archives(max_parallel_archives)
         self.supported_games = {"skyrim", "fallout4"}
 
         if self.game_type not in self.supported_games:
@@ -39,7 +54,9 @@ class ArchiveCreator:
                                     files: List[str],
                                     mod_name: str,
                                     output_dir: str,
-                                    temp_dir: Optional[str] = None) -> Tuple[bool, str, List[str]]:
+                                    temp_dir: Optional[str] = None,
+                                    cancel_event: Optional[threading.Event] = None,
+                                    source_path: Optional[str] = None) -> Tuple[bool, str, List[str]]:
         """
         Create game-specific archives following proper naming conventions.
 
@@ -52,6 +69,9 @@ class ArchiveCreator:
             mod_name: Name of the mod (used for archive naming)
             output_dir: Directory to create archives in
             temp_dir: Temporary directory for staging files
+            cancel_event: Event that aborts the archive builds when set
+            source_path: Folder the files come from, identifying chunked archives across runs
+                         when output_dir is temporary
 
         Returns:
             Tuple of (success: bool, message: str, created_archives: List[str])
@@ -62,66 +82,47 @@ class ArchiveCreator:
         # Separate textures from other files
         texture_files, other_files = self._separate_textures_from_other_files(files)
 
-        created_archives = []
+        # Each job stages into its own subdirectory so builds can run concurrently
+        owns_temp_dir = not temp_dir
+        if owns_temp_dir:
+            temp_dir = os.path.join(output_dir, f"temp_{sanitize_filename(mod_name)}")
 
-        # Create textures archive if we have textures
+        jobs = []
+
+        # Textures archive (never chunked - game requirement)
         if texture_files:
             texture_archive_name = f"{mod_name} - Textures{self.archive_ext}"
-            texture_archive_path = os.path.join(output_dir, texture_archive_name)
-
-            log(f"🎨 Creating textures archive: {texture_archive_name} ({len(texture_files)} files)", log_type='INFO')
-
-            # Textures are never chunked (game requirement)
-            success, message, archive_list = self.create_archive(
-                texture_files, texture_archive_path, mod_name, temp_dir, allow_chunking=False, is_texture_archive=True
-            )
-
-            if success:
-                created_archives.extend(archive_list)
-                log(f"✅ Textures archive created: {texture_archive_name}", log_type='INFO')
-            else:
-                log(f"❌ Failed to create textures archive: {message}", log_type='ERROR')
-                return False, f"Failed to create textures archive: {message}", []
-
-        # Create main archive if we have other files
+            jobs.append(self._make_archive_job(
+                "textures archive", texture_files, os.path.join(output_dir, texture_archive_name),
+                mod_name, os.path.join(temp_dir, "textures"), allow_chunking=False, is_texture_archive=True,
+                source_path=source_path
+            ))
+            log(f"🎨 Queued textures archive: {texture_archive_name} ({len(texture_files)} files)", log_type='INFO')
+
+        # Main archive
         if other_files:
             if self.game_type == "fallout4":
                 # Fallout 4: ModName - Main.ba2 (no chunking)
                 main_archive_name = f"{mod_name} - Main{self.archive_ext}"
-                main_archive_path = os.path.join(output_dir, main_archive_name)
-
-                log(f"📦 Creating main archive: {main_archive_name} ({len(other_files)} files)", log_type='INFO')
-
-                # Fallout 4 doesn't support chunking
-                success, message, archive_list = self.create_archive(
-                    other_files, main_archive_path, mod_name, temp_dir, allow_chunking=False, is_texture_archive=False
-                )
-
-                if success:
-                    created_archives.extend(archive_list)
-                    log(f"✅ Main archive created: {main_archive_name}", log_type='INFO')
-                else:
-                    log(f"❌ Failed to create main archive: {message}", log_type='ERROR')
-                    return False, f"Failed to create main archive: {message}", []
-
-            else:  # Skyrim
+            else:
                 # Skyrim: ModName.bsa (chunking allowed for non-textures)
                 main_archive_name = f"{mod_name}{self.archive_ext}"
-                main_archive_path = os.path.join(output_dir, main_archive_name)
+            jobs.append(self._make_archive_job(
+                "main archive", other_files, os.path.join(output_dir, main_archive_name),
+                mod_name, os.path.join(temp_dir, "main"), allow_chunking=self.supports_chunking, is_texture_archive=False,
+                source_path=source_path
+            ))
+            log(f"📦 Queued main archive: {main_archive_name} ({len(other_files)} files)", log_type='INFO')
 
-                log(f"📦 Creating main archive: {main_archive_name} ({len(other_files)} files)", log_type='INFO')
+        executor = ArchiveJobExecutor(max_parallel=self.max_parallel_archives, cancel_event=cancel_event)
+        success, message, created_archives = executor.run(jobs)
 
-                # Skyrim supports chunking for non-texture files
-                success, message, archive_list = self.create_archive(
-                    other_files, main_archive_path, mod_name, temp_dir, allow_chunking=True, is_texture_archive=False
-                )
+        if owns_temp_dir:
+            shutil.rmtree(temp_dir, ignore_errors=True)
 
-                if success:
-                    created_archives.extend(archive_list)
-                    log(f"✅ Main archive created: {main_archive_name}", log_type='INFO')
-                else:
-                    log(f"❌ Failed to create main archive: {message}", log_type='ERROR')
-                    return False, f"Failed to create main archive: {message}", []
+        if not success:
+            log(f"❌ Failed to create archives: {message}", log_type='ERROR')
+            return False, f"Failed to create {message}", []
 
         if not created_archives:
             return False, "No archives were created", []
@@ -134,6 +135,29 @@ class ArchiveCreator:
 
         return True, f"Successfully created {len(created_archives)} archive(s)", created_archives
 
+    def _make_archive_job(self,
+                          name: str,
+                          files: List[str],
+                          archive_path: str,
+                          mod_name: str,
+                          temp_dir: str,
+                          allow_chunking: bool,
+                          is_texture_archive: bool,
+                          source_path: Optional[str] = None) -> ArchiveJob:
+        """Wrap a create_archive call as an ArchiveJob with a fixed output path."""
+
+        def build(cancel_event):
+            success, message, archive_list = self.create_archive(
+                files, archive_path, mod_name, temp_dir,
+                allow_chunking=allow_chunking, is_texture_archive=is_texture_archive, cancel_event=cancel_event,
+                source_path=source_path
+            )
+            if success:
+                log(f"✅ {name.capitalize()} created: {os.path.basename(archive_path)}", log_type='INFO')
+            return success, message, archive_list
+
+        return ArchiveJob(name, archive_path, build)
+
     def _separate_textures_from_other_files(self, files: List[str]) -> Tuple[List[str], List[str]]:
         """
         Separate texture files from other files based on file paths.
@@ -202,7 +226,9 @@ class ArchiveCreator:
                       mod_name: str,
                       temp_dir: Optional[str] = None,
                       allow_chunking: bool = True,
-                      is_texture_archive: bool = False) -> Tuple[bool, str, List[str]]:
+                      is_texture_archive: bool = False,
+                      cancel_event: Optional[threading.Event] = None,
+                      source_path: Optional[str] = None) -> Tuple[bool, str, List[str]]:
         """
         Create BSA/BA2 archive from list of files.
 
@@ -213,12 +239,14 @@ class ArchiveCreator:
             temp_dir: Temporary directory for staging files
             allow_chunking: Whether chunking is allowed (textures should never be chunked)
             is_texture_archive: Whether this archive contains texture files (affects --dds flag usage)
+            cancel_event: Event that aborts BSArch when set
+            source_path: Folder identifying the archive set across runs (defaults to the output folder)
 
         Returns:
             Tuple of (success: bool, message: str, created_archives: List[str])
         """
         if not files:
-            return False, "No files provided for archiving"
+            return False, "No files provided for archiving", []
 
         # Determine archive format
         archive_ext = ".ba2" if self.game_type == "fallout4" else ".bsa"
@@ -233,6 +261,15 @@ class ArchiveCreator:
         log(f"Creating {archive_ext.upper()} archive: {archive_path}", log_type='INFO')
         log(f"Including {len(files)} files in archive", log_type='INFO')
 
+        # Identical inputs produce identical archives - try the output cache first
+        cache_key = self._archive_cache_key(files, allow_chunking, is_texture_archive)
+        if cache_key:
+            restored = get_archive_cache().restore(
+                cache_key, lambda index: self._chunk_archive_path(archive_path, index)
+            )
+            if restored:
+                return True, f"Restored {len(restored)} archive(s) from cache", restored
+
         # Try different creation methods (no ZIP fallback - ZIP is not a valid game archive format)
         methods = [
             self._create_with_bsarch,
@@ -245,11 +282,16 @@ class ArchiveCreator:
         for i, method in enumerate(methods):
             try:
                 if method == self._create_with_bsarch:
-                    success, message, created_archives = method(files, archive_path, mod_name, temp_dir, allow_chunking, is_texture_archive)
+                    success, message, created_archives = method(files, archive_path, mod_name, temp_dir, allow_chunking,
+                                                                is_texture_archive, cancel_event, source_path)
                 else:
                     success, message, created_archives = method(files, archive_path, mod_name, temp_dir, allow_chunking)
                 if success:
+                    if cache_key and method == self._create_with_bsarch:
+                        get_archive_cache().store(cache_key, created_archives)
                     return True, message, created_archives
+                if cancel_event is not None and cancel_event.is_set():
+                    return False, "Cancelled", []
 
                 # Check if BSArch method failed
                 if method == self._create_with_bsarch and "BSArch not found" in message:
@@ -266,13 +308,71 @@ class ArchiveCreator:
 
         return False, "BSA/BA2 creation failed - BSArch is required for proper game archive creation. Install BSArch to continue.", []
 
+    def _chunk_archive_path(self, archive_path: str, index: int) -> str:
+        """Get the path of archive number index (0 = main archive, then base0, base1, ...)."""
+        if index == 0:
+            return archive_path
+        base = archive_path[:-len(self.archive_ext)] if archive_path.endswith(self.archive_ext) else archive_path
+        return f"{base}{index - 1}{self.archive_ext}"
+
+    def _archive_cache_key(self, files: List[str], allow_chunking: bool, is_texture_archive: bool) -> Optional[str]:
+        """
+        Build the output cache key for an archive, or None if caching is not possible.
+
+        Args:
+            files: Files going into the archive
+            allow_chunking: Whether chunking is allowed
+            is_texture_archive: Whether the archive is built with -dds
+
+        Returns:
+            Cache key or None
+        """
+        if not self.use_archive_cache:
+            return None
+
+        backend_version = self._archive_backend_version()
+        if not backend_version:
+            return None
+
+        try:
+            entries = [(self._extract_data_relative_path(f), f) for f in files if os.path.exists(f)]
+            params = {
+                'format': 1,
+                'game_type': self.game_type,
+                'dds': is_texture_archive,
+                'compress': True,
+                'chunked': bool(self.supports_chunking and allow_chunking),
+                'max_chunk_size_gb': 2.0,
+                'backend': backend_version
+            }
+            return get_archive_cache().make_key(entries, params)
+        except Exception as e:
+            log(f"⚠️ Archive cache unavailable: {e}", log_type='WARNING')
+            return None
+
+    def _archive_backend_version(self) -> Optional[str]:
+        """Identify the BSArch binary (version, size and mtime) for cache keys."""
+        try:
+            from ..bsarch_service import get_bsarch_service
+            bsarch_path = get_bsarch_service(self.game_type).detector.get_bsarch_path()
+            if not bsarch_path or not os.path.exists(bsarch_path):
+                return None
+            capabilities = get_tool_registry().bsarch(bsarch_path)
+            if not capabilities.get('valid'):
+                return None
+            return f"bsarch:{capabilities.get('version') or 'unknown'}:{capabilities['size']}:{capabilities['mtime_ns']}"
+        except Exception:
+            return None
+
     def _create_with_bsarch(self,
                            files: List[str],
                            archive_path: str,
                            mod_name: str,
                            temp_dir: Optional[str],
                            allow_chunking: bool = True,
-                           is_texture_archive: bool = False) -> Tuple[bool, str, List[str]]:
+                           is_texture_archive: bool = False,
+                           cancel_event: Optional[threading.Event] = None,
+                           source_path: Optional[str] = None) -> Tuple[bool, str, List[str]]:
         """Create archive using universal BSArch service with chunking support."""
 
         try:
@@ -282,7 +382,7 @@ class ArchiveCreator:
             # Validate archive path length
             is_valid, error_msg = validate_path_length(archive_path)
             if not is_valid:
-                return False, f"Archive path too long: {error_msg}"
+                return False, f"Archive path too long: {error_msg}", []
 
             # Create temporary directory structure
             if not temp_dir:
@@ -292,18 +392,17 @@ class ArchiveCreator:
             is_valid, error_msg = validate_path_length(temp_dir)
             if not is_valid:
                 # Try shorter path
-                import tempfile
-                temp_dir = os.path.join(tempfile.gettempdir(), f"srp_{safe_mod_name}")
+                temp_dir = get_scratch_manager().mkdtemp(prefix=f"srp_{safe_mod_name}_", near=archive_path)
 
             # Check disk space before starting
             estimated_size = sum(os.path.getsize(f) for f in files if os.path.exists(f))
             has_space, available, required = check_disk_space(os.path.dirname(archive_path), estimated_size * 2)  # 2x for temp files
             if not has_space:
-                return False, f"Insufficient disk space: need {format_bytes(required)}, have {format_bytes(available)}"
+                return False, f"Insufficient disk space: need {format_bytes(required)}, have {format_bytes(available)}", []
 
             os.makedirs(temp_dir, exist_ok=True)
 
-            # Copy files to temp directory maintaining structure
+            # Link files into the temp directory maintaining structure
             self._stage_files(files, temp_dir)
 
             # Generate staged file paths for chunking
@@ -332,7 +431,10 @@ class ArchiveCreator:
                     game_type=self.game_type,
                     max_chunk_size_gb=2.0,  # CAO-style 2GB limit
                     interactive=False,  # Non-interactive for ArchiveCreator
-                    is_texture_archive=is_texture_archive
+                    is_texture_archive=is_texture_archive,
+                    max_parallel=self.max_parallel_archives,
+                    cancel_event=cancel_event,
+                    source_path=source_path
                 )
             else:
                 # Fallout 4: No chunking, create single archive
@@ -343,7 +445,8 @@ class ArchiveCreator:
                     files=staged_files,
                     game_type=self.game_type,
                     interactive=False,
-                    is_texture_archive=is_texture_archive
+                    is_texture_archive=is_texture_archive,
+                    cancel_event=cancel_event
                 )
                 created_archives = [archive_path] if success else []
 
@@ -449,21 +552,9 @@ class ArchiveCreator:
 
     def _stage_files(self, files: List[str], temp_dir: str):
         """Stage files in temporary directory maintaining proper game Data structure."""
-
-        for file_path in files:
-            if not os.path.exists(file_path):
-                log(f"Skipping missing file: {file_path}", log_type='WARNING')
-                continue
-
-            # Extract Data-relative path for proper game structure
-            data_rel_path = self._extract_data_relative_path(file_path)
-            dest_path = os.path.join(temp_dir, data_rel_path)
-
-            # Create destination directory
-            os.makedirs(os.path.dirname(dest_path), exist_ok=True)
-
-            # Copy file
-            shutil.copy2(file_path, dest_path)
+        staging = StagingTree(temp_dir)
+        staging.add_files(files, self._extract_data_relative_path)
+        log(f"📋 {staging.summary()}", log_type='DEBUG')
 
     def _extract_data_relative_path(self, file_path: str) -> str:
         """
@@ -501,7 +592,7 @@ class ArchiveCreator:
             if part.lower() in [d.lower() for d in game_dirs]:
                 # Return path from this game directory onwards
                 data_relative = '/'.join(path_parts[i:])
-                log(f"Extracted Data path: {file_path} → {data_relative}", debug_only=True, log_type='SPAM')
+                log("Extracted Data path: %s → %s", file_path, data_relative, debug_only=True, log_type='SPAM')
                 return data_relative
 
         # If no game directory found, look for common patterns
@@ -511,7 +602,7 @@ class ArchiveCreator:
             if part_lower == 'data' and i < len(path_parts) - 1:
                 # Return everything after 'data' directory
                 data_relative = '/'.join(path_parts[i+1:])
-                log(f"Found Data folder: {file_path} → {data_relative}", debug_only=True, log_type='SPAM')
+                log("Found Data folder: %s → %s", file_path, data_relative, debug_only=True, log_type='SPAM')
                 return data_relative
 
         # Fallback: use the last 2-3 path components to preserve some structure
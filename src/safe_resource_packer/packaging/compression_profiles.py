@@ -0,0 +1,231 @@
+"""
+Compression Profiles
+
+Content-aware 7z settings for the final packages. Package entries are grouped
+by file type and each group is added with its own 7z method: BSA/BA2 archives
+and audio that are already compressed are stored or packed fast, plugins,
+scripts and configs get LZMA2 with a large dictionary, and solid blocks are
+split per extension so similar data shares a dictionary window.
+
+The default 'uniform' profile compresses every file at the chosen level, as
+packages always were; the content-aware profiles are opt-in.
+"""
+
+import os
+import struct
+from typing import Callable, Dict, List, Optional, Set, Tuple
+from ..dynamic_progress import log
+
+
+# Payloads that are already compressed (LZ4/zlib archives, xWMA/FUZ audio, media, nested archives)
+PRECOMPRESSED_EXTENSIONS = {
+    '.bsa', '.ba2', '.xwm', '.fuz', '.ogg', '.mp3', '.bik', '.png', '.jpg', '.jpeg',
+    '.7z', '.zip', '.rar'
+}
+
+# Block-compressed textures: little left to gain, so pack them fast
+TEXTURE_EXTENSIONS = {'.dds'}
+
+# DDS FourCCs and DX10 DXGI formats of block-compressed (BC1-BC7) textures
+BLOCK_COMPRESSED_FOURCCS = {b'DXT1', b'DXT2', b'DXT3', b'DXT4', b'DXT5', b'ATI1', b'ATI2',
+                            b'BC4U', b'BC4S', b'BC5U', b'BC5S'}
+BLOCK_COMPRESSED_DXGI_FORMATS = set(range(70, 85)) | set(range(94, 100))  # BC1-BC5, BC6H, BC7
+
+# Plugins, scripts and configs compress very well with a large dictionary
+TEXT_EXTENSIONS = {
+    '.esp', '.esm', '.esl', '.pex', '.psc', '.ini', '.json', '.txt', '.xml', '.toml',
+    '.yaml', '.yml', '.cfg', '.csv', '.md', '.html', '.lua', '.js', '.log'
+}
+
+DEFAULT_PROFILE = 'uniform'
+
+
+def is_block_compressed_dds(path: str) -> bool:
+    """
+    Check whether a DDS texture is already block-compressed (BC1-BC7).
+
+    Uncompressed DDS (RGBA and friends) still shrinks a lot under LZMA, so only
+    block-compressed ones belong in the fast texture group.
+
+    Args:
+        path: DDS file
+
+    Returns:
+        True if the header names a block-compressed format
+    """
+    try:
+        with open(path, 'rb') as f:
+            header = f.read(132)
+    except OSError:
+        return False
+    if len(header) < 128 or header[:4] != b'DDS ':
+        return False
+    four_cc = header[84:88]
+    if four_cc == b'DX10':
+        return len(header) >= 132 and struct.unpack('<I', header[128:132])[0] in BLOCK_COMPRESSED_DXGI_FORMATS
+    return four_cc in BLOCK_COMPRESSED_FOURCCS
+
+
+class CompressionGroup:
+    """A set of file types compressed with the same 7z switches."""
+
+    def __init__(self, name: str, extensions: Optional[Set[str]], switches: List[str],
+                 content_check: Optional[Callable[[str], bool]] = None):
+        """
+        Initialize compression group.
+
+        Args:
+            name: Group name
+            extensions: Lowercase extensions in this group (None matches everything)
+            switches: 7z switches; '{level}' is replaced by the run's compression level
+            content_check: Optional test on the source file for files with a matching extension
+        """
+        self.name = name
+        self.extensions = extensions
+        self.switches = switches
+        self.content_check = content_check
+
+    def matches(self, path: str, source: Optional[str] = None) -> bool:
+        """Check whether a file (named path in the package, read from source) belongs to this group."""
+        if self.extensions is not None and os.path.splitext(path)[1].lower() not in self.extensions:
+            return False
+        return self.content_check is None or self.content_check(source or path)
+
+
+class CompressionProfile:
+    """Ordered compression groups; the first matching group wins."""
+
+    def __init__(self, name: str, description: str, groups: List[CompressionGroup]):
+        """
+        Initialize compression profile.
+
+        Args:
+            name: Profile name
+            description: Short description for help output
+            groups: Groups in match order (the last should match everything)
+        """
+        self.name = name
+        self.description = description
+        self.groups = groups
+
+    def group_for(self, path: str, source: Optional[str] = None) -> CompressionGroup:
+        """Get the group a file (named path in the package, read from source) belongs to."""
+        for group in self.groups:
+            if group.matches(path, source):
+                return group
+        return self.groups[-1]
+
+    def switches_for(self, group: CompressionGroup, compression_level: int) -> List[str]:
+        """
+        Get the 7z switches for a group.
+
+        Args:
+            group: Compression group
+            compression_level: Run compression level (0-9)
+
+        Returns:
+            List of 7z switches
+        """
+        return [switch.replace('{level}', str(compression_level)) for switch in group.switches]
+
+    def split_entries(self, entries: List[Tuple[str, str]]) -> List[Tuple[CompressionGroup, List[Tuple[str, str]]]]:
+        """
+        Split package entries into compression groups.
+
+        Folders whose files all fall into one group stay a single entry; mixed
+        folders are expanded into per-file entries.
+
+        Args:
+            entries: List of (source_path, archive_name) tuples
+
+        Returns:
+            List of (group, entries) ordered by ascending total size. Every group
+            after the first rewrites the archive, so the biggest group goes last.
+        """
+        grouped: Dict[str, List[Tuple[str, str]]] = {}
+        sizes: Dict[str, int] = {}
+
+        def add(group, source, name, size):
+            grouped.setdefault(group.name, []).append((source, name))
+            sizes[group.name] = sizes.get(group.name, 0) + size
+
+        for source, name in entries:
+            if not os.path.isdir(source):
+                add(self.group_for(name, source), source, name, _file_size(source))
+                continue
+
+            files = []
+            for root, dirs, filenames in os.walk(source):
+                for filename in filenames:
+                    path = os.path.join(root, filename)
+                    rel_path = os.path.relpath(path, source).replace(os.sep, '/')
+                    files.append((path, f"{name}/{rel_path}", self.group_for(filename, path), _file_size(path)))
+
+            groups = {group.name for _, _, group, _ in files}
+            if len(groups) <= 1:
+                group = files[0][2] if files else self.groups[-1]
+                add(group, source, name, sum(size for _, _, _, size in files))
+            else:
+                for path, archive_name, group, size in files:
+                    add(group, path, archive_name, size)
+
+        by_name = {group.name: group for group in self.groups}
+        return [(by_name[group_name], grouped[group_name])
+                for group_name in sorted(grouped, key=lambda g: sizes[g])]
+
+
+def _file_size(path: str) -> int:
+    """Get a file size, 0 if it can't be read."""
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+COMPRESSION_PROFILES: Dict[str, CompressionProfile] = {
+    'uniform': CompressionProfile(
+        'uniform', "One compression level for every file",
+        [CompressionGroup('all', None, ['-mx{level}'])]
+    ),
+    'balanced': CompressionProfile(
+        'balanced', "Store pre-compressed archives/audio, LZMA2 with a large dictionary for plugins and scripts",
+        [
+            CompressionGroup('precompressed', PRECOMPRESSED_EXTENSIONS, ['-mx0']),
+            CompressionGroup('textures', TEXTURE_EXTENSIONS, ['-m0=LZMA2', '-mx1', '-ms=e'], is_block_compressed_dds),
+            CompressionGroup('text', TEXT_EXTENSIONS, ['-m0=LZMA2', '-mx{level}', '-md=64m', '-ms=e']),
+            CompressionGroup('other', None, ['-mx{level}', '-ms=e'])
+        ]
+    ),
+    'fast': CompressionProfile(
+        'fast', "Store pre-compressed archives/audio, fastest LZMA2 for everything else",
+        [
+            CompressionGroup('precompressed', PRECOMPRESSED_EXTENSIONS, ['-mx0']),
+            CompressionGroup('other', None, ['-m0=LZMA2', '-mx1', '-ms=e'])
+        ]
+    ),
+    'max': CompressionProfile(
+        'max', "Smallest packages: fast pass over pre-compressed data, maximum LZMA2 elsewhere",
+        [
+            CompressionGroup('precompressed', PRECOMPRESSED_EXTENSIONS, ['-m0=LZMA2', '-mx1']),
+            CompressionGroup('text', TEXT_EXTENSIONS, ['-m0=LZMA2', '-mx9', '-md=256m', '-ms=e']),
+            CompressionGroup('other', None, ['-mx9', '-ms=e'])
+        ]
+    )
+}
+
+
+def get_compression_profile(name: Optional[str] = None) -> CompressionProfile:
+    """
+    Get a compression profile by name.
+
+    Args:
+        name: Profile name (defaults to DEFAULT_PROFILE)
+
+    Returns:
+        CompressionProfile (the default one if name is unknown)
+    """
+    profile = COMPRESSION_PROFILES.get((name or DEFAULT_PROFILE).lower())
+    if profile is None:
+        log(f"⚠️ Unknown compression profile '{name}', using '{DEFAULT_PROFILE}'", log_type='WARNING')
+        profile = COMPRESSION_PROFILES[DEFAULT_PROFILE]
+    return profile
@@ -9,22 +9,101 @@ import os
 import subprocess
 import tempfile
 import shutil
+import threading
+from contextlib import contextmanager
 from pathlib import Path
 from typing import List, Optional, Tuple
 from ..dynamic_progress import log
+from ..tool_registry import get_tool_registry
+from ..staging import link_or_copy
+from .compression_profiles import get_compression_profile, DEFAULT_PROFILE
+from ..process_runner import run_streaming, parse_7z_progress, tool_progress, inactivity_timeout_for
+
+
+class SevenZipThreadBudget:
+    """
+    Caps the total number of 7z compression threads across concurrent runs.
+    
+    Each run is granted a fair share of the budget based on how many runs are
+    expected to overlap, so concurrent archives don't each claim every core.
+    """
+    
+    def __init__(self, total_threads: Optional[int] = None):
+        """
+        Initialize thread budget.
+        
+        Args:
+            total_threads: Total 7z threads allowed at once (defaults to the CPU count)
+        """
+        self.total_threads = max(1, total_threads or os.cpu_count() or 1)
+        self._available = self.total_threads
+        self._expected_runs = 0
+        self._condition = threading.Condition()
+        
+    @contextmanager
+    def expect_concurrent(self, runs: int):
+        """
+        Declare that `runs` 7z runs will overlap while the context is active.
+        
+        Args:
+            runs: Number of concurrent runs
+        """
+        with self._condition:
+            self._expected_runs += runs
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._expected_runs -= runs
+                
+    def acquire(self) -> int:
+        """
+        Reserve threads for one 7z run, waiting until at least one is free.
+        
+        Returns:
+            Number of threads granted
+        """
+        with self._condition:
+            while self._available < 1:
+                self._condition.wait()
+            share = max(1, self.total_threads // max(1, self._expected_runs))
+            granted = min(share, self._available)
+            self._available -= granted
+            return granted
+            
+    def release(self, threads: int) -> None:
+        """Return threads granted by acquire()."""
+        with self._condition:
+            self._available += threads
+            self._condition.notify_all()
+
+
+_thread_budget = None
+_thread_budget_lock = threading.Lock()
+
+
+def get_7z_thread_budget() -> SevenZipThreadBudget:
+    """Get the process-wide 7z thread budget."""
+    global _thread_budget
+    with _thread_budget_lock:
+        if _thread_budget is None:
+            _thread_budget = SevenZipThreadBudget()
+        return _thread_budget
 
 
 class CompressionService:
     """Unified 7z CLI compression service - handles ALL compression needs."""
 
-    def __init__(self, compression_level: int = 3):
+    def __init__(self, compression_level: int = 3, compression_profile: Optional[str] = None):
         """
         Initialize compression service.
         
         Args:
             compression_level: 7z compression level (0-9)
+            compression_profile: Name of the content-aware profile for packages (see compression_profiles)
         """
         self.compression_level = max(0, min(9, compression_level))
+        self.profile = get_compression_profile(compression_profile)
         self.sevenz_cmd = self._find_7z_command()
         
     def _find_7z_command(self) -> Optional[str]:
@@ -32,24 +111,17 @@ class CompressionService:
         # Try different possible 7z command names in order of preference
         # Accept both 7z CLI and NanaZip (they're both valid)
         possible_commands = ['7z', '7za', '7zz']
+        registry = get_tool_registry()
         
         for cmd in possible_commands:
             if shutil.which(cmd):
-                # Verify this is a valid 7z-compatible command
-                try:
-                    result = subprocess.run([cmd, '--help'], capture_output=True, text=True, timeout=5)
-                    if result.returncode == 0:
-                        help_text = result.stdout.lower()
-                        # Accept both 7z CLI and NanaZip
-                        if ('7-zip' in help_text or 'igor pavlov' in help_text or 
-                            'nanazip' in help_text or 'm2-team' in help_text):
-                            log(f"Found 7z-compatible command: {cmd}", log_type='DEBUG')
-                            return cmd
-                        else:
-                            log(f"Found {cmd} but couldn't verify it's 7z-compatible", log_type='WARNING')
-                            continue
-                except Exception as e:
-                    log(f"Error checking {cmd}: {e}", log_type='WARNING')
+                # Verify this is a valid 7z-compatible command (probed once per binary)
+                capabilities = registry.sevenzip(cmd)
+                if capabilities.get('valid'):
+                    log(f"Found 7z-compatible command: {cmd}", log_type='DEBUG')
+                    return cmd
+                else:
+                    log(f"Found {cmd} but couldn't verify it's 7z-compatible", log_type='WARNING')
                     continue
         
         # Check what's available and provide helpful error message
@@ -71,37 +143,54 @@ class CompressionService:
         """Check if 7z CLI is available."""
         return self.sevenz_cmd is not None
         
+    def _capabilities(self) -> dict:
+        """Get registry capabilities of the selected 7z command."""
+        if not self.sevenz_cmd:
+            return {}
+        return get_tool_registry().sevenzip(self.sevenz_cmd)
+        
     def _is_nanazip(self) -> bool:
         """Check if we're using NanaZip."""
-        if not self.sevenz_cmd:
-            return False
-        try:
-            result = subprocess.run([self.sevenz_cmd, '--help'], capture_output=True, text=True, timeout=5)
-            if result.returncode == 0:
-                help_text = result.stdout.lower()
-                return 'nanazip' in help_text or 'm2-team' in help_text
-        except Exception:
-            pass
-        return False
+        return self._capabilities().get('flavor') == 'nanazip'
         
     def _test_mmt_parameter(self) -> bool:
-        """Test if the current 7z command supports -mmt parameter."""
-        if not self.sevenz_cmd:
-            return False
+        """Check if the current 7z command supports -mmt parameter."""
+        # NanaZip doesn't support -mmt parameter (recorded by the registry probe)
+        return bool(self._capabilities().get('supports_mmt'))
         
-        # NanaZip doesn't support -mmt parameter, so skip it
-        if self._is_nanazip():
-            return False
-            
-        try:
-            # Test with a simple command that uses -mmt
-            result = subprocess.run([self.sevenz_cmd, 'a', '-mmt=on', '--help'], 
-                                  capture_output=True, text=True, timeout=5)
-            # If it doesn't error out, the parameter is supported
-            return result.returncode == 0
-        except Exception:
-            return False
+    def _run_7z(self, cmd: List[str], archive_path: str, cwd: Optional[str] = None,
+                cancel_event: Optional[threading.Event] = None):
+        """
+        Run a 7z command with streamed output and percentage progress.
         
+        Multithreaded runs (-mmt=on) take their thread count from the shared
+        7z thread budget.
+
+        Args:
+            cmd: 7z command (executable and subcommand first)
+            archive_path: Archive being written or read (labels the progress display)
+            cwd: Working directory
+            cancel_event: Event that kills 7z when set
+
+        Returns:
+            ProcessResult of the run
+        """
+        # -bsp1 sends percentage progress to stdout
+        cmd = cmd[:2] + ['-bsp1'] + cmd[2:]
+        
+        budget = get_7z_thread_budget() if '-mmt=on' in cmd else None
+        threads = budget.acquire() if budget else 0
+        try:
+            if budget:
+                cmd[cmd.index('-mmt=on')] = f'-mmt={threads}'
+            with tool_progress(f"7z {os.path.basename(archive_path)}") as on_progress:
+                return run_streaming(cmd, cwd=cwd, tool="7z", cancel_event=cancel_event,
+                                     inactivity_timeout=inactivity_timeout_for("7z"),
+                                     progress_parser=parse_7z_progress, on_progress=on_progress)
+        finally:
+            if budget:
+                budget.release(threads)
+
     def compress_directory(self, source_dir: str, archive_path: str) -> Tuple[bool, str]:
         """
         Compress entire directory to 7z archive.
@@ -160,53 +249,44 @@ class CompressionService:
             
             # On Windows, try a different approach first
             if os.name == 'nt':
-                # Method 1.5: Windows-specific approach - change to source directory and use relative paths
+                # Method 1.5: Windows-specific approach - run from the source directory with relative paths
                 log("Trying Windows-specific directory compression...", log_type='DEBUG')
-                original_cwd = os.getcwd()
-                try:
-                    os.chdir(source_dir)
-                    # Build Windows command with adaptive parameters
-                    cmd_windows = [
-                        self.sevenz_cmd, 'a', 
-                        os.path.abspath(archive_path),
-                        f'-mx{self.compression_level}',
-                        '.'  # Current directory
-                    ]
-                    
-                    # Add multithreading parameter if supported
-                    is_nanazip = self._is_nanazip()
-                    supports_mmt = self._test_mmt_parameter()
-                    
-                    if supports_mmt:
-                        cmd_windows.insert(-1, '-mmt=on')  # Insert before '.'
-                        
-                    # Add NanaZip-specific parameters if needed
-                    if is_nanazip:
-                        cmd_windows.insert(-1, '-y')  # Assume Yes on all queries
-                    
-                    # Log the Windows-specific command
-                    log(f"Executing Windows 7z command: {' '.join(cmd_windows)}", log_type='DEBUG')
-                    log(f"Changed to directory: {os.getcwd()}", log_type='DEBUG')
-                    
-                    result_windows = subprocess.run(cmd_windows, capture_output=True, text=True, timeout=3600)
-                    
-                    # Log detailed results
-                    log(f"Windows 7z return code: {result_windows.returncode}", log_type='DEBUG')
-                    if result_windows.stdout:
-                        log(f"Windows 7z stdout: {result_windows.stdout}", log_type='DEBUG')
-                    if result_windows.stderr:
-                        log(f"Windows 7z stderr: {result_windows.stderr}", log_type='DEBUG')
-                    
-                    if result_windows.returncode != 0:
-                        log(f"Windows method failed (code {result_windows.returncode}), trying standard method...", log_type='DEBUG')
+                # Build Windows command with adaptive parameters
+                cmd_windows = [
+                    self.sevenz_cmd, 'a', 
+                    os.path.abspath(archive_path),
+                    f'-mx{self.compression_level}',
+                    '.'  # Source directory (used as working directory)
+                ]
+                
+                if supports_mmt:
+                    cmd_windows.insert(-1, '-mmt=on')  # Insert before '.'
                     
-                    if result_windows.returncode == 0:
-                        archive_size = os.path.getsize(archive_path) if os.path.exists(archive_path) else 0
-                        return True, f"Directory compressed successfully (Windows method): {archive_path} ({archive_size:,} bytes)"
-                    else:
-                        log(f"Windows method failed, trying standard method...", log_type='DEBUG')
-                finally:
-                    os.chdir(original_cwd)
+                # Add NanaZip-specific parameters if needed
+                if is_nanazip:
+                    cmd_windows.insert(-1, '-y')  # Assume Yes on all queries
+                
+                # Log the Windows-specific command
+                log(f"Executing Windows 7z command: {' '.join(cmd_windows)}", log_type='DEBUG')
+                log(f"Working directory: {os.path.abspath(source_dir)}", log_type='DEBUG')
+                
+                result_windows = self._run_7z(cmd_windows, archive_path, cwd=os.path.abspath(source_dir))
+                
+                # Log detailed results
+                log(f"Windows 7z return code: {result_windows.returncode}", log_type='DEBUG')
+                if result_windows.stdout:
+                    log(f"Windows 7z stdout: {result_windows.stdout}", log_type='DEBUG')
+                if result_windows.stderr:
+                    log(f"Windows 7z stderr: {result_windows.stderr}", log_type='DEBUG')
+                
+                if result_windows.timed_out:
+                    return False, f"7z compression stalled ({result_windows.stall_description})"
+                
+                if result_windows.returncode == 0:
+                    archive_size = os.path.getsize(archive_path) if os.path.exists(archive_path) else 0
+                    return True, f"Directory compressed successfully (Windows method): {archive_path} ({archive_size:,} bytes)"
+                else:
+                    log(f"Windows method failed (code {result_windows.returncode}), trying standard method...", log_type='DEBUG')
             
             # Check for potential issues with large directories (quietly)
             total_size = 0
@@ -236,7 +316,7 @@ class CompressionService:
             log(f"Source path: {source_path}", log_type='DEBUG')
             log(f"Archive path: {archive_path}", log_type='DEBUG')
             
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=3600)
+            result = self._run_7z(cmd, archive_path)
             
             # Log detailed results
             log(f"7z return code: {result.returncode}", log_type='DEBUG')
@@ -245,6 +325,9 @@ class CompressionService:
             if result.stderr:
                 log(f"7z stderr: {result.stderr}", log_type='DEBUG')
             
+            if result.timed_out:
+                return False, f"7z compression stalled ({result.stall_description})"
+            
             if result.returncode != 0:
                 error_msg = result.stderr.strip() if result.stderr else "Unknown 7z error"
                 stdout_msg = result.stdout.strip() if result.stdout else "No stdout"
@@ -278,8 +361,6 @@ class CompressionService:
                 log(f"Using file-by-file compression method...", log_type='DEBUG')
                 return self.compress_files(files_to_compress, archive_path)
                 
-        except subprocess.TimeoutExpired:
-            return False, "7z compression timed out (>60 minutes)"
         except Exception as e:
             return False, f"7z compression error: {e}"
             
@@ -344,58 +425,49 @@ class CompressionService:
             archive_path = str(Path(archive_path).with_suffix('.7z'))
             
         try:
-            # Change to source directory and compress all contents
-            original_cwd = os.getcwd()
-            os.chdir(source_dir)
+            # Build command to compress all contents of the source directory
+            cmd = [
+                self.sevenz_cmd, 'a', 
+                os.path.abspath(archive_path),
+                f'-mx{self.compression_level}',
+                '*'  # Compress all contents (expanded by 7z relative to cwd)
+            ]
             
-            try:
-                # Build command to compress all contents of current directory
-                cmd = [
-                    self.sevenz_cmd, 'a', 
-                    os.path.abspath(archive_path),
-                    f'-mx{self.compression_level}',
-                    '*'  # Compress all contents
-                ]
-                
-                # Add multithreading parameter if supported
-                is_nanazip = self._is_nanazip()
-                supports_mmt = self._test_mmt_parameter()
-                
-                if supports_mmt:
-                    cmd.insert(-1, '-mmt=on')
-                    
-                # Add NanaZip-specific parameters if needed
-                if is_nanazip:
-                    cmd.insert(-1, '-y')
-                
-                # Log command
-                log(f"Executing 7z command (direct contents): {' '.join(cmd)}", log_type='DEBUG')
-                log(f"Working directory: {os.getcwd()}", log_type='DEBUG')
-                
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=3600)
-                
-                # Log results
-                log(f"7z return code: {result.returncode}", log_type='DEBUG')
-                if result.stdout:
-                    log(f"7z stdout: {result.stdout}", log_type='DEBUG')
-                if result.stderr:
-                    log(f"7z stderr: {result.stderr}", log_type='DEBUG')
+            # Add multithreading parameter if supported
+            is_nanazip = self._is_nanazip()
+            supports_mmt = self._test_mmt_parameter()
+            
+            if supports_mmt:
+                cmd.insert(-1, '-mmt=on')
                 
-                if result.returncode == 0:
-                    archive_size = os.path.getsize(archive_path) if os.path.exists(archive_path) else 0
-                    return True, f"Directory contents compressed successfully: {archive_path} ({archive_size:,} bytes)"
-                else:
-                    error_msg = result.stderr.strip() if result.stderr else "Unknown 7z error"
-                    return False, f"7z compression failed: {error_msg}"
-                    
-            finally:
-                os.chdir(original_cwd)
+            # Add NanaZip-specific parameters if needed
+            if is_nanazip:
+                cmd.insert(-1, '-y')
+            
+            # Log command
+            log(f"Executing 7z command (direct contents): {' '.join(cmd)}", log_type='DEBUG')
+            log(f"Working directory: {os.path.abspath(source_dir)}", log_type='DEBUG')
+            
+            result = self._run_7z(cmd, archive_path, cwd=os.path.abspath(source_dir))
+            
+            # Log results
+            log(f"7z return code: {result.returncode}", log_type='DEBUG')
+            if result.stdout:
+                log(f"7z stdout: {result.stdout}", log_type='DEBUG')
+            if result.stderr:
+                log(f"7z stderr: {result.stderr}", log_type='DEBUG')
+            
+            if result.timed_out:
+                return False, f"7z compression stalled ({result.stall_description})"
+            
+            if result.returncode == 0:
+                archive_size = os.path.getsize(archive_path) if os.path.exists(archive_path) else 0
+                return True, f"Directory contents compressed successfully: {archive_path} ({archive_size:,} bytes)"
+            else:
+                error_msg = result.stderr.strip() if result.stderr else "Unknown 7z error"
+                return False, f"7z compression failed: {error_msg}"
                 
         except Exception as e:
-            try:
-                os.chdir(original_cwd)
-            except:
-                pass
             return False, f"Directory contents compression failed: {e}"
             
     def _compress_directory_direct(self, source_dir: str, archive_path: str) -> Tuple[bool, str]:
@@ -444,7 +516,7 @@ class CompressionService:
             log(f"Source path: {source_path}", log_type='DEBUG')
             log(f"Archive path: {archive_path}", log_type='DEBUG')
             
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=3600)
+            result = self._run_7z(cmd, archive_path)
             
             # Log detailed results
             log(f"7z return code: {result.returncode}", log_type='DEBUG')
@@ -453,6 +525,9 @@ class CompressionService:
             if result.stderr:
                 log(f"7z stderr: {result.stderr}", log_type='DEBUG')
             
+            if result.timed_out:
+                return False, f"7z compression stalled ({result.stall_description})"
+            
             if result.returncode == 0:
                 archive_size = os.path.getsize(archive_path) if os.path.exists(archive_path) else 0
                 return True, f"Directory compressed successfully: {archive_path} ({archive_size:,} bytes)"
@@ -466,15 +541,13 @@ class CompressionService:
                     log(f"Output: {stdout_msg}", log_type='ERROR')
                 return False, f"7z compression failed: {error_msg}"
                 
-        except subprocess.TimeoutExpired:
-            return False, "7z compression timed out (>60 minutes)"
         except Exception as e:
             return False, f"7z compression error: {e}"
             
     def compress_files(self, files: List[str], archive_path: str, base_dir: Optional[str] = None) -> Tuple[bool, str]:
         """
         Compress list of files to 7z archive.
-        SIMPLE: Copy files to temp directory, then compress directory.
+        Files are placed in a folder named after the archive, without copying them first.
         
         Args:
             files: List of file paths to compress
@@ -494,78 +567,253 @@ class CompressionService:
         if not archive_path.lower().endswith('.7z'):
             archive_path = str(Path(archive_path).with_suffix('.7z'))
             
-        # Use temp directory approach - ALWAYS works
-        # Use shorter prefix on Windows to avoid path length issues
-        prefix = "7z_" if os.name == 'nt' else "7z_unified_"
-        with tempfile.TemporaryDirectory(prefix=prefix) as temp_dir:
-            try:
-                files_copied = self._copy_files_to_temp(files, temp_dir, base_dir)
-                
-                if files_copied == 0:
-                    return False, "No files could be copied for compression"
-                    
-                log(f"Copied {files_copied} files to temp directory, compressing...", log_type='INFO')
-                
-                # Create a proper folder structure inside the archive
-                # Extract the mod name from the archive path to use as the folder name
-                archive_name = Path(archive_path).stem  # Get name without .7z extension
-                
-                # Create a subdirectory with the proper mod name
-                mod_folder = os.path.join(temp_dir, archive_name)
-                os.makedirs(mod_folder, exist_ok=True)
-                
-                # Move all files from temp_dir to mod_folder
-                for item in os.listdir(temp_dir):
-                    if item != archive_name:  # Don't move the folder we just created
-                        src = os.path.join(temp_dir, item)
-                        dst = os.path.join(mod_folder, item)
-                        if os.path.isdir(src):
-                            shutil.move(src, dst)
-                        else:
-                            shutil.move(src, dst)
-                
-                # Now compress the mod_folder (which contains the proper mod name folder)
-                return self._compress_directory_direct(mod_folder, archive_path)
-                
-            except Exception as e:
-                return False, f"File preparation failed: {e}"
-                
-    def _copy_files_to_temp(self, files: List[str], temp_dir: str, base_dir: Optional[str] = None) -> int:
-        """Copy files to temporary directory for compression."""
-        files_copied = 0
+        # Create a proper folder structure inside the archive named after the mod
+        archive_name = Path(archive_path).stem
+        entries = []
+        used_names = set()
         
         for file_path in files:
             if not os.path.exists(file_path):
                 log(f"File not found: {file_path}", log_type='WARNING')
                 continue
                 
-            try:
-                if base_dir and os.path.commonpath([os.path.abspath(file_path), os.path.abspath(base_dir)]) == os.path.abspath(base_dir):
-                    # Maintain relative structure if file is under base_dir
-                    rel_path = os.path.relpath(file_path, base_dir)
-                    dest_path = os.path.join(temp_dir, rel_path)
-                else:
-                    # For loose files, use filename only
-                    filename = os.path.basename(file_path)
-                    dest_path = os.path.join(temp_dir, filename)
-                    
-                    # Handle filename conflicts
-                    counter = 1
-                    while os.path.exists(dest_path):
-                        name, ext = os.path.splitext(filename)
-                        dest_path = os.path.join(temp_dir, f"{name}_{counter}{ext}")
-                        counter += 1
-                
-                # Create destination directory and copy file
-                os.makedirs(os.path.dirname(dest_path), exist_ok=True)
-                shutil.copy2(file_path, dest_path)
-                files_copied += 1
+            if base_dir and os.path.commonpath([os.path.abspath(file_path), os.path.abspath(base_dir)]) == os.path.abspath(base_dir):
+                # Maintain relative structure if file is under base_dir
+                rel_path = os.path.relpath(file_path, base_dir)
+            else:
+                # For loose files, use filename only
+                filename = os.path.basename(file_path)
+                rel_path = filename
                 
-            except Exception as e:
-                log(f"Failed to copy {file_path}: {e}", log_type='WARNING')
+                # Handle filename conflicts
+                counter = 1
+                while rel_path.lower() in used_names:
+                    name, ext = os.path.splitext(filename)
+                    rel_path = f"{name}_{counter}{ext}"
+                    counter += 1
+                    
+            used_names.add(rel_path.lower())
+            entries.append((file_path, f"{archive_name}/{rel_path}"))
+            
+        if not entries:
+            return False, "No files could be found for compression"
+            
+        log(f"Packaging {len(entries)} files, compressing...", log_type='INFO')
+        return self.compress_entries(entries, archive_path)
+        
+    def compress_entries(self, entries: List[Tuple[str, str]], archive_path: str,
+                         staging_root: Optional[str] = None,
+                         cancel_event: Optional[threading.Event] = None) -> Tuple[bool, str]:
+        """
+        Compress files and folders under explicit in-archive names, without copying them.
+        
+        Sources are handed to 7z through an @listfile. 7z stores an absolute path
+        under its last component, so an entry whose archive name is the source's
+        own name is read in place. Only renamed or nested entries are staged, as
+        hardlinks (falling back to a copy where the filesystem cannot link).
+        Later entries replace earlier ones with the same archive name.
+        
+        Entries are split into the compression profile's groups and each group
+        is added with its own 7z switches. 7z cannot append to a solid archive
+        in place, so every group after the first is a separate pass that
+        rewrites the archive built so far; packages whose entries all fall
+        into one group (and single-group profiles) take a single pass. The
+        archive is built under a temporary name and only replaces archive_path
+        once every group has succeeded, so a failed or cancelled run never
+        leaves a half-written package or appends to an old one.
+        
+        Args:
+            entries: List of (source_path, archive_name) tuples; sources may be files or folders
+            archive_path: Output archive path
+            staging_root: Directory for link staging (defaults to the archive's directory)
+            cancel_event: Event that aborts compression when set
+            
+        Returns:
+            Tuple of (success: bool, message: str)
+        """
+        if not self.is_available():
+            return False, "7z command not available"
+            
+        # Ensure .7z extension
+        if not archive_path.lower().endswith('.7z'):
+            archive_path = str(Path(archive_path).with_suffix('.7z'))
+            
+        direct, staged = self._plan_entries(entries)
+        if not direct and not staged:
+            return False, "No files provided for compression"
+            
+        normalized = [(source, os.path.basename(source)) for source in direct] + staged
+        groups = self.profile.split_entries(normalized)
+        log(f"Compression profile '{self.profile.name}': {', '.join(f'{g.name} ({len(e)})' for g, e in groups)}", log_type='DEBUG')
+        
+        # Built next to the target so the final rename stays on one filesystem
+        partial_path = f"{archive_path[:-3]}.partial.7z"
+        work_dir = tempfile.mkdtemp(prefix="7z_", dir=staging_root or os.path.dirname(os.path.abspath(archive_path)))
+        try:
+            if os.path.exists(partial_path):
+                os.remove(partial_path)  # Left over from an interrupted run
+            for index, (group, group_entries) in enumerate(groups):
+                if cancel_event is not None and cancel_event.is_set():
+                    return False, "Cancelled"
+                success, message = self._compress_listed(
+                    group_entries, partial_path, os.path.join(work_dir, str(index)),
+                    self.profile.switches_for(group, self.compression_level), cancel_event
+                )
+                if not success:
+                    return False, message
+                    
+            os.replace(partial_path, archive_path)
+            archive_size = os.path.getsize(archive_path)
+            return True, f"Package compressed successfully: {archive_path} ({archive_size:,} bytes)"
+            
+        except Exception as e:
+            return False, f"7z compression error: {e}"
+        finally:
+            # Removing the staged links never touches the sources
+            shutil.rmtree(work_dir, ignore_errors=True)
+            if os.path.exists(partial_path):
+                try:
+                    os.remove(partial_path)
+                except OSError:
+                    pass
+            
+    def _compress_listed(self, entries: List[Tuple[str, str]], archive_path: str, work_dir: str,
+                         switches: List[str], cancel_event: Optional[threading.Event] = None) -> Tuple[bool, str]:
+        """
+        Add entries to an archive with one 7z run over a list file.
+        
+        Args:
+            entries: List of (source_path, archive_name) tuples
+            archive_path: Output archive path
+            work_dir: Directory for the list file and staged links
+            switches: Compression switches for this run
+            cancel_event: Event that kills 7z when set
+            
+        Returns:
+            Tuple of (success: bool, message: str)
+        """
+        direct, staged = self._plan_entries(entries)
+        os.makedirs(work_dir, exist_ok=True)
+        
+        list_entries = list(direct)
+        if staged:
+            stage_dir = os.path.join(work_dir, "stage")
+            copied_bytes = 0
+            for source, name in staged:
+                copied_bytes += self._link_into(source, os.path.join(stage_dir, *name.split('/')))
+            for top in sorted({name.split('/')[0] for _, name in staged}, key=str.lower):
+                list_entries.append(os.path.join(stage_dir, top))
+            if copied_bytes:
+                log(f"Hardlinks unavailable for some entries, copied {copied_bytes / (1024*1024):.1f} MB for staging", log_type='DEBUG')
                 
-        return files_copied
+        log(f"Packaging {len(direct)} entries in place, {len(staged)} via link staging", log_type='DEBUG')
+        
+        list_file = os.path.join(work_dir, "files.lst")
+        with open(list_file, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(list_entries) + '\n')
+            
+        cmd = [
+            self.sevenz_cmd, 'a',
+            os.path.abspath(archive_path),
+            *switches,
+            '-scsUTF-8',  # List file encoding
+            '-spd',  # Names in the list are literal paths, not wildcards
+            f'@{list_file}'
+        ]
+        
+        if self._test_mmt_parameter():
+            cmd.insert(-1, '-mmt=on')
+        if self._is_nanazip():
+            cmd.insert(-1, '-y')
+            
+        log(f"Executing 7z command (list file): {' '.join(cmd)}", log_type='DEBUG')
+        result = self._run_7z(cmd, archive_path, cancel_event=cancel_event)
+        
+        if result.cancelled:
+            return False, "Cancelled"
+        
+        log(f"7z return code: {result.returncode}", log_type='DEBUG')
+        if result.stdout:
+            log(f"7z stdout: {result.stdout}", log_type='DEBUG')
+        if result.stderr:
+            log(f"7z stderr: {result.stderr}", log_type='DEBUG')
+            
+        if result.timed_out:
+            return False, f"7z compression stalled ({result.stall_description})"
+            
+        if result.returncode != 0:
+            error_msg = result.stderr.strip() if result.stderr else "Unknown 7z error"
+            log(f"7z command failed with return code {result.returncode}", log_type='ERROR')
+            log(f"Error: {error_msg}", log_type='ERROR')
+            return False, f"7z compression failed: {error_msg}"
+            
+        return True, f"Added {len(entries)} entries to {os.path.basename(archive_path)}"
+        
+    def _plan_entries(self, entries: List[Tuple[str, str]]) -> Tuple[List[str], List[Tuple[str, str]]]:
+        """
+        Split package entries into sources 7z can read in place and ones that need staging.
+        
+        Args:
+            entries: List of (source_path, archive_name) tuples
+            
+        Returns:
+            Tuple of (direct source paths, staged (source_path, archive_name) tuples)
+        """
+        # Normalise archive names; later entries win like copying into one folder would
+        mapped = {}
+        for source, name in entries:
+            name = name.replace('\\', '/').strip('/')
+            if not name or not os.path.exists(source):
+                log(f"Skipping missing package entry: {source}", log_type='WARNING')
+                continue
+            mapped[name.lower()] = (os.path.abspath(source), name)
+            
+        def needs_staging(source, name):
+            return '/' in name or os.path.basename(source) != name
+            
+        # Entries sharing a top-level folder with staged entries must be merged there too
+        staged_tops = {name.split('/')[0].lower() for source, name in mapped.values() if needs_staging(source, name)}
+        direct = []
+        staged = []
+        for source, name in mapped.values():
+            if needs_staging(source, name) or name.lower() in staged_tops:
+                staged.append((source, name))
+            else:
+                direct.append(source)
+        return direct, staged
+        
+    def _link_into(self, source: str, target: str) -> int:
+        """
+        Stage a file or folder at target using hardlinks.
+        
+        Args:
+            source: File or folder to stage
+            target: Staged path
+            
+        Returns:
+            Number of bytes that had to be copied because linking failed
+        """
+        if not os.path.isdir(source):
+            return self._link_file(source, target)
+            
+        copied_bytes = 0
+        for root, dirs, files in os.walk(source):
+            dest_root = os.path.normpath(os.path.join(target, os.path.relpath(root, source)))
+            os.makedirs(dest_root, exist_ok=True)
+            for file in files:
+                copied_bytes += self._link_file(os.path.join(root, file), os.path.join(dest_root, file))
+        return copied_bytes
         
+    def _link_file(self, source: str, target: str) -> int:
+        """Hardlink or reflink a single file, copying it if the filesystem can't link."""
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        if os.path.lexists(target):
+            os.remove(target)
+        # No symlinks: 7z would archive the link instead of the file
+        if link_or_copy(source, target, ('hardlink', 'reflink', 'copy')) == 'copy':
+            return os.path.getsize(target)
+        return 0
+            
     def extract_archive(self, archive_path: str, extract_dir: str) -> Tuple[bool, str]:
         """
         Extract 7z archive to directory.
@@ -595,7 +843,10 @@ class CompressionService:
             
             log(f"7z extract: {' '.join(cmd)}", log_type='DEBUG')
             
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+            result = self._run_7z(cmd, archive_path)
+            
+            if result.timed_out:
+                return False, f"7z extraction stalled ({result.stall_description})"
             
             if result.returncode == 0:
                 return True, f"Archive extracted successfully to: {extract_dir}"
@@ -603,8 +854,6 @@ class CompressionService:
                 error_msg = result.stderr.strip() if result.stderr else "Unknown 7z error"
                 return False, f"7z extraction failed: {error_msg}"
                 
-        except subprocess.TimeoutExpired:
-            return False, "7z extraction timed out (>5 minutes)"
         except Exception as e:
             return False, f"7z extraction error: {e}"
             
@@ -655,11 +904,13 @@ class CompressionService:
 _compression_service = None
 
 
-def get_compression_service(compression_level: int = 3) -> CompressionService:
+def get_compression_service(compression_level: int = 3, compression_profile: Optional[str] = None) -> CompressionService:
     """Get global compression service instance."""
     global _compression_service
-    if _compression_service is None or _compression_service.compression_level != compression_level:
-        _compression_service = CompressionService(compression_level)
+    profile_name = compression_profile or DEFAULT_PROFILE
+    if (_compression_service is None or _compression_service.compression_level != compression_level
+            or _compression_service.profile.name != profile_name):
+        _compression_service = CompressionService(compression_level, profile_name)
     return _compression_service
 
 
@@ -687,6 +938,46 @@ def is_7z_available() -> bool:
     return service.is_available()
 
 
+def benchmark_compression_profiles(sample_dir: str, compression_level: int = 3,
+                                   profiles: Optional[List[str]] = None) -> List[dict]:
+    """
+    Package a sample corpus with each compression profile and measure time and size.
+    
+    Args:
+        sample_dir: Directory whose contents are packaged (e.g. an unpacked mod)
+        compression_level: 7z compression level (0-9)
+        profiles: Profile names to compare (defaults to all)
+        
+    Returns:
+        List of dicts with profile, success, seconds, size and input_size
+    """
+    import time
+    from .compression_profiles import COMPRESSION_PROFILES
+    
+    entries = [(os.path.join(sample_dir, item), item) for item in os.listdir(sample_dir)]
+    input_size = sum(os.path.getsize(os.path.join(root, f))
+                     for root, dirs, files in os.walk(sample_dir) for f in files)
+    
+    results = []
+    with tempfile.TemporaryDirectory(prefix="7z_bench_") as bench_dir:
+        for name in profiles or list(COMPRESSION_PROFILES):
+            service = CompressionService(compression_level, name)
+            archive_path = os.path.join(bench_dir, f"{name}.7z")
+            start_time = time.time()
+            success, message = service.compress_entries(entries, archive_path, staging_root=bench_dir)
+            results.append({
+                'profile': name,
+                'success': success,
+                'message': message,
+                'seconds': time.time() - start_time,
+                'size': os.path.getsize(archive_path) if success and os.path.exists(archive_path) else 0,
+                'input_size': input_size
+            })
+            if os.path.exists(archive_path):
+                os.remove(archive_path)
+    return results
+
+
 class Compressor:
     """
     Compressor class - maintains backward compatibility with existing code.
@@ -695,15 +986,16 @@ class Compressor:
     that existing code expects from the Compressor class.
     """
     
-    def __init__(self, compression_level: int = 3):
+    def __init__(self, compression_level: int = 3, compression_profile: Optional[str] = None):
         """
         Initialize compressor.
         
         Args:
             compression_level: 7z compression level (0-9)
+            compression_profile: Content-aware compression profile name (optional)
         """
         self.compression_level = compression_level
-        self.service = get_compression_service(compression_level)
+        self.service = get_compression_service(compression_level, compression_profile)
         
     def compress_files(self, files: List[str], archive_path: str, base_dir: Optional[str] = None) -> Tuple[bool, str]:
         """
@@ -719,6 +1011,23 @@ class Compressor:
         """
         return self.service.compress_files(files, archive_path, base_dir)
         
+    def compress_entries(self, entries: List[Tuple[str, str]], archive_path: str,
+                         staging_root: Optional[str] = None,
+                         cancel_event: Optional[threading.Event] = None) -> Tuple[bool, str]:
+        """
+        Compress files and folders under explicit in-archive names.
+        
+        Args:
+            entries: List of (source_path, archive_name) tuples
+            archive_path: Output path for 7z archive
+            staging_root: Directory for link staging (optional)
+            cancel_event: Event that aborts compression when set (optional)
+            
+        Returns:
+            Tuple of (success: bool, message: str)
+        """
+        return self.service.compress_entries(entries, archive_path, staging_root, cancel_event)
+        
     def compress_bulk_directory(self, source_dir: str, archive_path: str) -> Tuple[bool, str]:
         """
         Compress entire directory using 7z CLI.
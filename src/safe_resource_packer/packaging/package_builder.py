@@ -9,14 +9,17 @@ import os
 import json
 import shutil
 import tempfile
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
 from ..dynamic_progress import log
+from ..staging import StagingTree
 from .archive_creator import ArchiveCreator
 from .esp_manager import ESPManager
-from .compression_service import Compressor
+from .compression_service import Compressor, get_7z_thread_budget
+from ..archive_jobs import ArchiveJob, ArchiveJobExecutor
 
 
 class PackageBuilder:
@@ -25,7 +28,10 @@ class PackageBuilder:
     def __init__(self,
                  game_type: str = "skyrim",
                  compression_level: int = 3,
-                 template_dir: Optional[str] = None):
+                 template_dir: Optional[str] = None,
+                 compression_profile: Optional[str] = None,
+                 max_parallel_components: Optional[int] = None,
+                 max_parallel_archives: Optional[int] = None):
         """
         Initialize package builder.
 
@@ -33,14 +39,19 @@ class PackageBuilder:
             game_type: Target game ("skyrim" or "fallout4")
             compression_level: 7z compression level (0-9)
             template_dir: Directory containing ESP templates
+            compression_profile: Content-aware 7z profile for the packages (defaults to 'uniform')
+            max_parallel_components: Maximum pack/loose/blacklisted archives built at once (defaults to all)
+            max_parallel_archives: Maximum BSArch processes running at once (defaults to the process-wide limit)
         """
         self.game_type = game_type.lower()
         self.compression_level = compression_level
+        self.compression_profile = compression_profile
+        self.max_parallel_components = max_parallel_components
 
         # Initialize components
-        self.archive_creator = ArchiveCreator(game_type)
+        self.archive_creator = ArchiveCreator(game_type, max_parallel_archives=max_parallel_archives)
         self.esp_manager = ESPManager(template_dir)
-        self.compressor = Compressor(compression_level)
+        self.compressor = Compressor(compression_level, compression_profile)
 
         # Package metadata
         self.package_info = {}
@@ -148,21 +159,29 @@ class PackageBuilder:
             "components": {}
         }
 
+        # Pack, loose and blacklisted archives have independent inputs and outputs,
+        # so they are built concurrently; one failing cancels and removes the others
+        jobs = []
+
         # 1. Create BSA/BA2 + ESP package (packed side)
         if 'pack' in classification_results and classification_results['pack']:
-            packed_success = self._create_packed_archive(
-                classification_results['pack'], mod_name, output_dir, package_info, esp_name, archive_name
-            )
-            if not packed_success:
-                return False, {}
+            jobs.append(ArchiveJob(
+                "packed archive", os.path.join(output_dir, f"{mod_name}_pack.7z"),
+                self._component_build(lambda cancel_event: self._create_packed_archive(
+                    classification_results['pack'], mod_name, output_dir, package_info, esp_name, archive_name,
+                    cancel_event=cancel_event
+                ), package_info, "pack")
+            ))
 
         # 2. Create loose files 7z (loose side)
         if 'loose' in classification_results and classification_results['loose']:
-            loose_success = self._create_loose_archive(
-                classification_results['loose'], mod_name, output_dir, package_info, options
-            )
-            if not loose_success:
-                return False, {}
+            jobs.append(ArchiveJob(
+                "loose archive", os.path.join(output_dir, f"{mod_name}_loose.7z"),
+                self._component_build(lambda cancel_event: self._create_loose_archive(
+                    classification_results['loose'], mod_name, output_dir, package_info, options,
+                    cancel_event=cancel_event
+                ), package_info, "loose")
+            ))
 
         # 3. Handle blacklisted files - include them in loose archive or create separate archive if no loose files
         if 'blacklisted' in classification_results and classification_results['blacklisted']:
@@ -172,11 +191,20 @@ class PackageBuilder:
             else:
                 # No loose files - create separate archive for blacklisted files
                 log(f"🚫 {len(classification_results['blacklisted'])} blacklisted files - creating separate archive", log_type='INFO')
-                blacklisted_success = self._create_blacklisted_archive(
-                    mod_name, output_dir, package_info, options
-                )
-                if not blacklisted_success:
-                    return False, {}
+                jobs.append(ArchiveJob(
+                    "blacklisted archive", os.path.join(output_dir, f"{mod_name}_Loose_Files.7z"),
+                    self._component_build(lambda cancel_event: self._create_blacklisted_archive(
+                        mod_name, output_dir, package_info, options, cancel_event=cancel_event
+                    ), package_info, "blacklisted")
+                ))
+
+        # Concurrent components share the 7z thread budget instead of each claiming every core
+        executor = ArchiveJobExecutor(max_parallel=self.max_parallel_components or len(jobs))
+        with get_7z_thread_budget().expect_concurrent(min(executor.max_parallel, len(jobs))):
+            components_success, components_message, _ = executor.run(jobs)
+        if not components_success:
+            log(f"Package components failed: {components_message}", log_type='ERROR')
+            return False, {}
 
         # 4. Final package creation removed - users get separate 7z archives
         has_pack = package_info.get("components", {}).get("pack")
@@ -202,43 +230,57 @@ class PackageBuilder:
 
         return True, package_info
 
+    def _component_build(self, create, package_info: Dict[str, Any], component: str):
+        """
+        Adapt a component creation method to the ArchiveJob build interface.
+
+        Args:
+            create: Callable taking the cancel event and returning success
+            package_info: Package info the component records its output in
+            component: Component key in package_info["components"]
+
+        Returns:
+            Build callable returning (success, message, created_archives)
+        """
+        def build(cancel_event):
+            if not create(cancel_event):
+                return False, f"{component} component failed", []
+            created = package_info["components"].get(component, {}).get("path")
+            return True, f"{component} component created", [created] if created else []
+
+        return build
+
     def _create_blacklisted_archive(self, mod_name: str,
-                                   output_dir: str, package_info: Dict[str, Any], options: Dict[str, Any] = None) -> bool:
+                                   output_dir: str, package_info: Dict[str, Any], options: Dict[str, Any] = None,
+                                   cancel_event: Optional[threading.Event] = None) -> bool:
         """Create 7z archive for blacklisted files when no loose files exist."""
         self._log_build_step("Creating blacklisted files 7z archive")
 
         blacklisted_7z_path = os.path.join(output_dir, f"{mod_name}_Loose_Files.7z")
 
-        # Create temporary directory for blacklisted files
-        import tempfile
-        with tempfile.TemporaryDirectory(prefix=f"blacklisted_archive_{mod_name}_") as temp_dir:
-            blacklisted_items_count = 0
-
-            # Copy blacklisted files from temp directory
-            temp_blacklisted_dir = options.get('temp_blacklisted_dir')
-            if temp_blacklisted_dir and os.path.exists(temp_blacklisted_dir):
-                log(f"🚫 Copying blacklisted files from temp directory: {temp_blacklisted_dir}", log_type='INFO')
-                for root, dirs, files in os.walk(temp_blacklisted_dir):
-                    for file in files:
-                        src_path = os.path.join(root, file)
-                        rel_path = os.path.relpath(src_path, temp_blacklisted_dir)
-                        dest_path = os.path.join(temp_dir, rel_path)
-                        os.makedirs(os.path.dirname(dest_path), exist_ok=True)
-                        shutil.copy2(src_path, dest_path)
-                        blacklisted_items_count += 1
-                        log(f"📄 Added blacklisted file: {rel_path}", log_type='SPAM')
-
-                if blacklisted_items_count == 0:
-                    log(f"⚠️ No blacklisted items found in temp directory: {temp_blacklisted_dir}", log_type='WARNING')
-                    return False
-            else:
-                log(f"❌ Temp blacklisted directory not found: {temp_blacklisted_dir}", log_type='ERROR')
+        blacklisted_items_count = 0
+
+        # Package blacklisted files in place from the temp directory
+        temp_blacklisted_dir = options.get('temp_blacklisted_dir')
+        if temp_blacklisted_dir and os.path.exists(temp_blacklisted_dir):
+            log(f"🚫 Packaging blacklisted files from temp directory: {temp_blacklisted_dir}", log_type='INFO')
+            for root, dirs, files in os.walk(temp_blacklisted_dir):
+                for file in files:
+                    blacklisted_items_count += 1
+                    log("📄 Added blacklisted file: %s", os.path.relpath(os.path.join(root, file), temp_blacklisted_dir), log_type='SPAM')
+
+            if blacklisted_items_count == 0:
+                log(f"⚠️ No blacklisted items found in temp directory: {temp_blacklisted_dir}", log_type='WARNING')
                 return False
+        else:
+            log(f"❌ Temp blacklisted directory not found: {temp_blacklisted_dir}", log_type='ERROR')
+            return False
 
-            # Compress the blacklisted directory
-            compression_success, compression_message = self.compressor.compress_directory_with_folder_name(
-                temp_dir, blacklisted_7z_path, f"{mod_name}_Loose_Files"
-            )
+        # Compress the blacklisted items at the root of the archive
+        entries = [(os.path.join(temp_blacklisted_dir, item), item) for item in os.listdir(temp_blacklisted_dir)]
+        compression_success, compression_message = self.compressor.compress_entries(
+            entries, blacklisted_7z_path, cancel_event=cancel_event
+        )
 
         if compression_success:
             package_info["components"]["blacklisted"] = {
@@ -252,81 +294,10 @@ class PackageBuilder:
             log(f"Blacklisted archive compression failed: {compression_message}", log_type='ERROR')
             return False
 
-    def _copy_loose_files_from_extracted(self, loose_extract_dir: str, temp_dir: str, mod_name: str):
-        """Copy loose files from extracted loose archive."""
-        log(f"🔍 Looking for loose folder in: {loose_extract_dir}", log_type='DEBUG')
-
-        # Look for the mod's loose folder in the extracted directory
-        mod_loose_dir = os.path.join(loose_extract_dir, f"{mod_name}_Loose")
-        if not os.path.exists(mod_loose_dir):
-            log(f"⚠️ Expected loose folder not found: {mod_loose_dir}", log_type='WARNING')
-            # Try alternative paths
-            for item in os.listdir(loose_extract_dir):
-                item_path = os.path.join(loose_extract_dir, item)
-                if os.path.isdir(item_path) and mod_name.lower() in item.lower():
-                    mod_loose_dir = item_path
-                    log(f"🔍 Found alternative loose folder: {mod_loose_dir}", log_type='DEBUG')
-                    break
-
-        if os.path.exists(mod_loose_dir):
-            log(f"📁 Processing loose folder: {mod_loose_dir}", log_type='DEBUG')
-            # List all items in the loose folder
-            loose_items = os.listdir(mod_loose_dir)
-            log(f"📋 Loose folder contents: {loose_items}", log_type='DEBUG')
-
-            # Copy all loose files and folders
-            loose_copied = []
-            for item in loose_items:
-                item_path = os.path.join(mod_loose_dir, item)
-                if os.path.isdir(item_path):
-                    dest_path = os.path.join(temp_dir, item)
-                    shutil.copytree(item_path, dest_path, dirs_exist_ok=True)
-                    loose_copied.append(item)
-                    log(f"📁 Copied loose folder: {item}", log_type='INFO')
-                elif os.path.isfile(item_path):
-                    dest_path = os.path.join(temp_dir, item)
-                    shutil.copy2(item_path, dest_path)
-                    loose_copied.append(item)
-                    log(f"📄 Copied loose file: {item}", log_type='INFO')
-
-            if loose_copied:
-                log(f"✅ Copied {len(loose_copied)} loose items: {loose_copied}", log_type='INFO')
-            else:
-                log(f"⚠️ No loose items found in loose directory", log_type='WARNING')
-        else:
-            log(f"❌ Loose folder not found: {mod_loose_dir}", log_type='ERROR')
-
-    def _copy_blacklisted_folders_from_directory(self, blacklisted_dir: str, temp_dir: str):
-        """Copy blacklisted folders from blacklisted directory."""
-        log(f"🔍 Looking for blacklisted folders in: {blacklisted_dir}", log_type='DEBUG')
-
-        if not os.path.exists(blacklisted_dir):
-            log(f"❌ Blacklisted directory not found: {blacklisted_dir}", log_type='ERROR')
-            return
-
-        # Copy all contents from blacklisted directory to temp directory
-        blacklisted_copied = []
-        for item in os.listdir(blacklisted_dir):
-            item_path = os.path.join(blacklisted_dir, item)
-            if os.path.isdir(item_path):
-                dest_path = os.path.join(temp_dir, item)
-                shutil.copytree(item_path, dest_path, dirs_exist_ok=True)
-                blacklisted_copied.append(item)
-                log(f"📦 Copied blacklisted folder: {item}", log_type='INFO')
-            elif os.path.isfile(item_path):
-                dest_path = os.path.join(temp_dir, item)
-                shutil.copy2(item_path, dest_path)
-                blacklisted_copied.append(item)
-                log(f"📄 Copied blacklisted file: {item}", log_type='INFO')
-
-        if blacklisted_copied:
-            log(f"✅ Copied {len(blacklisted_copied)} blacklisted items: {blacklisted_copied}", log_type='INFO')
-        else:
-            log(f"⚠️ No blacklisted items found in blacklisted directory", log_type='WARNING')
-
     def _create_packed_archive(self, pack_files: List[str], mod_name: str,
                               output_dir: str, package_info: Dict[str, Any],
-                              esp_name: str = None, archive_name: str = None) -> bool:
+                              esp_name: str = None, archive_name: str = None,
+                              cancel_event: Optional[threading.Event] = None) -> bool:
         """Create game-specific BSA/BA2 + ESP archives following proper naming conventions."""
         # Set defaults
         esp_name = esp_name or mod_name
@@ -346,13 +317,17 @@ class PackageBuilder:
 
             # Use game-specific archive creation
             bsa_creation_success, bsa_creation_message, created_archives = self.archive_creator.create_game_specific_archives(
-                pack_files, archive_name, output_dir, temp_dir
+                pack_files, archive_name, output_dir, temp_dir, cancel_event=cancel_event
             )
 
             if not bsa_creation_success:
                 log(f"Game-specific BSA/BA2 creation failed: {bsa_creation_message}", log_type='ERROR')
                 return False
 
+            if cancel_event is not None and cancel_event.is_set():
+                self._cleanup_packaged_files(created_archives, [])
+                return False
+
             if not created_archives:
                 log(f"No archive files found for {archive_name}", log_type='ERROR')
                 return False
@@ -390,16 +365,23 @@ class PackageBuilder:
 
             # 3. Create final 7z package containing all BSA/BA2 files and ESP plugins
             final_7z_success = self._create_final_7z_package(
-                created_archives, esp_file_path, mod_name, output_dir
+                created_archives, esp_file_path, mod_name, output_dir, cancel_event=cancel_event
             )
 
             if not final_7z_success:
                 log(f"Final 7z package creation failed", log_type='ERROR')
+                self._cleanup_packaged_files(created_archives, esp_file_path)
                 return False
 
             # 4. Clean up individual BSA/ESP files after successful 7z packaging
             self._cleanup_packaged_files(created_archives, esp_file_path)
 
+            package_info["components"]["pack"] = {
+                "path": os.path.join(output_dir, f"{mod_name}_pack.7z"),
+                "file_count": len(pack_files),
+                "contains": f"{len(created_archives)} BSA/BA2 archive(s) and plugin(s)"
+            }
+
             return True
 
         except Exception as e:
@@ -450,28 +432,14 @@ class PackageBuilder:
     def _create_temp_staging_directory(self, pack_files: List[str]) -> Optional[str]:
         """Create temporary directory and stage files for archiving."""
         try:
-            temp_dir = tempfile.mkdtemp(prefix="safe_resource_packer_")
-            log(f"📁 Created temp staging directory: {temp_dir}", log_type='DEBUG')
-
-            # Copy files to temp directory maintaining Data structure
-            staged_count = 0
-            for file_path in pack_files:
-                if os.path.exists(file_path):
-                    # Extract Data-relative path
-                    data_rel_path = self._extract_data_relative_path(file_path)
-                    if data_rel_path:
-                        staged_path = os.path.join(temp_dir, data_rel_path)
-                        staged_dir = os.path.dirname(staged_path)
+            staging = StagingTree(prefix="safe_resource_packer_", near=pack_files[0] if pack_files else None)
+            log(f"📁 Created temp staging directory: {staging.root}", log_type='DEBUG')
 
-                        # Create directory structure
-                        os.makedirs(staged_dir, exist_ok=True)
+            # Link files into the temp directory maintaining Data structure
+            staging.add_files(pack_files, self._extract_data_relative_path)
 
-                        # Copy file
-                        shutil.copy2(file_path, staged_path)
-                        staged_count += 1
-
-            log(f"📋 Staged {staged_count} files for archiving", log_type='DEBUG')
-            return temp_dir
+            log(f"📋 {staging.summary()}", log_type='DEBUG')
+            return staging.root
 
         except Exception as e:
             log(f"Failed to create temp staging directory: {e}", log_type='ERROR')
@@ -502,7 +470,8 @@ class PackageBuilder:
                                created_archives: List[str],
                                esp_file_path: str,
                                mod_name: str,
-                               output_dir: str) -> bool:
+                               output_dir: str,
+                               cancel_event: Optional[threading.Event] = None) -> bool:
         """Create final 7z package containing all BSA/BA2 files and ESP plugins."""
         try:
             # Collect all files to include in the final package
@@ -538,91 +507,76 @@ class PackageBuilder:
                 file_size = os.path.getsize(file_path) / (1024 * 1024)  # MB
                 log(f"  • {os.path.basename(file_path)} ({file_size:.1f} MB)", log_type='INFO')
 
-            # Create temporary directory for staging files
-            with tempfile.TemporaryDirectory(prefix="final_7z_") as temp_staging:
-                # Copy all files to temp staging directory
-                for file_path in files_to_package:
-                    filename = os.path.basename(file_path)
-                    dest_path = os.path.join(temp_staging, filename)
-                    shutil.copy2(file_path, dest_path)
-
-                # Compress the staging directory
-                success, message = self.compressor.compress_bulk_directory(temp_staging, final_package_path)
-
-                if success:
-                    final_size = os.path.getsize(final_package_path) / (1024 * 1024)  # MB
-                    log(f"✅ Final 7z package created: {final_package_name} ({final_size:.1f} MB)", log_type='SUCCESS')
-                    return True
-                else:
-                    log(f"❌ Final 7z package creation failed: {message}", log_type='ERROR')
-                    return False
+            # Package the files in place at the root of the 7z (no staging copies)
+            entries = [(file_path, os.path.basename(file_path)) for file_path in files_to_package]
+            success, message = self.compressor.compress_entries(entries, final_package_path, cancel_event=cancel_event)
+
+            if success:
+                final_size = os.path.getsize(final_package_path) / (1024 * 1024)  # MB
+                log(f"✅ Final 7z package created: {final_package_name} ({final_size:.1f} MB)", log_type='SUCCESS')
+                return True
+            else:
+                log(f"❌ Final 7z package creation failed: {message}", log_type='ERROR')
+                return False
 
         except Exception as e:
             log(f"Error creating final 7z package: {e}", log_type='ERROR')
             return False
 
     def _create_loose_archive(self, loose_files: List[str], mod_name: str,
-                             output_dir: str, package_info: Dict[str, Any], options: Dict[str, Any] = None) -> bool:
+                             output_dir: str, package_info: Dict[str, Any], options: Dict[str, Any] = None,
+                             cancel_event: Optional[threading.Event] = None) -> bool:
         """Create 7z archive for loose files (including blacklisted files)."""
         self._log_build_step("Creating loose files 7z archive")
 
         loose_7z_path = os.path.join(output_dir, f"{mod_name}_loose.7z")
 
-        # Create temporary directory to combine loose files and blacklisted files
-        import tempfile
-        with tempfile.TemporaryDirectory(prefix=f"loose_archive_{mod_name}_") as temp_dir:
-            loose_items_count = 0
-            blacklisted_items_count = 0
-
-            # 1. Copy loose files
-            if loose_files:
-                loose_source_folder = options.get('output_loose')
-                if not loose_source_folder:
-                    # Fallback: use common path of loose files
-                    loose_source_folder = os.path.commonpath(loose_files)
-                    log(f"⚠️ No output_loose in options, using common path: {loose_source_folder}", log_type='WARNING')
-                else:
-                    log(f"Using user-defined loose folder: {loose_source_folder}", log_type='DEBUG')
-
-                if os.path.exists(loose_source_folder):
-                    # Copy all contents from loose folder to temp directory
-                    for item in os.listdir(loose_source_folder):
-                        item_path = os.path.join(loose_source_folder, item)
-                        dest_path = os.path.join(temp_dir, item)
-                        if os.path.isdir(item_path):
-                            shutil.copytree(item_path, dest_path, dirs_exist_ok=True)
-                            loose_items_count += 1
-                        elif os.path.isfile(item_path):
-                            shutil.copy2(item_path, dest_path)
-                            loose_items_count += 1
-                    log(f"📁 Copied {loose_items_count} loose items to temp directory", log_type='DEBUG')
-
-            # 2. Copy blacklisted files (if any) - from temp directory
-            temp_blacklisted_dir = options.get('temp_blacklisted_dir')
-            if temp_blacklisted_dir and os.path.exists(temp_blacklisted_dir):
-                log(f"🚫 Adding blacklisted files from temp directory: {temp_blacklisted_dir}", log_type='DEBUG')
-                for root, dirs, files in os.walk(temp_blacklisted_dir):
-                    for file in files:
-                        src_path = os.path.join(root, file)
-                        rel_path = os.path.relpath(src_path, temp_blacklisted_dir)
-                        dest_path = os.path.join(temp_dir, rel_path)
-                        os.makedirs(os.path.dirname(dest_path), exist_ok=True)
-                        shutil.copy2(src_path, dest_path)
-                        blacklisted_items_count += 1
-                        log(f"📄 Added blacklisted file: {rel_path}", log_type='SPAM')
-
-                if blacklisted_items_count > 0:
-                    log(f"🚫 Added {blacklisted_items_count} blacklisted items to loose archive", log_type='INFO')
-
-            # 3. Compress the combined temp directory
-            if loose_items_count > 0 or blacklisted_items_count > 0:
-                loose_compression_success, loose_compression_message = self.compressor.compress_directory_with_folder_name(
-                    temp_dir,
-                    loose_7z_path,
-                    f"{mod_name}_Loose"
-                )
+        # Combine loose files and blacklisted files as package entries (read in place)
+        entries = []
+        loose_items_count = 0
+        blacklisted_items_count = 0
+
+        # 1. Loose files
+        if loose_files:
+            loose_source_folder = options.get('output_loose')
+            if not loose_source_folder:
+                # Fallback: use common path of loose files
+                loose_source_folder = os.path.commonpath(loose_files)
+                log(f"⚠️ No output_loose in options, using common path: {loose_source_folder}", log_type='WARNING')
             else:
-                loose_compression_success, loose_compression_message = False, "No loose or blacklisted files found"
+                log(f"Using user-defined loose folder: {loose_source_folder}", log_type='DEBUG')
+
+            if os.path.exists(loose_source_folder):
+                # Include all contents of the loose folder
+                for item in os.listdir(loose_source_folder):
+                    item_path = os.path.join(loose_source_folder, item)
+                    if os.path.isdir(item_path) or os.path.isfile(item_path):
+                        entries.append((item_path, item))
+                        loose_items_count += 1
+                log(f"📁 Added {loose_items_count} loose items", log_type='DEBUG')
+
+        # 2. Blacklisted files (if any) - from temp directory, merged over the loose files
+        temp_blacklisted_dir = options.get('temp_blacklisted_dir')
+        if temp_blacklisted_dir and os.path.exists(temp_blacklisted_dir):
+            log(f"🚫 Adding blacklisted files from temp directory: {temp_blacklisted_dir}", log_type='DEBUG')
+            for root, dirs, files in os.walk(temp_blacklisted_dir):
+                for file in files:
+                    src_path = os.path.join(root, file)
+                    rel_path = os.path.relpath(src_path, temp_blacklisted_dir)
+                    entries.append((src_path, rel_path))
+                    blacklisted_items_count += 1
+                    log("📄 Added blacklisted file: %s", rel_path, log_type='SPAM')
+
+            if blacklisted_items_count > 0:
+                log(f"🚫 Added {blacklisted_items_count} blacklisted items to loose archive", log_type='INFO')
+
+        # 3. Compress the combined entries
+        if loose_items_count > 0 or blacklisted_items_count > 0:
+            loose_compression_success, loose_compression_message = self.compressor.compress_entries(
+                entries, loose_7z_path, cancel_event=cancel_event
+            )
+        else:
+            loose_compression_success, loose_compression_message = False, "No loose or blacklisted files found"
 
         if loose_compression_success:
             total_items = loose_items_count + blacklisted_items_count
@@ -858,6 +812,7 @@ class PackageBuilder:
         return {
             "game_type": self.game_type,
             "compression_level": self.compression_level,
+            "compression_profile": self.compressor.service.profile.name,
             "build_log": self.build_log.copy(),
             "package_info": self.package_info.copy()
         }
@@ -0,0 +1,199 @@
+"""
+Stage Pipeline Scheduler
+
+Runs items through a fixed sequence of stages. Each stage has its own worker
+limit and a bounded hand-off queue in front of it, so stages with different
+resource profiles (disk-bound staging, CPU-bound archiving and compression)
+overlap across items instead of one worker holding an item through every
+stage. Every stage execution is recorded in a trace for utilization reports.
+"""
+
+import time
+import queue
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from .dynamic_progress import log
+
+
+_STOP = object()
+
+
+class PipelineStage:
+    """One step of the pipeline with its own concurrency limit."""
+
+    def __init__(self,
+                 name: str,
+                 handler: Callable[[Any], Tuple[bool, str]],
+                 workers: int = 1,
+                 queue_size: int = 1):
+        """
+        Initialize pipeline stage.
+
+        Args:
+            name: Stage name (used in the trace)
+            handler: Callable processing an item, returning (success, message)
+            workers: Maximum items processed by this stage at once
+            queue_size: Maximum items waiting in front of this stage
+        """
+        self.name = name
+        self.handler = handler
+        self.workers = max(1, workers)
+        self.queue_size = max(1, queue_size)
+
+
+class StageEvent:
+    """A single stage execution recorded in the scheduling trace."""
+
+    def __init__(self, item_name: str, stage: str, worker: int, start: float, end: float, success: bool):
+        self.item_name = item_name
+        self.stage = stage
+        self.worker = worker
+        self.start = start
+        self.end = end
+        self.success = success
+
+    @property
+    def duration(self) -> float:
+        """Seconds spent in the stage."""
+        return self.end - self.start
+
+
+class StagePipeline:
+    """Schedules items through stages connected by bounded queues."""
+
+    def __init__(self,
+                 stages: List[PipelineStage],
+                 item_name: Callable[[Any], str] = str,
+                 on_finished: Optional[Callable[[Any, bool, str], None]] = None):
+        """
+        Initialize pipeline.
+
+        Args:
+            stages: Stages in execution order
+            item_name: Maps an item to its name in the trace
+            on_finished: Called with (item, success, message) when an item leaves
+                         the pipeline (after the last stage or on its first failure)
+        """
+        self.stages = stages
+        self.item_name = item_name
+        self.on_finished = on_finished
+        self.trace: List[StageEvent] = []
+        self.started_at = 0.0
+        self.finished_at = 0.0
+        self._lock = threading.Lock()
+
+    def run(self, items: Iterable[Any]) -> List[Tuple[Any, bool, str]]:
+        """
+        Run items through all stages.
+
+        Items are pulled lazily, so a generator is only advanced when the first
+        stage has room for another item.
+
+        Args:
+            items: Items to process
+
+        Returns:
+            List of (item, success, message) in completion order
+        """
+        self.trace = []
+        self.started_at = time.time()
+        results: List[Tuple[Any, bool, str]] = []
+        queues = [queue.Queue(maxsize=stage.queue_size) for stage in self.stages]
+        remaining_workers = [stage.workers for stage in self.stages]
+        threads = []
+
+        def finish(item, success, message):
+            with self._lock:
+                results.append((item, success, message))
+            if self.on_finished:
+                try:
+                    self.on_finished(item, success, message)
+                except Exception as e:
+                    log(f"⚠️ Pipeline completion callback failed: {e}", log_type='WARNING')
+
+        def worker(index: int, worker_id: int):
+            stage = self.stages[index]
+            while True:
+                item = queues[index].get()
+                if item is _STOP:
+                    with self._lock:
+                        remaining_workers[index] -= 1
+                        last_out = remaining_workers[index] == 0
+                    if last_out and index + 1 < len(self.stages):
+                        for _ in range(self.stages[index + 1].workers):
+                            queues[index + 1].put(_STOP)
+                    return
+
+                start = time.time()
+                try:
+                    success, message = stage.handler(item)
+                except Exception as e:
+                    success, message = False, f"{stage.name} raised: {e}"
+                end = time.time()
+
+                with self._lock:
+                    self.trace.append(StageEvent(self.item_name(item), stage.name, worker_id, start, end, success))
+
+                if success and index + 1 < len(self.stages):
+                    # Blocks while the next stage is saturated (back-pressure)
+                    queues[index + 1].put(item)
+                else:
+                    finish(item, success, message)
+
+        for index, stage in enumerate(self.stages):
+            for worker_id in range(stage.workers):
+                thread = threading.Thread(target=worker, args=(index, worker_id),
+                                          name=f"pipeline_{stage.name}_{worker_id}", daemon=True)
+                thread.start()
+                threads.append(thread)
+
+        try:
+            for item in items:
+                queues[0].put(item)
+        finally:
+            for _ in range(self.stages[0].workers):
+                queues[0].put(_STOP)
+            for thread in threads:
+                thread.join()
+            self.finished_at = time.time()
+
+        return results
+
+    def utilization(self) -> Dict[str, Dict[str, float]]:
+        """
+        Summarize how busy each stage was.
+
+        Returns:
+            Dictionary of stage name -> {'items', 'busy', 'utilization'} where
+            utilization is busy time over (workers * wall time)
+        """
+        wall_time = max(self.finished_at - self.started_at, 1e-9)
+        summary = {}
+        for stage in self.stages:
+            events = [event for event in self.trace if event.stage == stage.name]
+            busy = sum(event.duration for event in events)
+            summary[stage.name] = {
+                'items': len(events),
+                'workers': stage.workers,
+                'busy': busy,
+                'utilization': busy / (stage.workers * wall_time)
+            }
+        return summary
+
+    def format_trace(self) -> str:
+        """
+        Format the scheduling trace and stage utilization as text.
+
+        Returns:
+            Multi-line report
+        """
+        lines = [f"Pipeline wall time: {self.finished_at - self.started_at:.1f}s"]
+        for name, stats in self.utilization().items():
+            lines.append(f"  {name:<10} {stats['items']:>4} item(s)  {stats['workers']} worker(s)  "
+                         f"busy {stats['busy']:.1f}s  utilization {stats['utilization']:.0%}")
+        lines.append("Timeline (seconds from start):")
+        for event in sorted(self.trace, key=lambda e: e.start):
+            status = "" if event.success else "  FAILED"
+            lines.append(f"  {event.start - self.started_at:8.1f} - {event.end - self.started_at:8.1f}  "
+                         f"{event.stage}[{event.worker}]  {event.item_name}{status}")
+        return "\n".join(lines)
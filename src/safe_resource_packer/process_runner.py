@@ -0,0 +1,308 @@
+"""
+Streaming Process Runner
+
+Runs external tools (BSArch, 7z) with Popen instead of a buffered
+subprocess.run. Output is streamed line by line, tool progress is parsed from
+the stream, timeouts are based on inactivity rather than total runtime, and a
+cancel event kills the whole child process tree.
+
+BSArch prints nothing while it compresses a single large file, so it gets a
+much longer inactivity timeout than 7z. $SRP_INACTIVITY_TIMEOUT (seconds, 0
+disables) overrides the defaults of both tools. Tool progress is shown on
+the live progress display rather than logged.
+"""
+
+import os
+import re
+import codecs
+import time
+import queue
+import signal
+import threading
+import subprocess
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Optional
+from .dynamic_progress import log, set_tool_progress
+from .logging_service import log_external_tool
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+# A tool that prints nothing for this long is considered hung
+DEFAULT_INACTIVITY_TIMEOUT = 600
+# BSArch stays silent for the whole compression of one large file
+BSARCH_INACTIVITY_TIMEOUT = 3600
+INACTIVITY_TIMEOUT_ENV_VAR = "SRP_INACTIVITY_TIMEOUT"
+TOOL_INACTIVITY_TIMEOUTS = {'7z': DEFAULT_INACTIVITY_TIMEOUT, 'BSArch': BSARCH_INACTIVITY_TIMEOUT}
+
+# Output kept in memory for error messages (the full stream is never buffered)
+MAX_TAIL_LINES = 200
+
+# 7z -bsp1 progress: "  42% 130 - meshes\\foo.nif" rewritten with backspaces/carriage returns
+_SEVEN_ZIP_PERCENT = re.compile(r'^\s*(\d{1,3})%')
+_LINE_SPLIT = re.compile(r'[\r\n\x08]+')
+
+
+class ProcessResult:
+    """Outcome of a streamed process run."""
+
+    def __init__(self, returncode: int, stdout: str, stderr: str, duration: float,
+                 timed_out: bool = False, cancelled: bool = False,
+                 inactivity_timeout: Optional[float] = None):
+        self.returncode = returncode
+        self.stdout = stdout
+        self.stderr = stderr
+        self.duration = duration
+        self.timed_out = timed_out
+        self.cancelled = cancelled
+        self.inactivity_timeout = inactivity_timeout
+
+    @property
+    def stall_description(self) -> str:
+        """Human-readable reason of a timed-out run, e.g. "no output for 10 minutes"."""
+        timeout = self.inactivity_timeout or 0
+        if timeout >= 60:
+            return f"no output for {timeout / 60:.0f} minutes"
+        return f"no output for {timeout:.0f} seconds"
+
+    @property
+    def success(self) -> bool:
+        """Whether the process exited cleanly."""
+        return self.returncode == 0 and not self.timed_out and not self.cancelled
+
+
+def parse_7z_progress(line: str) -> Optional[float]:
+    """
+    Parse a 7z -bsp1 progress line.
+
+    Args:
+        line: Output line
+
+    Returns:
+        Percentage (0-100) or None
+    """
+    match = _SEVEN_ZIP_PERCENT.match(line)
+    if match:
+        return min(100.0, float(match.group(1)))
+    return None
+
+
+class BSArchProgressCounter:
+    """Estimates BSArch progress by counting the per-file lines it prints."""
+
+    def __init__(self, total_files: int):
+        """
+        Initialize counter.
+
+        Args:
+            total_files: Number of files being packed
+        """
+        self.total_files = max(1, total_files)
+        self.seen = 0
+
+    def __call__(self, line: str) -> Optional[float]:
+        """Count a file line and return the estimated percentage."""
+        # BSArch echoes packed entries as Data-relative paths
+        if '\\' in line or '/' in line:
+            self.seen += 1
+            return min(99.0, self.seen * 100.0 / self.total_files)
+        return None
+
+
+def inactivity_timeout_for(tool: str) -> Optional[float]:
+    """
+    Inactivity timeout of an external tool.
+
+    Args:
+        tool: Tool name ('7z' or 'BSArch')
+
+    Returns:
+        Seconds from $SRP_INACTIVITY_TIMEOUT, else the tool's default (None disables)
+    """
+    configured = os.environ.get(INACTIVITY_TIMEOUT_ENV_VAR, '').strip()
+    if configured:
+        try:
+            return float(configured) or None
+        except ValueError:
+            log(f"⚠️ Ignoring invalid {INACTIVITY_TIMEOUT_ENV_VAR}={configured!r}", log_type='WARNING')
+    return TOOL_INACTIVITY_TIMEOUTS.get(tool, DEFAULT_INACTIVITY_TIMEOUT)
+
+
+@contextmanager
+def tool_progress(label: str, step: float = 10.0) -> Iterator[Callable[[float, str], None]]:
+    """
+    Show a running tool's progress on the live progress display.
+
+    The entry is removed when the block exits. Every `step` percent is also
+    logged at DEBUG level for runs without a live display.
+
+    Args:
+        label: Label shown on the display, e.g. "BSArch Mod.bsa"
+        step: Percentage step between debug messages
+
+    Yields:
+        Progress callback accepting (percent, line)
+    """
+    state = {'next': step}
+
+    def callback(percent: float, line: str) -> None:
+        set_tool_progress(label, percent)
+        if percent >= state['next']:
+            state['next'] = (int(percent // step) + 1) * step
+            log(f"⏳ {label}: {percent:.0f}%", log_type='DEBUG')
+
+    try:
+        yield callback
+    finally:
+        set_tool_progress(label, None)
+
+
+def kill_process_tree(process: subprocess.Popen) -> None:
+    """
+    Kill a process and all of its children.
+
+    Args:
+        process: Process to kill
+    """
+    try:
+        if psutil is not None:
+            parent = psutil.Process(process.pid)
+            for child in parent.children(recursive=True):
+                try:
+                    child.kill()
+                except psutil.Error:
+                    pass
+            parent.kill()
+        elif os.name == 'nt':
+            subprocess.run(["taskkill", "/F", "/T", "/PID", str(process.pid)], capture_output=True)
+        else:
+            os.killpg(os.getpgid(process.pid), signal.SIGKILL)
+    except Exception:
+        try:
+            process.kill()
+        except Exception:
+            pass
+
+
+def run_streaming(cmd: List[str],
+                  cwd: Optional[str] = None,
+                  tool: Optional[str] = None,
+                  inactivity_timeout: Optional[float] = DEFAULT_INACTIVITY_TIMEOUT,
+                  cancel_event: Optional[threading.Event] = None,
+                  progress_parser: Optional[Callable[[str], Optional[float]]] = None,
+                  on_progress: Optional[Callable[[float, str], None]] = None,
+                  on_line: Optional[Callable[[str, str], None]] = None) -> ProcessResult:
+    """
+    Run a command, streaming its output.
+
+    Args:
+        cmd: Command and arguments
+        cwd: Working directory
+        tool: Tool name for logging (defaults to the executable name)
+        inactivity_timeout: Seconds without any output before the process is killed (None disables)
+        cancel_event: Event that kills the process tree when set
+        progress_parser: Maps an output line to a percentage (or None)
+        on_progress: Called with (percent, line) when progress advances
+        on_line: Called with (stream_name, line) for every output line
+
+    Returns:
+        ProcessResult with the tail of stdout/stderr
+    """
+    tool = tool or os.path.basename(cmd[0])
+    start_time = time.time()
+
+    popen_kwargs = {}
+    if os.name == 'nt':
+        popen_kwargs['creationflags'] = subprocess.CREATE_NEW_PROCESS_GROUP
+    else:
+        popen_kwargs['start_new_session'] = True
+
+    process = subprocess.Popen(cmd, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                               stdin=subprocess.DEVNULL, shell=False, **popen_kwargs)
+
+    lines: "queue.Queue" = queue.Queue()
+    readers = [
+        threading.Thread(target=_pump, args=(process.stdout, 'stdout', lines), daemon=True),
+        threading.Thread(target=_pump, args=(process.stderr, 'stderr', lines), daemon=True),
+    ]
+    for reader in readers:
+        reader.start()
+
+    tails = {'stdout': deque(maxlen=MAX_TAIL_LINES), 'stderr': deque(maxlen=MAX_TAIL_LINES)}
+    last_activity = time.time()
+    last_percent = -1.0
+    open_streams = 2
+    timed_out = False
+    cancelled = False
+
+    while open_streams:
+        if cancel_event is not None and cancel_event.is_set():
+            cancelled = True
+            log(f"🛑 Cancelling {tool}", log_type='WARNING')
+            kill_process_tree(process)
+            break
+
+        try:
+            stream, line = lines.get(timeout=0.25)
+        except queue.Empty:
+            if inactivity_timeout and time.time() - last_activity > inactivity_timeout:
+                timed_out = True
+                log(f"⏱️ {tool} produced no output for {inactivity_timeout:.0f}s - killing it", log_type='ERROR')
+                kill_process_tree(process)
+                break
+            continue
+
+        if line is None:
+            open_streams -= 1
+            continue
+
+        last_activity = time.time()
+        tails[stream].append(line)
+        if on_line:
+            on_line(stream, line)
+        if progress_parser and on_progress:
+            percent = progress_parser(line)
+            if percent is not None and percent > last_percent:
+                last_percent = percent
+                on_progress(percent, line)
+
+    returncode = process.wait()
+    for reader in readers:
+        reader.join(timeout=1)
+
+    duration = time.time() - start_time
+    stdout = "\n".join(tails['stdout'])
+    stderr = "\n".join(tails['stderr'])
+    log_external_tool(tool, [str(part) for part in cmd], output=stdout[-2000:] or None,
+                      error=stderr[-2000:] or None, return_code=returncode, duration=duration)
+
+    return ProcessResult(returncode, stdout, stderr, duration, timed_out=timed_out, cancelled=cancelled,
+                         inactivity_timeout=inactivity_timeout)
+
+
+def _pump(stream, name: str, lines: "queue.Queue") -> None:
+    """Read a pipe in chunks, splitting on newlines, carriage returns and backspaces."""
+    # Console tools write in the OEM/ANSI code page on Windows
+    decoder = codecs.getincrementaldecoder('mbcs' if os.name == 'nt' else 'utf-8')(errors='replace')
+    pending = ""
+    try:
+        while True:
+            chunk = stream.read1(65536)
+            if not chunk:
+                break
+            parts = _LINE_SPLIT.split(pending + decoder.decode(chunk))
+            pending = parts.pop()
+            for part in parts:
+                if part.strip():
+                    lines.put((name, part))
+        pending += decoder.decode(b'', final=True)
+        if pending.strip():
+            lines.put((name, pending))
+    except (OSError, ValueError):
+        pass
+    finally:
+        lines.put((name, None))
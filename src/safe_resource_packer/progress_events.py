@@ -0,0 +1,283 @@
+"""
+Machine-Readable Progress Events
+
+CI jobs and external launchers can't scrape Rich output. With
+--progress=jsonl the packer writes one JSON object per line to stdout or a
+file descriptor instead, and Python callers can subscribe to the same
+events with add_listener(). Every event has 'event' and 'time' fields:
+
+- run_start / run_end: one pair per CLI run (run_end carries 'exit_code')
+- stage_start: 'stage' and, when known, 'total'
+- progress: 'stage', 'current', 'total', 'rate' (items/s), 'eta_seconds'
+  and, when bytes are counted, 'bytes' and 'bytes_per_second'; throttled
+  to one event per stage every min_interval seconds
+- stage_end: 'stage', 'success', 'elapsed' and the stage's counts
+- mod_result: 'mod', 'status' ('success', 'up_to_date', 'resumed' or
+  'failed') and 'output' or 'error'
+
+This module must not import Rich: headless_requested() is checked by the
+display modules at import time so a jsonl run never loads it.
+"""
+
+import os
+import sys
+import json
+import time
+import atexit
+import threading
+from typing import Any, Callable, Dict, List, Optional, TextIO
+
+
+PROGRESS_ENV_VAR = "SRP_PROGRESS"
+PROGRESS_MODES = ('rich', 'jsonl')
+DEFAULT_MIN_INTERVAL = 0.5
+
+
+def headless_requested(argv: Optional[List[str]] = None) -> bool:
+    """
+    Whether this process was started for machine-readable progress.
+
+    Checked before any Rich import, so it reads $SRP_PROGRESS and the raw
+    command line rather than parsed arguments.
+
+    Args:
+        argv: Command line to inspect (defaults to sys.argv)
+
+    Returns:
+        True for --progress=jsonl, --progress jsonl or SRP_PROGRESS=jsonl
+    """
+    if os.environ.get(PROGRESS_ENV_VAR, '').strip().lower() == 'jsonl':
+        return True
+    argv = sys.argv if argv is None else argv
+    for index, arg in enumerate(argv):
+        if arg == '--progress=jsonl':
+            return True
+        if arg == '--progress' and index + 1 < len(argv) and argv[index + 1] == 'jsonl':
+            return True
+    return False
+
+
+class _StageState:
+    """Timing and counters of one running stage."""
+
+    def __init__(self, total: Optional[int]):
+        self.started = time.time()
+        self.total = total
+        self.current = 0
+        self.bytes = None
+        self.last_emit = 0.0
+
+
+class ProgressEventEmitter:
+    """Writes throttled progress events as JSON lines and hands them to listeners."""
+
+    def __init__(self, stream: Optional[TextIO] = None, min_interval: float = DEFAULT_MIN_INTERVAL):
+        """
+        Initialize the emitter.
+
+        Args:
+            stream: Text stream for JSON lines (None to only notify listeners)
+            min_interval: Minimum seconds between progress events of one stage
+        """
+        self.stream = stream
+        self.min_interval = min_interval
+        self._listeners = []
+        self._stages = {}  # stage -> _StageState
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether anyone receives events (callers skip building them otherwise)."""
+        return self.stream is not None or bool(self._listeners)
+
+    def add_listener(self, callback: Callable[[Dict[str, Any]], None]) -> None:
+        """Call callback(event_dict) for every event."""
+        with self._lock:
+            self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[Dict[str, Any]], None]) -> None:
+        """Stop calling a listener."""
+        with self._lock:
+            if callback in self._listeners:
+                self._listeners.remove(callback)
+
+    def emit(self, event: str, **fields) -> None:
+        """
+        Emit one event.
+
+        Args:
+            event: Event name
+            **fields: JSON-serializable event fields
+        """
+        if not self.enabled:
+            return
+        record = {'event': event, 'time': round(time.time(), 3)}
+        record.update(fields)
+        with self._lock:
+            listeners = list(self._listeners)
+            if self.stream is not None:
+                try:
+                    self.stream.write(json.dumps(record, default=str) + '\n')
+                    self.stream.flush()
+                except (OSError, ValueError):
+                    self.stream = None  # Reader went away; keep the run going
+        for listener in listeners:
+            try:
+                listener(record)
+            except Exception:
+                pass  # A broken listener must not break processing
+
+    def stage_start(self, stage: str, total: Optional[int] = None, **fields) -> None:
+        """
+        Start timing a stage.
+
+        Args:
+            stage: Stage name ('classify', 'copy', 'batch', ...)
+            total: Number of items expected, if known
+            **fields: Extra event fields
+        """
+        with self._lock:
+            self._stages[stage] = _StageState(total)
+        self.emit('stage_start', stage=stage, total=total, **fields)
+
+    def progress(self, stage: str, current: int, total: Optional[int] = None,
+                 bytes_done: Optional[int] = None, force: bool = False, **fields) -> None:
+        """
+        Report stage progress; throttled except for the last item.
+
+        Args:
+            stage: Stage name
+            current: Items done so far
+            total: Items expected (defaults to the total given at stage_start)
+            bytes_done: Bytes handled so far, if counted
+            force: Emit even within min_interval of the previous event
+            **fields: Extra event fields
+        """
+        if not self.enabled:
+            return
+        now = time.time()
+        with self._lock:
+            state = self._stages.get(stage)
+            if state is None:
+                state = self._stages[stage] = _StageState(total)
+            if total is not None:
+                state.total = total
+            state.current = current
+            if bytes_done is not None:
+                state.bytes = bytes_done
+            finished = state.total is not None and current >= state.total
+            if not (force or finished) and now - state.last_emit < self.min_interval:
+                return
+            state.last_emit = now
+            payload = self._measure(state, now)
+        payload.update(fields)
+        self.emit('progress', stage=stage, **payload)
+
+    def stage_end(self, stage: str, success: bool = True, **fields) -> None:
+        """
+        Finish a stage.
+
+        Args:
+            stage: Stage name
+            success: Whether the stage succeeded
+            **fields: Stage counts and other extra event fields
+        """
+        with self._lock:
+            state = self._stages.pop(stage, None)
+            payload = self._measure(state, time.time()) if state else {}
+        payload.pop('eta_seconds', None)
+        payload.update(fields)
+        self.emit('stage_end', stage=stage, success=success, **payload)
+
+    def mod_result(self, mod: str, status: str, **fields) -> None:
+        """
+        Report the outcome of one mod.
+
+        Args:
+            mod: Mod name
+            status: 'success', 'up_to_date', 'resumed' or 'failed'
+            **fields: 'output', 'error' and other extra event fields
+        """
+        self.emit('mod_result', mod=mod, status=status, **fields)
+
+    def close(self) -> None:
+        """Flush the stream; it stays open for its owner."""
+        with self._lock:
+            if self.stream is not None:
+                try:
+                    self.stream.flush()
+                except (OSError, ValueError):
+                    pass
+
+    @staticmethod
+    def _measure(state: _StageState, now: float) -> Dict[str, Any]:
+        """Counts, rates and ETA of a stage."""
+        elapsed = max(now - state.started, 1e-6)
+        rate = state.current / elapsed
+        payload = {
+            'current': state.current,
+            'total': state.total,
+            'elapsed': round(elapsed, 3),
+            'rate': round(rate, 2),
+            'eta_seconds': round((state.total - state.current) / rate, 1)
+                           if rate and state.total is not None and state.total >= state.current else None
+        }
+        if state.bytes is not None:
+            payload['bytes'] = state.bytes
+            payload['bytes_per_second'] = round(state.bytes / elapsed)
+        return payload
+
+
+# Global emitter; disabled (no stream, no listeners) until configured
+_progress_events = None
+_events_lock = threading.Lock()
+
+
+def get_progress_events() -> ProgressEventEmitter:
+    """Get global progress event emitter."""
+    global _progress_events
+    if _progress_events is None:
+        with _events_lock:
+            if _progress_events is None:
+                _progress_events = ProgressEventEmitter()
+    return _progress_events
+
+
+def configure_progress_events(stream: Optional[TextIO] = None, fd: Optional[int] = None,
+                              min_interval: float = DEFAULT_MIN_INTERVAL) -> ProgressEventEmitter:
+    """
+    Send global progress events to a stream or file descriptor.
+
+    With neither given, events take over stdout and ordinary output
+    (log lines, prints) is moved to stderr so the JSON lines stay clean.
+
+    Args:
+        stream: Text stream for events
+        fd: File descriptor for events (e.g. a pipe set up by a launcher)
+        min_interval: Minimum seconds between progress events of one stage
+
+    Returns:
+        The new global emitter
+    """
+    global _progress_events
+    if stream is None:
+        if fd is not None:
+            stream = os.fdopen(fd, 'w', encoding='utf-8', closefd=False)
+        else:
+            stream = sys.stdout
+            sys.stdout = sys.stderr
+    emitter = ProgressEventEmitter(stream, min_interval)
+    with _events_lock:
+        previous, _progress_events = _progress_events, emitter
+    if previous is not None:
+        for listener in list(previous._listeners):
+            emitter.add_listener(listener)
+        previous.close()
+    return emitter
+
+
+@atexit.register
+def _close_progress_events() -> None:
+    """Flush pending events at interpreter exit."""
+    if _progress_events is not None:
+        _progress_events.close()
@@ -0,0 +1,375 @@
+"""
+Scratch Space Manager
+
+Single place that decides where temporary working data goes. Scratch
+directories are created under one or more configurable roots (round-robin
+across disks), preferring a root on the same filesystem as the outputs so
+finished files can be renamed into place instead of copied. With the default
+roots, a directory that has to live on another filesystem gets an implicit
+root there (.srp_scratch at that volume's mount point, when writable). Each
+process works inside its own srp_run_* directory, which lets a startup sweep
+remove the leftovers of crashed runs, and an optional per-run quota stops a
+run from filling the scratch disk; callers may wait for other directories to
+be released instead of failing at once.
+"""
+
+import os
+import json
+import time
+import uuid
+import atexit
+import shutil
+import socket
+import tempfile
+import threading
+from typing import Dict, List, Optional
+from .dynamic_progress import log
+from .utils import format_bytes
+from .background_delete import get_background_deleter, TOMBSTONE_PREFIX
+
+try:
+    import psutil
+except ImportError:  # pragma: no cover - psutil is an install requirement
+    psutil = None
+
+
+SCRATCH_ENV_VAR = "SRP_SCRATCH_DIRS"
+RUN_PREFIX = "srp_run_"
+OWNER_FILE = "owner.json"
+VOLUME_ROOT_NAME = ".srp_scratch"  # Implicit root at a volume's mount point
+QUOTA_WAIT_SECONDS = 1800  # How long pipelined callers wait for space held by other jobs
+
+# Temp directories created before the scratch manager existed (swept by age)
+LEGACY_PREFIXES = ('srp_pack_', 'srp_loose_', 'srp_blacklisted_', 'bsa_chunk_', '7z_unified_',
+                   'batch_repack_', 'safe_resource_packer_', 'srp_stage_')
+LEGACY_MAX_AGE_HOURS = 24.0
+
+
+class ScratchQuotaExceeded(OSError):
+    """Raised when a scratch directory would exceed the run quota or free space."""
+
+
+def _pid_alive(pid: int) -> bool:
+    """Check whether a process exists (assumes yes when it can't be determined)."""
+    if psutil is not None:
+        return psutil.pid_exists(pid)
+    if os.name == 'nt':
+        return True  # os.kill would terminate the process on Windows
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        return True
+    return True
+
+
+def _device_of(path: str) -> Optional[int]:
+    """Device of the nearest existing ancestor of path."""
+    path = os.path.abspath(path)
+    while True:
+        try:
+            return os.stat(path).st_dev
+        except OSError:
+            parent = os.path.dirname(path)
+            if parent == path:
+                return None
+            path = parent
+
+
+def _mount_point(path: str) -> Optional[str]:
+    """Top directory of the filesystem holding path (e.g. D:\\ or /mnt/games)."""
+    device = _device_of(path)
+    if device is None:
+        return None
+    path = os.path.abspath(path)
+    while True:
+        parent = os.path.dirname(path)
+        if parent == path or _device_of(parent) != device:
+            return path
+        path = parent
+
+
+class ScratchManager:
+    """Places, accounts for and cleans up temporary working directories."""
+
+    def __init__(self, roots: Optional[List[str]] = None, quota_gb: Optional[float] = None):
+        """
+        Initialize scratch manager.
+
+        Args:
+            roots: Scratch root directories (defaults to $SRP_SCRATCH_DIRS, then the temp directory)
+            quota_gb: Maximum scratch space a run may reserve in GB (None for no limit)
+        """
+        if not roots:
+            env_roots = os.environ.get(SCRATCH_ENV_VAR, '')
+            roots = [root for root in env_roots.split(os.pathsep) if root]
+        # Configured roots are used exactly; the default may grow per-volume roots
+        self.volume_roots = not roots
+        roots = roots or [tempfile.gettempdir()]
+
+        self.roots = [os.path.abspath(root) for root in roots]
+        self.quota_bytes = int(quota_gb * 1024 ** 3) if quota_gb else None
+        self.run_token = f"{os.getpid()}_{uuid.uuid4().hex[:8]}"
+        self._run_dirs = {}
+        self._reservations = {}
+        self._next_root = 0
+        self._checked_devices = set()
+        self._lock = threading.Lock()
+        self._released = threading.Condition(self._lock)
+
+    def _run_dir(self, root: str) -> str:
+        """This process's run directory under a root (caller holds the lock)."""
+        run_dir = self._run_dirs.get(root)
+        if run_dir is None:
+            run_dir = os.path.join(root, f"{RUN_PREFIX}{self.run_token}")
+            os.makedirs(run_dir, exist_ok=True)
+            with open(os.path.join(run_dir, OWNER_FILE), 'w', encoding='utf-8') as f:
+                json.dump({'pid': os.getpid(), 'host': socket.gethostname(), 'started': time.time()}, f)
+            self._run_dirs[root] = run_dir
+        return run_dir
+
+    def _pick_root(self, near: Optional[str], size_hint: int) -> str:
+        """
+        Choose a scratch root (caller holds the lock).
+
+        Args:
+            near: Path the scratch data will end up next to (prefer its filesystem)
+            size_hint: Expected scratch usage in bytes
+
+        Returns:
+            Scratch root
+        """
+        candidates = self.roots
+        if near:
+            device = _device_of(near)
+            same_device = [root for root in self.roots if _device_of(root) == device]
+            if not same_device and self.volume_roots:
+                same_device = self._add_volume_root(near, device)
+            candidates = same_device or self.roots
+
+        for offset in range(len(candidates)):
+            root = candidates[(self._next_root + offset) % len(candidates)]
+            try:
+                os.makedirs(root, exist_ok=True)
+                free = shutil.disk_usage(root).free
+            except OSError:
+                continue
+            if free >= size_hint:
+                self._next_root += offset + 1
+                return root
+
+        raise ScratchQuotaExceeded(f"No scratch root has {format_bytes(size_hint)} free: {', '.join(candidates)}")
+
+    def _add_volume_root(self, near: str, device: Optional[int]) -> List[str]:
+        """
+        Add the implicit root on near's filesystem, once per device (caller holds the lock).
+
+        Args:
+            near: Path on the filesystem
+            device: Its device number
+
+        Returns:
+            [root] if the volume has a usable root, else []
+        """
+        if device is None or device in self._checked_devices:
+            return []
+        self._checked_devices.add(device)
+        mount_point = _mount_point(near)
+        if not mount_point:
+            return []
+        root = os.path.join(mount_point, VOLUME_ROOT_NAME)
+        try:
+            os.makedirs(root, exist_ok=True)
+        except OSError:
+            return []  # Read-only or protected volume: fall back to the default root
+        self.roots.append(root)
+        self.sweep(roots=[root])
+        log(f"📁 Scratch root added on the source volume: {root}", log_type='DEBUG')
+        return [root]
+
+    def mkdtemp(self, prefix: str = "srp_", near: Optional[str] = None, size_hint: int = 0,
+                wait: float = 0) -> str:
+        """
+        Create a scratch directory.
+
+        Args:
+            prefix: Directory name prefix
+            near: Path the data comes from or will be moved to (selects a root on its filesystem)
+            size_hint: Expected usage in bytes, reserved against the run quota
+            wait: Seconds to wait for other directories to be released when the quota
+                  or free space is short (0 fails at once)
+
+        Returns:
+            Path of the new directory
+        """
+        deadline = time.time() + wait
+        waiting = False
+        with self._released:
+            while True:
+                try:
+                    if self.quota_bytes is not None:
+                        reserved = sum(self._reservations.values())
+                        if reserved + size_hint > self.quota_bytes:
+                            raise ScratchQuotaExceeded(
+                                f"Scratch quota exceeded: {format_bytes(reserved)} reserved + {format_bytes(size_hint)} "
+                                f"requested > {format_bytes(self.quota_bytes)}")
+                    root = self._pick_root(near, size_hint)
+                    break
+                except ScratchQuotaExceeded:
+                    remaining = deadline - time.time()
+                    # Only a release by another directory can make room
+                    if remaining <= 0 or not self._reservations:
+                        raise
+                    if not waiting:
+                        waiting = True
+                        log(f"⏳ Waiting for scratch space ({format_bytes(size_hint)} needed)", log_type='INFO')
+                    # Background deletion frees disk space without a release, so re-check periodically
+                    self._released.wait(min(remaining, 5.0))
+            path = tempfile.mkdtemp(prefix=prefix, dir=self._run_dir(root))
+            self._reservations[path] = size_hint
+        return path
+
+    def release(self, path: str, remove: bool = True) -> None:
+        """
+        Return a scratch directory's reservation, removing the directory.
+
+        The directory disappears immediately; its files are deleted in the background.
+
+        Args:
+            path: Directory created by mkdtemp
+            remove: Delete the directory
+        """
+        if remove:
+            get_background_deleter().discard(path)
+        with self._released:
+            self._reservations.pop(path, None)
+            self._released.notify_all()
+
+    def reserved_bytes(self) -> int:
+        """Bytes currently reserved by live scratch directories."""
+        with self._lock:
+            return sum(self._reservations.values())
+
+    def sweep(self, legacy_max_age_hours: float = LEGACY_MAX_AGE_HOURS, roots: Optional[List[str]] = None) -> int:
+        """
+        Remove scratch data left behind by crashed runs (deleted in the background).
+
+        Args:
+            legacy_max_age_hours: Age after which pre-manager temp directories count as orphaned
+            roots: Roots to sweep (defaults to all)
+
+        Returns:
+            Number of orphaned directories removed
+        """
+        host = socket.gethostname()
+        legacy_cutoff = time.time() - legacy_max_age_hours * 3600
+        deleter = get_background_deleter()
+        removed = 0
+
+        for root in roots or list(self.roots):
+            try:
+                names = os.listdir(root)
+            except OSError:
+                continue
+            for name in names:
+                path = os.path.join(root, name)
+                if path in self._run_dirs.values() or not os.path.isdir(path) or os.path.islink(path):
+                    continue
+                try:
+                    if name.startswith(TOMBSTONE_PREFIX):
+                        pass  # Deletion interrupted by the end of its process
+                    elif name.startswith(RUN_PREFIX):
+                        with open(os.path.join(path, OWNER_FILE), 'r', encoding='utf-8') as f:
+                            owner = json.load(f)
+                        if owner.get('host') != host or _pid_alive(owner.get('pid', -1)):
+                            continue
+                    elif not (name.startswith(LEGACY_PREFIXES) and os.path.getmtime(path) < legacy_cutoff):
+                        continue
+                except (OSError, ValueError):
+                    continue
+
+                try:
+                    deleter.discard(path)
+                    removed += 1
+                except OSError:
+                    continue
+
+        if removed:
+            log(f"🧹 Removing {removed} orphaned scratch director{'y' if removed == 1 else 'ies'} in the background", log_type='INFO')
+        return removed
+
+    def cleanup(self) -> None:
+        """Remove this process's run directories."""
+        with self._released:
+            run_dirs = list(self._run_dirs.values())
+            self._run_dirs = {}
+            self._reservations = {}
+            self._released.notify_all()
+        deleter = get_background_deleter()
+        for run_dir in run_dirs:
+            try:
+                deleter.discard(run_dir)
+            except OSError:
+                pass
+
+    def stats(self) -> Dict[str, object]:
+        """
+        Get scratch statistics.
+
+        Returns:
+            Dictionary with roots, quota and current reservations
+        """
+        with self._lock:
+            return {
+                'roots': list(self.roots),
+                'quota': self.quota_bytes,
+                'reserved': sum(self._reservations.values()),
+                'directories': len(self._reservations),
+                'run_dirs': dict(self._run_dirs)
+            }
+
+
+# Global scratch manager
+_scratch_manager = None
+_scratch_lock = threading.Lock()
+
+
+def configure_scratch(roots: Optional[List[str]] = None, quota_gb: Optional[float] = None) -> ScratchManager:
+    """
+    Configure the global scratch manager (call before any scratch directory is created).
+
+    Args:
+        roots: Scratch root directories
+        quota_gb: Per-run quota in GB
+
+    Returns:
+        The configured manager
+    """
+    global _scratch_manager
+    with _scratch_lock:
+        if _scratch_manager is not None:
+            _scratch_manager.cleanup()
+        _scratch_manager = ScratchManager(roots, quota_gb)
+        manager = _scratch_manager
+    manager.sweep()
+    return manager
+
+
+def get_scratch_manager() -> ScratchManager:
+    """Get global scratch manager instance (sweeping orphans on first use)."""
+    global _scratch_manager
+    with _scratch_lock:
+        if _scratch_manager is not None:
+            return _scratch_manager
+        _scratch_manager = ScratchManager()
+        manager = _scratch_manager
+    manager.sweep()
+    return manager
+
+
+@atexit.register
+def _cleanup_scratch() -> None:
+    """Remove this process's scratch data at interpreter exit."""
+    if _scratch_manager is not None:
+        _scratch_manager.cleanup()
@@ -0,0 +1,223 @@
+"""
+Link-based Staging Trees
+
+Archive tools need their input laid out as a Data-relative tree (meshes/...,
+textures/...). Instead of copying every file into such a tree, a StagingTree
+materializes each entry as a hardlink, copy-on-write reflink or symlink to the
+original file and only copies when none of those work (typically across
+filesystems without symlink support). Created entries are tracked so cleanup
+never touches the original files, and the tree reports how many bytes were
+never copied.
+"""
+
+import os
+import sys
+import shutil
+from typing import Callable, Dict, Iterable, Optional
+from .dynamic_progress import log
+from .utils import format_bytes
+from .scratch import get_scratch_manager
+
+
+# Linux FICLONE ioctl: copy-on-write clone on btrfs/XFS/bcachefs
+FICLONE = 0x40049409
+
+LINK_METHODS = ('hardlink', 'reflink', 'symlink', 'copy')
+DEFAULT_LINK_METHODS = LINK_METHODS
+
+
+def reflink_file(src: str, dst: str) -> bool:
+    """
+    Clone src to dst as a copy-on-write reflink.
+
+    Args:
+        src: Source file
+        dst: Destination file (must not exist)
+
+    Returns:
+        True if the clone was created, False if the filesystem can't reflink
+    """
+    if not sys.platform.startswith('linux'):
+        return False
+    try:
+        import fcntl
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+        shutil.copystat(src, dst)
+        return True
+    except (OSError, ImportError):
+        try:
+            os.remove(dst)
+        except OSError:
+            pass
+        return False
+
+
+def link_or_copy(src: str, dst: str, methods: Iterable[str] = DEFAULT_LINK_METHODS) -> str:
+    """
+    Materialize src at dst with the first method that works.
+
+    Args:
+        src: Source file
+        dst: Destination path (must not exist)
+        methods: Methods to try in order, from LINK_METHODS
+
+    Returns:
+        Name of the method used
+    """
+    for method in methods:
+        try:
+            if method == 'hardlink':
+                os.link(src, dst)
+            elif method == 'reflink':
+                if not reflink_file(src, dst):
+                    continue
+            elif method == 'symlink':
+                os.symlink(src, dst)
+            elif method == 'copy':
+                shutil.copy2(src, dst)
+            else:
+                continue
+            return method
+        except OSError:
+            continue
+    shutil.copy2(src, dst)
+    return 'copy'
+
+
+class StagingTree:
+    """Data-relative layout of existing files, built from links where possible."""
+
+    def __init__(self, root: Optional[str] = None, prefix: str = "srp_stage_",
+                 methods: Iterable[str] = DEFAULT_LINK_METHODS, near: Optional[str] = None):
+        """
+        Initialize staging tree.
+
+        Args:
+            root: Directory to stage into (a new scratch directory if None)
+            prefix: Prefix of the scratch directory created when root is None
+            methods: Link methods to try in order, from LINK_METHODS
+            near: File the staged files come from, so the scratch directory can share its filesystem
+        """
+        self.owns_root = root is None
+        self.root = get_scratch_manager().mkdtemp(prefix=prefix, near=near) if root is None else root
+        self.methods = tuple(methods)
+        self.created_files = []
+        self.created_dirs = []
+        self.method_counts = {}
+        self.method_bytes = {}
+        os.makedirs(self.root, exist_ok=True)
+
+    def add(self, source: str, rel_path: str) -> str:
+        """
+        Stage a file at a root-relative path.
+
+        Args:
+            source: Original file
+            rel_path: Path inside the tree (e.g. 'meshes/armor/file.nif')
+
+        Returns:
+            Staged path
+        """
+        # Link to the real file, so trees staged from other trees don't chain symlinks
+        if os.path.islink(source):
+            source = os.path.realpath(source)
+
+        dest_path = os.path.join(self.root, rel_path)
+        self._make_dirs(os.path.dirname(dest_path))
+        if os.path.lexists(dest_path):
+            os.remove(dest_path)
+        else:
+            self.created_files.append(dest_path)
+
+        method = link_or_copy(source, dest_path, self.methods)
+        size = os.path.getsize(source)
+        self.method_counts[method] = self.method_counts.get(method, 0) + 1
+        self.method_bytes[method] = self.method_bytes.get(method, 0) + size
+        return dest_path
+
+    def add_files(self, files: Iterable[str], rel_path: Callable[[str], Optional[str]]) -> int:
+        """
+        Stage many files.
+
+        Args:
+            files: Original files (missing ones are skipped)
+            rel_path: Maps a file to its path inside the tree (None skips the file)
+
+        Returns:
+            Number of files staged
+        """
+        staged = 0
+        for file_path in files:
+            if not os.path.exists(file_path):
+                log(f"⚠️ File not found, skipping: {file_path}", log_type='WARNING')
+                continue
+            target = rel_path(file_path)
+            if not target:
+                continue
+            try:
+                self.add(file_path, target)
+                staged += 1
+            except Exception as e:
+                log(f"⚠️ Failed to stage file {file_path}: {e}", log_type='WARNING')
+        return staged
+
+    def _make_dirs(self, path: str) -> None:
+        """Create a directory inside the tree, remembering which ones were new."""
+        missing = []
+        while path and not os.path.isdir(path):
+            missing.append(path)
+            path = os.path.dirname(path)
+        for directory in reversed(missing):
+            os.makedirs(directory, exist_ok=True)
+            self.created_dirs.append(directory)
+
+    @property
+    def files(self) -> int:
+        """Number of staged files."""
+        return sum(self.method_counts.values())
+
+    @property
+    def bytes_copied(self) -> int:
+        """Bytes that had to be copied."""
+        return self.method_bytes.get('copy', 0)
+
+    @property
+    def bytes_saved(self) -> int:
+        """Bytes staged without being copied."""
+        return sum(size for method, size in self.method_bytes.items() if method != 'copy')
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Get staging statistics.
+
+        Returns:
+            Dictionary with per-method file counts and bytes
+        """
+        return {'files': dict(self.method_counts), 'bytes': dict(self.method_bytes)}
+
+    def summary(self) -> str:
+        """One-line description of how the tree was staged."""
+        methods = ', '.join(f"{count} {method}" for method, count in sorted(self.method_counts.items()))
+        return (f"Staged {self.files} files ({methods or 'none'}): "
+                f"{format_bytes(self.bytes_saved)} never copied, {format_bytes(self.bytes_copied)} copied")
+
+    def cleanup(self) -> None:
+        """Remove the staged entries (never the original files) and the tree's directories."""
+        if self.owns_root:
+            # rmtree unlinks links without following them
+            get_scratch_manager().release(self.root)
+        else:
+            for path in self.created_files:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            for directory in reversed(self.created_dirs):
+                try:
+                    os.rmdir(directory)
+                except OSError:
+                    pass
+        self.created_files = []
+        self.created_dirs = []
+
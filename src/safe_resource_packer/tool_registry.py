@@ -0,0 +1,219 @@
+"""
+External Tool Capability Registry
+
+Probes external tools (BSArch, 7z, NanaZip) once and remembers what they can
+do. Results are keyed by the binary's path, size and modification time and
+persisted between runs, so a tool is only re-probed after it is replaced or
+updated instead of spawning `--help` before every archive. Failed or timed
+out probes are only trusted for NEGATIVE_PROBE_TTL seconds, so a tool that
+was busy or briefly locked (antivirus scans, first launch) is retried.
+"""
+
+import os
+import re
+import json
+import time
+import shutil
+import tempfile
+import threading
+import subprocess
+from typing import Dict, Any, Optional
+from .dynamic_progress import log
+
+
+REGISTRY_FORMAT_VERSION = 1
+PROBE_TIMEOUT = 10
+NEGATIVE_PROBE_TTL = 60.0
+
+_SEVEN_ZIP_VERSION = re.compile(r'(?:7-Zip|NanaZip)[^\d\n]*(\d+(?:\.\d+)+)', re.IGNORECASE)
+_BSARCH_VERSION = re.compile(r'BSArch[^\d\n]*(\d+(?:\.\d+)+)', re.IGNORECASE)
+
+
+class ToolRegistry:
+    """Persistent, process-wide record of external tool capabilities."""
+
+    def __init__(self, cache_dir: Optional[str] = None, negative_ttl: float = NEGATIVE_PROBE_TTL):
+        """
+        Initialize tool registry.
+
+        Args:
+            cache_dir: Directory to store the registry file (defaults to temp directory)
+            negative_ttl: Seconds a failed probe is remembered before the tool is probed again
+        """
+        if cache_dir is None:
+            cache_dir = os.path.join(tempfile.gettempdir(), "srp_tool_registry")
+
+        self.cache_dir = cache_dir
+        self.registry_file = os.path.join(cache_dir, "tools.json")
+        self.negative_ttl = negative_ttl
+        self._lock = threading.Lock()
+        self._probe_locks = {}  # key -> lock held while that binary is probed
+        self._tools = self._load()
+
+    def _load(self) -> Dict[str, Any]:
+        """Load persisted probe results."""
+        try:
+            if os.path.exists(self.registry_file):
+                with open(self.registry_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get('version') == REGISTRY_FORMAT_VERSION:
+                    return data.get('tools', {})
+        except Exception as e:
+            log(f"⚠️ Failed to load tool registry: {e}", log_type='WARNING')
+        return {}
+
+    def _save(self) -> None:
+        """Atomically persist probe results (caller holds the lock)."""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = f"{self.registry_file}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': REGISTRY_FORMAT_VERSION, 'tools': self._tools}, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_path, self.registry_file)
+        except Exception as e:
+            log(f"⚠️ Failed to save tool registry: {e}", log_type='WARNING')
+
+    def _resolve(self, command: str) -> Optional[str]:
+        """Resolve a command name or path to an absolute executable path."""
+        if os.path.isfile(command):
+            return os.path.abspath(command)
+        found = shutil.which(command)
+        return os.path.abspath(found) if found else None
+
+    def _lookup(self, tool: str, command: str, prober) -> Dict[str, Any]:
+        """Return cached capabilities for a binary, probing it if it is new or changed."""
+        path = self._resolve(command)
+        if not path:
+            return {'tool': tool, 'path': command, 'valid': False}
+
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return {'tool': tool, 'path': path, 'valid': False}
+
+        key = f"{tool}|{os.path.normcase(path)}"
+        with self._lock:
+            entry = self._cached(key, stat)
+            if entry:
+                return entry
+            probe_lock = self._probe_locks.setdefault(key, threading.Lock())
+
+        # Probes spawn the tool; other binaries stay available meanwhile
+        with probe_lock:
+            with self._lock:
+                entry = self._cached(key, stat)
+                if entry:
+                    return entry
+
+            log(f"🔍 Probing {tool} capabilities: {path}", log_type='DEBUG')
+            entry = {'tool': tool, 'path': path, 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+            try:
+                entry.update(prober(path))
+            except Exception as e:
+                log(f"⚠️ {tool} probe failed: {e}", log_type='DEBUG')
+                entry['valid'] = False
+            entry['probed'] = time.time()
+
+            with self._lock:
+                self._tools[key] = entry
+                self._save()
+            return entry
+
+    def _cached(self, key: str, stat: os.stat_result) -> Optional[Dict[str, Any]]:
+        """Cached entry for an unchanged binary; failures expire after negative_ttl (caller holds the lock)."""
+        entry = self._tools.get(key)
+        if not entry or entry.get('size') != stat.st_size or entry.get('mtime_ns') != stat.st_mtime_ns:
+            return None
+        if not entry.get('valid') and time.time() - entry.get('probed', 0) >= self.negative_ttl:
+            return None
+        return entry
+
+    def _run_probe(self, cmd, cwd: Optional[str] = None) -> subprocess.CompletedProcess:
+        """Run a short probe command."""
+        return subprocess.run(cmd, capture_output=True, text=True, timeout=PROBE_TIMEOUT, cwd=cwd)
+
+    def _probe_7z(self, path: str) -> Dict[str, Any]:
+        """Probe a 7z-compatible command (7z, 7za, 7zz or NanaZip)."""
+        result = self._run_probe([path, '--help'])
+        help_text = result.stdout.lower()
+        is_nanazip = 'nanazip' in help_text or 'm2-team' in help_text
+        valid = result.returncode == 0 and ('7-zip' in help_text or 'igor pavlov' in help_text or is_nanazip)
+
+        supports_mmt = False
+        if valid and not is_nanazip:
+            # NanaZip rejects -mmt, so only test real 7-Zip builds
+            supports_mmt = self._run_probe([path, 'a', '-mmt=on', '--help']).returncode == 0
+
+        match = _SEVEN_ZIP_VERSION.search(result.stdout)
+        return {
+            'valid': valid,
+            'version': match.group(1) if match else None,
+            'flavor': 'nanazip' if is_nanazip else '7-zip',
+            'supports_mmt': supports_mmt
+        }
+
+    def _probe_bsarch(self, path: str) -> Dict[str, Any]:
+        """Probe a BSArch executable."""
+        if os.path.getsize(path) < 1000:
+            return {'valid': False, 'version': None}
+
+        result = self._run_probe([path, '--help'], cwd=os.path.dirname(path) or None)
+        match = _BSARCH_VERSION.search(result.stdout)
+        return {
+            'valid': result.returncode == 0 and 'BSArch' in result.stdout,
+            'version': match.group(1) if match else None
+        }
+
+    def sevenzip(self, command: str) -> Dict[str, Any]:
+        """
+        Get capabilities of a 7z-compatible command.
+
+        Args:
+            command: Command name or path
+
+        Returns:
+            Dictionary with path, valid, version, flavor and supports_mmt
+        """
+        return self._lookup('7z', command, self._probe_7z)
+
+    def bsarch(self, path: str) -> Dict[str, Any]:
+        """
+        Get capabilities of a BSArch executable.
+
+        Args:
+            path: Path to BSArch
+
+        Returns:
+            Dictionary with path, valid, version, size and mtime_ns
+        """
+        return self._lookup('bsarch', path, self._probe_bsarch)
+
+    def invalidate(self, path: Optional[str] = None) -> None:
+        """
+        Forget probe results so tools are re-probed on next use.
+
+        Args:
+            path: Only forget this binary (defaults to all tools)
+        """
+        with self._lock:
+            if path is None:
+                self._tools = {}
+            else:
+                resolved = os.path.normcase(os.path.abspath(path))
+                self._tools = {key: entry for key, entry in self._tools.items()
+                               if os.path.normcase(entry.get('path', '')) != resolved}
+            self._save()
+
+
+# Global registry instance
+_tool_registry = None
+_tool_registry_lock = threading.Lock()
+
+
+def get_tool_registry() -> ToolRegistry:
+    """Get global tool registry instance."""
+    global _tool_registry
+    with _tool_registry_lock:
+        if _tool_registry is None:
+            _tool_registry = ToolRegistry()
+        return _tool_registry
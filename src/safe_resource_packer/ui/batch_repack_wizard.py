@@ -119,7 +119,8 @@ class BatchRepackWizard:
             # Initialize batch repacker
             batch_repacker = BatchModRepacker(
                 game_type=config.get('game_type', 'skyrim'),
-                threads=config.get('threads', 8)
+                threads=config.get('threads', 8),
+                config={'job_order': config.get('job_order', 'lpt')}
             )
             
             # Discover mods in collection
@@ -243,7 +244,8 @@ class BatchRepackWizard:
             from ..batch_repacker import BatchModRepacker
             batch_repacker = BatchModRepacker(
                 game_type=config.get('game_type', 'skyrim'),
-                threads=config.get('threads', 8)
+                threads=config.get('threads', 8),
+                config={'job_order': config.get('job_order', 'lpt')}
             )
             
             # Discover mods in collection
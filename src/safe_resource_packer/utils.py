@@ -10,10 +10,14 @@ import platform
 import shutil
 import unicodedata
 from datetime import datetime
+from .progress_events import headless_requested
+from .dynamic_progress import log
 
 
 # Check if rich is available for colored output
 try:
+    if headless_requested():
+        raise ImportError("Rich output disabled for --progress=jsonl")
     from rich.console import Console
     RICH_CONSOLE = Console()
     RICH_AVAILABLE = True
@@ -248,6 +252,53 @@ def safe_walk(path, followlinks=False, max_depth=20):
     yield from _walk_recursive(path, 0)
 
 
+def safe_walk_with_sizes(path, max_depth=20):
+    """
+    Walk a directory tree with os.scandir, returning file sizes from the listing.
+
+    Symbolic links are skipped (like safe_walk with followlinks=False), so the
+    tree can't contain cycles. On Windows the sizes come straight from the
+    directory listing without a stat call per file.
+
+    Args:
+        path (str): Directory to walk
+        max_depth (int): Maximum recursion depth
+
+    Yields:
+        tuple: (root, dirs, files) where files is a list of (name, size) tuples
+    """
+    def _walk_recursive(current_path, current_depth):
+        if current_depth > max_depth:
+            log(f"⚠️ Max depth {max_depth} reached, stopping walk at: {current_path}", log_type='WARNING')
+            return
+
+        dirs = []
+        files = []
+        try:
+            with os.scandir(current_path) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_symlink():
+                            continue
+                        if entry.is_dir():
+                            dirs.append(entry.name)
+                        elif entry.is_file():
+                            files.append((entry.name, entry.stat().st_size))
+                    except (OSError, PermissionError):
+                        # Skip items we can't access
+                        continue
+        except (OSError, PermissionError) as e:
+            log(f"⚠️ Cannot access directory {current_path}: {e}", log_type='WARNING')
+            return
+
+        yield current_path, dirs, files
+
+        for dir_name in dirs:
+            yield from _walk_recursive(os.path.join(current_path, dir_name), current_depth + 1)
+
+    yield from _walk_recursive(path, 0)
+
+
 def is_file_locked(filepath):
     """
     Check if a file is locked by another process.
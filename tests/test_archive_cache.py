@@ -0,0 +1,97 @@
+"""Tests for the archive output cache."""
+
+import unittest
+import tempfile
+import os
+import shutil
+import sys
+from pathlib import Path
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from safe_resource_packer.archive_cache import ArchiveCache
+
+
+class TestArchiveCache(unittest.TestCase):
+    """Test content-addressed archive caching."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.test_dir = tempfile.mkdtemp()
+        self.cache = ArchiveCache(os.path.join(self.test_dir, "cache"), max_size_gb=1)
+        self.params = {'game_type': 'skyrim', 'dds': False, 'backend': 'bsarch:1:1'}
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.test_dir)
+
+    def write(self, name, content):
+        """Write a file in the test directory."""
+        path = os.path.join(self.test_dir, name)
+        with open(path, 'w') as f:
+            f.write(content)
+        return path
+
+    def test_key_depends_on_content_and_params(self):
+        """Test that keys change with file content and build flags only."""
+        mesh = self.write("a.nif", "mesh")
+        key = self.cache.make_key([("meshes/a.nif", mesh)], self.params)
+
+        self.assertEqual(key, self.cache.make_key([("Meshes\\A.nif", mesh)], self.params))
+        self.assertNotEqual(key, self.cache.make_key([("meshes/a.nif", mesh)], dict(self.params, dds=True)))
+
+        self.write("a.nif", "other mesh")
+        self.assertNotEqual(key, self.cache.make_key([("meshes/a.nif", mesh)], self.params))
+
+    def test_store_and_restore_chunked_archives(self):
+        """Test that restored archives follow the requested names and contents."""
+        archives = [self.write("Mod.bsa", "main"), self.write("Mod0.bsa", "chunk")]
+        self.cache.store("key1", archives)
+
+        restore_dir = os.path.join(self.test_dir, "restore")
+        os.makedirs(restore_dir)
+        restored = self.cache.restore("key1", lambda i: os.path.join(restore_dir, f"New{i}.bsa"))
+
+        self.assertEqual(len(restored), 2)
+        with open(restored[1]) as f:
+            self.assertEqual(f.read(), "chunk")
+        self.assertEqual(self.cache.stats()['hits'], 1)
+        self.assertIsNone(self.cache.restore("missing", lambda i: "unused"))
+
+    def test_prune_evicts_least_recently_used(self):
+        """Test LRU eviction when pruning to a smaller size."""
+        self.cache.store("old", [self.write("old.bsa", "x" * 100)])
+        self.cache.store("new", [self.write("new.bsa", "y" * 100)])
+        self.cache.restore("new", lambda i: os.path.join(self.test_dir, "restored.bsa"))
+
+        removed, freed = self.cache.prune(max_size_gb=150 / 1024 ** 3)
+
+        self.assertEqual((removed, freed), (1, 100))
+        self.assertIsNone(self.cache.restore("old", lambda i: os.path.join(self.test_dir, "x.bsa")))
+
+    def test_digests_survive_fresh_staging_dirs(self):
+        """Test that a staged copy in a new temp dir reuses the digest, saved once per run."""
+        first = self.write("run1.nif", "mesh")
+        key = self.cache.make_key([("meshes/a.nif", first)], self.params)
+        self.cache.store("key1", [self.write("Mod.bsa", "main")])
+        self.assertFalse(os.path.exists(self.cache.digest_file))
+        self.cache.save_digests()
+
+        second = os.path.join(self.test_dir, "run2.nif")
+        shutil.copy2(first, second)  # Next run stages the same file elsewhere
+        reloaded = ArchiveCache(self.cache.cache_dir, max_size_gb=1)
+        self.assertEqual(reloaded.make_key([("meshes/a.nif", second)], self.params), key)
+        self.assertEqual(reloaded.stats()['tracked_digests'], 1)
+
+    def test_size_limit_applies_at_runtime(self):
+        """Test that lowering the limit evicts immediately and caps later stores."""
+        self.cache.store("old", [self.write("old.bsa", "x" * 100)])
+        self.cache.set_max_size(150 / 1024 ** 3)
+        self.cache.store("new", [self.write("new.bsa", "y" * 100)])
+        self.assertEqual(self.cache.stats()['entries'], 1)
+        self.assertIsNone(self.cache.restore("old", lambda i: os.path.join(self.test_dir, "x.bsa")))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,156 @@
+"""Tests for concurrent archive job execution."""
+
+import unittest
+import tempfile
+import os
+import shutil
+import sys
+import threading
+from pathlib import Path
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from safe_resource_packer import archive_jobs
+from safe_resource_packer.archive_jobs import (
+    ArchiveJob, ArchiveJobExecutor, mark_reused, archive_build_slot, set_max_parallel_archives,
+    get_max_parallel_archives
+)
+
+
+class TestArchiveJobExecutor(unittest.TestCase):
+    """Test ArchiveJobExecutor ordering and failure handling."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.test_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.test_dir)
+
+    def make_job(self, name, fail=False):
+        """Create a job that writes its archive (and optionally fails afterwards)."""
+        path = os.path.join(self.test_dir, f"{name}.bsa")
+
+        def build(cancel_event):
+            with open(path, 'w') as f:
+                f.write(name)
+            if fail:
+                return False, "boom", []
+            return True, "ok", [path]
+
+        return ArchiveJob(name, path, build)
+
+    def test_results_follow_submission_order(self):
+        """Test that archives are returned in job order regardless of completion order."""
+        jobs = [self.make_job(f"chunk{i}") for i in range(6)]
+        success, message, archives = ArchiveJobExecutor(max_parallel=4).run(jobs)
+
+        self.assertTrue(success)
+        self.assertEqual(archives, [job.output_path for job in jobs])
+
+    def test_failure_removes_all_outputs(self):
+        """Test that one failing job fails the run and removes partial archives."""
+        jobs = [self.make_job("main"), self.make_job("textures", fail=True), self.make_job("extra")]
+        success, message, archives = ArchiveJobExecutor(max_parallel=2).run(jobs)
+
+        self.assertFalse(success)
+        self.assertIn("boom", message)
+        self.assertEqual(archives, [])
+        self.assertEqual(os.listdir(self.test_dir), [])
+
+    def test_sequential_failure_cancels_remaining(self):
+        """Test that jobs after a failure are not started when running one at a time."""
+        jobs = [self.make_job("first", fail=True), self.make_job("second")]
+        success, _, _ = ArchiveJobExecutor(max_parallel=1).run(jobs)
+
+        self.assertFalse(success)
+        self.assertTrue(jobs[1].cancelled)
+
+    def test_cleanup_keeps_files_the_jobs_did_not_write(self):
+        """Test that existing files at the outputs of unstarted or non-writing jobs survive a failure."""
+        previous = [os.path.join(self.test_dir, f"{name}.bsa") for name in ("early", "later")]
+        for path in previous:
+            with open(path, 'w') as f:
+                f.write("previous build")
+        early = ArchiveJob("early", previous[0], lambda cancel_event: (False, "BSArch missing", []))
+        later = ArchiveJob("later", previous[1], lambda cancel_event: (True, "ok", [previous[1]]))
+
+        success, _, _ = ArchiveJobExecutor(max_parallel=1).run([early, later])
+
+        self.assertFalse(success)
+        self.assertFalse(later.started)
+        self.assertEqual(sorted(os.listdir(self.test_dir)), ["early.bsa", "later.bsa"])
+
+    def test_reused_archives_survive_failure(self):
+        """Test that an archive kept from an earlier build is not removed when a sibling fails."""
+        kept = os.path.join(self.test_dir, "kept.bsa")
+        with open(kept, 'w') as f:
+            f.write("previous build")
+
+        def reuse(cancel_event):
+            mark_reused(kept)
+            return True, "Reused unchanged chunk", [kept]
+
+        jobs = [ArchiveJob("kept", kept, reuse), self.make_job("broken", fail=True)]
+        success, _, _ = ArchiveJobExecutor(max_parallel=1).run(jobs)
+
+        self.assertFalse(success)
+        self.assertEqual(os.listdir(self.test_dir), ["kept.bsa"])
+
+    def test_parent_cancel_reaches_nested_jobs(self):
+        """Test that cancelling the enclosing job's event cancels a nested executor's jobs."""
+        parent = threading.Event()
+        parent.set()
+        jobs = [self.make_job("chunk0"), self.make_job("chunk1")]
+
+        success, _, archives = ArchiveJobExecutor(max_parallel=2, cancel_event=parent).run(jobs)
+
+        self.assertFalse(success)
+        self.assertEqual(archives, [])
+        self.assertTrue(all(job.cancelled for job in jobs))
+
+    def test_build_slot_limit_is_configurable(self):
+        """Test that the process-wide BSArch limit follows set_max_parallel_archives."""
+        saved = get_max_parallel_archives()
+        running, peak, lock = [0], [0], threading.Lock()
+
+        def build():
+            with archive_build_slot() as acquired:
+                self.assertTrue(acquired)
+                with lock:
+                    running[0] += 1
+                    peak[0] = max(peak[0], running[0])
+                threading.Event().wait(0.1)
+                with lock:
+                    running[0] -= 1
+
+        try:
+            set_max_parallel_archives(3)
+            threads = [threading.Thread(target=build) for _ in range(6)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            self.assertEqual(peak[0], 3)
+            self.assertEqual(ArchiveJobExecutor().max_parallel, 3)
+        finally:
+            set_max_parallel_archives(saved)
+
+    def test_reused_archives_are_forgotten_after_the_build(self):
+        """Test that the outermost executor drops the reuse protection of its archives."""
+        path = os.path.join(self.test_dir, "reused.bsa")
+        with open(path, 'w') as f:
+            f.write("chunk")
+
+        def reuse(cancel_event):
+            mark_reused(path)
+            return True, "Reused", [path]
+
+        ArchiveJobExecutor().run([ArchiveJob("reused", path, reuse)])
+        self.assertNotIn(os.path.abspath(path), archive_jobs._reused_archives)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+"""Tests for background deletion of temp trees."""
+
+import unittest
+import tempfile
+import shutil
+import os
+import sys
+from pathlib import Path
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from safe_resource_packer.background_delete import BackgroundDeleter, remove_tree_parallel
+
+
+class TestBackgroundDeleter(unittest.TestCase):
+    """Test tombstoning and parallel deletion."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.tree = os.path.join(self.temp_dir, 'srp_source_x')
+        for folder in ('meshes', 'textures/armor'):
+            os.makedirs(os.path.join(self.tree, folder))
+            for index in range(20):
+                with open(os.path.join(self.tree, folder, f"{index}.bin"), 'wb') as f:
+                    f.write(b'x')
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_discard_returns_immediately_and_deletes(self):
+        """Test that the tree vanishes at once and its tombstone is deleted in the background."""
+        deleter = BackgroundDeleter(workers=4, wait_at_exit=True)
+        tombstone = deleter.discard(self.tree)
+        self.assertFalse(os.path.exists(self.tree))
+        self.assertEqual(os.path.dirname(tombstone), self.temp_dir)
+
+        self.assertTrue(deleter.wait(timeout=30))
+        self.assertFalse(os.path.exists(tombstone))
+        self.assertEqual(os.listdir(self.temp_dir), [])
+
+    def test_parallel_removal_keeps_link_targets(self):
+        """Test that linked directories are unlinked, not emptied."""
+        outside = os.path.join(self.temp_dir, 'outside')
+        os.makedirs(outside)
+        with open(os.path.join(outside, 'keep.txt'), 'w') as f:
+            f.write('keep')
+        os.symlink(outside, os.path.join(self.tree, 'link'))
+
+        self.assertEqual(remove_tree_parallel(self.tree, workers=4), 41)
+        self.assertFalse(os.path.exists(self.tree))
+        self.assertTrue(os.path.exists(os.path.join(outside, 'keep.txt')))
+
+
+if __name__ == '__main__':
+    unittest.main()
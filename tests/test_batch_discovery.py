@@ -0,0 +1,78 @@
+"""Tests for parallel mod discovery in BatchModRepacker."""
+
+import unittest
+import tempfile
+import os
+import shutil
+import sys
+from pathlib import Path
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from safe_resource_packer.batch_repacker import BatchModRepacker
+from safe_resource_packer.discovery_cache import DiscoveryCache
+
+
+class TestModDiscovery(unittest.TestCase):
+    """Test discovery results, ordering and streaming."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.collection = tempfile.mkdtemp()
+        for index, name in enumerate(['ModA', 'ModB', 'ModC']):
+            mod_dir = os.path.join(self.collection, name)
+            os.makedirs(os.path.join(mod_dir, 'textures', 'sub'))
+            os.makedirs(os.path.join(mod_dir, 'extras', 'nested'))
+            with open(os.path.join(mod_dir, f'{name}.esp'), 'wb') as f:
+                f.write(b'TES4')
+            with open(os.path.join(mod_dir, 'textures', 'sub', 'a.dds'), 'wb') as f:
+                f.write(b'x' * 100 * (index + 1))
+            with open(os.path.join(mod_dir, 'extras', 'nested', 'notes.nif'), 'wb') as f:
+                f.write(b'y' * 10)
+        os.makedirs(os.path.join(self.collection, 'NotAMod'))
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.collection, ignore_errors=True)
+
+    def test_discover_mods_keeps_listing_order_and_sizes(self):
+        """Test that parallel discovery matches the folder listing and walk sizes."""
+        repacker = BatchModRepacker(threads=4)
+        mods = repacker.discover_mods(self.collection)
+
+        expected = [item for item in os.listdir(self.collection) if item != 'NotAMod']
+        self.assertEqual([mod.mod_name for mod in mods], expected)
+
+        mod_a = next(mod for mod in mods if mod.mod_name == 'ModA')
+        self.assertEqual(mod_a.asset_size, 110)
+        self.assertEqual(mod_a.texture_size, 100)
+        # 'textures' is a known game folder; 'extras' has no assets directly inside it
+        self.assertEqual([os.path.basename(folder) for folder in mod_a.available_folders], ['textures'])
+
+    def test_iter_discover_mods_streams_every_mod(self):
+        """Test that streaming discovery yields every mod exactly once."""
+        repacker = BatchModRepacker(threads=2)
+        names = sorted(mod.mod_name for mod in repacker.iter_discover_mods(self.collection))
+        self.assertEqual(names, ['ModA', 'ModB', 'ModC'])
+
+    def test_cached_discovery_matches_fresh_walk(self):
+        """Test that a second discovery reuses the cache and returns the same mods."""
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir, True)
+        repacker = BatchModRepacker(threads=2)
+        repacker._discovery_cache = DiscoveryCache(cache_dir)
+        fresh = {mod.mod_name: (mod.asset_files, mod.available_folders, mod.available_plugins)
+                 for mod in repacker.discover_mods(self.collection)}
+
+        again = BatchModRepacker(threads=2)
+        again._discovery_cache = DiscoveryCache(cache_dir)
+        cached = {mod.mod_name: (mod.asset_files, mod.available_folders, mod.available_plugins)
+                  for mod in again.discover_mods(self.collection)}
+
+        self.assertEqual(again._discovery_cache.hits, 4)
+        self.assertEqual(cached, fresh)
+
+
+if __name__ == '__main__':
+    unittest.main()
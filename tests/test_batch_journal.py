@@ -0,0 +1,86 @@
+"""Tests for the batch repack journal."""
+
+import unittest
+import tempfile
+import shutil
+import os
+import sys
+import json
+import socket
+from pathlib import Path
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from safe_resource_packer.batch_journal import BatchJournal, MOD_PENDING, MOD_IN_PROGRESS, JOURNAL_FILE_NAME, TEMP_PREFIX
+
+
+class TestBatchJournal(unittest.TestCase):
+    """Test resuming and cleaning up after an interrupted batch."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.output_dir = os.path.join(self.temp_dir, 'out')
+        self.mods = [os.path.join(self.temp_dir, 'coll', name) for name in ('ModA', 'ModB', 'ModC')]
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def write_package(self, name, content=b'7z'):
+        path = os.path.join(self.output_dir, name)
+        with open(path, 'wb') as f:
+            f.write(content)
+        return path
+
+    def test_resume_after_crash(self):
+        """Test that finished mods are kept and the interrupted run's leftovers are removed."""
+        journal = BatchJournal(self.output_dir)
+        journal.start('coll')
+        finished = self.write_package('ModA.7z')
+        journal.mark_done(self.mods[0], finished)
+
+        # ModB crashed while staging, ModC while writing its package
+        staging = tempfile.mkdtemp(prefix=journal.temp_prefix('ModB'))
+        journal.mark(self.mods[1], MOD_IN_PROGRESS, step='stage_assets', temp_dir=None)
+        partial = self.write_package('ModC.7z')
+        journal.mark(self.mods[2], MOD_PENDING)
+        journal.mark(self.mods[2], MOD_IN_PROGRESS, step='compress_package', output=partial)
+        journal._file.close()  # Simulated crash: no orderly close
+
+        resumed = BatchJournal(self.output_dir)
+        removed = resumed.start('coll', resume=True)
+        self.assertEqual(removed, 2)
+        self.assertFalse(os.path.exists(staging))
+        self.assertFalse(os.path.exists(partial))
+        self.assertEqual(resumed.finished_output(self.mods[0]), finished)
+        self.assertIsNone(resumed.finished_output(self.mods[1]))
+        resumed.close()
+
+        # A changed package is rebuilt, and a fresh run forgets everything
+        self.write_package('ModA.7z', b'modified')
+        again = BatchJournal(self.output_dir)
+        again.start('coll', resume=True)
+        self.assertIsNone(again.finished_output(self.mods[0]))
+        again.close()
+
+    def test_live_run_is_not_collected(self):
+        """Test that a run whose process is still alive keeps its temp files."""
+        staging = tempfile.mkdtemp(prefix=f"{TEMP_PREFIX}ModA_live_")
+        self.addCleanup(shutil.rmtree, staging, ignore_errors=True)
+        os.makedirs(self.output_dir)
+        with open(os.path.join(self.output_dir, JOURNAL_FILE_NAME), 'w', encoding='utf-8') as f:
+            f.write(json.dumps({'type': 'run', 'version': 1, 'run_id': 'live',
+                                'pid': os.getppid(), 'host': socket.gethostname()}) + "\n")
+            f.write(json.dumps({'type': 'mod', 'mod': BatchJournal.mod_key(self.mods[0]),
+                                'state': MOD_IN_PROGRESS, 'temp_dir': staging}) + "\n")
+
+        journal = BatchJournal(self.output_dir)
+        self.assertEqual(journal.start('coll'), 0)
+        self.assertTrue(os.path.isdir(staging))
+        journal.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
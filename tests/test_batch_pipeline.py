@@ -0,0 +1,59 @@
+"""End-to-end test of a mod going through the batch stage pipeline."""
+
+import unittest
+import tempfile
+import os
+import shutil
+import sys
+from pathlib import Path
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from safe_resource_packer.batch_repacker import BatchModRepacker
+from safe_resource_packer.bsarch_service import BSArchService
+from safe_resource_packer.packaging.compression_service import is_7z_available
+
+
+def _tools_available():
+    return is_7z_available() and BSArchService().is_available(interactive=False)[0]
+
+
+@unittest.skipUnless(_tools_available(), "BSArch and 7z are required to build packages")
+class TestBatchPipeline(unittest.TestCase):
+    """Test that a mod is staged, archived and compressed into its final package."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.collection = os.path.join(self.temp_dir, 'collection')
+        self.output = os.path.join(self.temp_dir, 'output')
+        mod_dir = os.path.join(self.collection, 'ModA')
+        os.makedirs(os.path.join(mod_dir, 'meshes', 'armor'))
+        with open(os.path.join(mod_dir, 'ModA.esp'), 'wb') as f:
+            f.write(b'TES4')
+        with open(os.path.join(mod_dir, 'readme.txt'), 'w') as f:
+            f.write('ModA')
+        for index in range(3):
+            with open(os.path.join(mod_dir, 'meshes', 'armor', f'part{index}.nif'), 'wb') as f:
+                f.write(os.urandom(2048))
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_mod_reaches_final_package(self):
+        """Test that one mod runs through every pipeline stage into a 7z package."""
+        repacker = BatchModRepacker(threads=2)
+        results = repacker.process_mod_collection(self.collection, self.output)
+
+        self.assertEqual((results['processed'], results['failed']), (1, 0), results['failed_mods'])
+        mod_info, package_path = results['processed_mods'][0]
+        self.assertEqual(package_path, repacker._batch_repack_package_path(mod_info, self.output))
+        self.assertTrue(os.path.isfile(package_path))
+        self.assertGreater(os.path.getsize(package_path), 0)
+        self.assertEqual(set(repacker.last_pipeline.utilization()), {'stage', 'archive', 'compress'})
+
+
+if __name__ == '__main__':
+    unittest.main()
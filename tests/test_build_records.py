@@ -0,0 +1,72 @@
+"""Tests for incremental build records."""
+
+import unittest
+import tempfile
+import shutil
+import os
+import sys
+from pathlib import Path
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from safe_resource_packer.build_records import BuildRecords, input_fingerprint
+from safe_resource_packer.utils import file_hash
+
+
+class TestBuildRecords(unittest.TestCase):
+    """Test input fingerprints and package up-to-date checks."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.mod_dir = os.path.join(self.temp_dir, 'MyMod')
+        self.output_dir = os.path.join(self.temp_dir, 'out')
+        os.makedirs(os.path.join(self.mod_dir, 'meshes'))
+        os.makedirs(self.output_dir)
+        self.files = [os.path.join(self.mod_dir, 'MyMod.esp'), os.path.join(self.mod_dir, 'meshes', 'a.nif')]
+        for path in self.files:
+            with open(path, 'w') as f:
+                f.write(os.path.basename(path))
+        self.package = os.path.join(self.output_dir, 'MyMod_v1.0_Repacked.7z')
+        with open(self.package, 'wb') as f:
+            f.write(b'7z')
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def fingerprint(self, settings=None):
+        return input_fingerprint(self.files, self.mod_dir, settings or {'game_type': 'skyrim'}, file_hash)
+
+    def test_fingerprint_tracks_content_and_settings(self):
+        """Test that edits and setting changes alter the fingerprint."""
+        original = self.fingerprint()
+        self.assertEqual(original, self.fingerprint())
+        self.assertNotEqual(original, self.fingerprint({'game_type': 'fallout4'}))
+
+        with open(self.files[1], 'w') as f:
+            f.write('changed')
+        self.assertNotEqual(original, self.fingerprint())
+
+    def test_up_to_date_survives_reload(self):
+        """Test that recorded packages stay up to date until inputs or the package change."""
+        fingerprint = self.fingerprint()
+        records = BuildRecords(self.output_dir)
+        self.assertFalse(records.is_up_to_date(self.package, fingerprint))
+
+        records.record(self.package, fingerprint, 'MyMod')
+        reloaded = BuildRecords(self.output_dir)
+        self.assertTrue(reloaded.is_up_to_date(self.package, fingerprint))
+        self.assertFalse(reloaded.is_up_to_date(self.package, self.fingerprint({'game_type': 'fallout4'})))
+
+        with open(self.package, 'ab') as f:
+            f.write(b'tampered')
+        self.assertFalse(reloaded.is_up_to_date(self.package, fingerprint))
+
+        reloaded.forget(self.package)
+        self.assertFalse(BuildRecords(self.output_dir).is_up_to_date(self.package, fingerprint))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,185 @@
+"""Tests for BSA chunk planning."""
+
+import unittest
+import tempfile
+import os
+import shutil
+import sys
+from pathlib import Path
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from safe_resource_packer import archive_cache
+from safe_resource_packer.archive_cache import ArchiveCache
+from safe_resource_packer.bsarch_service import BSArchService
+from safe_resource_packer.chunk_manifest import ChunkManifestStore
+from safe_resource_packer.chunk_planner import ChunkPlanner, CompressionRatioModel, FILE_RECORD_OVERHEAD
+
+
+class TestChunkPlanner(unittest.TestCase):
+    """Test first-fit-decreasing chunk planning."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.planner = ChunkPlanner(model=CompressionRatioModel(), fill_target=1.0, compressed=False)
+        self.unit = 1000 - FILE_RECORD_OVERHEAD  # Predicts to exactly 1000 bytes
+
+    def test_first_fit_fills_gaps(self):
+        """Test that small files fill gaps left in earlier chunks."""
+        sizes = [6, 5, 4, 3, 2]  # Next-fit would need 3 chunks of 10
+        file_info = [(f"meshes/f{i}.nif", s * 1000 - FILE_RECORD_OVERHEAD) for i, s in enumerate(sizes)]
+        chunks = self.planner.plan(file_info, 10000)
+
+        self.assertEqual(len(chunks), 2)
+        self.assertEqual(sorted(sum(chunks, [])), sorted(path for path, _ in file_info))
+
+    def test_oversized_file_gets_own_chunk(self):
+        """Test that a file larger than the limit is isolated."""
+        file_info = [("meshes/big.nif", 50000), ("meshes/small.nif", self.unit)]
+        chunks = self.planner.plan(file_info, 10000)
+
+        self.assertIn(["meshes/big.nif"], chunks)
+        self.assertEqual(len(chunks), 2)
+
+    def test_plan_is_deterministic(self):
+        """Test that input order does not change the plan."""
+        file_info = [(f"meshes/f{i}.nif", self.unit) for i in range(25)]
+        first = self.planner.plan(file_info, 10000)
+        second = self.planner.plan(list(reversed(file_info)), 10000)
+
+        self.assertEqual(first, second)
+
+    def test_previous_assignment_is_kept(self):
+        """Test that adding a file leaves previously assigned chunks untouched."""
+        file_info = [(f"meshes/f{i:02d}.nif", self.unit) for i in range(25)]
+        first = self.planner.plan(file_info, 10000)
+        assignment = {path: index for index, chunk in enumerate(first) for path in chunk}
+
+        file_info.append(("meshes/new.nif", self.unit))
+        second = self.planner.plan(file_info, 10000, previous_assignment=assignment)
+
+        changed = [i for i, chunk in enumerate(first) if sorted(chunk) != sorted(second[i])]
+        self.assertEqual(len(changed), 1)
+        self.assertIn("meshes/new.nif", second[changed[0]])
+
+    def test_split_oversized_chunk(self):
+        """Test that an oversized chunk is split into pieces sized by the actual archive."""
+        file_info = [(f"meshes/f{i}.nif", self.unit) for i in range(10)]
+        pieces = self.planner.split(file_info, 10000, actual_size=25000)
+
+        self.assertEqual(len(pieces), 3)
+        self.assertEqual(sorted(sum(pieces, [])), sorted(path for path, _ in file_info))
+        # Barely over the limit still yields two pieces
+        self.assertEqual(len(self.planner.split(file_info, 10000, actual_size=10001)), 2)
+
+
+class TestChunkManifest(unittest.TestCase):
+    """Test chunk manifest digests and reuse."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.test_dir = tempfile.mkdtemp()
+        self.saved_cache = archive_cache._archive_cache
+        archive_cache._archive_cache = ArchiveCache(os.path.join(self.test_dir, "cache"))
+        self.store = ChunkManifestStore(os.path.join(self.test_dir, "manifests"))
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        archive_cache._archive_cache = self.saved_cache
+        shutil.rmtree(self.test_dir)
+
+    def write(self, name, content):
+        """Write a file in the test directory."""
+        path = os.path.join(self.test_dir, name)
+        with open(path, 'w') as f:
+            f.write(content)
+        return path
+
+    def test_manifests_are_scoped_by_source(self):
+        """Test that same-named archive sets of different mods keep separate manifests."""
+        mesh = self.write("a.nif", "mesh")
+        archive = self.write("Mod.bsa", "archive")
+
+        manifest = self.store.load("skyrim", "tmp1/Mod", source_path="mods/A")
+        digests = manifest.digest_files([("a.nif", mesh)])
+        manifest.update([["a.nif"]], digests, [archive])
+        self.store.save("skyrim", "tmp1/Mod", manifest, source_path="mods/A")
+
+        self.assertEqual(self.store.load("skyrim", "tmp2/Mod", source_path="mods/A").assignment(), {"a.nif": 0})
+        self.assertEqual(self.store.load("skyrim", "tmp2/Mod", source_path="other/A").assignment(), {})
+        self.assertEqual(self.store.load("skyrim", "tmp1/Mod").assignment(), {})
+
+    def test_unchanged_chunk_is_restored_from_cache(self):
+        """Test that a chunk is rebuilt only when its contents change, even after the output was deleted."""
+        mesh = self.write("a.nif", "mesh")
+        output = os.path.join(self.test_dir, "Mod.bsa")
+        builds = []
+
+        def build(cancel_event):
+            builds.append(output)
+            with open(output, 'w') as f:
+                f.write("archive %d" % len(builds))
+            return True, "Built", [output]
+
+        service = BSArchService()
+        key = archive_cache.get_archive_cache().make_key([("a.nif", mesh)], {'chunk': True})
+        service._make_cached_chunk_build(build, key, output, 0)(None)
+        os.remove(output)  # The package step deletes built chunks
+        service._make_cached_chunk_build(build, key, output, 0)(None)
+        self.assertEqual(len(builds), 1)
+        with open(output) as f:
+            self.assertEqual(f.read(), "archive 1")
+
+        self.write("a.nif", "changed mesh")
+        key = archive_cache.get_archive_cache().make_key([("a.nif", mesh)], {'chunk': True})
+        service._make_cached_chunk_build(build, key, output, 0)(None)
+        self.assertEqual(len(builds), 2)
+
+
+class TestCompressionRatioModel(unittest.TestCase):
+    """Test compression ratio calibration."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.test_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.test_dir)
+
+    def test_calibration_uses_sampled_data(self):
+        """Test that highly compressible files calibrate to a low ratio."""
+        path = os.path.join(self.test_dir, "data.txt")
+        with open(path, 'w') as f:
+            f.write("a" * 100000)
+
+        model = CompressionRatioModel()
+        model.calibrate([(path, 100000)])
+
+        self.assertLess(model.ratio_for(path), 0.1)
+        self.assertLess(model.predict_size(path, 100000), 100000)
+
+    def test_later_samples_and_corrections_update_ratio(self):
+        """Test that new files move the ratio and correct() raises predictions."""
+        text = os.path.join(self.test_dir, "a.txt")
+        noise = os.path.join(self.test_dir, "b.txt")
+        with open(text, 'w') as f:
+            f.write("a" * 100000)
+        with open(noise, 'wb') as f:
+            f.write(os.urandom(100000))
+
+        model = CompressionRatioModel()
+        model.calibrate([(text, 100000)])
+        first = model.ratio_for(text)
+        model.calibrate([(text, 100000), (noise, 100000)])
+        self.assertGreater(model.ratio_for(text), first + 0.3)
+
+        before = model.predict_size(text, 100000)
+        model.correct(1.5)
+        model.correct(0.5)  # Never scales predictions down
+        self.assertGreater(model.predict_size(text, 100000), before * 1.4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,181 @@
+"""Tests for 7z package entry planning and compression profiles."""
+
+import unittest
+import tempfile
+import os
+import struct
+import shutil
+import sys
+from pathlib import Path
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from safe_resource_packer.packaging.compression_service import CompressionService, SevenZipThreadBudget, is_7z_available
+from safe_resource_packer.packaging.compression_profiles import get_compression_profile
+
+
+class TestPackageEntries(unittest.TestCase):
+    """Test zero-copy package entry planning and link staging."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.test_dir = tempfile.mkdtemp()
+        self.service = CompressionService()
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.test_dir)
+
+    def write(self, rel_path, content="data"):
+        """Write a file in the test directory."""
+        path = os.path.join(self.test_dir, rel_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as f:
+            f.write(content)
+        return path
+
+    def test_same_named_entries_are_read_in_place(self):
+        """Test that only renamed or nested entries are staged."""
+        bsa = self.write("temp/Mod.bsa")
+        plugin = self.write("mod/mod.esp")
+        readme = self.write("mod/readme.txt")
+
+        direct, staged = self.service._plan_entries([
+            (bsa, "Mod.bsa"), (plugin, "Mod.esp"), (readme, "docs/readme.txt")
+        ])
+
+        self.assertEqual(direct, [os.path.abspath(bsa)])
+        self.assertEqual([name for _, name in staged], ["Mod.esp", "docs/readme.txt"])
+
+    def test_folders_merging_with_staged_entries_are_staged(self):
+        """Test that a folder sharing a top-level name with nested entries is merged by staging."""
+        loose = os.path.dirname(self.write("loose/SKSE/Plugins/a.dll"))
+        extra = self.write("blacklisted/SKSE/Plugins/b.dll")
+
+        direct, staged = self.service._plan_entries([
+            (os.path.dirname(loose), "SKSE"), (extra, "SKSE/Plugins/b.dll")
+        ])
+
+        self.assertEqual(direct, [])
+        self.assertEqual(len(staged), 2)
+
+    def test_link_staging_does_not_copy(self):
+        """Test that staged folders are hardlinked rather than copied."""
+        source = self.write("mod/Scripts/a.pex", "x" * 1000)
+        target = os.path.join(self.test_dir, "stage", "Scripts")
+
+        copied = self.service._link_into(os.path.dirname(source), target)
+
+        self.assertEqual(copied, 0)
+        self.assertTrue(os.path.samefile(source, os.path.join(target, "a.pex")))
+
+    @unittest.skipUnless(is_7z_available(), "7z is required to build packages")
+    def test_existing_package_is_replaced_not_appended(self):
+        """Test that groups are built aside and replace a stale package only on success."""
+        package = self.write("out/Mod.7z", "not a 7z archive")
+        entries = [(self.write("mod/Mod.esp"), "Mod.esp"), (self.write("mod/Mod.bsa"), "Mod.bsa")]
+
+        success, message = self.service.compress_entries(entries, package)
+
+        self.assertTrue(success, message)
+        self.assertEqual(os.listdir(os.path.dirname(package)), ["Mod.7z"])
+        self.assertTrue(self.service.get_archive_info(package)[0])
+
+
+class TestCompressionProfiles(unittest.TestCase):
+    """Test grouping of package entries by compression profile."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.test_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.test_dir)
+
+    def write(self, rel_path, size):
+        """Write a file of the given size in the test directory."""
+        path = os.path.join(self.test_dir, rel_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(b"x" * size)
+        return path
+
+    def test_entries_grouped_by_type_largest_last(self):
+        """Test that archives are stored separately and the largest group is added last."""
+        bsa = self.write("Mod.bsa", 5000)
+        plugin = self.write("Mod.esp", 100)
+        scripts = os.path.dirname(self.write("Scripts/a.pex", 10))
+
+        groups = get_compression_profile('balanced').split_entries(
+            [(bsa, "Mod.bsa"), (plugin, "Mod.esp"), (scripts, "Scripts")]
+        )
+
+        self.assertEqual([group.name for group, _ in groups], ["text", "precompressed"])
+        self.assertIn((scripts, "Scripts"), groups[0][1])
+        self.assertIn('-mx0', groups[1][0].switches)
+
+    def test_mixed_folder_is_expanded(self):
+        """Test that a folder with mixed file types is split per file."""
+        self.write("SKSE/Plugins/a.dll", 10)
+        self.write("SKSE/Plugins/a.ini", 10)
+
+        groups = dict((group.name, entries) for group, entries in get_compression_profile('balanced').split_entries(
+            [(os.path.join(self.test_dir, "SKSE"), "SKSE")]
+        ))
+
+        self.assertEqual([name for _, name in groups['text']], ["SKSE/Plugins/a.ini"])
+        self.assertEqual([name for _, name in groups['other']], ["SKSE/Plugins/a.dll"])
+
+    def test_uniform_profile_uses_run_level(self):
+        """Test that the uniform profile keeps a single group at the run's level."""
+        profile = get_compression_profile('uniform')
+        groups = profile.split_entries([(self.write("Mod.bsa", 10), "Mod.bsa")])
+
+        self.assertEqual(len(groups), 1)
+        self.assertEqual(profile.switches_for(groups[0][0], 7), ['-mx7'])
+        self.assertIs(get_compression_profile(), profile)  # Content-aware profiles are opt-in
+
+    def test_only_block_compressed_dds_is_packed_fast(self):
+        """Test that BC7 textures take the fast path and uncompressed DDS keeps the run level."""
+        def dds(rel_path, four_cc, dxgi_format=0):
+            path = os.path.join(self.test_dir, rel_path)
+            header = bytearray(148)
+            header[:4] = b'DDS '
+            header[84:88] = four_cc
+            header[128:132] = struct.pack('<I', dxgi_format)
+            with open(path, 'wb') as f:
+                f.write(bytes(header))
+            return path
+
+        bc7 = dds("bc7.dds", b'DX10', 98)
+        rgba = dds("rgba.dds", b'\0\0\0\0')
+        groups = dict((group.name, [name for _, name in entries]) for group, entries in
+                      get_compression_profile('balanced').split_entries([(bc7, "bc7.dds"), (rgba, "rgba.dds")]))
+
+        self.assertEqual(groups, {'textures': ["bc7.dds"], 'other': ["rgba.dds"]})
+
+
+class TestSevenZipThreadBudget(unittest.TestCase):
+    """Test sharing of 7z threads between concurrent runs."""
+
+    def test_concurrent_runs_share_threads(self):
+        """Test that expected concurrent runs split the budget instead of each taking it all."""
+        budget = SevenZipThreadBudget(total_threads=8)
+
+        self.assertEqual(budget.acquire(), 8)
+        budget.release(8)
+
+        with budget.expect_concurrent(3):
+            grants = [budget.acquire() for _ in range(3)]
+        self.assertEqual(grants, [2, 2, 2])
+        self.assertLessEqual(sum(grants), 8)
+
+        for threads in grants:
+            budget.release(threads)
+        self.assertEqual(budget.acquire(), 8)
+
+
+if __name__ == '__main__':
+    unittest.main()
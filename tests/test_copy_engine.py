@@ -0,0 +1,77 @@
+"""Tests for the parallel copy engine."""
+
+import unittest
+import tempfile
+import shutil
+import os
+import sys
+from pathlib import Path
+from unittest import mock
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from safe_resource_packer.copy_engine import ParallelCopier, copy_workers_for, STORAGE_WORKERS
+
+
+class TestParallelCopier(unittest.TestCase):
+    """Test batched parallel copying."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.source = os.path.join(self.temp_dir, 'Data')
+        for folder in ('meshes/armor', 'textures'):
+            os.makedirs(os.path.join(self.source, folder))
+            for index in range(10):
+                with open(os.path.join(self.source, folder, f"{index}.dds"), 'w') as f:
+                    f.write(f"{folder}/{index}")
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_copy_trees_with_batched_progress(self):
+        """Test that every file is copied and progress arrives per batch."""
+        updates = []
+        copier = ParallelCopier(workers=4, batch_size=3, progress_callback=lambda *args: updates.append(args))
+        dest = os.path.join(self.temp_dir, 'temp')
+        pairs = [(os.path.join(self.source, d), os.path.join(dest, d)) for d in ('meshes', 'textures', 'missing')]
+        result = copier.copy_trees(pairs)
+
+        self.assertEqual((result.copied, result.failed), (20, 0))
+        self.assertEqual(sum(copied for copied, _, _ in updates), 20)
+        self.assertLess(len(updates), 20)
+        with open(os.path.join(dest, 'meshes', 'armor', '7.dds')) as f:
+            self.assertEqual(f.read(), 'meshes/armor/7')
+        self.assertFalse(os.path.exists(os.path.join(dest, 'missing')))
+
+    def test_failures_are_aggregated(self):
+        """Test that failed files are counted instead of aborting the copy."""
+        os.symlink(os.path.join(self.temp_dir, 'gone.dds'), os.path.join(self.source, 'textures', 'broken.dds'))
+        result = ParallelCopier(workers=2).copy_trees([(self.source, os.path.join(self.temp_dir, 'temp'))])
+        self.assertEqual((result.copied, result.failed), (20, 1))
+        self.assertTrue(result.errors[0][0].endswith('broken.dds'))
+
+    def test_unexpected_error_fails_only_that_file(self):
+        """Test that a non-OS error is recorded per file and the batch continues."""
+        real_copy = shutil.copy2
+
+        def copy2(src, dst):
+            if src.endswith(os.path.join('textures', '3.dds')):
+                raise ValueError("bad name")
+            return real_copy(src, dst)
+
+        with mock.patch('safe_resource_packer.copy_engine.shutil.copy2', side_effect=copy2):
+            result = ParallelCopier(workers=1, batch_size=50).copy_trees([(self.source, os.path.join(self.temp_dir, 'temp'))])
+        self.assertEqual((result.copied, result.failed), (19, 1))
+        self.assertEqual(result.errors[0][1], "bad name")
+
+    def test_worker_count_defaults(self):
+        """Test that unknown storage gets the default pool size."""
+        self.assertGreaterEqual(copy_workers_for(self.source), STORAGE_WORKERS['hdd'])
+        self.assertEqual(copy_workers_for(), STORAGE_WORKERS['unknown'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+"""Tests for the mod discovery cache."""
+
+import unittest
+import tempfile
+import os
+import shutil
+import sys
+from pathlib import Path
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from safe_resource_packer.discovery_cache import DiscoveryCache
+
+
+class TestDiscoveryCache(unittest.TestCase):
+    """Test fingerprints and persisted entries."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.cache_dir = tempfile.mkdtemp()
+        self.mod_dir = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.mod_dir, 'meshes'))
+        self.asset = os.path.join(self.mod_dir, 'meshes', 'a.nif')
+        with open(self.asset, 'wb') as f:
+            f.write(b'mesh')
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+        shutil.rmtree(self.mod_dir, ignore_errors=True)
+
+    def test_hit_after_reload_and_miss_after_new_file(self):
+        """Test that entries survive a reload and adding a file invalidates them."""
+        cache = DiscoveryCache(self.cache_dir)
+        fingerprint = cache.fingerprint(self.mod_dir)
+        cache.put(self.mod_dir, fingerprint, 'skyrim', {'assets': ['meshes/a.nif']})
+        cache.save()
+
+        reloaded = DiscoveryCache(self.cache_dir)
+        entry = reloaded.get(self.mod_dir, reloaded.fingerprint(self.mod_dir), 'skyrim')
+        self.assertEqual(entry['mod'], {'assets': ['meshes/a.nif']})
+        self.assertIsNone(reloaded.get(self.mod_dir, fingerprint, 'fallout4'))
+
+        with open(os.path.join(self.mod_dir, 'meshes', 'b.nif'), 'wb') as f:
+            f.write(b'new')
+        self.assertNotEqual(reloaded.fingerprint(self.mod_dir), fingerprint)
+
+    def test_full_digest_detects_in_place_edit(self):
+        """Test that only the full digest notices a file rewritten in place."""
+        cheap = DiscoveryCache(self.cache_dir)
+        full = DiscoveryCache(self.cache_dir, full_digest=True)
+        cheap_before, full_before = cheap.fingerprint(self.mod_dir), full.fingerprint(self.mod_dir)
+
+        with open(self.asset, 'ab') as f:
+            f.write(b' grown')
+
+        self.assertEqual(cheap.fingerprint(self.mod_dir), cheap_before)
+        self.assertNotEqual(full.fingerprint(self.mod_dir), full_before)
+
+
+if __name__ == '__main__':
+    unittest.main()
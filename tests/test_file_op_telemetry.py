@@ -0,0 +1,66 @@
+"""Tests for aggregated file operation telemetry."""
+
+import unittest
+import tempfile
+import shutil
+import sys
+from pathlib import Path
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from safe_resource_packer import logging_service
+from safe_resource_packer.file_op_telemetry import FileOpTelemetry
+
+
+class TestFileOpTelemetry(unittest.TestCase):
+    """Test aggregation, sampling and summaries."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.service = logging_service.initialize_logging(self.temp_dir, 'telemetry')
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.service.close()
+        logging_service._global_log_service = None
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def read_log(self, name):
+        self.service.close()
+        return (Path(self.service.get_log_directory()) / name).read_text(encoding='utf-8')
+
+    def test_only_errors_and_samples_are_logged(self):
+        """Test that successes are aggregated and only sampled ones are written."""
+        telemetry = FileOpTelemetry(sample_every=1000, summary_interval=3600)
+        for index in range(2500):
+            telemetry.record('copy', f"src/{index}.dds", f"dst/{index}.dds", size=4096, latency=0.002, stage='Selective Copy')
+        telemetry.record('copy', 'src/locked.dds', 'dst/locked.dds', latency=0.5, error='Permission denied', stage='Selective Copy')
+
+        summary = telemetry.summary('Selective Copy')['Selective Copy:copy']
+        self.assertEqual((summary['count'], summary['errors'], summary['bytes']), (2501, 1, 2500 * 4096))
+        self.assertEqual(summary['size_p50_bytes'], 8192)
+        self.assertLessEqual(summary['latency_p50_ms'], 4.096)
+        self.assertGreaterEqual(summary['latency_max_ms'], 500)
+
+        file_ops = self.read_log('file_operations.log')
+        self.assertEqual(file_ops.count('FILE COPY_SAMPLED'), 3)
+        self.assertEqual(file_ops.count('Permission denied'), 1)
+        self.assertNotIn('src/5.dds', file_ops)
+
+    def test_flush_emits_stage_summaries(self):
+        """Test that a flush writes one summary per stage and operation."""
+        telemetry = FileOpTelemetry(sample_every=0, summary_interval=3600)
+        telemetry.record('copy', size=10, latency=0.001, stage='classify')
+        telemetry.record('move', size=10, stage='classify')
+        telemetry.flush()
+        telemetry.flush()  # Nothing new: no second summary
+
+        performance = self.read_log('performance.log')
+        self.assertEqual(performance.count('PERFORMANCE METRIC: file_ops:classify:copy'), 1)
+        self.assertEqual(performance.count('PERFORMANCE METRIC: file_ops:classify:move'), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
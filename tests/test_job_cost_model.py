@@ -0,0 +1,76 @@
+"""Tests for the batch job cost model."""
+
+import unittest
+import tempfile
+import shutil
+import sys
+from pathlib import Path
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from safe_resource_packer.job_cost_model import ModCostModel
+
+
+class FakeMod:
+    """Minimal stand-in for ModInfo cost features."""
+
+    def __init__(self, name, size, files=10, texture_size=0):
+        self.mod_name = name
+        self.asset_size = size
+        self.asset_files = ['f'] * files
+        self.texture_size = texture_size
+
+
+class TestModCostModel(unittest.TestCase):
+    """Test ordering, simulation and calibration."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.cache_dir = tempfile.mkdtemp()
+        self.mods = [FakeMod('small', 10 * 1024 ** 2), FakeMod('huge', 20 * 1024 ** 3), FakeMod('mid', 1024 ** 3)]
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def test_order_strategies(self):
+        """Test LPT, small-first and discovery ordering."""
+        model = ModCostModel(self.cache_dir)
+        self.assertEqual([m.mod_name for m in model.order(self.mods, 'lpt')], ['huge', 'mid', 'small'])
+        self.assertEqual([m.mod_name for m in model.order(self.mods, 'small_first')], ['small', 'mid', 'huge'])
+        self.assertEqual(model.order(self.mods, 'discovery'), self.mods)
+
+    def test_textures_are_cheaper_to_compress(self):
+        """Test that texture share lowers the compress estimate."""
+        model = ModCostModel(self.cache_dir)
+        plain = model.predict_stages(FakeMod('a', 1024 ** 3))
+        textures = model.predict_stages(FakeMod('b', 1024 ** 3, texture_size=1024 ** 3))
+        self.assertLess(textures['compress'], plain['compress'])
+        self.assertAlmostEqual(textures['stage'], plain['stage'])
+
+    def test_simulation_and_persisted_calibration(self):
+        """Test pipelined completion times and that calibration survives a reload."""
+        model = ModCostModel(self.cache_dir)
+        ordered = model.order(self.mods, 'lpt')
+        completion = model.simulate(ordered, [('stage', 1), ('archive', 1), ('compress', 1)])
+        self.assertEqual(max(completion, key=completion.get), 'small')
+        self.assertGreater(completion['huge'], model.predict(self.mods[1]) * 0.99)
+
+        before = model.rates['compress']
+        model.calibrate(self.mods[1], {'compress': model.predict_stages(self.mods[1])['compress'] * 4})
+        model.save()
+        reloaded = ModCostModel(self.cache_dir)
+        self.assertGreater(reloaded.rates['compress'], before)
+        self.assertEqual(reloaded.samples, 1)
+
+    def test_stream_order_picks_largest_available(self):
+        """Test that streamed ordering yields every mod, largest first when all are ready."""
+        model = ModCostModel(self.cache_dir)
+        ordered = list(model.stream_order(iter(self.mods), 'lpt'))
+        self.assertEqual(sorted(m.mod_name for m in ordered), ['huge', 'mid', 'small'])
+        self.assertEqual(list(model.stream_order(iter(self.mods), 'discovery')), self.mods)
+
+
+if __name__ == '__main__':
+    unittest.main()
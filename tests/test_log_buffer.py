@@ -0,0 +1,105 @@
+"""Tests for the bounded log buffer and streaming log file."""
+
+import unittest
+import tempfile
+import shutil
+import threading
+import os
+import sys
+from pathlib import Path
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from safe_resource_packer import dynamic_progress
+from safe_resource_packer.dynamic_progress import (
+    log, get_logs, clear_logs, start_log_stream, write_log_file, LOG_BUFFER_SIZE
+)
+
+
+class Unformattable:
+    """Object that fails the test if it is ever formatted."""
+
+    def __str__(self):
+        raise AssertionError("filtered message was formatted")
+
+
+class TestLogBuffer(unittest.TestCase):
+    """Test bounded, lazily formatted, streamed logging."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        clear_logs()
+        dynamic_progress.DEBUG = False
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        dynamic_progress.stop_log_stream()
+        dynamic_progress.DEBUG = False
+        clear_logs()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_buffer_is_bounded(self):
+        """Test that memory keeps only the most recent entries."""
+        for index in range(LOG_BUFFER_SIZE + 5):
+            log("entry %d", index, quiet_mode=True)
+        logs = get_logs()
+        self.assertEqual(len(logs), LOG_BUFFER_SIZE)
+        self.assertTrue(logs[-1].endswith(f"entry {LOG_BUFFER_SIZE + 4}"))
+        self.assertTrue(logs[0].startswith("["))
+
+    def test_filtered_messages_are_not_formatted(self):
+        """Test that debug-only and streamless non-debug SPAM entries are dropped before formatting."""
+        log("debug %s", Unformattable(), debug_only=True)
+        log("spam %s", Unformattable(), log_type='SPAM')
+        self.assertEqual(get_logs(), [])
+
+        dynamic_progress.DEBUG = True
+        log("spam %d", 1, debug_only=True, log_type='SPAM')  # Debug runs keep it for write_log_file()
+        self.assertTrue(get_logs()[-1].endswith("spam 1"))
+
+    def test_stream_collects_all_threads(self):
+        """Test that every thread's entries reach the log file, SPAM included."""
+        dynamic_progress.DEBUG = True
+        path = os.path.join(self.temp_dir, 'run.log')
+        start_log_stream(path)
+
+        def worker(number):
+            for index in range(300):
+                log("worker %d file %d", number, index, debug_only=True, log_type='SPAM')
+
+        threads = [threading.Thread(target=worker, args=(number,)) for number in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        write_log_file(path)
+
+        with open(path, 'r', encoding='utf-8') as f:
+            lines = f.read().splitlines()
+        self.assertEqual(len(lines), 1200)
+        self.assertIn("worker 3 file 299", '\n'.join(lines))
+
+    def test_exited_threads_release_their_buffers(self):
+        """Test that a new thread's first entry writes out and drops buffers of exited threads."""
+        path = os.path.join(self.temp_dir, 'run.log')
+        start_log_stream(path)
+
+        def worker(number):
+            log("worker %d done", number, quiet_mode=True)
+
+        for number in range(20):
+            thread = threading.Thread(target=worker, args=(number,))
+            thread.start()
+            thread.join()
+        self.assertLessEqual(len(dynamic_progress._LOG_THREAD_BUFFERS), 2)
+        dynamic_progress.LOG_STREAM.flush()  # File object buffering only, no thread buffers drained
+
+        with open(path, 'r', encoding='utf-8') as f:
+            written = f.read()
+        self.assertIn("worker 18 done", written)  # Written when worker 19 registered
+
+
+if __name__ == '__main__':
+    unittest.main()
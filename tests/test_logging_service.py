@@ -0,0 +1,82 @@
+"""Tests for the queued comprehensive logging service."""
+
+import unittest
+import tempfile
+import shutil
+import threading
+import json
+import logging
+import logging.handlers
+import os
+import sys
+from pathlib import Path
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from safe_resource_packer.logging_service import ComprehensiveLogService, EVENTS_FILE
+
+
+class TestComprehensiveLogService(unittest.TestCase):
+    """Test routing of queued records to text files and the JSONL stream."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_text_logs_are_routed_per_category(self):
+        """Test that each category still lands in its own file."""
+        service = ComprehensiveLogService(self.temp_dir, 'text_session', log_format='text')
+        service.log_file_operation('copy', 'a.nif', 'b.nif')
+        service.log_external_tool('BSArch', ['bsarch', 'pack'], return_code=0)
+        service.close()
+
+        logs_dir = Path(service.get_log_directory())
+        file_ops = (logs_dir / 'file_operations.log').read_text(encoding='utf-8')
+        tools = (logs_dir / 'external_tools.log').read_text(encoding='utf-8')
+        self.assertIn('FILE COPY', file_ops)
+        self.assertNotIn('EXTERNAL TOOL', file_ops)
+        self.assertIn('Command: bsarch pack', tools)
+        self.assertFalse((logs_dir / EVENTS_FILE).exists())
+
+    def test_jsonl_stream_from_worker_threads(self):
+        """Test that records from many threads end up as one event stream."""
+        service = ComprehensiveLogService(self.temp_dir, 'jsonl_session', log_format='jsonl')
+
+        def worker():
+            for index in range(50):
+                service.log_performance_metric('files', index)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        service.close()
+
+        logs_dir = service.get_log_directory()
+        self.assertEqual(sorted(os.listdir(logs_dir)), [EVENTS_FILE, 'session_metadata.json'])
+        with open(os.path.join(logs_dir, EVENTS_FILE), 'r', encoding='utf-8') as f:
+            events = [json.loads(line) for line in f]
+        metrics = [event for event in events if event['message'].startswith('PERFORMANCE METRIC')]
+        self.assertEqual(len(metrics), 200)
+        self.assertEqual(metrics[0]['category'], 'performance')
+        self.assertTrue(any(event['category'] == 'system' for event in events))
+
+    def test_close_detaches_queue_handlers(self):
+        """Test that records logged after close() are dropped, not queued forever."""
+        service = ComprehensiveLogService(self.temp_dir, 'closed_session', log_format='jsonl')
+        service.close()
+        service.log_performance_metric('late', 1)
+
+        for logger in (service.app_logger, service.performance_logger):
+            self.assertFalse(any(isinstance(handler, logging.handlers.QueueHandler) for handler in logger.handlers))
+        self.assertTrue(service._queue.empty())
+
+
+if __name__ == '__main__':
+    unittest.main()
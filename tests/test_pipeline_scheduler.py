@@ -0,0 +1,62 @@
+"""Tests for the stage pipeline scheduler."""
+
+import unittest
+import threading
+import time
+import sys
+from pathlib import Path
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from safe_resource_packer.pipeline_scheduler import StagePipeline, PipelineStage
+
+
+class TestStagePipeline(unittest.TestCase):
+    """Test stage overlap, failure short-circuiting and the trace."""
+
+    def test_stages_overlap_across_items(self):
+        """Test that different items occupy different stages at the same time."""
+        def slow(item):
+            time.sleep(0.05)
+            return True, item
+
+        pipeline = StagePipeline([PipelineStage('a', slow), PipelineStage('b', slow), PipelineStage('c', slow)])
+        results = pipeline.run(['x', 'y', 'z'])
+
+        self.assertEqual([item for item, _, _ in results], ['x', 'y', 'z'])
+        self.assertTrue(all(success for _, success, _ in results))
+        # Fully sequential would take 9 steps; pipelined it takes 5
+        self.assertLess(pipeline.finished_at - pipeline.started_at, 0.4)
+        self.assertEqual(pipeline.utilization()['b']['items'], 3)
+
+    def test_failure_stops_item_and_respects_worker_limit(self):
+        """Test that a failed item skips later stages and stage limits hold."""
+        active = {'count': 0, 'peak': 0}
+        lock = threading.Lock()
+
+        def limited(item):
+            with lock:
+                active['count'] += 1
+                active['peak'] = max(active['peak'], active['count'])
+            time.sleep(0.02)
+            with lock:
+                active['count'] -= 1
+            return item != 'bad', f"{item} done"
+
+        finished = []
+        pipeline = StagePipeline(
+            [PipelineStage('first', limited, workers=2), PipelineStage('second', lambda item: (True, 'packed'))],
+            on_finished=lambda item, success, message: finished.append((item, success, message))
+        )
+        pipeline.run(['a', 'bad', 'c', 'd'])
+
+        self.assertLessEqual(active['peak'], 2)
+        self.assertIn(('bad', False, 'bad done'), finished)
+        self.assertEqual(sorted(item for item, success, _ in finished if success), ['a', 'c', 'd'])
+        self.assertNotIn('bad', [event.item_name for event in pipeline.trace if event.stage == 'second'])
+        self.assertIn('utilization', pipeline.format_trace())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+"""Tests for the streaming process runner."""
+
+import unittest
+import threading
+import os
+import sys
+from unittest import mock
+from pathlib import Path
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from safe_resource_packer.process_runner import (run_streaming, parse_7z_progress, inactivity_timeout_for,
+                                                 tool_progress, INACTIVITY_TIMEOUT_ENV_VAR)
+from safe_resource_packer import dynamic_progress
+
+
+class TestProcessRunner(unittest.TestCase):
+    """Test streamed process execution."""
+
+    def test_progress_is_parsed_from_carriage_return_updates(self):
+        """Test that 7z-style in-place progress updates are reported."""
+        script = "import sys; sys.stdout.write('  10%\\r  55% 3 - a.nif\\r100%\\nEverything is Ok\\n')"
+        seen = []
+        result = run_streaming([sys.executable, "-c", script], tool="test",
+                               progress_parser=parse_7z_progress,
+                               on_progress=lambda percent, line: seen.append(percent))
+
+        self.assertTrue(result.success)
+        self.assertEqual(seen, [10.0, 55.0, 100.0])
+        self.assertIn("Everything is Ok", result.stdout)
+
+    def test_inactivity_timeout_kills_process(self):
+        """Test that a silent process is killed after the inactivity timeout."""
+        result = run_streaming([sys.executable, "-c", "import time; time.sleep(30)"],
+                               tool="test", inactivity_timeout=0.5)
+
+        self.assertTrue(result.timed_out)
+        self.assertFalse(result.success)
+        self.assertLess(result.duration, 10)
+
+    def test_cancel_event_stops_process(self):
+        """Test that setting the cancel event kills the process."""
+        cancel_event = threading.Event()
+        threading.Timer(0.3, cancel_event.set).start()
+        result = run_streaming([sys.executable, "-c", "import time; time.sleep(30)"],
+                               tool="test", cancel_event=cancel_event)
+
+        self.assertTrue(result.cancelled)
+        self.assertLess(result.duration, 10)
+
+    def test_bsarch_timeout_is_generous_and_overridable(self):
+        """Test that BSArch gets a long default inactivity timeout the environment can override."""
+        with mock.patch.dict(os.environ, {INACTIVITY_TIMEOUT_ENV_VAR: ''}):
+            self.assertEqual(inactivity_timeout_for("BSArch"), 3600)
+            self.assertEqual(inactivity_timeout_for("7z"), 600)
+        with mock.patch.dict(os.environ, {INACTIVITY_TIMEOUT_ENV_VAR: '1800'}):
+            self.assertEqual(inactivity_timeout_for("BSArch"), 1800)
+        with mock.patch.dict(os.environ, {INACTIVITY_TIMEOUT_ENV_VAR: '0'}):
+            self.assertIsNone(inactivity_timeout_for("7z"))
+
+    def test_tool_progress_feeds_the_display(self):
+        """Test that tool progress shows on the display while the tool runs."""
+        with tool_progress("7z Mod.7z") as on_progress:
+            on_progress(42.0, "42%")
+            self.assertEqual(dynamic_progress.PROGRESS_STATS['tools']["7z Mod.7z"], 42.0)
+        self.assertNotIn("7z Mod.7z", dynamic_progress.PROGRESS_STATS['tools'])
+
+
+if __name__ == '__main__':
+    unittest.main()
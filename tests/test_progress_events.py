@@ -0,0 +1,63 @@
+"""Tests for machine-readable progress events."""
+
+import unittest
+import subprocess
+import json
+import io
+import os
+import sys
+from pathlib import Path
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from safe_resource_packer.progress_events import ProgressEventEmitter, headless_requested
+
+
+class TestProgressEvents(unittest.TestCase):
+    """Test event shapes, throttling and Rich-free headless imports."""
+
+    def test_progress_is_throttled_and_stages_are_measured(self):
+        """Test that bursts collapse into few events and the last item is always reported."""
+        stream = io.StringIO()
+        received = []
+        events = ProgressEventEmitter(stream, min_interval=60)
+        events.add_listener(received.append)
+
+        events.stage_start('copy', 1000)
+        for current in range(1, 1001):
+            events.progress('copy', current, bytes_done=current * 4096)
+        events.mod_result('ModA', 'failed', error='BSArch missing')
+        events.stage_end('copy', True, copied=1000)
+
+        lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+        self.assertEqual(lines, received)
+        self.assertEqual([line['event'] for line in lines],
+                         ['stage_start', 'progress', 'progress', 'mod_result', 'stage_end'])
+        last = lines[2]
+        self.assertEqual((last['current'], last['total'], last['bytes'], last['eta_seconds']), (1000, 1000, 4096000, 0.0))
+        self.assertGreater(last['bytes_per_second'], 0)
+        self.assertEqual((lines[4]['stage'], lines[4]['success'], lines[4]['copied']), ('copy', True, 1000))
+
+    def test_disabled_emitter_and_headless_detection(self):
+        """Test that an unconfigured emitter is inert and the flag forms are recognized."""
+        events = ProgressEventEmitter()
+        self.assertFalse(events.enabled)
+        events.progress('copy', 1, 2)  # No stream, no listeners: nothing to do
+        self.assertTrue(headless_requested(['srp', '--progress=jsonl']))
+        self.assertTrue(headless_requested(['srp', '--progress', 'jsonl']))
+        if 'SRP_PROGRESS' not in os.environ:
+            self.assertFalse(headless_requested(['srp', '--progress', 'rich']))
+
+    def test_jsonl_mode_never_imports_rich(self):
+        """Test that the CLI import chain skips Rich entirely in jsonl mode."""
+        code = ("import sys; import safe_resource_packer.enhanced_cli; "
+                "print(sorted(m for m in sys.modules if m == 'rich' or m.startswith('rich.')))")
+        env = dict(os.environ, SRP_PROGRESS='jsonl',
+                   PYTHONPATH=str(Path(__file__).parent.parent / "src"))
+        output = subprocess.run([sys.executable, '-c', code], env=env, capture_output=True, text=True, check=True)
+        self.assertEqual(output.stdout.strip(), '[]')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+"""Tests for render-thread driven progress displays."""
+
+import unittest
+import threading
+import time
+import io
+import sys
+from pathlib import Path
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from safe_resource_packer import dynamic_progress
+from safe_resource_packer.dynamic_progress import (
+    start_copy_progress, update_copy_progress, finish_copy_progress, COPY_PROGRESS, RICH_AVAILABLE,
+    start_classification_progress, finish_classification_progress, LAYOUT_MESSAGES, SCROLLBACK_LINES
+)
+
+
+@unittest.skipUnless(RICH_AVAILABLE, "Rich is not installed")
+class TestProgressRender(unittest.TestCase):
+    """Test render-thread progress displays and the pinned layout scrollback."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        from rich.console import Console
+        self.output = io.StringIO()
+        self.saved_console = dynamic_progress.RICH_CONSOLE
+        dynamic_progress.RICH_CONSOLE = Console(file=self.output, force_terminal=True, width=100)
+        dynamic_progress.PROGRESS_ENABLED = True
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        finish_copy_progress()
+        finish_classification_progress()
+        dynamic_progress.PROGRESS_ENABLED = False
+        dynamic_progress.DEBUG = False
+        dynamic_progress.RICH_CONSOLE = self.saved_console
+
+    def test_workers_count_and_finish_returns_immediately(self):
+        """Test that concurrent updates are all counted and the final frame shows them."""
+        start_copy_progress(8000)
+
+        def worker():
+            for _ in range(1000):
+                update_copy_progress('mesh.nif', 'copy', increment=True, count=2)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(COPY_PROGRESS['stats']['counters']['copy'], 8000)
+
+        started = time.perf_counter()
+        finish_copy_progress()
+        self.assertLess(time.perf_counter() - started, 0.5)
+        self.assertIsNone(COPY_PROGRESS['live'])
+        self.assertIn('8,000/8,000', self.output.getvalue())
+
+    def test_layout_scrollback_is_bounded(self):
+        """Test that similar messages collapse and distinct ones stay within the scrollback."""
+        dynamic_progress.DEBUG = True
+        dynamic_progress.LAYOUT_MESSAGE_RATE = 10 ** 6  # No rate limiting for this test
+        try:
+            start_classification_progress(10)
+            for index in range(300):
+                dynamic_progress.log("[SKIP] meshes/armor/%d.nif identical", index, debug_only=True, log_type='SKIP')
+            self.assertEqual(len(LAYOUT_MESSAGES), 1)
+            self.assertEqual(LAYOUT_MESSAGES[0][3], 300)
+
+            for index in range(SCROLLBACK_LINES * 3):
+                dynamic_progress.log("Stage %s", 'x' * (index + 1), debug_only=True, log_type='INFO')
+            self.assertEqual(len(LAYOUT_MESSAGES), SCROLLBACK_LINES)
+            rendered = dynamic_progress._render_layout_messages(5)
+            self.assertEqual(len(rendered.plain.splitlines()), 5)
+        finally:
+            dynamic_progress.LAYOUT_MESSAGE_RATE = 20
+
+    def test_suppressed_count_moves_into_scrollback_and_resets(self):
+        """Test that a finished burst leaves one summary line and a restart starts from zero."""
+        dynamic_progress.DEBUG = True
+        dynamic_progress.LAYOUT_MESSAGE_RATE = 2
+        try:
+            start_classification_progress(10)
+            for index in range(10):
+                dynamic_progress.log("Stage %s", 'x' * (index + 1), debug_only=True, log_type='INFO')
+            suppressed = dynamic_progress.LAYOUT_MESSAGE_STATE['suppressed']
+            self.assertGreater(suppressed, 0)
+            if dynamic_progress.LOG_STREAM is None:
+                self.assertIn("more messages not shown", dynamic_progress._render_layout_messages().plain)
+
+            dynamic_progress.LAYOUT_MESSAGE_STATE['tokens'] = 2  # Burst over
+            dynamic_progress.log("Done", debug_only=True, log_type='INFO')
+            self.assertEqual(dynamic_progress.LAYOUT_MESSAGE_STATE['suppressed'], 0)
+            self.assertIn(f"{suppressed:,} more messages", LAYOUT_MESSAGES[-2][1])
+
+            dynamic_progress.LAYOUT_MESSAGE_STATE['suppressed'] = 5
+            finish_classification_progress()
+            self.assertEqual((len(LAYOUT_MESSAGES), dynamic_progress.LAYOUT_MESSAGE_STATE['suppressed']), (0, 0))
+        finally:
+            dynamic_progress.LAYOUT_MESSAGE_RATE = 20
+
+
+if __name__ == '__main__':
+    unittest.main()
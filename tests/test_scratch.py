@@ -0,0 +1,81 @@
+"""Tests for the scratch space manager."""
+
+import unittest
+import tempfile
+import shutil
+import subprocess
+import json
+import threading
+import os
+import sys
+from pathlib import Path
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from safe_resource_packer.scratch import ScratchManager, ScratchQuotaExceeded, RUN_PREFIX, OWNER_FILE
+
+
+class TestScratchManager(unittest.TestCase):
+    """Test placement, quotas and orphan sweeping."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.roots = [os.path.join(self.temp_dir, 'disk1'), os.path.join(self.temp_dir, 'disk2')]
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_round_robin_and_quota(self):
+        """Test that directories alternate between roots and the quota is enforced."""
+        manager = ScratchManager(self.roots, quota_gb=1)
+        first = manager.mkdtemp('srp_a_', size_hint=600 * 1024 ** 2)
+        second = manager.mkdtemp('srp_b_', size_hint=100)
+        self.assertNotEqual(Path(first).parents[1], Path(second).parents[1])
+        self.assertTrue(Path(first).parent.name.startswith(RUN_PREFIX))
+
+        with self.assertRaises(ScratchQuotaExceeded):
+            manager.mkdtemp('srp_c_', size_hint=600 * 1024 ** 2)
+        manager.release(first)
+        self.assertFalse(os.path.exists(first))
+        manager.mkdtemp('srp_c_', size_hint=600 * 1024 ** 2)
+        manager.cleanup()
+
+    def test_waits_for_quota_released_by_another_job(self):
+        """Test that a waiting request succeeds once another directory is released."""
+        manager = ScratchManager(self.roots, quota_gb=1)
+        first = manager.mkdtemp('srp_a_', size_hint=600 * 1024 ** 2)
+        timer = threading.Timer(0.2, manager.release, args=(first,))
+        timer.start()
+
+        second = manager.mkdtemp('srp_b_', size_hint=600 * 1024 ** 2, wait=30)
+        timer.join()
+        self.assertTrue(os.path.isdir(second))
+        manager.cleanup()
+
+    def test_sweep_removes_dead_runs_only(self):
+        """Test that the sweep removes crashed runs but keeps live ones."""
+        crashed = ScratchManager(self.roots[:1])
+        leftover = crashed.mkdtemp('srp_blacklisted_')
+        dead = subprocess.Popen([sys.executable, '-c', 'pass'])
+        dead.wait()
+        owner_file = os.path.join(os.path.dirname(leftover), OWNER_FILE)
+        with open(owner_file, 'r', encoding='utf-8') as f:
+            owner = json.load(f)
+        owner['pid'] = dead.pid
+        with open(owner_file, 'w', encoding='utf-8') as f:
+            json.dump(owner, f)
+
+        live = ScratchManager(self.roots[:1])
+        kept = live.mkdtemp('srp_pack_')
+        removed = ScratchManager(self.roots[:1]).sweep()
+        self.assertEqual(removed, 1)
+        self.assertFalse(os.path.exists(leftover))
+        self.assertTrue(os.path.exists(kept))
+        live.cleanup()
+
+
+if __name__ == '__main__':
+    unittest.main()
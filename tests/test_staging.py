@@ -0,0 +1,66 @@
+"""Tests for link-based staging trees."""
+
+import unittest
+import tempfile
+import shutil
+import os
+import sys
+from pathlib import Path
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from safe_resource_packer.staging import StagingTree
+
+
+class TestStagingTree(unittest.TestCase):
+    """Test staging layouts, byte accounting and cleanup."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.source_dir = os.path.join(self.temp_dir, 'Data')
+        os.makedirs(os.path.join(self.source_dir, 'meshes', 'armor'))
+        self.files = []
+        for name, size in (('meshes/armor/a.nif', 100), ('meshes/b.nif', 50)):
+            path = os.path.join(self.source_dir, name)
+            with open(path, 'wb') as f:
+                f.write(b'x' * size)
+            self.files.append(path)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def rel_path(self, file_path):
+        return os.path.relpath(file_path, self.source_dir)
+
+    def test_links_are_not_copies(self):
+        """Test that same-filesystem staging never copies and cleanup keeps the originals."""
+        root = os.path.join(self.temp_dir, 'stage')
+        tree = StagingTree(root)
+        self.assertEqual(tree.add_files(self.files + [os.path.join(self.source_dir, 'missing.nif')], self.rel_path), 2)
+        self.assertEqual(tree.bytes_saved, 150)
+        self.assertEqual(tree.bytes_copied, 0)
+        with open(os.path.join(root, 'meshes', 'armor', 'a.nif'), 'rb') as f:
+            self.assertEqual(len(f.read()), 100)
+
+        tree.cleanup()
+        self.assertEqual(os.listdir(root), [])
+        self.assertTrue(all(os.path.getsize(path) > 0 for path in self.files))
+
+    def test_copy_fallback_and_owned_root(self):
+        """Test copy accounting and removal of a tree's own temp directory."""
+        tree = StagingTree(methods=('copy',))
+        tree.add_files(self.files, self.rel_path)
+        self.assertEqual(tree.stats()['files'], {'copy': 2})
+        self.assertEqual(tree.bytes_copied, 150)
+        self.assertEqual(tree.bytes_saved, 0)
+
+        tree.cleanup()
+        self.assertFalse(os.path.exists(tree.root))
+        self.assertTrue(all(os.path.exists(path) for path in self.files))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+"""Tests for the external tool capability registry."""
+
+import unittest
+import tempfile
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from safe_resource_packer.tool_registry import ToolRegistry
+
+
+FAKE_7Z = """#!{python}
+import sys
+with open({log!r}, 'a') as f:
+    f.write(' '.join(sys.argv[1:]) + '\\n')
+print('7-Zip 23.01 (x64) : Copyright (c) 1999-2023 Igor Pavlov')
+"""
+
+
+@unittest.skipIf(os.name == 'nt', "Uses a POSIX script as a fake 7z binary")
+class TestToolRegistry(unittest.TestCase):
+    """Test tool probing and persistence."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.test_dir = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.test_dir, "registry")
+        self.probe_log = os.path.join(self.test_dir, "probes.log")
+        self.tool = os.path.join(self.test_dir, "7z")
+        self.write_tool()
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.test_dir)
+
+    def write_tool(self, extra=""):
+        """Write the fake 7z script."""
+        with open(self.tool, 'w') as f:
+            f.write(FAKE_7Z.format(python=sys.executable, log=self.probe_log) + extra)
+        os.chmod(self.tool, 0o755)
+
+    def probe_count(self):
+        """Number of times the fake tool was run."""
+        if not os.path.exists(self.probe_log):
+            return 0
+        with open(self.probe_log) as f:
+            return len(f.readlines())
+
+    def test_probe_results_are_persisted(self):
+        """Test that a tool is probed once across registry instances."""
+        capabilities = ToolRegistry(self.cache_dir).sevenzip(self.tool)
+        probes = self.probe_count()
+
+        self.assertTrue(capabilities['valid'])
+        self.assertEqual(capabilities['version'], '23.01')
+        self.assertEqual(capabilities['flavor'], '7-zip')
+        self.assertTrue(capabilities['supports_mmt'])
+
+        ToolRegistry(self.cache_dir).sevenzip(self.tool)
+        self.assertEqual(self.probe_count(), probes)
+
+    def test_changed_binary_is_reprobed(self):
+        """Test that replacing the binary invalidates its cached capabilities."""
+        registry = ToolRegistry(self.cache_dir)
+        registry.sevenzip(self.tool)
+        probes = self.probe_count()
+
+        self.write_tool(extra="# updated build\n")
+        registry.sevenzip(self.tool)
+        self.assertGreater(self.probe_count(), probes)
+
+    def test_only_successful_probes_stick(self):
+        """Test that a failed probe is retried once its TTL expired, a successful one is kept."""
+        registry = ToolRegistry(self.cache_dir, negative_ttl=0)
+
+        def timed_out(path):
+            raise subprocess.TimeoutExpired(path, 10)
+
+        self.assertFalse(registry._lookup('7z', self.tool, timed_out)['valid'])
+        self.assertTrue(registry._lookup('7z', self.tool, lambda path: {'valid': True})['valid'])
+        self.assertTrue(registry._lookup('7z', self.tool, timed_out)['valid'])
+
+
+if __name__ == '__main__':
+    unittest.main()